@@ -11,15 +11,22 @@ from fastapi import Depends
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlmodel import Session
 from typing import List
+import logging
 import uuid
 
 from app.core.database import get_session
-from app.infrastructure.auth import verify_token
-from app.features.users.models import User
-from app.features.users.repository import UserRepository
+from app.infrastructure.auth import verify_token, token_digest
+from app.features.auth.cache import AuthenticatedUser, user_auth_cache
 from app.features.auth.repository import TokenBlacklistRepository
-from app.features.auth.service import AuthService
-from app.common.exceptions import UnauthorizedException, NotFoundException, ForbiddenException
+from app.features.auth.revocation import revoked_tokens
+from app.common.exceptions import (
+    UnauthorizedException,
+    NotFoundException,
+    ForbiddenException,
+    TokenBlacklistedException,
+)
+
+logger = logging.getLogger(__name__)
 
 # HTTP Bearer token security scheme
 security = HTTPBearer()
@@ -28,29 +35,33 @@ security = HTTPBearer()
 def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
     session: Session = Depends(get_session)
-) -> User:
+) -> AuthenticatedUser:
     """
     Get authenticated user from JWT token.
     
     This dependency extracts the JWT token from the Authorization header,
     validates it, checks if it's blacklisted, retrieves the user from the 
-    database, and checks if the user account is active.
+    database, and checks if the user account is active. The blacklist check
+    and the user lookup share a single database query; users found in
+    user_auth_cache only need the blacklist check. The blacklist table is
+    only queried for tokens the in-memory revoked_tokens set may contain.
     
     Args:
         credentials: HTTP Bearer token credentials from the request header
         session: Database session dependency
         
     Returns:
-        Authenticated User object
+        AuthenticatedUser snapshot (id, role, is_active, email, token_epoch) of the user
         
     Raises:
-        UnauthorizedException: If token is invalid, expired, blacklisted, or missing user ID
+        UnauthorizedException: If token is invalid, expired, blacklisted, older than the
+            user's token epoch, or missing user ID
         NotFoundException: If user ID from token doesn't exist in database
         ForbiddenException: If user account is deactivated
         
     Example:
         @router.get("/protected")
-        def protected_endpoint(current_user: User = Depends(get_current_user)):
+        def protected_endpoint(current_user: AuthenticatedUser = Depends(get_current_user)):
             return {"user_id": current_user.id, "role": current_user.role}
     
     Requirements:
@@ -65,12 +76,6 @@ def get_current_user(
     # Verify and decode token (raises UnauthorizedException if invalid)
     payload = verify_token(token)
     
-    # Check if token is blacklisted (Requirement 1.2)
-    token_blacklist_repo = TokenBlacklistRepository(session)
-    user_repo = UserRepository(session)
-    auth_service = AuthService(user_repo, token_blacklist_repo)
-    auth_service.verify_token_not_blacklisted(token)
-    
     # Extract user ID from token payload
     user_id_str = payload.get("sub")
     if not user_id_str:
@@ -82,8 +87,27 @@ def get_current_user(
     except (ValueError, AttributeError):
         raise UnauthorizedException("Invalid token: malformed user ID")
     
-    # Retrieve user from database
-    user = user_repo.get_by_id(user_id)
+    # Query the blacklist only for possibly revoked tokens, and the user only
+    # when no snapshot is cached; a lookup of both is a single query
+    digest = token_digest(token, payload)
+    token_blacklist_repo = TokenBlacklistRepository(session)
+    might_be_revoked = revoked_tokens.might_be_revoked(digest, token_blacklist_repo)
+    user = user_auth_cache.get(user_id)
+    if user is not None:
+        is_blacklisted = might_be_revoked and token_blacklist_repo.is_digest_blacklisted(digest)
+    else:
+        generation = user_auth_cache.generation
+        found, is_blacklisted = token_blacklist_repo.get_user_for_token(
+            user_id, digest, check_blacklist=might_be_revoked
+        )
+        if found is not None:
+            user = AuthenticatedUser.from_user(found)
+            user_auth_cache.set(user, generation)
+    
+    # Reject blacklisted tokens (Requirement 1.2)
+    if is_blacklisted:
+        logger.warning("Authentication attempt with blacklisted token")
+        raise TokenBlacklistedException("Token has been invalidated")
     
     if not user:
         raise NotFoundException("User")
@@ -92,6 +116,11 @@ def get_current_user(
     if not user.is_active:
         raise ForbiddenException("Account is deactivated")
     
+    # Reject tokens issued before the user's last logout from all sessions
+    if payload.get("epoch", 0) < user.token_epoch:
+        logger.warning("Authentication attempt with token from a revoked epoch")
+        raise TokenBlacklistedException("Token has been invalidated")
+    
     return user
 
 
@@ -117,7 +146,7 @@ def require_role(allowed_roles: List[str]):
         # Admin-only endpoint
         @router.patch("/clinic/status")
         def update_clinic_status(
-            current_user: User = Depends(require_role(["admin"])),
+            current_user: AuthenticatedUser = Depends(require_role(["admin"])),
             ...
         ):
             return {"status": "updated"}
@@ -125,7 +154,7 @@ def require_role(allowed_roles: List[str]):
         # Endpoint accessible by both roles
         @router.get("/appointments")
         def get_appointments(
-            current_user: User = Depends(require_role(["admin", "pet_owner"])),
+            current_user: AuthenticatedUser = Depends(require_role(["admin", "pet_owner"])),
             ...
         ):
             return []
@@ -134,7 +163,7 @@ def require_role(allowed_roles: List[str]):
         - 2.1: Grant full access to admins
         - 2.4: Reject pet owners from admin-only endpoints
     """
-    def role_checker(current_user: User = Depends(get_current_user)) -> User:
+    def role_checker(current_user: AuthenticatedUser = Depends(get_current_user)) -> AuthenticatedUser:
         """
         Check if current user has required role.
         
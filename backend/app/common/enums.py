@@ -2,8 +2,8 @@
 Common enums for the Vet Clinic Scheduling System.
 
 This module defines all enumeration types used throughout the application
-for user roles, appointment statuses, service types, clinic status, and
-vaccination status.
+for user roles, appointment statuses, service types, clinic status,
+vaccination status, and resource kinds.
 """
 
 from enum import Enum
@@ -74,3 +74,14 @@ class VaccinationStatus(str, Enum):
     VALID = "valid"
     EXPIRED = "expired"
     UNKNOWN = "unknown"
+
+
+class ResourceKind(str, Enum):
+    """Resource kind enumeration.
+    
+    Defines the kinds of resources appointments are assigned to:
+    - VET: A veterinarian
+    - ROOM: A treatment or surgery room
+    """
+    VET = "vet"
+    ROOM = "room"
@@ -0,0 +1,103 @@
+"""
+ETag helpers for conditional requests.
+
+List endpoints derive a fingerprint of the rows they would return with one
+aggregate query (row count plus latest modification time). If it matches
+the client's If-None-Match header the endpoint answers 304 Not Modified
+without loading or serializing the rows.
+
+Versioned resources (appointments) use their row version as a strong ETag;
+updates may send it back in If-Match to avoid overwriting newer changes.
+"""
+
+import hashlib
+from typing import Optional
+
+from fastapi import Response, status
+
+from app.common.exceptions import BadRequestException
+
+# Cached list responses are user-specific; browsers must revalidate each time
+LIST_CACHE_CONTROL = "private, no-cache"
+
+
+def make_weak_etag(*parts: object) -> str:
+    """Build a weak ETag from fingerprint parts.
+
+    Args:
+        *parts: Values that change whenever the response body changes
+            (e.g. row count, max(updated_at), the query string, the user)
+
+    Returns:
+        Weak ETag header value, e.g. W/"3f2a..."
+    """
+    digest = hashlib.sha1("|".join(str(part) for part in parts).encode()).hexdigest()
+    return f'W/"{digest[:20]}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Check an If-None-Match header against an ETag (weak comparison).
+
+    Args:
+        if_none_match: Raw If-None-Match header value, if any
+        etag: Current ETag of the resource
+
+    Returns:
+        True if the client's copy is current
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(
+        candidate.strip().removeprefix("W/") == opaque
+        for candidate in if_none_match.split(",")
+    )
+
+
+def not_modified(etag: str) -> Response:
+    """Build a 304 Not Modified response.
+
+    Args:
+        etag: Current ETag of the resource
+
+    Returns:
+        Empty response carrying the ETag
+    """
+    return Response(
+        status_code=status.HTTP_304_NOT_MODIFIED,
+        headers={"ETag": etag, "Cache-Control": LIST_CACHE_CONTROL}
+    )
+
+
+def version_etag(version: int) -> str:
+    """Build the strong ETag of a versioned resource.
+
+    Args:
+        version: Current row version
+
+    Returns:
+        ETag header value, e.g. "3"
+    """
+    return f'"{version}"'
+
+
+def parse_if_match_version(if_match: Optional[str]) -> Optional[int]:
+    """Read the expected row version from an If-Match header.
+
+    Args:
+        if_match: Raw If-Match header value, if any ("3", 3 or *)
+
+    Returns:
+        Expected version, or None when the header is absent or *
+
+    Raises:
+        BadRequestException: If the header is not a version ETag
+    """
+    if if_match is None or if_match.strip() == "*":
+        return None
+    try:
+        return int(if_match.strip().strip('"'))
+    except ValueError:
+        raise BadRequestException("If-Match must be the appointment version, e.g. \"3\"")
@@ -10,6 +10,9 @@ These exceptions provide consistent error responses across the API:
 - ProfileUpdateForbiddenException (403): Cross-user profile update attempt
 - AppointmentRescheduleForbiddenException (403): Appointment ownership violation
 - TimeSlotUnavailableException (409): Double booking / time slot conflict
+- AppointmentVersionConflictException (409): Stale If-Match / concurrent update
+- IdempotencyKeyInProgressException (409): Duplicate Idempotency-Key still being processed
+- ChangesExpiredException (410): Delta-sync timestamp older than the retained deletions
 """
 
 from fastapi import HTTPException, status
@@ -183,3 +186,68 @@ class TimeSlotUnavailableException(HTTPException):
             status_code=status.HTTP_409_CONFLICT,
             detail=message
         )
+
+
+class AppointmentVersionConflictException(HTTPException):
+    """
+    Raised when an appointment changed since the client last read it.
+    
+    Returns HTTP 409 status code (Conflict).
+    
+    This exception is thrown when the If-Match version sent with an update
+    is stale, or when a concurrent request updated the appointment first.
+    The client should reload the appointment and retry.
+    
+    Example:
+        raise AppointmentVersionConflictException()
+        # Returns: {"detail": "Appointment was modified by another request; reload and try again"}
+    """
+    
+    def __init__(self, message: str = "Appointment was modified by another request; reload and try again"):
+        super().__init__(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=message
+        )
+
+
+class IdempotencyKeyInProgressException(HTTPException):
+    """
+    Raised when a request reuses an Idempotency-Key that is still being processed.
+    
+    Returns HTTP 409 status code (Conflict).
+    
+    This exception is thrown when two requests with the same key arrive at
+    the same time. Once the first one finishes, retrying returns its response.
+    
+    Example:
+        raise IdempotencyKeyInProgressException()
+        # Returns: {"detail": "A request with this Idempotency-Key is already in progress"}
+    """
+    
+    def __init__(self, message: str = "A request with this Idempotency-Key is already in progress"):
+        super().__init__(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=message
+        )
+
+
+class ChangesExpiredException(HTTPException):
+    """
+    Raised when a delta sync asks for changes older than the retention window.
+    
+    Returns HTTP 410 status code (Gone).
+    
+    This exception is thrown when the since timestamp of
+    GET /api/v1/appointments/changes predates the oldest deletions still kept.
+    The client should reload the full appointment list and sync from there.
+    
+    Example:
+        raise ChangesExpiredException()
+        # Returns: {"detail": "Changes this old are no longer available; reload the full appointment list"}
+    """
+    
+    def __init__(self, message: str = "Changes this old are no longer available; reload the full appointment list"):
+        super().__init__(
+            status_code=status.HTTP_410_GONE,
+            detail=message
+        )
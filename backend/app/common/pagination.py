@@ -0,0 +1,51 @@
+"""
+Keyset (cursor) pagination helpers.
+
+List endpoints that page through time-ordered rows use an opaque cursor that
+encodes the sort key of the last row returned, e.g. (start_time, id) for
+appointments. The next page is read with a keyset predicate instead of an
+OFFSET, so each page costs the same no matter how deep the client goes.
+"""
+
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import Tuple
+import uuid
+
+from app.common.exceptions import BadRequestException
+
+
+def encode_cursor(sort_time: datetime, row_id: uuid.UUID) -> str:
+    """Encode the sort key of the last row on a page as an opaque cursor.
+
+    Args:
+        sort_time: Timestamp column the rows are ordered by
+        row_id: Primary key used as the tie-breaker
+
+    Returns:
+        URL-safe cursor string
+    """
+    payload = json.dumps([sort_time.isoformat(), str(row_id)], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, uuid.UUID]:
+    """Decode a cursor produced by encode_cursor.
+
+    Args:
+        cursor: Cursor string received from the client
+
+    Returns:
+        Tuple of (sort_time, row_id)
+
+    Raises:
+        BadRequestException: If the cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        sort_time, row_id = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return datetime.fromisoformat(sort_time), uuid.UUID(row_id)
+    except (binascii.Error, UnicodeDecodeError, ValueError, TypeError):
+        raise BadRequestException("Invalid cursor")
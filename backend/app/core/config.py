@@ -31,6 +31,59 @@ ENVIRONMENT = os.environ.get("ENVIRONMENT", "development")
 # Timezone
 CLINIC_TIMEZONE = os.environ.get("CLINIC_TIMEZONE", "Asia/Manila")
 
+# Event files of the "file" backends below are rotated to <file>.1 at this size
+EVENTS_FILE_MAX_BYTES = int(os.environ.get("EVENTS_FILE_MAX_BYTES", str(10 * 1024 * 1024)))
+
+# Authenticated user snapshots (per worker process); "memory" or "file" shares invalidations between workers
+AUTH_USER_CACHE_TTL_SECONDS = int(os.environ.get("AUTH_USER_CACHE_TTL_SECONDS", "60"))
+AUTH_USER_CACHE_MAX_ENTRIES = int(os.environ.get("AUTH_USER_CACHE_MAX_ENTRIES", "10000"))
+AUTH_USER_CACHE_BACKEND = os.environ.get("AUTH_USER_CACHE_BACKEND", "memory")
+AUTH_USER_CACHE_EVENTS_FILE = os.environ.get("AUTH_USER_CACHE_EVENTS_FILE", "/tmp/vet_clinic_auth_user_events.ndjson")
+
+# Seconds before a worker reloads its in-memory set of revoked tokens (logouts from other workers)
+TOKEN_REVOCATION_REFRESH_SECONDS = int(os.environ.get("TOKEN_REVOCATION_REFRESH_SECONDS", "30"))
+
+# Available-slots cache (per worker process)
+AVAILABILITY_CACHE_TTL_SECONDS = int(os.environ.get("AVAILABILITY_CACHE_TTL_SECONDS", "30"))
+AVAILABILITY_CACHE_MAX_ENTRIES = int(os.environ.get("AVAILABILITY_CACHE_MAX_ENTRIES", "1024"))
+
+# Compiled clinic hours/closures: seconds before a worker re-reads the schedule tables
+CLINIC_SCHEDULE_TTL_SECONDS = int(os.environ.get("CLINIC_SCHEDULE_TTL_SECONDS", "60"))
+
+# Earliest-available-slot search: furthest day scanned and time budget per request
+NEXT_AVAILABLE_MAX_DAYS = int(os.environ.get("NEXT_AVAILABLE_MAX_DAYS", "90"))
+NEXT_AVAILABLE_MAX_SECONDS = float(os.environ.get("NEXT_AVAILABLE_MAX_SECONDS", "0.5"))
+
+# Appointment list pagination
+APPOINTMENTS_PAGE_SIZE = int(os.environ.get("APPOINTMENTS_PAGE_SIZE", "50"))
+APPOINTMENTS_MAX_PAGE_SIZE = int(os.environ.get("APPOINTMENTS_MAX_PAGE_SIZE", "200"))
+
+# Appointment change events (SSE): "memory" (per worker) or "file" (shared by workers on one host)
+APPOINTMENT_EVENTS_BACKEND = os.environ.get("APPOINTMENT_EVENTS_BACKEND", "memory")
+APPOINTMENT_EVENTS_FILE = os.environ.get("APPOINTMENT_EVENTS_FILE", "/tmp/vet_clinic_appointment_events.ndjson")
+APPOINTMENT_EVENTS_QUEUE_SIZE = int(os.environ.get("APPOINTMENT_EVENTS_QUEUE_SIZE", "100"))
+APPOINTMENT_EVENTS_KEEPALIVE_SECONDS = int(os.environ.get("APPOINTMENT_EVENTS_KEEPALIVE_SECONDS", "15"))
+
+# Idempotency-Key replay window for POST /api/v1/appointments
+IDEMPOTENCY_KEY_TTL_HOURS = int(os.environ.get("IDEMPOTENCY_KEY_TTL_HOURS", "24"))
+IDEMPOTENCY_KEY_CLEANUP_INTERVAL_MINUTES = int(os.environ.get("IDEMPOTENCY_KEY_CLEANUP_INTERVAL_MINUTES", "60"))
+
+# How long deleted-appointment tombstones are kept for delta sync; older since values get 410
+APPOINTMENT_TOMBSTONE_RETENTION_DAYS = int(os.environ.get("APPOINTMENT_TOMBSTONE_RETENTION_DAYS", "30"))
+APPOINTMENT_TOMBSTONE_CLEANUP_INTERVAL_MINUTES = int(os.environ.get("APPOINTMENT_TOMBSTONE_CLEANUP_INTERVAL_MINUTES", "60"))
+
+# Slot holds taken while booking: "memory" (per worker) or "file" (shared by workers on one host)
+SLOT_HOLD_MINUTES = int(os.environ.get("SLOT_HOLD_MINUTES", "5"))
+SLOT_HOLDS_PER_USER = int(os.environ.get("SLOT_HOLDS_PER_USER", "3"))
+SLOT_HOLDS_BACKEND = os.environ.get("SLOT_HOLDS_BACKEND", "memory")
+SLOT_HOLDS_FILE = os.environ.get("SLOT_HOLDS_FILE", "/tmp/vet_clinic_slot_holds.json")
+
+# Waitlist: how long an offered slot is held for the waiter, the longest date range per entry,
+# and how often lapsed offers are passed on to the next waiter
+WAITLIST_OFFER_MINUTES = int(os.environ.get("WAITLIST_OFFER_MINUTES", "30"))
+WAITLIST_MAX_DAYS = int(os.environ.get("WAITLIST_MAX_DAYS", "31"))
+WAITLIST_EXPIRY_INTERVAL_MINUTES = int(os.environ.get("WAITLIST_EXPIRY_INTERVAL_MINUTES", "1"))
+
 # Handle NeonDB specific SSL requirements
 connect_args = {}
 if DATABASE_URL and "neon.tech" in DATABASE_URL:
@@ -0,0 +1,148 @@
+"""
+Availability engine for appointment slot generation.
+
+This module turns a set of busy intervals into free slots without the
+nested "for each slot, scan every appointment" loop:
+- merge_busy_intervals: Sort busy intervals once and merge overlaps
+- find_free_slots: Emit free candidate slots in one linear sweep
+- index_busy_by_resource: Group busy intervals per resource and merge each group
+- find_free_slots_on_any: Free slots where at least one resource is free
+
+Intervals are half-open ``[start, end)``, so an appointment ending at 09:00
+does not block a slot starting at 09:00. This matches the overlap rule used
+by AppointmentRepository.check_overlap, which stays the check for a single
+requested slot (booking, holds, rescheduling): it asks the database for one
+overlapping row, so there is nothing to gain from loading and merging the
+day's intervals first.
+"""
+
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, Optional, Tuple
+
+Interval = Tuple[datetime, datetime]
+
+
+def merge_busy_intervals(intervals: Iterable[Interval]) -> List[Interval]:
+    """
+    Sort busy intervals and merge the ones that overlap or touch.
+
+    Args:
+        intervals: Iterable of (start, end) pairs in any order
+
+    Returns:
+        Sorted list of disjoint (start, end) pairs
+
+    Example:
+        >>> merge_busy_intervals([(t(10), t(11)), (t(9), t(10))])
+        [(t(9), t(11))]
+    """
+    merged: List[Interval] = []
+    for start, end in sorted(intervals):
+        if merged and start <= merged[-1][1]:
+            if end > merged[-1][1]:
+                merged[-1] = (merged[-1][0], end)
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def find_free_slots(
+    window_start: datetime,
+    window_end: datetime,
+    busy: List[Interval],
+    duration: timedelta,
+    step: timedelta,
+    not_before: Optional[datetime] = None
+) -> List[Interval]:
+    """
+    Generate the free slots of a window in one linear sweep.
+
+    Candidate slots start at window_start and advance by step. Because both
+    the candidates and the merged busy intervals are sorted, a single pointer
+    walks the busy list once, so the cost is O(slots + busy) instead of
+    O(slots * busy).
+
+    Args:
+        window_start: First candidate start time (e.g. clinic opening)
+        window_end: Latest allowed slot end time (e.g. clinic closing)
+        busy: Busy intervals as returned by merge_busy_intervals()
+        duration: Length of each slot
+        step: Distance between consecutive candidate start times
+        not_before: Optional cut-off; candidates starting at or before it are skipped
+
+    Returns:
+        List of free (start, end) slots in chronological order
+    """
+    slots: List[Interval] = []
+    index = 0
+    current_start = window_start
+
+    while current_start + duration <= window_end:
+        slot_end = current_start + duration
+
+        if not_before is None or current_start > not_before:
+            # Skip busy intervals that finish before this candidate starts
+            while index < len(busy) and busy[index][1] <= current_start:
+                index += 1
+
+            if index >= len(busy) or busy[index][0] >= slot_end:
+                slots.append((current_start, slot_end))
+
+        current_start += step
+
+    return slots
+
+
+def index_busy_by_resource(items: Iterable) -> Dict[Optional[int], List[Interval]]:
+    """
+    Group busy intervals by resource and merge each group.
+
+    Args:
+        items: Appointments or slot holds (anything with start_time, end_time
+            and resource_id); a resource_id of None blocks every resource
+
+    Returns:
+        Dict of resource ID (or None) to merged busy intervals
+    """
+    grouped: Dict[Optional[int], List[Interval]] = {}
+    for item in items:
+        grouped.setdefault(item.resource_id, []).append((item.start_time, item.end_time))
+    return {resource_id: merge_busy_intervals(intervals) for resource_id, intervals in grouped.items()}
+
+
+def find_free_slots_on_any(
+    window_start: datetime,
+    window_end: datetime,
+    busy_by_resource: Dict[Optional[int], List[Interval]],
+    resource_ids: Iterable[int],
+    duration: timedelta,
+    step: timedelta,
+    not_before: Optional[datetime] = None
+) -> List[Interval]:
+    """
+    Generate the slots of a window where at least one resource is free.
+
+    Runs one find_free_slots sweep per resource over that resource's own
+    busy intervals, so the cost is O(resources * (slots + busy)) with no
+    extra queries per resource.
+
+    Args:
+        window_start: First candidate start time (e.g. clinic opening)
+        window_end: Latest allowed slot end time (e.g. clinic closing)
+        busy_by_resource: Busy intervals as returned by index_busy_by_resource()
+        resource_ids: Resources that can serve the slot
+        duration: Length of each slot
+        step: Distance between consecutive candidate start times
+        not_before: Optional cut-off; candidates starting at or before it are skipped
+
+    Returns:
+        List of (start, end) slots in chronological order
+    """
+    shared = busy_by_resource.get(None, [])
+    free = set()
+    for resource_id in resource_ids:
+        busy = busy_by_resource.get(resource_id, [])
+        if shared:
+            busy = merge_busy_intervals(busy + shared)
+        free.update(find_free_slots(window_start, window_end, busy, duration, step, not_before))
+    return sorted(free)
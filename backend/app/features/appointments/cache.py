@@ -0,0 +1,198 @@
+"""
+In-process cache for the public available-slots endpoints.
+
+Computed slots are cached per (date, service_type) with a TTL and a
+bounded size (least recently used entries are evicted first). Entries are
+invalidated by the repositories that change availability:
+- AppointmentRepository.create, update, update_appointment_times, delete
+- Clinic status, hours, closures and resource changes (clear everything,
+  through app.infrastructure.availability)
+
+Each worker process has its own cache, so a change made by another worker
+is only seen once the entry expires. Keep the TTL short.
+"""
+
+import threading
+from collections import OrderedDict
+from datetime import date, datetime, timedelta
+from time import monotonic
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import event
+from sqlmodel import Session
+
+from app.core.config import AVAILABILITY_CACHE_TTL_SECONDS, AVAILABILITY_CACHE_MAX_ENTRIES
+from app.infrastructure.availability import on_availability_changed
+
+CacheKey = Tuple[date, str]
+
+# Session.info key holding dates to invalidate again once the transaction commits
+_PENDING_DATES_KEY = "availability_cache_pending_dates"
+
+
+class AvailabilityCache:
+    """
+    Thread-safe TTL + LRU cache of available slots.
+
+    Attributes:
+        ttl_seconds: How long an entry stays valid
+        max_entries: Maximum number of cached (date, service_type) entries
+        hits: Number of lookups answered from the cache
+        misses: Number of lookups that had to be computed
+    """
+
+    def __init__(self, ttl_seconds: float, max_entries: int):
+        """
+        Initialize an empty cache.
+
+        Args:
+            ttl_seconds: How long an entry stays valid
+            max_entries: Maximum number of entries before LRU eviction
+        """
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[CacheKey, Tuple[float, List[dict]]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, target_date: date, service_type: str) -> Optional[List[dict]]:
+        """
+        Look up cached slots and update the hit/miss counters.
+
+        Args:
+            target_date: Date of the slots
+            service_type: Service type the slots were computed for
+
+        Returns:
+            Cached list of slots, or None if missing or expired
+        """
+        key = (target_date, service_type)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= monotonic():
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def set(self, target_date: date, service_type: str, slots: List[dict]) -> None:
+        """
+        Store slots for a date and service type, evicting the oldest entries if full.
+
+        Args:
+            target_date: Date of the slots
+            service_type: Service type the slots were computed for
+            slots: Available slots to cache
+        """
+        if self.max_entries <= 0 or self.ttl_seconds <= 0:
+            return
+        key = (target_date, service_type)
+        with self._lock:
+            self._entries[key] = (monotonic() + self.ttl_seconds, slots)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate_dates(self, dates: Iterable[date]) -> None:
+        """
+        Drop every service type cached for the given dates.
+
+        Args:
+            dates: Dates whose availability changed
+        """
+        dates = set(dates)
+        if not dates:
+            return
+        with self._lock:
+            for key in [key for key in self._entries if key[0] in dates]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        """Drop all entries and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def invalidate_all(self) -> None:
+        """Drop all entries but keep the counters."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, float]:
+        """
+        Return the cache counters.
+
+        Returns:
+            Dict with hits, misses, hit_ratio and current size
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+                "size": len(self._entries),
+            }
+
+
+# Process-wide cache used by AppointmentService
+availability_cache = AvailabilityCache(
+    ttl_seconds=AVAILABILITY_CACHE_TTL_SECONDS,
+    max_entries=AVAILABILITY_CACHE_MAX_ENTRIES
+)
+
+
+@on_availability_changed
+def _invalidate_all_dates() -> None:
+    """Availability listener: clinic status, hours or resources changed every date."""
+    availability_cache.invalidate_all()
+
+
+def dates_between(start_time: datetime, end_time: datetime) -> List[date]:
+    """
+    List every calendar date touched by a time interval.
+
+    Args:
+        start_time: Start of the interval
+        end_time: End of the interval
+
+    Returns:
+        Dates from start_time to end_time, inclusive
+    """
+    dates = []
+    day = start_time.date()
+    while day <= end_time.date():
+        dates.append(day)
+        day += timedelta(days=1)
+    return dates
+
+
+def invalidate_availability(session: Session, dates: Iterable[date]) -> None:
+    """
+    Invalidate cached availability for dates changed in a session.
+
+    Entries are dropped immediately and again when the session commits,
+    so a concurrent request cannot re-cache the pre-commit state.
+
+    Args:
+        session: Session performing the write
+        dates: Dates whose availability changed
+    """
+    dates = set(dates)
+    availability_cache.invalidate_dates(dates)
+
+    pending = session.info.get(_PENDING_DATES_KEY)
+    if pending is None:
+        pending = session.info[_PENDING_DATES_KEY] = set()
+        event.listen(session, "after_commit", _invalidate_pending_dates, once=True)
+    pending.update(dates)
+
+
+def _invalidate_pending_dates(session: Session) -> None:
+    """Session after_commit hook: invalidate dates recorded during the transaction."""
+    availability_cache.invalidate_dates(session.info.pop(_PENDING_DATES_KEY, ()))
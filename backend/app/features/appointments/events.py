@@ -0,0 +1,222 @@
+"""
+Appointment change events for the live dashboard (Server-Sent Events).
+
+AppointmentService queues an event for every create, status change,
+reschedule and delete. Events are published only once the session commits,
+and dropped if it rolls back. The broadcaster fans published events out to
+the asyncio queues of connected SSE clients.
+
+Delivery goes through a pluggable backend from app.infrastructure.events:
+- "memory": events stay in the worker process that produced them (default)
+- "file": workers on the same host share events through an append-only
+  NDJSON file that every worker tails, a local stand-in for a message
+  broker such as Redis pub/sub
+
+Events are best effort: a client that falls behind loses events and should
+re-fetch the list.
+"""
+
+import asyncio
+import json
+import logging
+import threading
+from contextlib import contextmanager
+from typing import Iterator, List, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.core.config import (
+    APPOINTMENT_EVENTS_BACKEND,
+    APPOINTMENT_EVENTS_FILE,
+    APPOINTMENT_EVENTS_QUEUE_SIZE,
+    EVENTS_FILE_MAX_BYTES
+)
+from app.features.appointments.schemas import AppointmentResponse
+from app.infrastructure.events import InMemoryEventBackend, FileEventBackend
+from app.common.utils import get_pht_now
+
+logger = logging.getLogger(__name__)
+
+# Event types pushed to subscribers
+EVENT_TYPES = ("created", "status_changed", "rescheduled", "deleted")
+
+# Session.info key holding events to publish once the transaction commits
+_PENDING_EVENTS_KEY = "appointment_events_pending"
+
+class AppointmentEventBroadcaster:
+    """
+    Fan appointment events out to connected SSE clients.
+
+    Subscribers are asyncio queues bound to the event loop that created
+    them; events may be published from any thread (sync endpoints run in
+    the threadpool).
+
+    Attributes:
+        backend: Backend carrying events between publishers and subscribers
+        queue_size: Maximum undelivered events per subscriber
+    """
+
+    def __init__(self, backend, queue_size: int = 100):
+        """
+        Initialize the broadcaster.
+
+        Args:
+            backend: InMemoryEventBackend, FileEventBackend or compatible
+            queue_size: Maximum undelivered events per subscriber
+        """
+        self.backend = backend
+        self.queue_size = queue_size
+        self._subscribers: List[Tuple[asyncio.AbstractEventLoop, asyncio.Queue]] = []
+        self._lock = threading.Lock()
+        self._started = False
+
+    def publish(self, message: dict) -> None:
+        """
+        Publish an event to every subscriber (in all workers, per backend).
+
+        Args:
+            message: JSON-serializable event
+        """
+        self._ensure_started()
+        self.backend.publish(message)
+
+    @contextmanager
+    def subscribe(self) -> Iterator[asyncio.Queue]:
+        """
+        Register a subscriber queue for the duration of a context.
+
+        Must be called from a running event loop.
+
+        Yields:
+            Queue receiving published events
+        """
+        self._ensure_started()
+        subscriber = (asyncio.get_running_loop(), asyncio.Queue(maxsize=self.queue_size))
+        with self._lock:
+            self._subscribers.append(subscriber)
+        try:
+            yield subscriber[1]
+        finally:
+            with self._lock:
+                self._subscribers.remove(subscriber)
+
+    def subscriber_count(self) -> int:
+        """
+        Count connected subscribers in this process.
+
+        Returns:
+            Number of active subscriptions
+        """
+        with self._lock:
+            return len(self._subscribers)
+
+    def _ensure_started(self) -> None:
+        """Start the backend on first use."""
+        with self._lock:
+            if self._started:
+                return
+            self._started = True
+        self.backend.start(self._deliver)
+
+    def _deliver(self, message: dict) -> None:
+        """Hand an event to every local subscriber's event loop."""
+        with self._lock:
+            subscribers = list(self._subscribers)
+        for loop, queue in subscribers:
+            try:
+                loop.call_soon_threadsafe(_offer, queue, message)
+            except RuntimeError:
+                pass  # Loop already closed; the subscriber is going away
+
+
+def _offer(queue: asyncio.Queue, message: dict) -> None:
+    """Put an event on a subscriber queue, dropping it if the client lags."""
+    try:
+        queue.put_nowait(message)
+    except asyncio.QueueFull:
+        logger.warning("Appointment event dropped for a slow subscriber")
+
+
+def create_backend(name: str):
+    """
+    Create the event backend selected by configuration.
+
+    Args:
+        name: "memory" or "file"
+
+    Returns:
+        Event backend instance
+
+    Raises:
+        ValueError: If the backend name is unknown
+    """
+    if name == "memory":
+        return InMemoryEventBackend()
+    if name == "file":
+        return FileEventBackend(APPOINTMENT_EVENTS_FILE, max_bytes=EVENTS_FILE_MAX_BYTES)
+    raise ValueError(f"Unknown APPOINTMENT_EVENTS_BACKEND: {name}")
+
+
+# Process-wide broadcaster used by AppointmentRepository and the SSE endpoint
+appointment_events = AppointmentEventBroadcaster(
+    create_backend(APPOINTMENT_EVENTS_BACKEND), queue_size=APPOINTMENT_EVENTS_QUEUE_SIZE
+)
+
+
+def build_event(event_type: str, appointment) -> dict:
+    """
+    Build the payload of an appointment change event.
+
+    Args:
+        event_type: One of EVENT_TYPES
+        appointment: Appointment as it is after the change
+
+    Returns:
+        JSON-serializable event
+    """
+    return {
+        "type": event_type,
+        "appointment": AppointmentResponse.model_validate(appointment).model_dump(mode="json"),
+        "occurred_at": get_pht_now().isoformat()
+    }
+
+
+def queue_event(session: Session, message: dict) -> None:
+    """
+    Queue an event to be published when the session commits.
+
+    Args:
+        session: Session performing the change
+        message: Event built with build_event
+    """
+    session.info.setdefault(_PENDING_EVENTS_KEY, []).append(message)
+
+
+def format_sse(message: dict) -> str:
+    """
+    Format an event as a Server-Sent Events message.
+
+    Args:
+        message: Event built with build_event
+
+    Returns:
+        SSE text with the event type and JSON data
+    """
+    return f"event: {message['type']}\ndata: {json.dumps(message)}\n\n"
+
+
+@event.listens_for(Session, "after_commit")
+def _publish_pending_events(session: Session) -> None:
+    """Session after_commit hook: publish events queued during the transaction."""
+    for message in session.info.pop(_PENDING_EVENTS_KEY, ()):
+        try:
+            appointment_events.publish(message)
+        except Exception as e:
+            logger.error(f"Failed to publish appointment event: {str(e)}")
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_pending_events(session: Session) -> None:
+    """Session after_rollback hook: changes were not saved, so drop their events."""
+    session.info.pop(_PENDING_EVENTS_KEY, None)
@@ -0,0 +1,72 @@
+"""Serializers for streaming appointment exports.
+
+Rows from AppointmentRepository.iter_for_export are turned into NDJSON or
+CSV text one batch at a time, so a StreamingResponse can send an export of
+any size without building it in memory.
+"""
+import csv
+import io
+import json
+from datetime import datetime
+from typing import Iterable, Iterator
+import uuid
+
+# Rows per chunk written to the response
+EXPORT_CHUNK_ROWS = 500
+
+EXPORT_MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+}
+
+
+def _to_text(value):
+    """Convert a column value to a JSON/CSV friendly value."""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, uuid.UUID):
+        return str(value)
+    return value
+
+
+def iter_ndjson(rows: Iterable) -> Iterator[str]:
+    """Serialize rows as newline-delimited JSON objects.
+    
+    Args:
+        rows: Rows with named columns (e.g. SQLAlchemy Row objects)
+        
+    Yields:
+        Chunks of NDJSON text
+    """
+    lines = []
+    for row in rows:
+        lines.append(json.dumps({key: _to_text(value) for key, value in row._mapping.items()}))
+        if len(lines) == EXPORT_CHUNK_ROWS:
+            yield "\n".join(lines) + "\n"
+            lines = []
+    if lines:
+        yield "\n".join(lines) + "\n"
+
+
+def iter_csv(rows: Iterable, columns: Iterable[str]) -> Iterator[str]:
+    """Serialize rows as CSV with a header line.
+    
+    Args:
+        rows: Rows in the same column order as columns
+        columns: Column names for the header
+        
+    Yields:
+        Chunks of CSV text
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(columns)
+    count = 0
+    for row in rows:
+        writer.writerow([_to_text(value) for value in row])
+        count += 1
+        if count % EXPORT_CHUNK_ROWS == 0:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+    yield buffer.getvalue()
@@ -0,0 +1,308 @@
+"""
+Short-lived slot holds taken while a client completes a booking.
+
+A hold reserves a time range for SLOT_HOLD_MINUTES. Until it expires (or
+is released, or its owner books), the range counts as busy for everyone
+else in get_available_slots and AppointmentRepository.check_overlap; when
+resources are configured, only on the held resource. Each
+user keeps at most SLOT_HOLDS_PER_USER holds; taking another releases the
+oldest one.
+
+Holds live in a pluggable store:
+- "memory": a dict in the worker process with an expiry heap swept on every
+  access (default, fastest, per worker)
+- "file": a JSON file shared by the workers on the same host, guarded by an
+  exclusive file lock, a local stand-in for a shared store such as Redis
+
+Holds are advisory: they are not persisted across restarts, and the
+database overlap constraint is still what prevents double booking.
+"""
+
+import heapq
+import json
+import os
+import threading
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from typing import Dict, Iterator, List, Optional, Tuple
+import uuid
+
+try:
+    import fcntl
+except ImportError:  # Windows: the file store only locks within one process
+    fcntl = None
+
+from app.core.config import SLOT_HOLDS_BACKEND, SLOT_HOLDS_FILE
+
+
+@dataclass(frozen=True)
+class SlotHold:
+    """
+    A time range reserved by a user.
+
+    Attributes:
+        id: Unique identifier of the hold
+        user_id: User who took the hold
+        start_time: Start of the held range
+        end_time: End of the held range
+        service_type: Service the range was sized for
+        expires_at: When the hold lapses (naive PHT)
+        resource_id: Held vet or room, or None to hold the whole clinic
+            (when no resources are configured)
+    """
+    id: uuid.UUID
+    user_id: uuid.UUID
+    start_time: datetime
+    end_time: datetime
+    service_type: str
+    expires_at: datetime
+    resource_id: Optional[int] = None
+
+    def overlaps(self, start_time: datetime, end_time: datetime) -> bool:
+        """Check whether the hold overlaps a half-open [start_time, end_time) range."""
+        return self.start_time < end_time and self.end_time > start_time
+
+    def shares_resource(self, other: "SlotHold") -> bool:
+        """Check whether two holds compete for a resource (a clinic-wide hold competes with all)."""
+        return self.resource_id is None or other.resource_id is None or self.resource_id == other.resource_id
+
+    def to_dict(self) -> dict:
+        """Serialize the hold to JSON-compatible values."""
+        data = asdict(self)
+        for field in ("id", "user_id"):
+            data[field] = str(data[field])
+        for field in ("start_time", "end_time", "expires_at"):
+            data[field] = data[field].isoformat()
+        return data
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "SlotHold":
+        """Deserialize a hold written by to_dict."""
+        return cls(
+            id=uuid.UUID(data["id"]),
+            user_id=uuid.UUID(data["user_id"]),
+            start_time=datetime.fromisoformat(data["start_time"]),
+            end_time=datetime.fromisoformat(data["end_time"]),
+            service_type=data["service_type"],
+            expires_at=datetime.fromisoformat(data["expires_at"]),
+            resource_id=data.get("resource_id"),
+        )
+
+
+def _place(
+    holds: Dict[uuid.UUID, SlotHold],
+    hold: SlotHold,
+    max_per_user: int
+) -> Optional[List[SlotHold]]:
+    """
+    Add a hold to a table of active holds unless another user holds the range
+    on the same resource.
+
+    The user's own holds overlapping the range are replaced, and the user's
+    oldest holds are released to stay within max_per_user.
+
+    Args:
+        holds: Active holds by ID (modified in place)
+        hold: Hold to add
+        max_per_user: Maximum active holds per user
+
+    Returns:
+        Holds released to make room, or None if the range is held by someone else
+    """
+    if any(
+        other.user_id != hold.user_id
+        and other.overlaps(hold.start_time, hold.end_time)
+        and other.shares_resource(hold)
+        for other in holds.values()
+    ):
+        return None
+
+    own = sorted(
+        (other for other in holds.values() if other.user_id == hold.user_id),
+        key=lambda other: other.expires_at
+    )
+    released = [other for other in own if other.overlaps(hold.start_time, hold.end_time)]
+    remaining = [other for other in own if other not in released]
+    released.extend(remaining[:max(0, len(remaining) - max_per_user + 1)])
+    for other in released:
+        del holds[other.id]
+    holds[hold.id] = hold
+    return released
+
+
+class InMemoryHoldStore:
+    """Keep holds in the worker process, sweeping expired ones on access."""
+
+    def __init__(self):
+        """Initialize an empty store."""
+        self._holds: Dict[uuid.UUID, SlotHold] = {}
+        self._expiry: List[Tuple[datetime, uuid.UUID]] = []
+        self._lock = threading.Lock()
+
+    def place(self, hold: SlotHold, now: datetime, max_per_user: int) -> Optional[List[SlotHold]]:
+        """
+        Take a hold unless another user already holds an overlapping range.
+
+        Args:
+            hold: Hold to take
+            now: Current PHT time
+            max_per_user: Maximum active holds per user
+
+        Returns:
+            Holds released to make room, or None on conflict
+        """
+        with self._lock:
+            self._sweep(now)
+            released = _place(self._holds, hold, max_per_user)
+            if released is not None:
+                heapq.heappush(self._expiry, (hold.expires_at, hold.id))
+            return released
+
+    def get(self, hold_id: uuid.UUID, now: datetime) -> Optional[SlotHold]:
+        """
+        Get an active hold.
+
+        Args:
+            hold_id: ID of the hold
+            now: Current PHT time
+
+        Returns:
+            The hold, or None if it does not exist or has expired
+        """
+        with self._lock:
+            self._sweep(now)
+            return self._holds.get(hold_id)
+
+    def release(self, hold_id: uuid.UUID) -> Optional[SlotHold]:
+        """
+        Release a hold.
+
+        Args:
+            hold_id: ID of the hold
+
+        Returns:
+            The released hold, or None if it did not exist
+        """
+        with self._lock:
+            return self._holds.pop(hold_id, None)
+
+    def overlapping(self, start_time: datetime, end_time: datetime, now: datetime) -> List[SlotHold]:
+        """
+        List active holds overlapping a range.
+
+        Args:
+            start_time: Start of the range
+            end_time: End of the range
+            now: Current PHT time
+
+        Returns:
+            Active holds that overlap [start_time, end_time)
+        """
+        with self._lock:
+            self._sweep(now)
+            return [hold for hold in self._holds.values() if hold.overlaps(start_time, end_time)]
+
+    def _sweep(self, now: datetime) -> None:
+        """Drop holds whose expiry has passed; O(expired * log n)."""
+        while self._expiry and self._expiry[0][0] <= now:
+            _, hold_id = heapq.heappop(self._expiry)
+            hold = self._holds.get(hold_id)
+            if hold is not None and hold.expires_at <= now:
+                del self._holds[hold_id]
+
+
+class FileHoldStore:
+    """
+    Share holds between worker processes through a JSON file.
+
+    Every operation takes an exclusive lock on a sibling ".lock" file, reads
+    the holds, drops expired ones and writes the file back atomically.
+    """
+
+    def __init__(self, path: str):
+        """
+        Initialize the store.
+
+        Args:
+            path: Holds file shared by all workers
+        """
+        self.path = path
+        self._lock = threading.Lock()
+
+    def place(self, hold: SlotHold, now: datetime, max_per_user: int) -> Optional[List[SlotHold]]:
+        """See InMemoryHoldStore.place."""
+        with self._locked(now) as holds:
+            return _place(holds, hold, max_per_user)
+
+    def get(self, hold_id: uuid.UUID, now: datetime) -> Optional[SlotHold]:
+        """See InMemoryHoldStore.get."""
+        with self._locked(now) as holds:
+            return holds.get(hold_id)
+
+    def release(self, hold_id: uuid.UUID) -> Optional[SlotHold]:
+        """See InMemoryHoldStore.release."""
+        with self._locked(None) as holds:
+            return holds.pop(hold_id, None)
+
+    def overlapping(self, start_time: datetime, end_time: datetime, now: datetime) -> List[SlotHold]:
+        """See InMemoryHoldStore.overlapping."""
+        with self._locked(now) as holds:
+            return [hold for hold in holds.values() if hold.overlaps(start_time, end_time)]
+
+    @contextmanager
+    def _locked(self, now: Optional[datetime]) -> Iterator[Dict[uuid.UUID, SlotHold]]:
+        """Yield the active holds under the file lock and save any changes."""
+        with self._lock, open(self.path + ".lock", "a") as lock_file:
+            if fcntl:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+            stored = self._read()
+            holds = {
+                hold.id: hold for hold in stored.values()
+                if now is None or hold.expires_at > now
+            }
+            yield holds
+            if holds != stored:
+                self._write(holds)
+
+    def _read(self) -> Dict[uuid.UUID, SlotHold]:
+        """Load the holds file (empty if missing)."""
+        try:
+            with open(self.path, "r", encoding="utf-8") as holds_file:
+                return {
+                    hold.id: hold
+                    for hold in (SlotHold.from_dict(item) for item in json.load(holds_file))
+                }
+        except FileNotFoundError:
+            return {}
+
+    def _write(self, holds: Dict[uuid.UUID, SlotHold]) -> None:
+        """Replace the holds file atomically."""
+        temp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as holds_file:
+            json.dump([hold.to_dict() for hold in holds.values()], holds_file)
+        os.replace(temp_path, self.path)
+
+
+def create_hold_store(name: str):
+    """
+    Create the hold store selected by configuration.
+
+    Args:
+        name: "memory" or "file"
+
+    Returns:
+        Hold store instance
+
+    Raises:
+        ValueError: If the store name is unknown
+    """
+    if name == "memory":
+        return InMemoryHoldStore()
+    if name == "file":
+        return FileHoldStore(SLOT_HOLDS_FILE)
+    raise ValueError(f"Unknown SLOT_HOLDS_BACKEND: {name}")
+
+
+# Process-wide hold store used by AppointmentService and AppointmentRepository
+slot_holds = create_hold_store(SLOT_HOLDS_BACKEND)
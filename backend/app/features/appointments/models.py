@@ -1,15 +1,25 @@
 """Appointment model for the vet clinic system."""
 from sqlmodel import SQLModel, Field, Relationship
+from sqlalchemy import Column, DDL, Index, Integer, JSON, event, insert, select
 from datetime import datetime
-from typing import Optional, TYPE_CHECKING
+from typing import Any, Dict, Optional, TYPE_CHECKING
 import uuid
 
 from app.common.utils import get_pht_now
+from app.features.resources.models import Resource  # noqa: F401 (resources table for the foreign key)
 
 if TYPE_CHECKING:
     from app.features.pets.models import Pet
     from app.features.users.models import User
 
+# Exclusion constraint that prevents double booking (PostgreSQL only)
+APPOINTMENT_OVERLAP_CONSTRAINT = "appointments_no_overlap"
+
+# Row version for optimistic concurrency. The mapper adds "AND version = :old"
+# to every UPDATE/DELETE and bumps it, raising StaleDataError when another
+# transaction changed the row first.
+_VERSION_COLUMN = Column("version", Integer, nullable=False, server_default="1")
+
 
 class Appointment(SQLModel, table=True):
     """Appointment model representing scheduled visits for pets.
@@ -23,8 +33,11 @@ class Appointment(SQLModel, table=True):
         notes: Optional notes about the appointment
         pet_id: Foreign key to the pet this appointment is for
         user_id: Foreign key to the user who booked the appointment
+        resource_id: Vet or room serving the appointment (None when booked
+            while no resources were configured; such appointments block every resource)
         created_at: Timestamp when the appointment was created
         updated_at: Timestamp when the appointment was last updated
+        version: Row version, incremented on every update (optimistic concurrency)
         pet: Relationship to the Pet this appointment is for
         user: Relationship to the User who booked this appointment
     """
@@ -40,11 +53,111 @@ class Appointment(SQLModel, table=True):
     # Foreign keys
     pet_id: uuid.UUID = Field(foreign_key="pets.id", index=True, ondelete="CASCADE")
     user_id: uuid.UUID = Field(foreign_key="users.id", index=True, ondelete="CASCADE")
+    resource_id: Optional[int] = Field(default=None, foreign_key="resources.id")
     
     # Timestamps
     created_at: datetime = Field(default_factory=get_pht_now)
-    updated_at: datetime = Field(default_factory=get_pht_now)
+    updated_at: datetime = Field(default_factory=get_pht_now, index=True)  # Delta sync reads by this
+    version: int = Field(default=1, sa_column=_VERSION_COLUMN)
     
     # Relationships
     pet: "Pet" = Relationship(back_populates="appointments")
     user: "User" = Relationship()
+    
+    __table_args__ = (
+        # Busy intervals per resource, read when assigning and computing slots
+        Index("ix_appointments_resource_start", "resource_id", "start_time"),
+    )
+    __mapper_args__ = {"version_id_col": _VERSION_COLUMN}
+
+
+# Exclusion constraint body: pending/confirmed appointments on the same
+# resource must not overlap. The resource is compared as a one-point
+# int4range because GiST handles ranges natively, whereas equality on a
+# plain column would need the btree_gist extension. For an appointment
+# without a resource both bounds are NULL, which makes the range unbounded:
+# it overlaps every resource, matching the application rule that such
+# appointments block every resource.
+APPOINTMENT_OVERLAP_EXCLUSION = (
+    "EXCLUDE USING gist ("
+    "int4range(resource_id, resource_id, '[]') WITH &&, "
+    "tsrange(start_time, end_time, '[)') WITH &&"
+    ") WHERE (status IN ('pending', 'confirmed'))"
+)
+
+# PostgreSQL rejects overlapping pending/confirmed appointments on a resource
+# atomically, so two concurrent bookings cannot both pass the availability
+# check. The constraint's GiST index also serves the tsrange overlap queries
+# in AppointmentRepository. Other databases (SQLite in tests) rely on the
+# application checks alone.
+# Existing databases: run migrate_add_appointment_resources.py.
+event.listen(
+    Appointment.__table__,
+    "after_create",
+    DDL(
+        f"ALTER TABLE appointments ADD CONSTRAINT {APPOINTMENT_OVERLAP_CONSTRAINT} "
+        f"{APPOINTMENT_OVERLAP_EXCLUSION}"
+    ).execute_if(dialect="postgresql")
+)
+
+
+class AppointmentTombstone(SQLModel, table=True):
+    """Record of a deleted appointment, used by the delta-sync endpoint.
+    
+    Appointments are hard-deleted, so clients syncing with
+    GET /api/v1/appointments/changes learn about deletions from these rows.
+    
+    Attributes:
+        appointment_id: ID of the deleted appointment
+        owner_id: Owner of the appointment's pet (to scope pet-owner syncs)
+        deleted_at: When the appointment was deleted
+    """
+    __tablename__ = "appointment_tombstones"
+    
+    appointment_id: uuid.UUID = Field(primary_key=True)
+    owner_id: Optional[uuid.UUID] = Field(default=None, index=True)
+    deleted_at: datetime = Field(default_factory=get_pht_now, index=True, nullable=False)
+
+
+@event.listens_for(Appointment, "after_delete")
+def _record_tombstone(mapper, connection, target: Appointment) -> None:
+    """Write a tombstone for every deleted appointment.
+    
+    A mapper event also covers appointments removed by the pet and user
+    delete cascades, not just AppointmentRepository.delete.
+    """
+    from app.features.pets.models import Pet
+    
+    owner_id = connection.execute(
+        select(Pet.owner_id).where(Pet.id == target.pet_id)
+    ).scalar()
+    connection.execute(
+        insert(AppointmentTombstone).values(
+            appointment_id=target.id, owner_id=owner_id, deleted_at=get_pht_now()
+        )
+    )
+
+
+class AppointmentIdempotencyKey(SQLModel, table=True):
+    """Idempotency-Key of a POST /api/v1/appointments request.
+    
+    Stored in the same transaction as the appointment it created, so a
+    retried request with the same key replays response_body instead of
+    booking again. Keys are scoped per user and purged after expires_at.
+    
+    Attributes:
+        user_id: User who sent the request
+        key: Client-chosen Idempotency-Key header value
+        request_hash: SHA-256 of the request payload, to detect key reuse
+        response_body: AppointmentResponse returned for the original request
+        created_at: When the original request was processed
+        expires_at: When the key may be purged
+    """
+    __tablename__ = "appointment_idempotency_keys"
+    
+    user_id: uuid.UUID = Field(foreign_key="users.id", primary_key=True, ondelete="CASCADE")
+    key: str = Field(primary_key=True, max_length=255)
+    request_hash: str = Field(max_length=64, nullable=False)
+    response_body: Optional[Dict[str, Any]] = Field(default=None, sa_column=Column(JSON, nullable=True))
+    created_at: datetime = Field(default_factory=get_pht_now)
+    expires_at: datetime = Field(index=True, nullable=False)
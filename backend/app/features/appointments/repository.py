@@ -1,14 +1,38 @@
 """Appointment repository for database operations."""
 from sqlmodel import Session, select, and_
-from typing import Optional, List
+from sqlalchemy import inspect, func, tuple_, case, delete, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import contains_eager, joinedload
+from typing import Optional, Dict, List, Set, Tuple, Collection, Iterator
 from datetime import datetime
 import uuid
 
-from app.features.appointments.models import Appointment
+from app.features.appointments.models import (
+    Appointment,
+    AppointmentIdempotencyKey,
+    AppointmentTombstone,
+    APPOINTMENT_OVERLAP_CONSTRAINT
+)
+from app.features.appointments.cache import dates_between, invalidate_availability
+from app.features.appointments.events import build_event, queue_event
+from app.features.appointments.holds import slot_holds
 from app.features.pets.models import Pet
+from app.features.users.models import User
 from app.common.utils import get_pht_now
 
 
+def is_overlap_violation(error: IntegrityError) -> bool:
+    """Check whether an IntegrityError was raised by the double-booking constraint.
+    
+    Args:
+        error: IntegrityError raised while flushing an appointment
+        
+    Returns:
+        True if the appointments_no_overlap exclusion constraint was violated
+    """
+    return APPOINTMENT_OVERLAP_CONSTRAINT in str(error.orig)
+
+
 class AppointmentRepository:
     """Repository for Appointment database operations.
     
@@ -39,19 +63,30 @@ class AppointmentRepository:
         self,
         status: Optional[str] = None,
         from_date: Optional[datetime] = None,
-        to_date: Optional[datetime] = None
+        to_date: Optional[datetime] = None,
+        limit: Optional[int] = None,
+        after: Optional[Tuple[datetime, uuid.UUID]] = None,
+        expand: Collection[str] = ()
     ) -> List[Appointment]:
         """Get all appointments with optional filters.
         
+        Results are ordered by (start_time, id) so they can be paged with a
+        keyset cursor.
+        
         Args:
             status: Optional status filter (pending, confirmed, cancelled, completed)
             from_date: Optional filter for appointments starting on or after this date
             to_date: Optional filter for appointments starting on or before this date
+            limit: Optional maximum number of appointments to return
+            after: Optional (start_time, id) of the last appointment already seen
+            expand: Related data to load in the same query ("pet", "owner")
             
         Returns:
             List of Appointment objects matching the filters
         """
         statement = select(Appointment)
+        if expand:
+            statement = statement.options(self._expand_loader(joinedload(Appointment.pet, innerjoin=True), expand))
         
         if status:
             statement = statement.where(Appointment.status == status)
@@ -60,30 +95,158 @@ class AppointmentRepository:
         if to_date:
             statement = statement.where(Appointment.start_time <= to_date)
         
-        return list(self.session.exec(statement).all())
+        return list(self.session.exec(self._page(statement, limit, after)).all())
     
     def get_by_owner_id(
         self,
         owner_id: uuid.UUID,
         status: Optional[str] = None,
         from_date: Optional[datetime] = None,
-        to_date: Optional[datetime] = None
+        to_date: Optional[datetime] = None,
+        limit: Optional[int] = None,
+        after: Optional[Tuple[datetime, uuid.UUID]] = None,
+        expand: Collection[str] = ()
     ) -> List[Appointment]:
         """Get appointments for pets owned by a specific user.
         
         This method joins with the Pet table to filter appointments
-        by the pet's owner_id.
+        by the pet's owner_id. Results are ordered by (start_time, id).
         
         Args:
             owner_id: UUID of the pet owner
             status: Optional status filter (pending, confirmed, cancelled, completed)
             from_date: Optional filter for appointments starting on or after this date
             to_date: Optional filter for appointments starting on or before this date
+            limit: Optional maximum number of appointments to return
+            after: Optional (start_time, id) of the last appointment already seen
+            expand: Related data to load in the same query ("pet", "owner")
             
         Returns:
             List of Appointment objects for pets owned by the user
         """
         statement = select(Appointment).join(Pet).where(Pet.owner_id == owner_id)
+        if expand:
+            # Reuse the ownership join to populate Appointment.pet
+            statement = statement.options(self._expand_loader(contains_eager(Appointment.pet), expand))
+        
+        if status:
+            statement = statement.where(Appointment.status == status)
+        if from_date:
+            statement = statement.where(Appointment.start_time >= from_date)
+        if to_date:
+            statement = statement.where(Appointment.start_time <= to_date)
+        
+        return list(self.session.exec(self._page(statement, limit, after)).all())
+    
+    def get_list_fingerprint(
+        self,
+        owner_id: Optional[uuid.UUID] = None,
+        status: Optional[str] = None,
+        from_date: Optional[datetime] = None,
+        to_date: Optional[datetime] = None,
+        expand: Collection[str] = ()
+    ) -> Tuple:
+        """Get the count and latest modification time of a filtered list.
+        
+        One aggregate query over the same filters as get_all/get_by_owner_id,
+        used to build the list's ETag without loading the appointments.
+        When pets or owners are embedded, their latest updated_at is included
+        so edits to them also change the fingerprint.
+        
+        Args:
+            owner_id: Optional pet owner to restrict the appointments to
+            status: Optional status filter
+            from_date: Optional filter for appointments starting on or after this date
+            to_date: Optional filter for appointments starting on or before this date
+            expand: Embedded related data ("pet", "owner")
+            
+        Returns:
+            Tuple of (count, max(appointments.updated_at)[, max(pets.updated_at)]
+            [, max(users.updated_at)])
+        """
+        columns = [func.count(Appointment.id), func.max(Appointment.updated_at)]
+        if expand:
+            columns.append(func.max(Pet.updated_at))
+        if "owner" in expand:
+            columns.append(func.max(User.updated_at))
+        
+        statement = select(*columns).select_from(Appointment)
+        if owner_id or expand:
+            statement = statement.join(Pet, Appointment.pet_id == Pet.id)
+        if "owner" in expand:
+            statement = statement.join(User, Pet.owner_id == User.id)
+        if owner_id:
+            statement = statement.where(Pet.owner_id == owner_id)
+        
+        if status:
+            statement = statement.where(Appointment.status == status)
+        if from_date:
+            statement = statement.where(Appointment.start_time >= from_date)
+        if to_date:
+            statement = statement.where(Appointment.start_time <= to_date)
+        
+        return tuple(self.session.exec(statement).one())
+    
+    def _expand_loader(self, pet_loader, expand: Collection[str]):
+        """Extend a loader for Appointment.pet with the requested expansions.
+        
+        Appointment.pet and Pet.owner are many-to-one, so they are joined
+        into the list query instead of being lazy-loaded per appointment.
+        
+        Args:
+            pet_loader: Loader option for Appointment.pet
+            expand: Requested expansions ("pet", "owner")
+            
+        Returns:
+            Loader option for the statement
+        """
+        if "owner" in expand:
+            return pet_loader.joinedload(Pet.owner, innerjoin=True)
+        return pet_loader
+    
+    def _page(self, statement, limit: Optional[int], after: Optional[Tuple[datetime, uuid.UUID]]):
+        """Order a list query by (start_time, id) and apply a keyset page.
+        
+        Args:
+            statement: Select statement over appointments
+            limit: Optional maximum number of rows
+            after: Optional (start_time, id) to continue after
+            
+        Returns:
+            Statement restricted to the requested page
+        """
+        if after:
+            statement = statement.where(
+                tuple_(Appointment.start_time, Appointment.id) > tuple(after)
+            )
+        statement = statement.order_by(Appointment.start_time, Appointment.id)
+        if limit is not None:
+            statement = statement.limit(limit)
+        return statement
+    
+    def iter_for_export(
+        self,
+        status: Optional[str] = None,
+        from_date: Optional[datetime] = None,
+        to_date: Optional[datetime] = None,
+        batch_size: int = 1000
+    ) -> Iterator[Tuple]:
+        """Stream appointment rows for export with a server-side cursor.
+        
+        Plain columns are selected (no Appointment objects) and fetched
+        batch_size rows at a time, so memory stays flat however many rows
+        match.
+        
+        Args:
+            status: Optional status filter (pending, confirmed, cancelled, completed)
+            from_date: Optional filter for appointments starting on or after this date
+            to_date: Optional filter for appointments starting on or before this date
+            batch_size: Number of rows fetched from the database per round trip
+            
+        Yields:
+            Rows with the columns of Appointment, ordered by (start_time, id)
+        """
+        statement = select(*Appointment.__table__.columns)
         
         if status:
             statement = statement.where(Appointment.status == status)
@@ -92,37 +255,101 @@ class AppointmentRepository:
         if to_date:
             statement = statement.where(Appointment.start_time <= to_date)
         
+        statement = statement.order_by(
+            Appointment.start_time, Appointment.id
+        ).execution_options(yield_per=batch_size)
+        yield from self.session.exec(statement)
+    
+    def get_changed_since(
+        self,
+        since: datetime,
+        limit: int,
+        owner_id: Optional[uuid.UUID] = None
+    ) -> List[Appointment]:
+        """Get appointments created or modified at or after a timestamp.
+        
+        Served by the index on updated_at.
+        
+        Args:
+            since: Only appointments with updated_at >= since are returned
+            limit: Maximum number of appointments to return
+            owner_id: Optional pet owner to restrict the results to
+            
+        Returns:
+            List of Appointment objects ordered by (updated_at, id)
+        """
+        statement = select(Appointment).where(Appointment.updated_at >= since)
+        if owner_id:
+            statement = statement.join(Pet).where(Pet.owner_id == owner_id)
+        statement = statement.order_by(Appointment.updated_at, Appointment.id).limit(limit)
+        return list(self.session.exec(statement).all())
+    
+    def get_deleted_since(
+        self,
+        since: datetime,
+        limit: int,
+        owner_id: Optional[uuid.UUID] = None
+    ) -> List[AppointmentTombstone]:
+        """Get tombstones of appointments deleted at or after a timestamp.
+        
+        Args:
+            since: Only tombstones with deleted_at >= since are returned
+            limit: Maximum number of tombstones to return
+            owner_id: Optional pet owner to restrict the results to
+            
+        Returns:
+            List of AppointmentTombstone objects ordered by deletion time
+        """
+        statement = select(AppointmentTombstone).where(AppointmentTombstone.deleted_at >= since)
+        if owner_id:
+            statement = statement.where(AppointmentTombstone.owner_id == owner_id)
+        statement = statement.order_by(
+            AppointmentTombstone.deleted_at, AppointmentTombstone.appointment_id
+        ).limit(limit)
         return list(self.session.exec(statement).all())
     
     def check_overlap(
         self,
         start_time: datetime,
         end_time: datetime,
-        exclude_id: Optional[uuid.UUID] = None
+        exclude_id: Optional[uuid.UUID] = None,
+        hold_owner_id: Optional[uuid.UUID] = None
     ) -> bool:
-        """Check if time slot has overlapping pending/confirmed appointments.
+        """Check if time slot has overlapping pending/confirmed appointments or holds.
         
         Two appointments overlap if:
         - One starts before the other ends AND
         - One ends after the other starts
         
         Only considers appointments with status "pending" or "confirmed".
-        Cancelled and completed appointments are ignored.
+        Cancelled and completed appointments are ignored. Active slot holds
+        count as busy too, except those taken by hold_owner_id; they are
+        checked first since they are in memory.
+        
+        This check runs before the write and cannot see concurrent,
+        uncommitted bookings. On PostgreSQL the appointments_no_overlap
+        exclusion constraint enforces the same rule atomically.
         
         Args:
             start_time: Start time of the time slot to check
             end_time: End time of the time slot to check
             exclude_id: Optional appointment ID to exclude from the check
                        (useful when updating an existing appointment)
+            hold_owner_id: Optional user whose own holds do not count as busy
             
         Returns:
-            True if there is an overlapping appointment, False otherwise
+            True if there is an overlapping appointment or hold, False otherwise
         """
+        if any(
+            hold.user_id != hold_owner_id
+            for hold in slot_holds.overlapping(start_time, end_time, get_pht_now())
+        ):
+            return True
+        
         statement = select(Appointment).where(
             and_(
                 Appointment.status.in_(["pending", "confirmed"]),
-                Appointment.start_time < end_time,
-                Appointment.end_time > start_time
+                self._overlaps(start_time, end_time)
             )
         )
         
@@ -132,6 +359,47 @@ class AppointmentRepository:
         result = self.session.exec(statement).first()
         return result is not None
     
+    def get_busy_resource_ids(
+        self,
+        start_time: datetime,
+        end_time: datetime,
+        exclude_id: Optional[uuid.UUID] = None,
+        hold_owner_id: Optional[uuid.UUID] = None
+    ) -> Set[Optional[int]]:
+        """Get the resources that are busy at any point of a time range.
+        
+        Multi-resource counterpart of check_overlap(): one query returns the
+        resource of every overlapping pending/confirmed appointment, and
+        other users' active holds add theirs. None in the result means an
+        appointment or hold without a resource, which blocks every resource.
+        
+        Args:
+            start_time: Start time of the range to check
+            end_time: End time of the range to check
+            exclude_id: Optional appointment ID to ignore (when rescheduling it)
+            hold_owner_id: Optional user whose own holds do not count as busy
+            
+        Returns:
+            Set of busy resource IDs (possibly containing None)
+        """
+        busy = {
+            hold.resource_id
+            for hold in slot_holds.overlapping(start_time, end_time, get_pht_now())
+            if hold.user_id != hold_owner_id
+        }
+        
+        statement = select(Appointment.resource_id).where(
+            and_(
+                Appointment.status.in_(["pending", "confirmed"]),
+                self._overlaps(start_time, end_time)
+            )
+        ).distinct()
+        if exclude_id:
+            statement = statement.where(Appointment.id != exclude_id)
+        
+        busy.update(self.session.exec(statement).all())
+        return busy
+    
     def get_appointments_for_day(
         self,
         day_start: datetime,
@@ -152,11 +420,100 @@ class AppointmentRepository:
         statement = select(Appointment).where(
             and_(
                 Appointment.status.in_(["pending", "confirmed"]),
-                Appointment.start_time < day_end,
-                Appointment.end_time > day_start
+                self._overlaps(day_start, day_end)
             )
         )
         return list(self.session.exec(statement).all())
+
+    def get_appointments_in_range(
+        self,
+        range_start: datetime,
+        range_end: datetime
+    ) -> List[Appointment]:
+        """Get all active appointments (pending/confirmed) within a time window.
+
+        Multi-day counterpart of get_appointments_for_day(): a single query
+        covers the whole window so callers can compute availability for
+        many days without one round trip per day.
+
+        Args:
+            range_start: Start of the window (inclusive)
+            range_end: End of the window (exclusive)
+
+        Returns:
+            List of active Appointment objects ordered by start_time
+        """
+        statement = select(Appointment).where(
+            and_(
+                Appointment.status.in_(["pending", "confirmed"]),
+                self._overlaps(range_start, range_end)
+            )
+        ).order_by(Appointment.start_time)
+        return list(self.session.exec(statement).all())
+
+    def count_by_status_and_service_type(
+        self,
+        day_start: datetime,
+        day_end: datetime
+    ) -> List[Tuple[str, str, bool, int]]:
+        """Count appointments per status and service type in one GROUP BY query.
+        
+        Each group is also split by whether the appointment starts within
+        [day_start, day_end), so daily counters come from the same query.
+        
+        Args:
+            day_start: Start of the day to count separately
+            day_end: End of that day (exclusive)
+            
+        Returns:
+            List of (status, service_type, starts_in_day, count) rows
+        """
+        starts_in_day = case(
+            (and_(Appointment.start_time >= day_start, Appointment.start_time < day_end), True),
+            else_=False
+        ).label("starts_in_day")
+        statement = select(
+            Appointment.status,
+            Appointment.service_type,
+            starts_in_day,
+            func.count()
+        ).group_by(Appointment.status, Appointment.service_type, starts_in_day)
+        return [tuple(row) for row in self.session.exec(statement).all()]
+    
+    def get_calendar_entries(
+        self,
+        range_start: datetime,
+        range_end: datetime,
+        owner_id: Optional[uuid.UUID] = None
+    ) -> List[Tuple[uuid.UUID, datetime, str, str, str]]:
+        """Get lightweight calendar rows for appointments starting in a window.
+        
+        Only the columns the calendar shows are selected (joined to the
+        pet's name), so no Appointment objects are built.
+        
+        Args:
+            range_start: Start of the window (inclusive)
+            range_end: End of the window (exclusive)
+            owner_id: Optional pet owner to restrict the rows to
+            
+        Returns:
+            List of (id, start_time, status, service_type, pet_name) rows
+            ordered by start time
+        """
+        statement = select(
+            Appointment.id,
+            Appointment.start_time,
+            Appointment.status,
+            Appointment.service_type,
+            Pet.name
+        ).join(Pet).where(
+            Appointment.start_time >= range_start,
+            Appointment.start_time < range_end
+        )
+        if owner_id:
+            statement = statement.where(Pet.owner_id == owner_id)
+        statement = statement.order_by(Appointment.start_time, Appointment.id)
+        return [tuple(row) for row in self.session.exec(statement).all()]
     
     def create(self, appointment: Appointment) -> Appointment:
         """Create a new appointment in the database.
@@ -170,6 +527,7 @@ class AppointmentRepository:
         self.session.add(appointment)
         self.session.flush()
         self.session.refresh(appointment)
+        self._invalidate_availability(appointment)
         return appointment
     
     def update(self, appointment: Appointment) -> Appointment:
@@ -182,17 +540,70 @@ class AppointmentRepository:
             Updated Appointment object
         """
         appointment.updated_at = get_pht_now()
+        self._invalidate_availability(appointment)
         self.session.add(appointment)
         self.session.flush()
         self.session.refresh(appointment)
         return appointment
     
+    def bulk_update_status(
+        self,
+        appointment_ids: Collection[uuid.UUID],
+        new_status: str,
+        final_statuses: Collection[str]
+    ) -> List[Appointment]:
+        """Set the status of many appointments with one UPDATE ... RETURNING.
+        
+        Appointments already in a final status are left unchanged by the
+        WHERE clause, so the transition rule holds even against concurrent
+        updates. The version is incremented as an ORM update would, and
+        appointments already loaded in the session are refreshed.
+        
+        Args:
+            appointment_ids: UUIDs of the appointments to update
+            new_status: Status to set
+            final_statuses: Statuses that can no longer change
+            
+        Returns:
+            The updated appointments
+        """
+        if not appointment_ids:
+            return []
+        statement = (
+            update(Appointment)
+            .where(Appointment.id.in_(appointment_ids), Appointment.status.notin_(final_statuses))
+            .values(status=new_status, updated_at=get_pht_now(), version=Appointment.version + 1)
+            .returning(Appointment)
+            .execution_options(synchronize_session=False, populate_existing=True)
+        )
+        updated = list(self.session.execute(statement).scalars().all())
+        dates = set()
+        for appointment in updated:
+            dates.update(dates_between(appointment.start_time, appointment.end_time))
+        invalidate_availability(self.session, dates)
+        return updated
+    
+    def get_statuses(self, appointment_ids: Collection[uuid.UUID]) -> Dict[uuid.UUID, str]:
+        """Get the current status of several appointments in one query.
+        
+        Args:
+            appointment_ids: UUIDs of the appointments
+            
+        Returns:
+            Dict mapping each existing appointment's UUID to its status
+        """
+        if not appointment_ids:
+            return {}
+        statement = select(Appointment.id, Appointment.status).where(Appointment.id.in_(appointment_ids))
+        return dict(self.session.exec(statement).all())
+    
     def delete(self, appointment: Appointment) -> None:
         """Delete an appointment from the database.
         
         Args:
             appointment: Appointment object to delete
         """
+        self._invalidate_availability(appointment)
         self.session.delete(appointment)
         self.session.flush()
     
@@ -213,33 +624,37 @@ class AppointmentRepository:
         self,
         start_time: datetime,
         end_time: datetime,
-        exclude_appointment_id: Optional[uuid.UUID] = None
+        exclude_appointment_id: Optional[uuid.UUID] = None,
+        hold_owner_id: Optional[uuid.UUID] = None
     ) -> bool:
         """Check if a time slot is available for scheduling/rescheduling.
         
-        This method checks for overlapping appointments, excluding the current
-        appointment being rescheduled if provided. Returns True if the slot
-        is available (no overlaps), False if there are conflicts.
+        This method checks for overlapping appointments and slot holds,
+        excluding the current appointment being rescheduled if provided.
+        Returns True if the slot is available (no overlaps), False if there
+        are conflicts.
         
         Args:
             start_time: Start time of the time slot to check
             end_time: End time of the time slot to check
             exclude_appointment_id: Optional appointment ID to exclude from the check
                                    (used when rescheduling an existing appointment)
+            hold_owner_id: Optional user whose own holds do not count as busy
             
         Returns:
             True if the time slot is available (no overlaps), False otherwise
         """
         # check_overlap returns True if there IS an overlap
         # We want to return True if the slot is AVAILABLE (no overlap)
-        has_overlap = self.check_overlap(start_time, end_time, exclude_appointment_id)
+        has_overlap = self.check_overlap(start_time, end_time, exclude_appointment_id, hold_owner_id)
         return not has_overlap
     
     def update_appointment_times(
         self,
         appointment_id: uuid.UUID,
         start_time: datetime,
-        end_time: datetime
+        end_time: datetime,
+        resource_id: Optional[int] = None
     ) -> Appointment:
         """Update appointment start and end times for rescheduling.
         
@@ -250,6 +665,7 @@ class AppointmentRepository:
             appointment_id: UUID of the appointment to update
             start_time: New start time for the appointment
             end_time: New end time for the appointment
+            resource_id: Optional resource to move the appointment to
             
         Returns:
             Updated Appointment object
@@ -261,12 +677,139 @@ class AppointmentRepository:
         if not appointment:
             raise ValueError(f"Appointment with id {appointment_id} not found")
         
+        # Both the old and the new day change availability
+        self._invalidate_availability(appointment)
+        
         appointment.start_time = start_time
         appointment.end_time = end_time
+        if resource_id is not None:
+            appointment.resource_id = resource_id
         appointment.updated_at = get_pht_now()
         
         self.session.add(appointment)
         self.session.flush()
         self.session.refresh(appointment)
+        self._invalidate_availability(appointment)
         
         return appointment
+
+    def _overlaps(self, start_time: datetime, end_time: datetime):
+        """Build the SQL condition for appointments overlapping [start_time, end_time).
+        
+        On PostgreSQL the condition is written as a tsrange overlap (&&) so it
+        can use the GiST index of the appointments_no_overlap constraint
+        instead of two separate btree indexes on start_time and end_time.
+        
+        Args:
+            start_time: Start of the interval (inclusive)
+            end_time: End of the interval (exclusive)
+            
+        Returns:
+            SQLAlchemy boolean expression
+        """
+        if self.session.get_bind().dialect.name == "postgresql":
+            return func.tsrange(Appointment.start_time, Appointment.end_time, "[)").op("&&")(
+                func.tsrange(start_time, end_time, "[)")
+            )
+        return and_(
+            Appointment.start_time < end_time,
+            Appointment.end_time > start_time
+        )
+
+    def queue_event(self, event_type: str, appointment: Appointment) -> None:
+        """Queue an appointment change event, published when the session commits.
+        
+        Args:
+            event_type: created, status_changed, rescheduled or deleted
+            appointment: Appointment as it is after the change
+        """
+        queue_event(self.session, build_event(event_type, appointment))
+    
+    def get_idempotency_key(self, user_id: uuid.UUID, key: str) -> Optional[AppointmentIdempotencyKey]:
+        """Get a stored Idempotency-Key of a user.
+        
+        Args:
+            user_id: UUID of the user who sent the request
+            key: Idempotency-Key header value
+            
+        Returns:
+            Stored key (possibly expired) or None
+        """
+        return self.session.get(AppointmentIdempotencyKey, (user_id, key))
+    
+    def save_idempotency_key(self, record: AppointmentIdempotencyKey) -> AppointmentIdempotencyKey:
+        """Insert or update an Idempotency-Key record.
+        
+        Inserting flushes immediately, so a concurrent request that claimed
+        the same key first fails here with an IntegrityError.
+        
+        Args:
+            record: Key record to store
+            
+        Returns:
+            The stored record
+            
+        Raises:
+            IntegrityError: If the (user_id, key) pair already exists
+        """
+        self.session.add(record)
+        self.session.flush()
+        return record
+    
+    def delete_idempotency_key(self, record: AppointmentIdempotencyKey) -> None:
+        """Delete an Idempotency-Key record.
+        
+        Args:
+            record: Key record to delete
+        """
+        self.session.delete(record)
+        self.session.flush()
+    
+    def remove_expired_idempotency_keys(self) -> int:
+        """Delete every Idempotency-Key whose replay window has passed.
+        
+        Uses a single DELETE statement rather than loading the rows.
+        
+        Returns:
+            Number of keys removed
+        """
+        statement = delete(AppointmentIdempotencyKey).where(
+            AppointmentIdempotencyKey.expires_at < get_pht_now()
+        )
+        result = self.session.exec(statement)
+        self.session.flush()
+        return result.rowcount
+    
+    def remove_expired_tombstones(self, before: datetime) -> int:
+        """Delete tombstones of appointments deleted before a cut-off.
+        
+        Uses a single DELETE statement rather than loading the rows.
+        
+        Args:
+            before: Tombstones with deleted_at earlier than this are removed
+            
+        Returns:
+            Number of tombstones removed
+        """
+        statement = delete(AppointmentTombstone).where(AppointmentTombstone.deleted_at < before)
+        result = self.session.exec(statement)
+        self.session.flush()
+        return result.rowcount
+    
+    def _invalidate_availability(self, appointment: Appointment) -> None:
+        """Invalidate cached available slots for every day the appointment touches.
+        
+        Pending (unflushed) changes to start_time/end_time are inspected so
+        the previous day is invalidated as well as the new one.
+        
+        Args:
+            appointment: Appointment being created, changed or deleted
+        """
+        state = inspect(appointment)
+        starts = [appointment.start_time, *state.attrs.start_time.history.deleted]
+        ends = [appointment.end_time, *state.attrs.end_time.history.deleted]
+        dates = set()
+        for start_time, end_time in zip(starts, ends):
+            if start_time and end_time:
+                dates.update(dates_between(start_time, end_time))
+        invalidate_availability(self.session, dates)
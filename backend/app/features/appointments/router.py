@@ -2,8 +2,21 @@
 Appointment router for API endpoints.
 
 This module implements the HTTP endpoints for appointment management:
+- GET /api/v1/appointments/available-slots: Available slots for one date (public)
+- GET /api/v1/appointments/available-slots/range: Available slots for a date range (public)
+- GET /api/v1/appointments/next-available: Earliest available slots from a point in time (public)
+- GET /api/v1/appointments/available-slots/cache-stats: Availability cache counters (admin only)
+- GET /api/v1/appointments/stats: Dashboard counters by status, service type and today (admin only)
+- GET /api/v1/appointments/calendar: Per-day appointment summaries for a month
+- GET /api/v1/appointments/export: Stream appointments as NDJSON or CSV (admin only)
+- GET /api/v1/appointments/events: Server-Sent Events feed of appointment changes (admin only)
+- GET /api/v1/appointments/changes: Appointments changed or deleted since a timestamp (delta sync)
+- POST /api/v1/appointments/holds: Hold a slot for a few minutes while booking
+- DELETE /api/v1/appointments/holds/{hold_id}: Release a slot hold
 - POST /api/v1/appointments: Create a new appointment
-- GET /api/v1/appointments: List appointments with filters (status, from_date, to_date)
+- GET /api/v1/appointments: List appointments with filters (status, from_date, to_date), keyset-paginated,
+  optionally embedding pet and owner data (expand=pet,owner)
+- PATCH /api/v1/appointments/status: Update the status of many appointments at once (admin only)
 - PATCH /api/v1/appointments/{appointment_id}/status: Update appointment status (admin only)
 - PATCH /api/v1/appointments/{appointment_id}/reschedule: Reschedule an appointment
 - DELETE /api/v1/appointments/{appointment_id}: Cancel/delete an appointment
@@ -14,30 +27,59 @@ their own pets, while admins can access all appointments.
 Requirements: 5.1, 6.1, 7.1, 7.3, 7.4, 7.5
 """
 
-from fastapi import APIRouter, Depends, status, Query
+import asyncio
+from fastapi import APIRouter, Depends, status, Header, Query, Request, Response
+from fastapi.responses import StreamingResponse
 from sqlmodel import Session
 from typing import List, Optional
 from datetime import datetime
 import uuid
 
 from app.core.database import get_session
-from app.common.dependencies import get_current_user, require_role
-from app.features.users.models import User
+from app.core.config import APPOINTMENTS_MAX_PAGE_SIZE, APPOINTMENT_EVENTS_KEEPALIVE_SECONDS
+from app.common.dependencies import AuthenticatedUser, get_current_user, require_role
+from app.common.etag import (
+    LIST_CACHE_CONTROL,
+    etag_matches,
+    make_weak_etag,
+    not_modified,
+    parse_if_match_version,
+    version_etag
+)
 from app.features.appointments.schemas import (
     AppointmentCreateRequest,
     AppointmentUpdateStatusRequest,
+    AppointmentBulkStatusRequest,
+    AppointmentBulkStatusResponse,
     AppointmentReschedule,
-    AppointmentResponse
+    AppointmentResponse,
+    AppointmentExpandedResponse,
+    AppointmentPageResponse,
+    AppointmentStatsResponse,
+    CalendarMonthResponse,
+    AppointmentChangesResponse,
+    AppointmentTombstoneResponse,
+    SlotHoldRequest,
+    SlotHoldResponse
 )
 from app.features.appointments.repository import AppointmentRepository
-from app.features.appointments.service import AppointmentService
+from app.features.appointments.service import AppointmentService, MAX_NEXT_AVAILABLE_LIMIT, parse_expand
+from app.features.appointments.cache import availability_cache
+from app.features.appointments.export import EXPORT_MEDIA_TYPES
+from app.features.appointments.events import appointment_events, format_sse
 from app.features.pets.repository import PetRepository
-from app.features.clinic.repository import ClinicStatusRepository
+from app.features.clinic.repository import ClinicStatusRepository, ClinicScheduleRepository
+from app.features.resources.repository import ResourceRepository
+from app.features.waitlist.repository import WaitlistRepository
+from app.features.waitlist.service import WaitlistService
 from datetime import date as date_type
 
 
 router = APIRouter(prefix="/api/v1/appointments", tags=["Appointments"])
 
+# Response header marking a POST /appointments answered from a stored Idempotency-Key
+IDEMPOTENT_REPLAYED_HEADER = "Idempotent-Replayed"
+
 
 @router.get("/available-slots")
 def get_available_slots(
@@ -48,9 +90,10 @@ def get_available_slots(
     """
     Get available appointment time slots for a given date.
     
-    Returns time slots within clinic operating hours (8:00 AM - 8:00 PM)
-    that don't conflict with existing appointments. Slots are generated
-    in 30-minute increments based on the service type duration.
+    Returns time slots within the clinic's opening hours for the date (see
+    /api/v1/clinic/hours; none on closed dates) that don't conflict with
+    existing appointments. Slots are generated in 30-minute increments
+    based on the service type duration.
     
     No authentication required — anyone can check availability.
     
@@ -67,7 +110,9 @@ def get_available_slots(
     clinic_status_repo = ClinicStatusRepository(session)
     
     appointment_service = AppointmentService(
-        appointment_repo, pet_repo, clinic_status_repo
+        appointment_repo, pet_repo, clinic_status_repo,
+        resource_repo=ResourceRepository(session),
+        schedule_repo=ClinicScheduleRepository(session)
     )
     
     slots = appointment_service.get_available_slots(date, service_type)
@@ -75,10 +120,409 @@ def get_available_slots(
     return slots
 
 
+@router.get("/available-slots/range")
+def get_available_slots_range(
+    start_date: date_type = Query(..., description="First date of the range (YYYY-MM-DD)"),
+    end_date: date_type = Query(..., description="Last date of the range, inclusive (YYYY-MM-DD)"),
+    service_type: str = Query("routine", description="Service type: vaccination, routine, surgery, or emergency"),
+    session: Session = Depends(get_session)
+):
+    """
+    Get available appointment time slots for every day in a date range.
+
+    Used by the week and month pickers so they need one request instead of
+    one per day. Appointments for the whole range are fetched with a single
+    query. The range may span at most 31 days.
+
+    No authentication required — anyone can check availability.
+
+    Args:
+        start_date: First date of the range (YYYY-MM-DD format)
+        end_date: Last date of the range, inclusive (YYYY-MM-DD format)
+        service_type: Type of service to determine slot duration
+        session: Database session
+
+    Returns:
+        List of days, each with its date and available time slots
+
+    Raises:
+        400: If clinic is closed or the range is invalid
+    """
+    appointment_repo = AppointmentRepository(session)
+    pet_repo = PetRepository(session)
+    clinic_status_repo = ClinicStatusRepository(session)
+
+    appointment_service = AppointmentService(
+        appointment_repo, pet_repo, clinic_status_repo,
+        resource_repo=ResourceRepository(session),
+        schedule_repo=ClinicScheduleRepository(session)
+    )
+
+    days = appointment_service.get_available_slots_range(
+        start_date, end_date, service_type
+    )
+    session.commit()
+    return days
+
+
+@router.get("/next-available")
+def get_next_available(
+    service_type: str = Query("routine", description="Service type: vaccination, routine, surgery, or emergency"),
+    after: Optional[datetime] = Query(None, description="Earliest acceptable start time (defaults to now)"),
+    limit: int = Query(1, ge=1, le=MAX_NEXT_AVAILABLE_LIMIT, description="Number of slots to return"),
+    session: Session = Depends(get_session)
+):
+    """
+    Get the earliest available appointment slots from a point in time.
+
+    Replaces calling available-slots day after day. The search scans forward
+    a week per query and stops once enough slots are found, after
+    NEXT_AVAILABLE_MAX_DAYS days, or after NEXT_AVAILABLE_MAX_SECONDS. When
+    fewer than limit slots come back, search again with after set to the day
+    following searched_through.
+
+    No authentication required — anyone can check availability.
+
+    Args:
+        service_type: Type of service to determine slot duration
+        after: Earliest acceptable start time
+        limit: Number of slots to return (1-20)
+        session: Database session
+
+    Returns:
+        The slots found, earliest first, and searched_through, the last date scanned
+
+    Raises:
+        400: If clinic is closed
+    """
+    appointment_service = AppointmentService(
+        AppointmentRepository(session), PetRepository(session), ClinicStatusRepository(session),
+        resource_repo=ResourceRepository(session),
+        schedule_repo=ClinicScheduleRepository(session)
+    )
+
+    result = appointment_service.find_next_available(service_type, after, limit)
+    session.commit()
+    return result
+
+
+@router.get("/available-slots/cache-stats")
+def get_available_slots_cache_stats(
+    current_user: AuthenticatedUser = Depends(require_role(["admin"]))
+):
+    """
+    Get hit/miss counters of the available-slots cache (admin only).
+
+    The counters belong to the worker process that serves the request.
+
+    Args:
+        current_user: Authenticated admin user (from JWT token)
+
+    Returns:
+        Dict with hits, misses, hit_ratio and the number of cached entries
+
+    Raises:
+        401: If authentication fails
+        403: If user is not an admin
+    """
+    return availability_cache.stats()
+
+
+@router.get("/stats", response_model=AppointmentStatsResponse)
+def get_appointment_stats(
+    current_user: AuthenticatedUser = Depends(require_role(["admin"])),
+    session: Session = Depends(get_session)
+) -> AppointmentStatsResponse:
+    """
+    Get appointment counters for the staff dashboard (admin only).
+
+    Counts by status, by service type and for today are computed by one
+    GROUP BY query, so the dashboard no longer needs the full appointment
+    list to show its counters.
+
+    Args:
+        current_user: Authenticated admin user (from JWT token)
+        session: Database session
+
+    Returns:
+        Total, per-status, per-service-type and today's counts
+
+    Raises:
+        401: If authentication fails
+        403: If user is not an admin
+    """
+    appointment_repo = AppointmentRepository(session)
+    pet_repo = PetRepository(session)
+    clinic_status_repo = ClinicStatusRepository(session)
+
+    appointment_service = AppointmentService(
+        appointment_repo, pet_repo, clinic_status_repo
+    )
+
+    return AppointmentStatsResponse(**appointment_service.get_appointment_stats())
+
+
+@router.get("/calendar", response_model=CalendarMonthResponse)
+def get_calendar_month(
+    month: str = Query(..., description="Month to show (YYYY-MM)"),
+    current_user: AuthenticatedUser = Depends(get_current_user),
+    session: Session = Depends(get_session)
+) -> CalendarMonthResponse:
+    """
+    Get compact per-day appointment summaries for a calendar month.
+
+    - Admin users: Summaries cover all appointments
+    - Pet owners: Summaries cover only appointments for their own pets
+
+    Each day lists its counts and a short label (time and pet name) per
+    appointment, built from one query that selects only those columns.
+
+    Args:
+        month: Month in YYYY-MM format
+        current_user: Authenticated user (from JWT token)
+        session: Database session
+
+    Returns:
+        The month and its days that have appointments
+
+    Raises:
+        400: If month is not in YYYY-MM format
+        401: If authentication fails
+    """
+    appointment_repo = AppointmentRepository(session)
+    pet_repo = PetRepository(session)
+    clinic_status_repo = ClinicStatusRepository(session)
+
+    appointment_service = AppointmentService(
+        appointment_repo, pet_repo, clinic_status_repo
+    )
+
+    return CalendarMonthResponse(
+        **appointment_service.get_calendar_month(month, current_user)
+    )
+
+
+@router.get("/changes", response_model=AppointmentChangesResponse)
+def get_appointment_changes(
+    since: datetime = Query(..., description="Return changes at or after this timestamp (next_since of the previous call)"),
+    limit: Optional[int] = Query(None, ge=1, le=APPOINTMENTS_MAX_PAGE_SIZE, description="Maximum changes and deletions per call"),
+    current_user: AuthenticatedUser = Depends(get_current_user),
+    session: Session = Depends(get_session)
+) -> AppointmentChangesResponse:
+    """
+    Get appointments changed or deleted since a timestamp.
+
+    Lets clients keep a local copy of their appointments in sync without
+    re-downloading the list: load the list once, then poll this endpoint
+    with the returned next_since. Consecutive responses overlap by a few
+    seconds, so apply them by appointment ID. When has_more is true, call
+    again immediately. Deletions are kept for
+    APPOINTMENT_TOMBSTONE_RETENTION_DAYS; an older since gets 410 and the
+    client must reload the full list.
+
+    - Admin users: Changes to all appointments
+    - Pet owners: Changes to appointments for their own pets
+
+    Args:
+        since: Timestamp of the previous sync
+        limit: Optional maximum number of changes and of deletions
+        current_user: Authenticated user (from JWT token)
+        session: Database session
+
+    Returns:
+        Changed appointments, deletions, next_since and has_more
+
+    Raises:
+        401: If authentication fails
+        410: If since is older than the deletion retention window
+        422: If since is not a valid timestamp
+    """
+    appointment_repo = AppointmentRepository(session)
+    pet_repo = PetRepository(session)
+    clinic_status_repo = ClinicStatusRepository(session)
+
+    appointment_service = AppointmentService(
+        appointment_repo, pet_repo, clinic_status_repo
+    )
+
+    changes = appointment_service.get_changes(current_user, since, limit)
+    return AppointmentChangesResponse(
+        appointments=[AppointmentResponse.model_validate(apt) for apt in changes["appointments"]],
+        deleted=[AppointmentTombstoneResponse.model_validate(t) for t in changes["deleted"]],
+        next_since=changes["next_since"],
+        has_more=changes["has_more"]
+    )
+
+
+@router.get("/export")
+def export_appointments(
+    format: str = Query("ndjson", description="Export format: ndjson or csv"),
+    status: Optional[str] = Query(None, description="Filter by appointment status"),
+    from_date: Optional[datetime] = Query(None, description="Filter appointments starting on or after this date"),
+    to_date: Optional[datetime] = Query(None, description="Filter appointments starting on or before this date"),
+    current_user: AuthenticatedUser = Depends(require_role(["admin"])),
+    session: Session = Depends(get_session)
+) -> StreamingResponse:
+    """
+    Export appointments as a streamed NDJSON or CSV download (admin only).
+
+    Rows are read with a server-side cursor and written as they arrive,
+    so worker memory stays flat regardless of how much history is exported.
+    Rows are ordered by start time.
+
+    Args:
+        format: Export format (ndjson or csv)
+        status: Optional status filter
+        from_date: Optional start date filter
+        to_date: Optional end date filter
+        current_user: Authenticated admin user (from JWT token)
+        session: Database session
+
+    Returns:
+        Streaming response with one appointment per line
+
+    Raises:
+        400: If the format is not supported
+        401: If authentication fails
+        403: If user is not an admin
+    """
+    appointment_repo = AppointmentRepository(session)
+    pet_repo = PetRepository(session)
+    clinic_status_repo = ClinicStatusRepository(session)
+
+    appointment_service = AppointmentService(
+        appointment_repo, pet_repo, clinic_status_repo
+    )
+
+    chunks = appointment_service.export_appointments(format, status, from_date, to_date)
+    return StreamingResponse(
+        chunks,
+        media_type=EXPORT_MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="appointments.{format}"'}
+    )
+
+
+@router.get("/events")
+async def stream_appointment_events(
+    request: Request,
+    current_user: AuthenticatedUser = Depends(require_role(["admin"])),
+    session: Session = Depends(get_session)
+) -> StreamingResponse:
+    """
+    Stream appointment changes as Server-Sent Events (admin only).
+
+    Pushes created, status_changed, rescheduled and deleted events once
+    the change is committed, so the dashboard can apply deltas instead of
+    re-fetching the list. Each event's data is JSON with the event type,
+    the appointment and the time of the change. A comment line is sent
+    periodically to keep idle connections open.
+
+    Args:
+        request: Incoming request (used to detect disconnects)
+        current_user: Authenticated admin user (from JWT token)
+        session: Database session (only used for authentication)
+
+    Returns:
+        text/event-stream response
+
+    Raises:
+        401: If authentication fails
+        403: If user is not an admin
+    """
+    # Release the pooled connection now; the stream can stay open for hours
+    session.close()
+
+    async def event_stream():
+        with appointment_events.subscribe() as queue:
+            yield ": connected\n\n"
+            while not await request.is_disconnected():
+                try:
+                    message = await asyncio.wait_for(
+                        queue.get(), timeout=APPOINTMENT_EVENTS_KEEPALIVE_SECONDS
+                    )
+                except asyncio.TimeoutError:
+                    yield ": keep-alive\n\n"
+                    continue
+                yield format_sse(message)
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
+@router.post("/holds", response_model=SlotHoldResponse, status_code=status.HTTP_201_CREATED)
+def hold_slot(
+    request: SlotHoldRequest,
+    current_user: AuthenticatedUser = Depends(get_current_user),
+    session: Session = Depends(get_session)
+) -> SlotHoldResponse:
+    """
+    Hold a slot for SLOT_HOLD_MINUTES while the user completes a booking.
+    
+    The held range is reported as busy by the available-slots endpoints and
+    rejected for other users' bookings until it expires, is released, or
+    the holder books it.
+    
+    Args:
+        request: Slot to hold
+        current_user: Authenticated user (from JWT token)
+        session: Database session
+        
+    Returns:
+        The hold, including its ID and expiry
+        
+    Raises:
+        401: If authentication fails
+        400: If the time is in the past, outside clinic hours, or the clinic is closed
+        409: If the slot is already booked or held by another user
+    """
+    appointment_service = AppointmentService(
+        AppointmentRepository(session), PetRepository(session), ClinicStatusRepository(session),
+        resource_repo=ResourceRepository(session),
+        schedule_repo=ClinicScheduleRepository(session)
+    )
+    hold = appointment_service.hold_slot(request.start_time, request.service_type, current_user)
+    return SlotHoldResponse.model_validate(hold)
+
+
+@router.delete("/holds/{hold_id}", status_code=status.HTTP_204_NO_CONTENT)
+def release_slot_hold(
+    hold_id: uuid.UUID,
+    current_user: AuthenticatedUser = Depends(get_current_user),
+    session: Session = Depends(get_session)
+) -> None:
+    """
+    Release a slot hold before it expires.
+    
+    Args:
+        hold_id: ID of the hold
+        current_user: Authenticated user (the holder, or an admin)
+        session: Database session
+        
+    Returns:
+        No content (204 status code)
+        
+    Raises:
+        401: If authentication fails
+        403: If a pet owner releases another user's hold
+        404: If the hold does not exist or has expired
+    """
+    appointment_service = AppointmentService(
+        AppointmentRepository(session), PetRepository(session), ClinicStatusRepository(session)
+    )
+    appointment_service.release_hold(hold_id, current_user)
+
+
 @router.post("", response_model=AppointmentResponse, status_code=status.HTTP_201_CREATED)
 def create_appointment(
     request: AppointmentCreateRequest,
-    current_user: User = Depends(get_current_user),
+    response: Response,
+    idempotency_key: Optional[str] = Header(
+        None, min_length=1, max_length=255, description="Client-chosen key that makes retries safe"
+    ),
+    current_user: AuthenticatedUser = Depends(get_current_user),
     session: Session = Depends(get_session)
 ) -> AppointmentResponse:
     """
@@ -93,19 +537,28 @@ def create_appointment(
     
     The created appointment has status "pending".
     
+    With an Idempotency-Key header, retries of a successful request (same
+    key and payload, within IDEMPOTENCY_KEY_TTL_HOURS) return the original
+    response with an Idempotent-Replayed: true header instead of booking
+    again.
+    
     Args:
         request: Appointment creation request data
+        response: Response used to set the Idempotent-Replayed header
+        idempotency_key: Optional Idempotency-Key header value
         current_user: Authenticated user (from JWT token)
         session: Database session
         
     Returns:
-        Created appointment
+        Created appointment (or the original one for a replayed key)
         
     Raises:
         401: If authentication fails
         403: If pet owner tries to book for another user's pet
         404: If pet doesn't exist
-        400: If validation fails (past time, clinic closed, overlap)
+        400: If validation fails (past time, clinic closed, overlap) or the
+            Idempotency-Key was used with a different payload
+        409: If a request with the same Idempotency-Key is still in progress
         422: If request data is invalid
         
     Requirements: 5.1, 5.2, 5.3, 5.4, 5.5, 5.10, 5.11, 5.12
@@ -115,9 +568,25 @@ def create_appointment(
     clinic_status_repo = ClinicStatusRepository(session)
     
     appointment_service = AppointmentService(
-        appointment_repo, pet_repo, clinic_status_repo
+        appointment_repo, pet_repo, clinic_status_repo,
+        resource_repo=ResourceRepository(session),
+        schedule_repo=ClinicScheduleRepository(session)
     )
     
+    if idempotency_key:
+        body, replayed = appointment_service.create_appointment_idempotent(
+            idempotency_key=idempotency_key,
+            pet_id=request.pet_id,
+            start_time=request.start_time,
+            service_type=request.service_type,
+            notes=request.notes,
+            current_user=current_user
+        )
+        session.commit()
+        if replayed:
+            response.headers[IDEMPOTENT_REPLAYED_HEADER] = "true"
+        return AppointmentResponse.model_validate(body)
+    
     appointment = appointment_service.create_appointment(
         pet_id=request.pet_id,
         start_time=request.start_time,
@@ -130,16 +599,21 @@ def create_appointment(
     return AppointmentResponse.model_validate(appointment)
 
 
-@router.get("", response_model=List[AppointmentResponse])
+@router.get("", response_model=AppointmentPageResponse, response_model_exclude_unset=True)
 def get_appointments(
+    request: Request,
+    response: Response,
     status: Optional[str] = Query(None, description="Filter by appointment status"),
     from_date: Optional[datetime] = Query(None, description="Filter appointments starting on or after this date"),
     to_date: Optional[datetime] = Query(None, description="Filter appointments starting on or before this date"),
-    current_user: User = Depends(get_current_user),
+    limit: Optional[int] = Query(None, ge=1, le=APPOINTMENTS_MAX_PAGE_SIZE, description="Page size"),
+    cursor: Optional[str] = Query(None, description="next_cursor of the previous page"),
+    expand: Optional[str] = Query(None, description="Comma-separated related data to embed: pet, owner"),
+    current_user: AuthenticatedUser = Depends(get_current_user),
     session: Session = Depends(get_session)
-) -> List[AppointmentResponse]:
+) -> AppointmentPageResponse:
     """
-    Get appointments with optional filters.
+    Get one page of appointments with optional filters.
     
     - Admin users: Returns all appointments in the system
     - Pet owners: Returns only appointments for pets owned by the authenticated user
@@ -151,17 +625,34 @@ def get_appointments(
     
     Multiple filters can be combined.
     
+    Appointments are ordered by start time. When more appointments match,
+    the response carries an opaque ``next_cursor``; pass it back as
+    ``cursor`` with the same filters. It is null on the last page.
+    
+    Responses carry a weak ETag computed in SQL from the count and latest
+    updated_at of the filtered appointments; a matching If-None-Match
+    header gets 304 Not Modified without loading the appointments.
+    
+    ``expand=pet,owner`` embeds each appointment's pet and the pet owner's
+    contact details, loaded in the same query as the appointments.
+    
     Args:
+        request: Incoming request (If-None-Match header and query string)
+        response: Response used to set the ETag header
         status: Optional status filter
         from_date: Optional start date filter
         to_date: Optional end date filter
+        limit: Optional page size (capped at APPOINTMENTS_MAX_PAGE_SIZE)
+        cursor: Optional cursor of the next page
+        expand: Optional comma-separated expansions (pet, owner)
         current_user: Authenticated user (from JWT token)
         session: Database session
         
     Returns:
-        List of appointments matching the filters
+        Appointments on this page and the next cursor, or 304 Not Modified
         
     Raises:
+        400: If the cursor or an expansion is invalid
         401: If authentication fails
         
     Requirements: 7.1, 7.2, 7.3, 7.4, 7.5, 7.6
@@ -174,21 +665,104 @@ def get_appointments(
         appointment_repo, pet_repo, clinic_status_repo
     )
     
-    appointments = appointment_service.get_appointments(
+    expansions = parse_expand(expand)
+    etag = make_weak_etag(
+        *appointment_service.get_appointments_fingerprint(
+            current_user, status, from_date, to_date, expansions
+        ),
+        current_user.id,
+        request.url.query
+    )
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return not_modified(etag)
+    
+    appointments, next_cursor = appointment_service.get_appointments(
         current_user=current_user,
         status=status,
         from_date=from_date,
-        to_date=to_date
+        to_date=to_date,
+        limit=limit,
+        cursor=cursor,
+        expand=expansions
     )
     
-    return [AppointmentResponse.model_validate(apt) for apt in appointments]
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = LIST_CACHE_CONTROL
+    return AppointmentPageResponse(
+        items=[
+            AppointmentExpandedResponse.from_appointment(apt, expansions)
+            for apt in appointments
+        ],
+        next_cursor=next_cursor
+    )
+
+
+@router.patch("/status", response_model=AppointmentBulkStatusResponse)
+def bulk_update_appointment_status(
+    request: AppointmentBulkStatusRequest,
+    current_user: AuthenticatedUser = Depends(require_role(["admin"])),
+    session: Session = Depends(get_session)
+) -> AppointmentBulkStatusResponse:
+    """
+    Update the status of many appointments at once (admin only).
+    
+    Used to confirm the day's pending appointments in one request instead of
+    one PATCH per appointment. The transition rules of the single-appointment
+    endpoint apply to each appointment, and all changes are written with one
+    UPDATE. Appointments that cannot change are reported per item and do
+    not fail the request.
+    
+    Args:
+        request: Appointment UUIDs (1-200) and the new status
+        current_user: Authenticated admin user (from JWT token)
+        session: Database session
+        
+    Returns:
+        Number of appointments updated and one result per appointment
+        
+    Raises:
+        401: If authentication fails
+        403: If user is not an admin
+        422: If request data is invalid
+        
+    Example Request:
+        {
+            "ids": ["3fa85f64-5717-4562-b3fc-2c963f66afa6", "..."],
+            "status": "confirmed"
+        }
+        
+    Example Response:
+        {
+            "updated": 1,
+            "results": [
+                {"id": "3fa85f64-...", "ok": true, "status": "confirmed", "version": 2},
+                {"id": "...", "ok": false, "status": "cancelled",
+                 "error": "Cannot change status of cancelled appointment"}
+            ]
+        }
+    """
+    appointment_repo = AppointmentRepository(session)
+    pet_repo = PetRepository(session)
+    
+    appointment_service = AppointmentService(
+        appointment_repo, pet_repo, ClinicStatusRepository(session),
+        WaitlistService(WaitlistRepository(session), pet_repo, appointment_repo),
+        resource_repo=ResourceRepository(session),
+        schedule_repo=ClinicScheduleRepository(session)
+    )
+    
+    result = appointment_service.bulk_update_status(request.ids, request.status.value, current_user)
+    session.commit()
+    return AppointmentBulkStatusResponse.model_validate(result)
 
 
 @router.patch("/{appointment_id}/status", response_model=AppointmentResponse)
 def update_appointment_status(
     appointment_id: uuid.UUID,
     request: AppointmentUpdateStatusRequest,
-    current_user: User = Depends(require_role(["admin"])),
+    response: Response,
+    if_match: Optional[str] = Header(None, description="Appointment version the change is based on"),
+    current_user: AuthenticatedUser = Depends(require_role(["admin"])),
     session: Session = Depends(get_session)
 ) -> AppointmentResponse:
     """
@@ -204,9 +778,15 @@ def update_appointment_status(
     - Cannot change status of cancelled appointments
     - Cannot cancel completed appointments
     
+    Send the appointment's version in If-Match (e.g. `If-Match: "3"`) to
+    make sure the change is based on the latest state. The response ETag
+    carries the new version.
+    
     Args:
         appointment_id: UUID of the appointment to update
         request: Status update request data
+        response: Response used to set the ETag header
+        if_match: Expected appointment version (optional)
         current_user: Authenticated admin user (from JWT token)
         session: Database session
         
@@ -217,7 +797,8 @@ def update_appointment_status(
         401: If authentication fails
         403: If user is not an admin
         404: If appointment doesn't exist
-        400: If status transition is invalid
+        400: If status transition is invalid or If-Match is malformed
+        409: If the appointment was modified since the If-Match version
         422: If request data is invalid
         
     Requirements: 6.1, 6.2, 6.3, 6.4, 6.5, 6.6
@@ -227,16 +808,21 @@ def update_appointment_status(
     clinic_status_repo = ClinicStatusRepository(session)
     
     appointment_service = AppointmentService(
-        appointment_repo, pet_repo, clinic_status_repo
+        appointment_repo, pet_repo, clinic_status_repo,
+        WaitlistService(WaitlistRepository(session), pet_repo, appointment_repo),
+        resource_repo=ResourceRepository(session),
+        schedule_repo=ClinicScheduleRepository(session)
     )
     
     appointment = appointment_service.update_appointment_status(
         appointment_id=appointment_id,
         new_status=request.status,
-        current_user=current_user
+        current_user=current_user,
+        expected_version=parse_if_match_version(if_match)
     )
     
     session.commit()
+    response.headers["ETag"] = version_etag(appointment.version)
     return AppointmentResponse.model_validate(appointment)
 
 
@@ -244,7 +830,9 @@ def update_appointment_status(
 def reschedule_appointment(
     appointment_id: uuid.UUID,
     reschedule_data: AppointmentReschedule,
-    current_user: User = Depends(get_current_user),
+    response: Response,
+    if_match: Optional[str] = Header(None, description="Appointment version the change is based on"),
+    current_user: AuthenticatedUser = Depends(get_current_user),
     session: Session = Depends(get_session)
 ) -> AppointmentResponse:
     """
@@ -270,6 +858,8 @@ def reschedule_appointment(
     - **appointment_id** (path): UUID of the appointment to reschedule
     - **Authorization header**: Required. Must contain a valid Bearer token
       - Format: `Authorization: Bearer <token>`
+    - **If-Match header**: Optional. The appointment `version` the change is based on
+      - Format: `If-Match: "3"`; the response ETag carries the new version
     
     **Request Body:**
     ```json
@@ -300,7 +890,8 @@ def reschedule_appointment(
         "status": "scheduled",
         "notes": "Annual checkup",
         "created_at": "2024-01-15T10:30:00Z",
-        "updated_at": "2024-01-20T16:45:00Z"
+        "updated_at": "2024-01-20T16:45:00Z",
+        "version": 4
     }
     ```
     
@@ -318,6 +909,8 @@ def reschedule_appointment(
     - **409 Conflict**: 
       - New time slot conflicts with an existing appointment (double booking)
       - Message: "The requested time slot is not available"
+      - The appointment was modified since the If-Match version
+      - Message: "Appointment was modified by another request; reload and try again"
     - **422 Unprocessable Entity**: 
       - Validation fails for the request data
       - Messages:
@@ -374,24 +967,29 @@ def reschedule_appointment(
     clinic_status_repo = ClinicStatusRepository(session)
     
     appointment_service = AppointmentService(
-        appointment_repo, pet_repo, clinic_status_repo
+        appointment_repo, pet_repo, clinic_status_repo,
+        WaitlistService(WaitlistRepository(session), pet_repo, appointment_repo),
+        resource_repo=ResourceRepository(session),
+        schedule_repo=ClinicScheduleRepository(session)
     )
     
     appointment = appointment_service.reschedule_appointment(
         appointment_id=appointment_id,
         user_id=current_user.id,
         new_start=reschedule_data.start_time,
-        new_end=reschedule_data.end_time
+        new_end=reschedule_data.end_time,
+        expected_version=parse_if_match_version(if_match)
     )
     
     session.commit()
+    response.headers["ETag"] = version_etag(appointment.version)
     return AppointmentResponse.model_validate(appointment)
 
 
 @router.delete("/{appointment_id}", status_code=status.HTTP_204_NO_CONTENT)
 def cancel_appointment(
     appointment_id: uuid.UUID,
-    current_user: User = Depends(get_current_user),
+    current_user: AuthenticatedUser = Depends(get_current_user),
     session: Session = Depends(get_session)
 ) -> None:
     """
@@ -423,7 +1021,10 @@ def cancel_appointment(
     clinic_status_repo = ClinicStatusRepository(session)
     
     appointment_service = AppointmentService(
-        appointment_repo, pet_repo, clinic_status_repo
+        appointment_repo, pet_repo, clinic_status_repo,
+        WaitlistService(WaitlistRepository(session), pet_repo, appointment_repo),
+        resource_repo=ResourceRepository(session),
+        schedule_repo=ClinicScheduleRepository(session)
     )
     
     appointment_service.cancel_appointment(appointment_id, current_user)
@@ -4,17 +4,27 @@ Appointment request and response schemas for the Vet Clinic Scheduling System.
 This module defines Pydantic schemas for appointment-related API operations:
 - AppointmentCreateRequest: Schema for creating a new appointment
 - AppointmentUpdateStatusRequest: Schema for updating appointment status
+- AppointmentBulkStatusRequest / AppointmentBulkStatusResponse: Status update of many appointments
 - AppointmentReschedule: Schema for rescheduling an appointment
 - AppointmentResponse: Schema for appointment responses
+- AppointmentExpandedResponse: Appointment response with embedded pet and owner
+- AppointmentStatsResponse: Dashboard counters for the admin stats endpoint
+- CalendarMonthResponse: Compact per-day summaries for the calendar view
+- AppointmentChangesResponse: Changed and deleted appointments for delta sync
 
 Requirements: 5.1, 6.1, 6.2
 """
 
 from pydantic import BaseModel, Field, field_validator
 from datetime import datetime
-from typing import Optional
+from typing import Dict, List, Optional, Collection
 import uuid
 
+from app.common.enums import AppointmentStatus
+
+# Most appointments one bulk status update may change
+MAX_BULK_STATUS_IDS = 200
+
 
 class AppointmentCreateRequest(BaseModel):
     """
@@ -62,6 +72,53 @@ class AppointmentUpdateStatusRequest(BaseModel):
     status: str = Field(..., description="New status: confirmed, completed, or cancelled")
 
 
+class AppointmentBulkStatusRequest(BaseModel):
+    """
+    Request schema for updating the status of many appointments at once.
+    
+    The same transition rules as the single-appointment endpoint apply to
+    each appointment.
+    
+    Attributes:
+        ids: UUIDs of the appointments to update (1-200)
+        status: New status for all of them
+    """
+    ids: List[uuid.UUID] = Field(
+        ..., min_length=1, max_length=MAX_BULK_STATUS_IDS, description="UUIDs of the appointments to update"
+    )
+    status: AppointmentStatus = Field(..., description="New status: confirmed, completed, or cancelled")
+
+
+class AppointmentBulkStatusResult(BaseModel):
+    """
+    Outcome of a bulk status update for one appointment.
+    
+    Attributes:
+        id: UUID of the appointment
+        ok: Whether the status was changed
+        status: Status after the request (unchanged status when ok is false)
+        version: New version of an updated appointment
+        error: Why the appointment was not updated
+    """
+    id: uuid.UUID
+    ok: bool
+    status: Optional[str] = None
+    version: Optional[int] = None
+    error: Optional[str] = None
+
+
+class AppointmentBulkStatusResponse(BaseModel):
+    """
+    Response schema for a bulk status update.
+    
+    Attributes:
+        updated: Number of appointments whose status changed
+        results: One result per requested appointment, in request order
+    """
+    updated: int
+    results: List[AppointmentBulkStatusResult]
+
+
 class AppointmentReschedule(BaseModel):
     """
     Request schema for rescheduling an appointment.
@@ -116,6 +173,8 @@ class AppointmentResponse(BaseModel):
         notes: Optional notes about the appointment
         created_at: Timestamp when the appointment was created
         updated_at: Timestamp when the appointment was last updated
+        version: Row version; send it back in If-Match when updating
+        resource_id: Vet or room serving the appointment, if resources are configured
     
     Requirements: 5.1, 6.1
     """
@@ -129,6 +188,237 @@ class AppointmentResponse(BaseModel):
     notes: Optional[str]
     created_at: datetime
     updated_at: datetime
+    version: int
+    resource_id: Optional[int] = None
+    
+    class Config:
+        """Pydantic configuration."""
+        from_attributes = True
+
+
+class AppointmentPetSummary(BaseModel):
+    """
+    Pet details embedded in an expanded appointment.
+    
+    Attributes:
+        id: Unique identifier for the pet
+        name: Pet's name
+        species: Type of animal
+        breed: Specific breed (optional)
+    """
+    id: uuid.UUID
+    name: str
+    species: str
+    breed: Optional[str]
+    
+    class Config:
+        """Pydantic configuration."""
+        from_attributes = True
+
+
+class AppointmentOwnerSummary(BaseModel):
+    """
+    Pet owner contact details embedded in an expanded appointment.
+    
+    Attributes:
+        id: Unique identifier for the owner
+        full_name: Owner's full name
+        email: Owner's email address
+        phone: Owner's phone number (optional)
+    """
+    id: uuid.UUID
+    full_name: str
+    email: str
+    phone: Optional[str]
+    
+    class Config:
+        """Pydantic configuration."""
+        from_attributes = True
+
+
+class AppointmentExpandedResponse(AppointmentResponse):
+    """
+    Appointment response with optional embedded pet and owner data.
+    
+    Returned by GET /api/v1/appointments?expand=pet,owner so the staff
+    dashboard does not have to download all pets and users to join them
+    client-side. Fields that were not requested are omitted.
+    
+    Attributes:
+        pet: The appointment's pet (when "pet" is expanded)
+        owner: The pet's owner (when "owner" is expanded)
+    """
+    pet: Optional[AppointmentPetSummary] = None
+    owner: Optional[AppointmentOwnerSummary] = None
+    
+    @classmethod
+    def from_appointment(cls, appointment, expand: Collection[str]) -> "AppointmentExpandedResponse":
+        """
+        Build a response from an appointment whose pet (and owner) are loaded.
+        
+        Args:
+            appointment: Appointment loaded with the requested expansions
+            expand: Requested expansions ("pet", "owner")
+            
+        Returns:
+            Response with only the requested related data set
+        """
+        extra = {}
+        if "pet" in expand:
+            extra["pet"] = AppointmentPetSummary.model_validate(appointment.pet)
+        if "owner" in expand:
+            extra["owner"] = AppointmentOwnerSummary.model_validate(appointment.pet.owner)
+        return cls(**AppointmentResponse.model_validate(appointment).model_dump(), **extra)
+
+
+class AppointmentPageResponse(BaseModel):
+    """
+    Response schema for one page of the appointment list.
+    
+    Attributes:
+        items: Appointments on this page, ordered by (start_time, id)
+        next_cursor: Opaque cursor of the next page, or None on the last page
+    """
+    items: List[AppointmentExpandedResponse]
+    next_cursor: Optional[str] = None
+
+
+class AppointmentDayStats(BaseModel):
+    """
+    Counters for appointments starting on a single day.
+    
+    Attributes:
+        total: Number of appointments starting that day
+        by_status: Count per appointment status
+    """
+    total: int
+    by_status: Dict[str, int]
+
+
+class AppointmentStatsResponse(BaseModel):
+    """
+    Response schema for the admin dashboard statistics.
+    
+    Attributes:
+        total: Number of appointments in the system
+        by_status: Count per appointment status
+        by_service_type: Count per service type
+        today: Counters for appointments starting today
+    """
+    total: int
+    by_status: Dict[str, int]
+    by_service_type: Dict[str, int]
+    today: AppointmentDayStats
+
+
+class CalendarAppointmentLabel(BaseModel):
+    """
+    Short label for one appointment in the calendar view.
+    
+    Attributes:
+        id: Unique identifier for the appointment
+        time: Start time of day (HH:MM)
+        pet_name: Name of the pet
+        status: Current status
+        service_type: Type of service
+    """
+    id: uuid.UUID
+    time: str
+    pet_name: str
+    status: str
+    service_type: str
+
+
+class CalendarDay(BaseModel):
+    """
+    Summary of the appointments starting on one day.
+    
+    Attributes:
+        date: The day (YYYY-MM-DD)
+        total: Number of appointments that day
+        by_status: Count per status (only statuses present that day)
+        appointments: Labels ordered by start time
+    """
+    date: str
+    total: int
+    by_status: Dict[str, int]
+    appointments: List[CalendarAppointmentLabel]
+
+
+class CalendarMonthResponse(BaseModel):
+    """
+    Response schema for the calendar month endpoint.
+    
+    Attributes:
+        month: The month (YYYY-MM)
+        days: Days that have appointments, in date order
+    """
+    month: str
+    days: List[CalendarDay]
+
+
+class AppointmentTombstoneResponse(BaseModel):
+    """
+    Deleted appointment reported by the delta-sync endpoint.
+    
+    Attributes:
+        appointment_id: ID of the deleted appointment
+        deleted_at: When the appointment was deleted
+    """
+    appointment_id: uuid.UUID
+    deleted_at: datetime
+    
+    class Config:
+        """Pydantic configuration."""
+        from_attributes = True
+
+
+class AppointmentChangesResponse(BaseModel):
+    """
+    Response schema for the delta-sync endpoint.
+    
+    Attributes:
+        appointments: Appointments created or modified since the cursor
+        deleted: Appointments deleted since the cursor
+        next_since: Value to pass as ``since`` on the next call
+        has_more: Whether more changes are waiting (call again right away)
+    """
+    appointments: List[AppointmentResponse]
+    deleted: List[AppointmentTombstoneResponse]
+    next_since: datetime
+    has_more: bool
+
+
+class SlotHoldRequest(BaseModel):
+    """
+    Request schema for holding a slot while completing a booking.
+    
+    Attributes:
+        start_time: When the slot starts (must be in the future)
+        service_type: Type of service, which determines the slot length
+    """
+    start_time: datetime = Field(..., description="When the slot starts (must be in the future)")
+    service_type: str = Field(..., description="Type of service: vaccination, routine, surgery, or emergency")
+
+
+class SlotHoldResponse(BaseModel):
+    """
+    Response schema for a slot hold.
+    
+    Attributes:
+        id: Unique identifier of the hold (used to release it)
+        start_time: Start of the held slot
+        end_time: End of the held slot
+        service_type: Service the slot was sized for
+        expires_at: When the hold lapses unless the slot is booked
+        resource_id: Vet or room held, if resources are configured
+    """
+    id: uuid.UUID
+    start_time: datetime
+    end_time: datetime
+    service_type: str
+    expires_at: datetime
+    resource_id: Optional[int] = None
     
     class Config:
         """Pydantic configuration."""
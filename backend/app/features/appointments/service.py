@@ -1,24 +1,116 @@
 """Appointment service for business logic."""
 from datetime import datetime, date, time, timedelta
-from typing import List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple, FrozenSet
+from time import monotonic
+import hashlib
+import json
 import uuid
 
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm.exc import StaleDataError
 
-from app.features.appointments.models import Appointment
-from app.features.appointments.repository import AppointmentRepository
+from app.features.appointments.models import Appointment, AppointmentIdempotencyKey
+from app.features.appointments.schemas import AppointmentResponse
+from app.features.appointments.repository import AppointmentRepository, is_overlap_violation
+from app.features.appointments.availability import (
+    merge_busy_intervals,
+    find_free_slots,
+    find_free_slots_on_any,
+    index_busy_by_resource
+)
+from app.features.appointments.cache import availability_cache, dates_between
+from app.features.appointments.holds import SlotHold, slot_holds
+from app.features.appointments.export import EXPORT_MEDIA_TYPES, iter_ndjson, iter_csv
 from app.features.pets.repository import PetRepository
-from app.features.clinic.repository import ClinicStatusRepository
-from app.features.users.models import User
+from app.features.clinic.repository import ClinicStatusRepository, ClinicScheduleRepository
+from app.features.clinic.schedule import DEFAULT_SCHEDULE, DaySchedule, clinic_schedule
+from app.features.resources.models import Resource
+from app.features.resources.repository import ResourceRepository
+from app.features.waitlist.service import WaitlistService
 from app.common.exceptions import (
     NotFoundException,
     ForbiddenException,
-    BadRequestException
+    BadRequestException,
+    TimeSlotUnavailableException,
+    AppointmentVersionConflictException,
+    IdempotencyKeyInProgressException,
+    ChangesExpiredException
+)
+from app.common.enums import AppointmentStatus, ServiceType
+from app.common.utils import calculate_end_time, SERVICE_DURATIONS, get_pht_now, PHT
+from app.common.pagination import encode_cursor, decode_cursor
+from app.common.dependencies import AuthenticatedUser
+from app.core.config import (
+    APPOINTMENTS_PAGE_SIZE,
+    APPOINTMENTS_MAX_PAGE_SIZE,
+    APPOINTMENT_TOMBSTONE_RETENTION_DAYS,
+    IDEMPOTENCY_KEY_TTL_HOURS,
+    NEXT_AVAILABLE_MAX_DAYS,
+    NEXT_AVAILABLE_MAX_SECONDS,
+    SLOT_HOLD_MINUTES,
+    SLOT_HOLDS_PER_USER
 )
-from app.common.utils import calculate_end_time, SERVICE_DURATIONS, get_pht_now
 
-# Clinic operating hours
-CLINIC_OPEN_HOUR = 8   # 8:00 AM
-CLINIC_CLOSE_HOUR = 20  # 8:00 PM
+# Distance between consecutive candidate slot start times
+SLOT_STEP_MINUTES = 30
+
+# Longest window accepted by the multi-day availability query
+MAX_AVAILABILITY_RANGE_DAYS = 31
+
+# Days fetched per range query by the earliest-available-slot search, and
+# the most slots it returns
+NEXT_AVAILABLE_WINDOW_DAYS = 7
+MAX_NEXT_AVAILABLE_LIMIT = 20
+
+# Delta sync re-sends changes from this many seconds before the server time,
+# so rows whose transaction committed late are not missed. Clients upsert by id.
+CHANGES_OVERLAP_SECONDS = 5
+
+# Related data that can be embedded in appointment listings (?expand=pet,owner)
+APPOINTMENT_EXPANSIONS = ("pet", "owner")
+
+
+def parse_expand(expand: Optional[str]) -> FrozenSet[str]:
+    """Parse a comma-separated ?expand= value.
+    
+    Args:
+        expand: Raw query value, e.g. "pet,owner"
+        
+    Returns:
+        Set of requested expansions (empty if none)
+        
+    Raises:
+        BadRequestException: If an unknown expansion is requested
+    """
+    if not expand:
+        return frozenset()
+    requested = frozenset(part.strip() for part in expand.split(",") if part.strip())
+    unknown = requested - set(APPOINTMENT_EXPANSIONS)
+    if unknown:
+        raise BadRequestException(
+            f"Cannot expand {', '.join(sorted(unknown))}. "
+            f"Allowed values: {', '.join(APPOINTMENT_EXPANSIONS)}"
+        )
+    return requested
+
+
+def _format_clock(value: datetime) -> str:
+    """Format a time of day for error messages, e.g. "8:00 AM".
+    
+    Args:
+        value: Datetime whose time of day is formatted
+        
+    Returns:
+        12-hour clock time without a leading zero
+    """
+    return value.strftime("%I:%M %p").lstrip("0")
+
+
+def _to_naive_pht(value: datetime) -> datetime:
+    """Convert a timezone-aware datetime to naive PHT; naive values are returned as is."""
+    if value.tzinfo:
+        return value.astimezone(PHT).replace(tzinfo=None)
+    return value
 
 
 class AppointmentService:
@@ -29,6 +121,7 @@ class AppointmentService:
     - Automatic end_time calculation based on service type
     - Status transition rules (pending -> confirmed/completed, cancellation rules)
     - Role-based access control for appointments
+    - Change events for the live dashboard, published after commit
     
     Requirements: 5.1, 5.2, 5.3, 5.4, 5.5, 5.10, 5.11, 5.12, 6.1, 6.2, 6.3, 6.5, 6.6, 6.7, 6.10
     """
@@ -37,7 +130,10 @@ class AppointmentService:
         self,
         appointment_repo: AppointmentRepository,
         pet_repo: PetRepository,
-        clinic_status_repo: ClinicStatusRepository
+        clinic_status_repo: ClinicStatusRepository,
+        waitlist_service: Optional[WaitlistService] = None,
+        resource_repo: Optional[ResourceRepository] = None,
+        schedule_repo: Optional[ClinicScheduleRepository] = None
     ):
         """Initialize the service with required repositories.
         
@@ -45,17 +141,25 @@ class AppointmentService:
             appointment_repo: Repository for appointment database operations
             pet_repo: Repository for pet database operations
             clinic_status_repo: Repository for clinic status database operations
+            waitlist_service: Optional waitlist to offer freed slots to
+            resource_repo: Optional repository of vets and rooms; without it
+                (or without active resources) the clinic is a single resource
+            schedule_repo: Optional repository of opening hours and closures;
+                without it the default hours (8:00 AM - 8:00 PM daily) apply
         """
         self.appointment_repo = appointment_repo
         self.pet_repo = pet_repo
         self.clinic_status_repo = clinic_status_repo
+        self.waitlist_service = waitlist_service
+        self.resource_repo = resource_repo
+        self.schedule_repo = schedule_repo
     
     def create_appointment(
         self,
         pet_id: uuid.UUID,
         start_time: datetime,
         service_type: str,
-        current_user: User,
+        current_user: AuthenticatedUser,
         notes: Optional[str] = None
     ) -> Appointment:
         """Create appointment with business rule validation.
@@ -69,6 +173,11 @@ class AppointmentService:
         6. Checks for overlapping appointments (Requirement 5.11)
         7. Creates appointment with "pending" status (Requirement 5.12)
         
+        The overlap check gives a fast, friendly rejection. On PostgreSQL the
+        appointments_no_overlap exclusion constraint is what guarantees that
+        concurrent bookings cannot both succeed; its violation is reported
+        as TimeSlotUnavailableException.
+        
         Args:
             pet_id: UUID of the pet for the appointment
             start_time: When the appointment should start
@@ -83,6 +192,7 @@ class AppointmentService:
             NotFoundException: If pet doesn't exist
             ForbiddenException: If pet owner tries to book for another user's pet
             BadRequestException: If validation fails (past time, clinic closed, overlap)
+            TimeSlotUnavailableException: If a concurrent booking took the slot first
             
         Requirements: 5.1, 5.2, 5.3, 5.4, 5.5, 5.10, 5.11, 5.12
         """
@@ -96,85 +206,462 @@ class AppointmentService:
         if current_user.role == "pet_owner" and pet.owner_id != current_user.id:
             raise ForbiddenException("You can only book for your own pets")
         
-        # 2. Validate time is in future (Requirement 5.4)
-        if start_time <= get_pht_now():
-            raise BadRequestException("Appointment time must be in the future")
+        # 2-4. Validate time, clinic hours and clinic status (Requirements 5.4, 5.5, 5.10)
+        end_time = self._validate_new_slot(start_time, service_type)
         
-        # 3. Validate appointment is within clinic hours (8am-8pm)
-        start_hour = start_time.hour
-        end_time = calculate_end_time(start_time, service_type)
-        end_hour = end_time.hour
-        end_minute = end_time.minute
+        # 5. Check for overlaps with appointments and other users' holds (Requirement 5.11),
+        #    on a free resource that provides the service when resources are configured
+        resources = self._qualifying_resources(service_type)
+        resource_id = None
+        if resources is None:
+            if self.appointment_repo.check_overlap(start_time, end_time, hold_owner_id=current_user.id):
+                raise BadRequestException("Time slot is occupied")
+        else:
+            resource_id = self._find_free_resource(resources, start_time, end_time, current_user.id)
+            if resource_id is None:
+                raise BadRequestException("Time slot is occupied")
         
-        if start_hour < CLINIC_OPEN_HOUR or start_hour >= CLINIC_CLOSE_HOUR:
-            raise BadRequestException(
-                f"Appointments must be between {CLINIC_OPEN_HOUR}:00 AM and {CLINIC_CLOSE_HOUR - 12}:00 PM"
-            )
+        # 6. Create appointment with "pending" status (Requirement 5.12)
+        appointment = Appointment(
+            pet_id=pet_id,
+            user_id=current_user.id,
+            start_time=start_time,
+            end_time=end_time,
+            service_type=service_type,
+            notes=notes,
+            status="pending",
+            resource_id=resource_id
+        )
         
-        # End time cannot exceed clinic closing
-        if end_hour > CLINIC_CLOSE_HOUR or (end_hour == CLINIC_CLOSE_HOUR and end_minute > 0):
-            raise BadRequestException(
-                f"Appointment would end after clinic closes at {CLINIC_CLOSE_HOUR - 12}:00 PM. "
-                "Please choose an earlier time slot."
-            )
+        try:
+            created = self.appointment_repo.create(appointment)
+        except IntegrityError as error:
+            if is_overlap_violation(error):
+                raise TimeSlotUnavailableException("Time slot is occupied")
+            raise
         
-        # 4. Check clinic is open (Requirement 5.10)
-        clinic_status = self.clinic_status_repo.get_current_status()
-        if clinic_status.status == "close":
-            raise BadRequestException("Clinic is closed")
+        self.appointment_repo.queue_event("created", created)
+        self._release_own_holds(current_user.id, start_time, end_time)
+        return created
+    
+    def create_appointment_idempotent(
+        self,
+        idempotency_key: str,
+        pet_id: uuid.UUID,
+        start_time: datetime,
+        service_type: str,
+        current_user: AuthenticatedUser,
+        notes: Optional[str] = None
+    ) -> Tuple[Dict[str, Any], bool]:
+        """Create an appointment at most once per Idempotency-Key.
         
-        # 5. Check for overlaps (Requirement 5.11)
-        if self.appointment_repo.check_overlap(start_time, end_time):
-            raise BadRequestException("Time slot is occupied")
+        The first request with a key books normally and stores its response
+        in the same transaction. Retries with the same key and payload get
+        that response back without any validation queries; if the booking
+        failed nothing was stored, so a retry is processed afresh.
         
-        # 6. Create appointment with "pending" status (Requirement 5.12)
-        appointment = Appointment(
+        Args:
+            idempotency_key: Client-chosen Idempotency-Key header value
+            pet_id: UUID of the pet for the appointment
+            start_time: When the appointment should start
+            service_type: Type of service (vaccination, routine, surgery, emergency)
+            current_user: The authenticated user creating the appointment
+            notes: Optional notes about the appointment
+            
+        Returns:
+            Tuple of (AppointmentResponse as JSON-compatible dict, whether it is a replay)
+            
+        Raises:
+            BadRequestException: If the key was used with a different payload,
+                or create_appointment validation fails
+            IdempotencyKeyInProgressException: If a request with the same key
+                is being processed concurrently
+            NotFoundException, ForbiddenException, TimeSlotUnavailableException:
+                As raised by create_appointment
+        """
+        request_hash = hashlib.sha256(json.dumps(
+            [str(pet_id), start_time.isoformat(), service_type, notes]
+        ).encode()).hexdigest()
+        
+        record = self.appointment_repo.get_idempotency_key(current_user.id, idempotency_key)
+        if record and record.expires_at <= get_pht_now():
+            self.appointment_repo.delete_idempotency_key(record)
+            record = None
+        if record:
+            if record.request_hash != request_hash:
+                raise BadRequestException(
+                    "Idempotency-Key was already used for a different appointment request"
+                )
+            return record.response_body, True
+        
+        # Claim the key before booking so a concurrent duplicate fails fast
+        now = get_pht_now()
+        record = AppointmentIdempotencyKey(
+            user_id=current_user.id,
+            key=idempotency_key,
+            request_hash=request_hash,
+            created_at=now,
+            expires_at=now + timedelta(hours=IDEMPOTENCY_KEY_TTL_HOURS)
+        )
+        try:
+            self.appointment_repo.save_idempotency_key(record)
+        except IntegrityError:
+            raise IdempotencyKeyInProgressException()
+        
+        created = self.create_appointment(
             pet_id=pet_id,
+            start_time=start_time,
+            service_type=service_type,
+            current_user=current_user,
+            notes=notes
+        )
+        record.response_body = AppointmentResponse.model_validate(created).model_dump(mode="json")
+        self.appointment_repo.save_idempotency_key(record)
+        return record.response_body, False
+    
+    def hold_slot(
+        self,
+        start_time: datetime,
+        service_type: str,
+        current_user: AuthenticatedUser
+    ) -> SlotHold:
+        """Reserve a slot for SLOT_HOLD_MINUTES while the user completes a booking.
+        
+        The slot is validated like a booking and, when resources are
+        configured, placed on a free resource. While the hold is active the
+        range (on that resource) is busy for other users; the holder can
+        still book it. Taking
+        more than SLOT_HOLDS_PER_USER holds releases the user's oldest hold.
+        
+        Args:
+            start_time: When the held slot starts
+            service_type: Type of service, which determines the slot length
+            current_user: The authenticated user taking the hold
+            
+        Returns:
+            The active SlotHold
+            
+        Raises:
+            BadRequestException: If the time is in the past, outside clinic
+                hours, or the clinic is closed
+            TimeSlotUnavailableException: If the slot is booked or held by someone else
+        """
+        end_time = self._validate_new_slot(start_time, service_type)
+        resources = self._qualifying_resources(service_type)
+        resource_id = None
+        if resources is None:
+            if self.appointment_repo.check_overlap(start_time, end_time, hold_owner_id=current_user.id):
+                raise TimeSlotUnavailableException()
+        else:
+            resource_id = self._find_free_resource(resources, start_time, end_time, current_user.id)
+            if resource_id is None:
+                raise TimeSlotUnavailableException()
+        
+        now = get_pht_now()
+        hold = SlotHold(
+            id=uuid.uuid4(),
             user_id=current_user.id,
             start_time=start_time,
             end_time=end_time,
             service_type=service_type,
-            notes=notes,
-            status="pending"
+            expires_at=now + timedelta(minutes=SLOT_HOLD_MINUTES),
+            resource_id=resource_id
         )
+        released = slot_holds.place(hold, now, SLOT_HOLDS_PER_USER)
+        if released is None:
+            raise TimeSlotUnavailableException()
+        
+        self._invalidate_hold_dates([hold, *released])
+        return hold
+    
+    def release_hold(self, hold_id: uuid.UUID, current_user: AuthenticatedUser) -> None:
+        """Release a slot hold before it expires.
+        
+        Args:
+            hold_id: ID of the hold
+            current_user: The authenticated user (the holder or an admin)
+            
+        Raises:
+            NotFoundException: If the hold does not exist or has expired
+            ForbiddenException: If a pet owner releases another user's hold
+        """
+        hold = slot_holds.get(hold_id, get_pht_now())
+        if not hold:
+            raise NotFoundException("Slot hold")
+        if current_user.role != "admin" and hold.user_id != current_user.id:
+            raise ForbiddenException("You can only release your own slot holds")
         
-        return self.appointment_repo.create(appointment)
+        slot_holds.release(hold_id)
+        self._invalidate_hold_dates([hold])
     
     def get_appointments(
         self,
-        current_user: User,
+        current_user: AuthenticatedUser,
         status: Optional[str] = None,
         from_date: Optional[datetime] = None,
-        to_date: Optional[datetime] = None
-    ) -> List[Appointment]:
-        """Get appointments based on user role with optional filters.
+        to_date: Optional[datetime] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        expand: FrozenSet[str] = frozenset()
+    ) -> Tuple[List[Appointment], Optional[str]]:
+        """Get one page of appointments based on user role with optional filters.
         
         Admins can see all appointments, pet owners can only see appointments
-        for their own pets.
+        for their own pets. Appointments are ordered by (start_time, id) and
+        paged with an opaque keyset cursor; the page size is capped at
+        APPOINTMENTS_MAX_PAGE_SIZE.
         
         Args:
             current_user: The authenticated user requesting appointments
             status: Optional filter by appointment status
             from_date: Optional filter for appointments starting on or after this date
             to_date: Optional filter for appointments starting on or before this date
+            limit: Optional page size (defaults to APPOINTMENTS_PAGE_SIZE)
+            cursor: Optional cursor returned with the previous page
+            expand: Related data to load with the appointments (see parse_expand)
             
         Returns:
-            List of Appointment objects matching the filters
+            Tuple of (appointments on this page, cursor for the next page or None)
+            
+        Raises:
+            BadRequestException: If the cursor is invalid
             
         Requirements: 7.1, 7.2, 7.3, 7.4, 7.5, 7.6
         """
+        page_size = min(limit or APPOINTMENTS_PAGE_SIZE, APPOINTMENTS_MAX_PAGE_SIZE)
+        after = decode_cursor(cursor) if cursor else None
+        
+        # Fetch one extra row to find out whether another page exists
         if current_user.role == "admin":
-            return self.appointment_repo.get_all(status, from_date, to_date)
+            appointments = self.appointment_repo.get_all(
+                status, from_date, to_date,
+                limit=page_size + 1, after=after, expand=expand
+            )
         else:
-            return self.appointment_repo.get_by_owner_id(
-                current_user.id, status, from_date, to_date
+            appointments = self.appointment_repo.get_by_owner_id(
+                current_user.id, status, from_date, to_date,
+                limit=page_size + 1, after=after, expand=expand
             )
+        
+        if len(appointments) <= page_size:
+            return appointments, None
+        
+        page = appointments[:page_size]
+        return page, encode_cursor(page[-1].start_time, page[-1].id)
+    
+    def get_appointments_fingerprint(
+        self,
+        current_user: AuthenticatedUser,
+        status: Optional[str] = None,
+        from_date: Optional[datetime] = None,
+        to_date: Optional[datetime] = None,
+        expand: FrozenSet[str] = frozenset()
+    ) -> tuple:
+        """Get a cheap fingerprint of the appointments get_appointments would return.
+        
+        Computed in SQL over the whole filtered set (count and latest
+        updated_at), with the same role-based scoping as get_appointments.
+        
+        Args:
+            current_user: The authenticated user requesting appointments
+            status: Optional filter by appointment status
+            from_date: Optional filter for appointments starting on or after this date
+            to_date: Optional filter for appointments starting on or before this date
+            expand: Related data embedded in the listing
+            
+        Returns:
+            Tuple of aggregate values that change whenever the listing changes
+        """
+        owner_id = None if current_user.role == "admin" else current_user.id
+        return self.appointment_repo.get_list_fingerprint(
+            owner_id, status, from_date, to_date, expand
+        )
+    
+    def get_changes(
+        self,
+        current_user: AuthenticatedUser,
+        since: datetime,
+        limit: Optional[int] = None
+    ) -> Dict[str, object]:
+        """Get appointments changed and deleted since a timestamp (delta sync).
+        
+        Admins receive changes to all appointments, pet owners only to
+        appointments for their own pets. Pass the returned next_since as
+        ``since`` on the next call. Results overlap slightly between calls,
+        so clients should upsert appointments and apply deletions by id.
+        
+        Tombstones are only kept for APPOINTMENT_TOMBSTONE_RETENTION_DAYS, so
+        an older since could miss deletions and is rejected; the client must
+        reload the full list instead.
+        
+        Args:
+            current_user: The authenticated user syncing
+            since: Timestamp of the previous sync (naive PHT or timezone-aware)
+            limit: Optional maximum number of appointments and of deletions
+                (defaults to APPOINTMENTS_PAGE_SIZE, capped at APPOINTMENTS_MAX_PAGE_SIZE)
+            
+        Returns:
+            Dict with appointments (changed), deleted (tombstones),
+            next_since and has_more
+            
+        Raises:
+            ChangesExpiredException: If since is older than the tombstone retention window
+        """
+        if since.tzinfo:
+            since = since.astimezone(PHT).replace(tzinfo=None)
+        page_size = min(limit or APPOINTMENTS_PAGE_SIZE, APPOINTMENTS_MAX_PAGE_SIZE)
+        server_time = get_pht_now()
+        if since < server_time - timedelta(days=APPOINTMENT_TOMBSTONE_RETENTION_DAYS):
+            raise ChangesExpiredException()
+        owner_id = None if current_user.role == "admin" else current_user.id
+        
+        changed = self.appointment_repo.get_changed_since(since, page_size + 1, owner_id)
+        deleted = self.appointment_repo.get_deleted_since(since, page_size + 1, owner_id)
+        
+        # When a list is cut off, resume from the last timestamp returned
+        resume_points = []
+        if len(changed) > page_size:
+            changed = changed[:page_size]
+            resume_points.append(changed[-1].updated_at)
+        if len(deleted) > page_size:
+            deleted = deleted[:page_size]
+            resume_points.append(deleted[-1].deleted_at)
+        
+        if resume_points:
+            next_since = min(resume_points)
+        else:
+            next_since = max(since, server_time - timedelta(seconds=CHANGES_OVERLAP_SECONDS))
+        
+        return {
+            "appointments": changed,
+            "deleted": deleted,
+            "next_since": next_since,
+            "has_more": bool(resume_points)
+        }
+    
+    def export_appointments(
+        self,
+        export_format: str,
+        status: Optional[str] = None,
+        from_date: Optional[datetime] = None,
+        to_date: Optional[datetime] = None
+    ) -> Iterator[str]:
+        """Export appointments as a stream of NDJSON or CSV text chunks.
+        
+        The format is validated up front; rows are read lazily through a
+        server-side cursor while the returned iterator is consumed.
+        
+        Args:
+            export_format: "ndjson" or "csv"
+            status: Optional filter by appointment status
+            from_date: Optional filter for appointments starting on or after this date
+            to_date: Optional filter for appointments starting on or before this date
+            
+        Returns:
+            Iterator of text chunks
+            
+        Raises:
+            BadRequestException: If the format is not supported
+        """
+        if export_format not in EXPORT_MEDIA_TYPES:
+            raise BadRequestException(
+                f"Unsupported export format. Allowed values: {', '.join(EXPORT_MEDIA_TYPES)}"
+            )
+        
+        rows = self.appointment_repo.iter_for_export(status, from_date, to_date)
+        if export_format == "csv":
+            columns = [column.name for column in Appointment.__table__.columns]
+            return iter_csv(rows, columns)
+        return iter_ndjson(rows)
+    
+    def get_appointment_stats(self) -> Dict[str, object]:
+        """Get dashboard counters computed by the database.
+        
+        Counts come from a single GROUP BY query over status, service type
+        and whether the appointment starts today (clinic timezone). Every
+        known status and service type is present, with zero if unused.
+        
+        Returns:
+            Dict with total, by_status, by_service_type and today
+            (total and by_status for appointments starting today)
+        """
+        today_start = datetime.combine(get_pht_now().date(), time.min)
+        rows = self.appointment_repo.count_by_status_and_service_type(
+            today_start, today_start + timedelta(days=1)
+        )
+        
+        by_status = {status.value: 0 for status in AppointmentStatus}
+        by_service_type = {service.value: 0 for service in ServiceType}
+        today_by_status = {status.value: 0 for status in AppointmentStatus}
+        for status, service_type, starts_today, count in rows:
+            by_status[status] = by_status.get(status, 0) + count
+            by_service_type[service_type] = by_service_type.get(service_type, 0) + count
+            if starts_today:
+                today_by_status[status] = today_by_status.get(status, 0) + count
+        
+        return {
+            "total": sum(by_status.values()),
+            "by_status": by_status,
+            "by_service_type": by_service_type,
+            "today": {
+                "total": sum(today_by_status.values()),
+                "by_status": today_by_status
+            }
+        }
+    
+    def get_calendar_month(self, month: str, current_user: AuthenticatedUser) -> Dict[str, object]:
+        """Get per-day appointment summaries for a calendar month.
+        
+        Admins see every appointment, pet owners only those for their own
+        pets. Rows come from one projected range query, grouped here by day.
+        Days without appointments are omitted.
+        
+        Args:
+            month: Month in YYYY-MM format
+            current_user: The authenticated user requesting the calendar
+            
+        Returns:
+            Dict with the month and a list of days, each with its date,
+            total, counts by status and short appointment labels
+            
+        Raises:
+            BadRequestException: If month is not a valid YYYY-MM value
+        """
+        try:
+            first_day = datetime.strptime(month, "%Y-%m")
+        except ValueError:
+            raise BadRequestException("month must be in YYYY-MM format")
+        next_month = (first_day + timedelta(days=32)).replace(day=1)
+        
+        owner_id = None if current_user.role == "admin" else current_user.id
+        rows = self.appointment_repo.get_calendar_entries(first_day, next_month, owner_id)
+        
+        days: Dict[date, Dict[str, object]] = {}
+        for appointment_id, start_time, status, service_type, pet_name in rows:
+            day = days.setdefault(start_time.date(), {
+                "date": start_time.date().isoformat(),
+                "total": 0,
+                "by_status": {},
+                "appointments": []
+            })
+            day["total"] += 1
+            day["by_status"][status] = day["by_status"].get(status, 0) + 1
+            day["appointments"].append({
+                "id": appointment_id,
+                "time": start_time.strftime("%H:%M"),
+                "pet_name": pet_name,
+                "status": status,
+                "service_type": service_type
+            })
+        
+        return {"month": first_day.strftime("%Y-%m"), "days": list(days.values())}
     
     def update_appointment_status(
         self,
         appointment_id: uuid.UUID,
         new_status: str,
-        current_user: User
+        current_user: AuthenticatedUser,
+        expected_version: Optional[int] = None
     ) -> Appointment:
         """Update appointment status with validation.
         
@@ -184,10 +671,13 @@ class AppointmentService:
         - Pet owners can only cancel their own appointments (Requirements 6.7, 6.8)
         - Cannot cancel completed appointments (Requirement 6.10)
         
+        Cancelling offers the freed slot to the waitlist, if one is configured.
+        
         Args:
             appointment_id: UUID of the appointment to update
             new_status: New status value (confirmed, completed, cancelled)
             current_user: The authenticated user updating the status
+            expected_version: Version the client last saw (If-Match), if any
             
         Returns:
             Updated Appointment object
@@ -196,12 +686,15 @@ class AppointmentService:
             NotFoundException: If appointment doesn't exist
             BadRequestException: If status transition is invalid
             ForbiddenException: If user lacks permission for the status change
+            AppointmentVersionConflictException: If the appointment changed since
+                expected_version, or a concurrent update won
             
         Requirements: 6.1, 6.2, 6.3, 6.4, 6.5, 6.6, 6.7, 6.8, 6.10
         """
         appointment = self.appointment_repo.get_by_id(appointment_id)
         if not appointment:
             raise NotFoundException("Appointment")
+        self._check_version(appointment, expected_version)
         
         # Cannot change completed or cancelled appointments (Requirements 6.5, 6.6)
         if appointment.status in ["completed", "cancelled"]:
@@ -225,12 +718,81 @@ class AppointmentService:
             raise BadRequestException("Cannot cancel completed appointment")
         
         appointment.status = new_status
-        return self.appointment_repo.update(appointment)
+        try:
+            updated = self.appointment_repo.update(appointment)
+        except StaleDataError:
+            raise AppointmentVersionConflictException()
+        self.appointment_repo.queue_event("status_changed", updated)
+        if new_status == "cancelled":
+            self._offer_freed_slot(updated.start_time, updated.end_time, updated.resource_id)
+        return updated
+    
+    def bulk_update_status(
+        self,
+        appointment_ids: List[uuid.UUID],
+        new_status: str,
+        current_user: AuthenticatedUser
+    ) -> Dict[str, object]:
+        """Update the status of many appointments at once (admin only).
+        
+        Applies the transition rules of update_appointment_status() to every
+        appointment in a single UPDATE: completed and cancelled appointments
+        cannot change. Only the appointments left unchanged are read
+        afterwards, to report why. Cancelled slots are offered to the
+        waitlist, and one change event is queued per updated appointment.
+        
+        Args:
+            appointment_ids: UUIDs of the appointments (duplicates are ignored)
+            new_status: New status value (confirmed, completed, cancelled)
+            current_user: The authenticated user updating the statuses
+            
+        Returns:
+            Dict with the number updated and one result per appointment, in
+            request order, holding the new status and version or the error
+            
+        Raises:
+            ForbiddenException: If the user is not an admin
+        """
+        if current_user.role != "admin":
+            raise ForbiddenException("Only admin can update appointments in bulk")
+        
+        appointment_ids = list(dict.fromkeys(appointment_ids))
+        final_statuses = [AppointmentStatus.COMPLETED.value, AppointmentStatus.CANCELLED.value]
+        updated = {
+            appointment.id: appointment
+            for appointment in self.appointment_repo.bulk_update_status(
+                appointment_ids, new_status, final_statuses
+            )
+        }
+        unchanged = self.appointment_repo.get_statuses(
+            [appointment_id for appointment_id in appointment_ids if appointment_id not in updated]
+        )
+        
+        results = []
+        for appointment_id in appointment_ids:
+            appointment = updated.get(appointment_id)
+            if appointment is not None:
+                self.appointment_repo.queue_event("status_changed", appointment)
+                if new_status == AppointmentStatus.CANCELLED.value:
+                    self._offer_freed_slot(appointment.start_time, appointment.end_time, appointment.resource_id)
+                results.append({
+                    "id": appointment_id, "ok": True,
+                    "status": appointment.status, "version": appointment.version
+                })
+            elif appointment_id not in unchanged:
+                results.append({"id": appointment_id, "ok": False, "error": "Appointment not found"})
+            else:
+                results.append({
+                    "id": appointment_id, "ok": False, "status": unchanged[appointment_id],
+                    "error": f"Cannot change status of {unchanged[appointment_id]} appointment"
+                })
+        
+        return {"updated": len(updated), "results": results}
     
     def cancel_appointment(
         self,
         appointment_id: uuid.UUID,
-        current_user: User
+        current_user: AuthenticatedUser
     ) -> None:
         """Cancel appointment (delete from database).
         
@@ -239,6 +801,8 @@ class AppointmentService:
         - Admins can cancel any appointment (Requirement 6.9)
         - Cannot cancel completed appointments (Requirement 6.10)
         
+        The freed slot is offered to the waitlist, if one is configured.
+        
         Args:
             appointment_id: UUID of the appointment to cancel
             current_user: The authenticated user cancelling the appointment
@@ -264,14 +828,18 @@ class AppointmentService:
         if appointment.status == "completed":
             raise BadRequestException("Cannot cancel completed appointment")
         
+        freed = (appointment.start_time, appointment.end_time, appointment.resource_id)
+        self.appointment_repo.queue_event("deleted", appointment)
         self.appointment_repo.delete(appointment)
+        self._offer_freed_slot(*freed)
     
     def reschedule_appointment(
         self,
         appointment_id: uuid.UUID,
         user_id: uuid.UUID,
         new_start: datetime,
-        new_end: datetime
+        new_end: datetime,
+        expected_version: Optional[int] = None
     ) -> Appointment:
         """Reschedule an appointment to a new time slot.
         
@@ -279,15 +847,20 @@ class AppointmentService:
         1. Validates appointment exists (Requirement 6.1)
         2. Validates user owns the pet associated with the appointment (Requirement 6.1)
         3. Validates appointment status is 'scheduled' or 'confirmed' (Requirement 6.8)
-        4. Validates clinic is open during new time (Requirement 6.4)
+        4. Validates clinic is open during new time, within the day's opening
+           hours and outside breaks (Requirement 6.4)
         5. Validates time slot is available (no double booking) (Requirement 6.3)
         6. Updates appointment times (Requirements 6.5, 6.7)
         
+        Any part of the old slot that is freed is offered to the waitlist,
+        if one is configured.
+        
         Args:
             appointment_id: UUID of the appointment to reschedule
             user_id: UUID of the user requesting the reschedule
             new_start: New start time for the appointment
             new_end: New end time for the appointment
+            expected_version: Version the client last saw (If-Match), if any
             
         Returns:
             Updated Appointment object with new times
@@ -296,6 +869,9 @@ class AppointmentService:
             NotFoundException: If appointment doesn't exist
             ForbiddenException: If user doesn't own the pet associated with the appointment
             BadRequestException: If validation fails (invalid status, clinic closed, time slot unavailable)
+            TimeSlotUnavailableException: If a concurrent booking took the slot first
+            AppointmentVersionConflictException: If the appointment changed since
+                expected_version, or a concurrent update won
             
         Requirements: 6.1, 6.2, 6.3, 6.4, 6.5, 6.7, 6.8
         """
@@ -311,6 +887,7 @@ class AppointmentService:
         
         if pet.owner_id != user_id:
             raise ForbiddenException("You can only reschedule appointments for your own pets")
+        self._check_version(appointment, expected_version)
         
         # 3. Verify appointment status is 'scheduled' or 'confirmed' (Requirement 6.8)
         if appointment.status not in ["pending", "confirmed"]:
@@ -323,18 +900,52 @@ class AppointmentService:
         clinic_status = self.clinic_status_repo.get_current_status()
         if clinic_status.status == "close":
             raise BadRequestException("Clinic is closed during the requested time")
+        self._check_within_hours(_to_naive_pht(new_start), _to_naive_pht(new_end))
         
-        # 5. Check time slot is available (no double booking) (Requirement 6.3)
-        if not self.appointment_repo.check_time_slot_available(
-            new_start, new_end, exclude_appointment_id=appointment_id
-        ):
-            raise BadRequestException("The requested time slot is not available")
+        # 5. Check time slot is available (no double booking) (Requirement 6.3),
+        #    preferably on the appointment's current resource
+        resources = self._qualifying_resources(appointment.service_type)
+        if resources is None:
+            if not self.appointment_repo.check_time_slot_available(
+                new_start, new_end, exclude_appointment_id=appointment_id, hold_owner_id=user_id
+            ):
+                raise BadRequestException("The requested time slot is not available")
+            resource_kwargs = {}
+        else:
+            resources.sort(key=lambda resource: resource.id != appointment.resource_id)
+            resource_id = self._find_free_resource(
+                resources, new_start, new_end, user_id, exclude_id=appointment_id
+            )
+            if resource_id is None:
+                raise BadRequestException("The requested time slot is not available")
+            resource_kwargs = {"resource_id": resource_id}
         
         # 6. Update appointment times via repository (Requirements 6.5, 6.7)
-        updated_appointment = self.appointment_repo.update_appointment_times(
-            appointment_id, new_start, new_end
-        )
+        old_start, old_end = appointment.start_time, appointment.end_time
+        old_resource_id = appointment.resource_id
+        try:
+            updated_appointment = self.appointment_repo.update_appointment_times(
+                appointment_id, new_start, new_end, **resource_kwargs
+            )
+        except IntegrityError as error:
+            if is_overlap_violation(error):
+                raise TimeSlotUnavailableException()
+            raise
+        except StaleDataError:
+            raise AppointmentVersionConflictException()
         
+        self.appointment_repo.queue_event("rescheduled", updated_appointment)
+        self._release_own_holds(user_id, new_start, new_end)
+        # Offer the parts of the old slot the new one no longer covers
+        old_start, old_end = _to_naive_pht(old_start), _to_naive_pht(old_end)
+        new_start, new_end = _to_naive_pht(new_start), _to_naive_pht(new_end)
+        if updated_appointment.resource_id != old_resource_id:
+            self._offer_freed_slot(old_start, old_end, old_resource_id)
+        else:
+            if new_start > old_start:
+                self._offer_freed_slot(old_start, min(old_end, new_start), old_resource_id)
+            if new_end < old_end:
+                self._offer_freed_slot(max(old_start, new_end), old_end, old_resource_id)
         return updated_appointment
 
     def get_available_slots(
@@ -344,9 +955,9 @@ class AppointmentService:
     ) -> List[dict]:
         """Get available appointment time slots for a given date.
         
-        Generates all possible time slots during clinic hours (8am-8pm)
+        Generates all possible time slots during the date's opening hours
         based on service duration, then filters out slots that overlap
-        with existing pending/confirmed appointments.
+        with existing pending/confirmed appointments and active slot holds.
         
         Args:
             target_date: The date to check for available slots
@@ -358,61 +969,536 @@ class AppointmentService:
         Raises:
             BadRequestException: If clinic is closed or date is in the past
         """
+        # Serve from the availability cache when possible. Entries only exist
+        # while the clinic is open, since closing it clears the cache.
+        now = get_pht_now()
+        if target_date >= now.date():
+            cached_slots = availability_cache.get(target_date, service_type)
+            if cached_slots is not None:
+                return self._drop_past_slots(target_date, cached_slots, now)
+        
         # Check clinic status
         clinic_status = self.clinic_status_repo.get_current_status()
         if clinic_status.status == "close":
             raise BadRequestException("Clinic is closed")
         
         # Check date is not in the past
-        today = get_pht_now().date()
+        today = now.date()
         if target_date < today:
             raise BadRequestException("Cannot view slots for past dates")
         
         # Get service duration
         duration_minutes = SERVICE_DURATIONS.get(service_type, 30)
         
-        # Define day boundaries (naive PHT datetimes)
-        day_start = datetime(
-            target_date.year, target_date.month, target_date.day,
-            CLINIC_OPEN_HOUR, 0
-        )
-        clinic_close = datetime(
-            target_date.year, target_date.month, target_date.day,
-            CLINIC_CLOSE_HOUR, 0
-        )
+        # Day boundaries come from the compiled schedule; closed days have no slots
+        day_schedule = self._day_schedule(target_date)
+        if day_schedule.is_closed:
+            availability_cache.set(target_date, service_type, [])
+            return []
+        day_start, clinic_close = day_schedule.opens_at, day_schedule.closes_at
         
-        # Fetch ALL existing appointments for this day in ONE query
+        # Fetch ALL existing appointments for this day in ONE query; active holds are busy too
         existing_appointments = self.appointment_repo.get_appointments_for_day(
             day_start, clinic_close
+        ) + slot_holds.overlapping(day_start, clinic_close, now)
+        
+        slots = self._build_day_slots(
+            target_date, duration_minutes, existing_appointments, now,
+            self._qualifying_resources(service_type)
         )
+        availability_cache.set(target_date, service_type, slots)
+        return slots
+
+    def get_available_slots_range(
+        self,
+        start_date: date,
+        end_date: date,
+        service_type: str
+    ) -> List[dict]:
+        """Get available appointment time slots for every day in a date range.
+        
+        Multi-day variant of get_available_slots() used by the week and month
+        pickers. The clinic status is read once and every active appointment
+        in the window is fetched with a single query, then slots are computed
+        for each day in one pass.
+        
+        Args:
+            start_date: First date of the range (inclusive)
+            end_date: Last date of the range (inclusive)
+            service_type: Type of service to determine slot duration
+            
+        Returns:
+            List of dicts, one per day, with the ISO date and its available slots
+            
+        Raises:
+            BadRequestException: If clinic is closed, the range is invalid,
+                                 too long, or starts in the past
+        """
+        now = get_pht_now()
+        
+        # Serve from the availability cache when every day of a valid range is cached
+        is_valid_range = (
+            now.date() <= start_date <= end_date
+            and (end_date - start_date).days < MAX_AVAILABILITY_RANGE_DAYS
+        )
+        if is_valid_range:
+            cached_days = []
+            target_date = start_date
+            while target_date <= end_date:
+                cached_slots = availability_cache.get(target_date, service_type)
+                if cached_slots is None:
+                    break
+                cached_days.append({
+                    "date": target_date.isoformat(),
+                    "slots": self._drop_past_slots(target_date, cached_slots, now),
+                })
+                target_date += timedelta(days=1)
+            else:
+                return cached_days
+        
+        # Check clinic status
+        clinic_status = self.clinic_status_repo.get_current_status()
+        if clinic_status.status == "close":
+            raise BadRequestException("Clinic is closed")
+        
+        if end_date < start_date:
+            raise BadRequestException("end_date must be on or after start_date")
+        
+        total_days = (end_date - start_date).days + 1
+        if total_days > MAX_AVAILABILITY_RANGE_DAYS:
+            raise BadRequestException(
+                f"Date range cannot exceed {MAX_AVAILABILITY_RANGE_DAYS} days"
+            )
+        
+        # Check range does not start in the past
+        if start_date < now.date():
+            raise BadRequestException("Cannot view slots for past dates")
+        
+        duration_minutes = SERVICE_DURATIONS.get(service_type, 30)
+        
+        # Fetch ALL existing appointments for the whole window in ONE query
+        range_start = datetime.combine(start_date, time.min)
+        range_end = datetime.combine(end_date + timedelta(days=1), time.min)
+        existing_appointments = self.appointment_repo.get_appointments_in_range(
+            range_start, range_end
+        ) + slot_holds.overlapping(range_start, range_end, now)
+        
+        resources = self._qualifying_resources(service_type)
+        appointments_by_day = self._bucket_by_day(existing_appointments, start_date, end_date)
+        
+        days = []
+        for offset in range(total_days):
+            target_date = start_date + timedelta(days=offset)
+            slots = self._build_day_slots(
+                target_date,
+                duration_minutes,
+                appointments_by_day.get(target_date, []),
+                now,
+                resources
+            )
+            availability_cache.set(target_date, service_type, slots)
+            days.append({"date": target_date.isoformat(), "slots": slots})
+        
+        return days
+
+    def find_next_available(
+        self,
+        service_type: str,
+        after: Optional[datetime] = None,
+        limit: int = 1
+    ) -> Dict[str, object]:
+        """Find the earliest available slots from a point in time onwards.
         
-        # Helper: check overlap in-memory against fetched appointments
-        def has_overlap(slot_start: datetime, slot_end: datetime) -> bool:
-            for appt in existing_appointments:
-                if appt.start_time < slot_end and appt.end_time > slot_start:
-                    return True
-            return False
+        Scans forward one NEXT_AVAILABLE_WINDOW_DAYS window at a time, with
+        at most one range query per window (cached days need none), and
+        builds each day's slots with the same logic as
+        get_available_slots(). The scan stops as soon as limit slots are
+        found, after NEXT_AVAILABLE_MAX_DAYS days, or once
+        NEXT_AVAILABLE_MAX_SECONDS have passed; searched_through tells the
+        caller where to resume.
         
-        # Generate all possible slots from 8am to 8pm
+        Args:
+            service_type: Type of service to determine slot duration
+            after: Earliest acceptable start time (defaults to now; past
+                times are treated as now)
+            limit: Number of slots wanted
+            
+        Returns:
+            Dict with the slots found (start_time, end_time), earliest first,
+            and searched_through, the last date that was fully scanned
+            
+        Raises:
+            BadRequestException: If clinic is closed
+        """
         now = get_pht_now()
-        slots = []
-        current_start = day_start
+        after = now if after is None else max(_to_naive_pht(after), now)
+        
+        clinic_status = self.clinic_status_repo.get_current_status()
+        if clinic_status.status == "close":
+            raise BadRequestException("Clinic is closed")
+        
+        duration_minutes = SERVICE_DURATIONS.get(service_type, 30)
+        resources = self._qualifying_resources(service_type)
+        deadline = monotonic() + NEXT_AVAILABLE_MAX_SECONDS
+        last_date = after.date() + timedelta(days=NEXT_AVAILABLE_MAX_DAYS - 1)
+        cutoff = after.isoformat()
         
-        while current_start + timedelta(minutes=duration_minutes) <= clinic_close:
-            slot_end = current_start + timedelta(minutes=duration_minutes)
+        found = []
+        searched_through = None
+        window_start = after.date()
+        while window_start <= last_date and len(found) < limit:
+            if searched_through is not None and monotonic() >= deadline:
+                break
+            window_end = min(window_start + timedelta(days=NEXT_AVAILABLE_WINDOW_DAYS - 1), last_date)
             
-            # For today, skip slots that are in the past
-            if target_date == today and current_start <= now:
-                current_start += timedelta(minutes=30)
-                continue
+            # Query the window from its first uncached day, at most once
+            appointments_by_day = None
+            target_date = window_start
+            while target_date <= window_end and len(found) < limit:
+                slots = availability_cache.get(target_date, service_type)
+                if slots is None:
+                    if appointments_by_day is None:
+                        range_start = datetime.combine(target_date, time.min)
+                        range_end = datetime.combine(window_end + timedelta(days=1), time.min)
+                        existing_appointments = self.appointment_repo.get_appointments_in_range(
+                            range_start, range_end
+                        ) + slot_holds.overlapping(range_start, range_end, now)
+                        appointments_by_day = self._bucket_by_day(
+                            existing_appointments, target_date, window_end
+                        )
+                    slots = self._build_day_slots(
+                        target_date,
+                        duration_minutes,
+                        appointments_by_day.get(target_date, []),
+                        now,
+                        resources
+                    )
+                    availability_cache.set(target_date, service_type, slots)
+                found.extend(slot for slot in slots if slot["start_time"] >= cutoff)
+                searched_through = target_date
+                target_date += timedelta(days=1)
+                if monotonic() >= deadline:
+                    break
+            window_start = window_end + timedelta(days=1)
+        
+        return {
+            "slots": found[:limit],
+            "searched_through": searched_through.isoformat() if searched_through else None,
+        }
+
+    def _bucket_by_day(
+        self,
+        items: List[Any],
+        start_date: date,
+        end_date: date
+    ) -> Dict[date, List[Any]]:
+        """Group appointments and holds by every day of a range they touch.
+        
+        Args:
+            items: Objects with start_time and end_time
+            start_date: First date of the range (inclusive)
+            end_date: Last date of the range (inclusive)
             
-            if not has_overlap(current_start, slot_end):
-                slots.append({
-                    "start_time": current_start.isoformat(),
-                    "end_time": slot_end.isoformat(),
-                })
+        Returns:
+            Dict mapping each date to the items overlapping it
+        """
+        items_by_day = {}
+        for item in items:
+            day = max(item.start_time.date(), start_date)
+            last_day = min(item.end_time.date(), end_date)
+            while day <= last_day:
+                items_by_day.setdefault(day, []).append(item)
+                day += timedelta(days=1)
+        return items_by_day
+
+    def _validate_new_slot(self, start_time: datetime, service_type: str) -> datetime:
+        """Validate a requested slot for booking or holding.
+        
+        Args:
+            start_time: When the slot starts
+            service_type: Type of service, which determines the slot length
             
-            # Move to next slot in 30-minute increments
-            current_start += timedelta(minutes=30)
+        Returns:
+            End time of the slot
+            
+        Raises:
+            BadRequestException: If the time is in the past, outside clinic
+                hours, or the clinic is closed
+        """
+        # Validate time is in future (Requirement 5.4)
+        if start_time <= get_pht_now():
+            raise BadRequestException("Appointment time must be in the future")
         
-        return slots
+        # Validate appointment is within the day's opening hours, outside breaks
+        end_time = calculate_end_time(start_time, service_type)
+        self._check_within_hours(start_time, end_time)
+        
+        # Check clinic is open (Requirement 5.10)
+        clinic_status = self.clinic_status_repo.get_current_status()
+        if clinic_status.status == "close":
+            raise BadRequestException("Clinic is closed")
+        
+        return end_time
+
+    def _check_within_hours(self, start_time: datetime, end_time: datetime) -> None:
+        """Check that a slot lies within one opening period of its day.
+        
+        Args:
+            start_time: When the slot starts (naive PHT)
+            end_time: When the slot ends (naive PHT)
+            
+        Raises:
+            BadRequestException: If the day is closed, or the slot starts
+                outside opening hours, ends after closing or overlaps a break
+        """
+        day_schedule = self._day_schedule(start_time.date())
+        self._check_open_day(day_schedule)
+        
+        if not day_schedule.opens_at <= start_time < day_schedule.closes_at:
+            raise BadRequestException(
+                f"Appointments must be between {_format_clock(day_schedule.opens_at)} "
+                f"and {_format_clock(day_schedule.closes_at)}"
+            )
+        
+        # End time cannot exceed clinic closing
+        if end_time > day_schedule.closes_at:
+            raise BadRequestException(
+                f"Appointment would end after clinic closes at {_format_clock(day_schedule.closes_at)}. "
+                "Please choose an earlier time slot."
+            )
+        
+        if not day_schedule.contains(start_time, end_time):
+            raise BadRequestException(
+                "Appointment would overlap a clinic break. Please choose another time slot."
+            )
+
+    def _day_schedule(self, target_date: date) -> DaySchedule:
+        """Get a date's opening periods from the compiled clinic schedule.
+        
+        The schedule tables are only read when the compiled schedule is
+        missing or expired, not on every call.
+        
+        Args:
+            target_date: The date
+            
+        Returns:
+            DaySchedule for the date (default hours without a schedule repository)
+        """
+        if self.schedule_repo is None:
+            return DEFAULT_SCHEDULE.day(target_date)
+        return clinic_schedule.get(self.schedule_repo).day(target_date)
+
+    def _check_open_day(self, day_schedule: DaySchedule) -> None:
+        """Reject dates the clinic is closed on.
+        
+        Args:
+            day_schedule: Compiled schedule of the date
+            
+        Raises:
+            BadRequestException: If the date is a closure or a closed weekday
+        """
+        if not day_schedule.is_closed:
+            return
+        message = f"Clinic is closed on {day_schedule.day.isoformat()}"
+        if day_schedule.closure_reason:
+            message += f" ({day_schedule.closure_reason})"
+        raise BadRequestException(message)
+
+    def _release_own_holds(self, user_id: uuid.UUID, start_time: datetime, end_time: datetime) -> None:
+        """Release the user's holds on a range they have just booked.
+        
+        Args:
+            user_id: User who booked
+            start_time: Start of the booked range
+            end_time: End of the booked range
+        """
+        own_holds = [
+            hold for hold in slot_holds.overlapping(start_time, end_time, get_pht_now())
+            if hold.user_id == user_id
+        ]
+        for hold in own_holds:
+            slot_holds.release(hold.id)
+
+    def _offer_freed_slot(
+        self,
+        start_time: datetime,
+        end_time: datetime,
+        resource_id: Optional[int] = None
+    ) -> None:
+        """Offer a range freed by a cancellation or reschedule to the waitlist.
+        
+        Args:
+            start_time: Start of the freed range
+            end_time: End of the freed range
+            resource_id: Resource the range was freed on, if any
+        """
+        if self.waitlist_service is None:
+            return
+        resource = None
+        if resource_id is not None and self.resource_repo is not None:
+            resource = self.resource_repo.get_by_id(resource_id)
+        self.waitlist_service.offer_freed_slot(start_time, end_time, resource)
+
+    def _qualifying_resources(self, service_type: str) -> Optional[List[Resource]]:
+        """Get the active resources that provide a service.
+        
+        Args:
+            service_type: Type of service
+            
+        Returns:
+            Qualifying resources in booking order (possibly empty), or None
+            when no resources are configured and the clinic is one resource
+        """
+        if self.resource_repo is None:
+            return None
+        active = self.resource_repo.get_active()
+        if not active:
+            return None
+        return [resource for resource in active if service_type in resource.service_types]
+
+    def _find_free_resource(
+        self,
+        resources: List[Resource],
+        start_time: datetime,
+        end_time: datetime,
+        hold_owner_id: uuid.UUID,
+        exclude_id: Optional[uuid.UUID] = None
+    ) -> Optional[int]:
+        """Pick the first of the given resources that is free for a range.
+        
+        Args:
+            resources: Qualifying resources in order of preference
+            start_time: Start of the range
+            end_time: End of the range
+            hold_owner_id: User whose own holds do not count as busy
+            exclude_id: Optional appointment to ignore (when rescheduling it)
+            
+        Returns:
+            ID of a free resource, or None if every resource is busy
+        """
+        if not resources:
+            return None
+        busy = self.appointment_repo.get_busy_resource_ids(
+            start_time, end_time, exclude_id=exclude_id, hold_owner_id=hold_owner_id
+        )
+        if None in busy:
+            return None
+        for resource in resources:
+            if resource.id not in busy:
+                return resource.id
+        return None
+
+    def _invalidate_hold_dates(self, holds: List[SlotHold]) -> None:
+        """Drop cached availability for the dates of taken or released holds.
+        
+        Args:
+            holds: Holds whose ranges changed availability
+        """
+        dates = set()
+        for hold in holds:
+            dates.update(dates_between(hold.start_time, hold.end_time))
+        availability_cache.invalidate_dates(dates)
+
+    def _check_version(
+        self,
+        appointment: Appointment,
+        expected_version: Optional[int]
+    ) -> None:
+        """Reject an update based on an outdated copy of the appointment.
+        
+        The UPDATE itself is also guarded by the mapper's version check, so a
+        concurrent change between this check and the flush is caught there.
+        
+        Args:
+            appointment: Appointment as currently stored
+            expected_version: Version the client last saw, or None to skip
+            
+        Raises:
+            AppointmentVersionConflictException: If the versions differ
+        """
+        if expected_version is not None and appointment.version != expected_version:
+            raise AppointmentVersionConflictException()
+
+    def _drop_past_slots(
+        self,
+        target_date: date,
+        slots: List[dict],
+        now: datetime
+    ) -> List[dict]:
+        """Remove slots that have already started from a cached list for today.
+        
+        Args:
+            target_date: Date the slots belong to
+            slots: Cached slots for the date
+            now: Current PHT time
+            
+        Returns:
+            The slots that are still in the future
+        """
+        if target_date != now.date():
+            return slots
+        cutoff = now.isoformat()
+        return [slot for slot in slots if slot["start_time"] > cutoff]
+
+    def _build_day_slots(
+        self,
+        target_date: date,
+        duration_minutes: int,
+        existing_appointments: List[Appointment],
+        now: datetime,
+        resources: Optional[List[Resource]] = None
+    ) -> List[dict]:
+        """Generate the free slots of a single day.
+        
+        With resources, a slot is free when at least one of them is free;
+        busy intervals are indexed per resource so each resource costs one
+        linear sweep.
+        
+        Args:
+            target_date: The date to generate slots for
+            duration_minutes: Length of each slot in minutes
+            existing_appointments: Active appointments and slot holds overlapping the day
+            now: Current PHT time, used to skip past slots for today
+            resources: Qualifying resources, or None to treat the clinic as one resource
+            
+        Returns:
+            List of dicts with start_time and end_time for each available slot
+        """
+        # Only skip past slots when generating today's availability
+        not_before = now if target_date == now.date() else None
+        
+        if resources is None:
+            busy = merge_busy_intervals(
+                (appt.start_time, appt.end_time) for appt in existing_appointments
+            )
+        else:
+            busy_by_resource = index_busy_by_resource(existing_appointments)
+            resource_ids = [resource.id for resource in resources]
+        
+        # Slots start at each open period's start, so breaks split the day
+        free_slots = []
+        for period_start, period_end in self._day_schedule(target_date).periods:
+            if resources is None:
+                free_slots += find_free_slots(
+                    period_start,
+                    period_end,
+                    busy,
+                    duration=timedelta(minutes=duration_minutes),
+                    step=timedelta(minutes=SLOT_STEP_MINUTES),
+                    not_before=not_before
+                )
+            else:
+                free_slots += find_free_slots_on_any(
+                    period_start,
+                    period_end,
+                    busy_by_resource,
+                    resource_ids,
+                    duration=timedelta(minutes=duration_minutes),
+                    step=timedelta(minutes=SLOT_STEP_MINUTES),
+                    not_before=not_before
+                )
+        
+        return [
+            {"start_time": start.isoformat(), "end_time": end.isoformat()}
+            for start, end in free_slots
+        ]
@@ -0,0 +1,76 @@
+"""Background tasks for appointment maintenance.
+
+This module contains tasks scheduled periodically by the application
+lifespan, such as purging expired Idempotency-Keys of appointment bookings
+and tombstones older than the delta-sync retention window.
+"""
+
+import logging
+from datetime import timedelta
+from typing import Optional
+from sqlmodel import Session
+
+from app.common.utils import get_pht_now
+from app.core.config import APPOINTMENT_TOMBSTONE_RETENTION_DAYS
+from app.core.database import engine
+from app.features.appointments.repository import AppointmentRepository
+
+logger = logging.getLogger(__name__)
+
+
+def cleanup_expired_idempotency_keys(session: Optional[Session] = None) -> int:
+    """Remove Idempotency-Keys whose replay window has passed.
+    
+    Args:
+        session: Optional database session. If not provided, creates a new session.
+                 This parameter is primarily for testing purposes.
+    
+    Returns:
+        Number of keys removed
+    """
+    try:
+        if session is not None:
+            removed_count = AppointmentRepository(session).remove_expired_idempotency_keys()
+            session.commit()
+        else:
+            with Session(engine) as db_session:
+                removed_count = AppointmentRepository(db_session).remove_expired_idempotency_keys()
+                db_session.commit()
+        
+        logger.info(f"Successfully removed {removed_count} expired idempotency key(s)")
+        return removed_count
+            
+    except Exception as e:
+        logger.error(f"Error during idempotency key cleanup: {str(e)}", exc_info=True)
+        raise
+
+
+def cleanup_expired_tombstones(session: Optional[Session] = None) -> int:
+    """Remove tombstones older than APPOINTMENT_TOMBSTONE_RETENTION_DAYS.
+    
+    GET /api/v1/appointments/changes answers 410 for since values older
+    than the same window, so no client relies on the removed rows.
+    
+    Args:
+        session: Optional database session. If not provided, creates a new session.
+                 This parameter is primarily for testing purposes.
+    
+    Returns:
+        Number of tombstones removed
+    """
+    cutoff = get_pht_now() - timedelta(days=APPOINTMENT_TOMBSTONE_RETENTION_DAYS)
+    try:
+        if session is not None:
+            removed_count = AppointmentRepository(session).remove_expired_tombstones(cutoff)
+            session.commit()
+        else:
+            with Session(engine) as db_session:
+                removed_count = AppointmentRepository(db_session).remove_expired_tombstones(cutoff)
+                db_session.commit()
+        
+        logger.info(f"Successfully removed {removed_count} expired appointment tombstone(s)")
+        return removed_count
+            
+    except Exception as e:
+        logger.error(f"Error during appointment tombstone cleanup: {str(e)}", exc_info=True)
+        raise
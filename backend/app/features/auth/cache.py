@@ -0,0 +1,276 @@
+"""
+In-process cache of the user fields needed to authenticate a request.
+
+get_current_user keeps an AuthenticatedUser snapshot (id, role, is_active,
+email, token_epoch) per user with a TTL and a bounded size (least recently used entries
+are evicted first), so requests from a known user do not reload the user
+row. Entries are invalidated by the repository methods that change them:
+- UserRepository.update_user_profile (profile edits, role changes, deactivation)
+- UserRepository.increment_token_epoch (logout from all sessions)
+- UserRepository.delete_user
+
+An invalidation drops the local entry at once and is published when the
+session commits, so other workers drop their copy too. Publishing goes
+through the shared event backends in app.infrastructure.events:
+- "memory": only the worker that made the change is notified (default);
+  other workers see the change once their entry expires
+- "file": workers on the same host share invalidations through an
+  append-only NDJSON file, a local stand-in for Redis pub/sub
+"""
+
+import logging
+import threading
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass
+from time import monotonic
+from typing import Dict, Optional, Tuple
+
+from sqlalchemy import event
+from sqlmodel import Session
+
+from app.core.config import (
+    AUTH_USER_CACHE_TTL_SECONDS,
+    AUTH_USER_CACHE_MAX_ENTRIES,
+    AUTH_USER_CACHE_BACKEND,
+    AUTH_USER_CACHE_EVENTS_FILE,
+    EVENTS_FILE_MAX_BYTES
+)
+from app.infrastructure.events import InMemoryEventBackend, FileEventBackend
+
+logger = logging.getLogger(__name__)
+
+# Session.info key holding user IDs to invalidate again once the transaction commits
+_PENDING_USERS_KEY = "auth_user_cache_pending_users"
+
+
+@dataclass(frozen=True)
+class AuthenticatedUser:
+    """
+    Snapshot of the user fields used for authentication and authorization.
+
+    Returned by get_current_user in place of the full User row.
+
+    Attributes:
+        id: User ID
+        role: User role (admin, pet_owner)
+        is_active: Whether the account is active
+        email: Email address
+        token_epoch: Tokens carrying an older epoch are revoked
+    """
+    id: uuid.UUID
+    role: str
+    is_active: bool
+    email: str
+    token_epoch: int = 0
+
+    @classmethod
+    def from_user(cls, user) -> "AuthenticatedUser":
+        """
+        Build a snapshot from a User row.
+
+        Args:
+            user: User to copy
+
+        Returns:
+            AuthenticatedUser with the user's current values
+        """
+        return cls(
+            id=user.id, role=user.role, is_active=user.is_active,
+            email=user.email, token_epoch=user.token_epoch
+        )
+
+
+class UserAuthCache:
+    """
+    Thread-safe TTL + LRU cache of AuthenticatedUser snapshots.
+
+    Attributes:
+        ttl_seconds: How long an entry stays valid
+        max_entries: Maximum number of cached users
+        backend: Event backend used to share invalidations between workers
+        hits: Number of lookups answered from the cache
+        misses: Number of lookups that had to load the user
+    """
+
+    def __init__(self, ttl_seconds: float, max_entries: int, backend=None):
+        """
+        Initialize an empty cache.
+
+        Args:
+            ttl_seconds: How long an entry stays valid
+            max_entries: Maximum number of entries before LRU eviction
+            backend: Event backend for cross-worker invalidation; None keeps it local
+        """
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.backend = backend
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[uuid.UUID, Tuple[float, AuthenticatedUser]]" = OrderedDict()
+        self._generation = 0
+        self._started = False
+        self._lock = threading.Lock()
+
+    @property
+    def generation(self) -> int:
+        """Counter bumped by every invalidation; pass it back to set()."""
+        return self._generation
+
+    def get(self, user_id: uuid.UUID) -> Optional[AuthenticatedUser]:
+        """
+        Look up a cached snapshot and update the hit/miss counters.
+
+        Args:
+            user_id: ID of the user
+
+        Returns:
+            Cached AuthenticatedUser, or None if missing or expired
+        """
+        with self._lock:
+            entry = self._entries.get(user_id)
+            if entry is None or entry[0] <= monotonic():
+                if entry is not None:
+                    del self._entries[user_id]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(user_id)
+            self.hits += 1
+            return entry[1]
+
+    def set(self, user: AuthenticatedUser, generation: int) -> None:
+        """
+        Store a snapshot unless an invalidation happened since it was loaded.
+
+        Args:
+            user: Snapshot to cache
+            generation: Value of `generation` read before loading the user
+        """
+        if self.max_entries <= 0 or self.ttl_seconds <= 0:
+            return
+        self._ensure_started()
+        with self._lock:
+            if generation != self._generation:
+                return
+            self._entries[user.id] = (monotonic() + self.ttl_seconds, user)
+            self._entries.move_to_end(user.id)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, user_id: uuid.UUID) -> None:
+        """
+        Drop a user's snapshot in this worker.
+
+        Args:
+            user_id: ID of the changed user
+        """
+        with self._lock:
+            self._entries.pop(user_id, None)
+            self._generation += 1
+
+    def publish_invalidation(self, user_id: uuid.UUID) -> None:
+        """
+        Drop a user's snapshot here and in every worker sharing the backend.
+
+        Args:
+            user_id: ID of the changed user
+        """
+        self.invalidate(user_id)
+        if self.backend is None:
+            return
+        try:
+            self.backend.publish({"user_id": str(user_id)})
+        except Exception as e:
+            logger.error(f"Failed to publish user cache invalidation: {str(e)}")
+
+    def clear(self) -> None:
+        """Drop all entries and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self._generation += 1
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> Dict[str, float]:
+        """
+        Return the cache counters.
+
+        Returns:
+            Dict with hits, misses, hit_ratio and current size
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+                "size": len(self._entries),
+            }
+
+    def _ensure_started(self) -> None:
+        """Start listening for invalidations before the first entry is cached."""
+        if self.backend is None:
+            return
+        with self._lock:
+            if self._started:
+                return
+            self._started = True
+        self.backend.start(self._deliver)
+
+    def _deliver(self, message: dict) -> None:
+        """Apply an invalidation published by any worker."""
+        try:
+            self.invalidate(uuid.UUID(message["user_id"]))
+        except (KeyError, ValueError):
+            logger.warning("Ignoring malformed user cache invalidation")
+
+
+def create_backend(name: str):
+    """
+    Create the invalidation backend selected by configuration.
+
+    Args:
+        name: "memory" or "file"
+
+    Returns:
+        Event backend instance
+
+    Raises:
+        ValueError: If the backend name is unknown
+    """
+    if name == "memory":
+        return InMemoryEventBackend()
+    if name == "file":
+        return FileEventBackend(AUTH_USER_CACHE_EVENTS_FILE, max_bytes=EVENTS_FILE_MAX_BYTES)
+    raise ValueError(f"Unknown AUTH_USER_CACHE_BACKEND: {name}")
+
+
+# Process-wide cache used by get_current_user
+user_auth_cache = UserAuthCache(
+    ttl_seconds=AUTH_USER_CACHE_TTL_SECONDS,
+    max_entries=AUTH_USER_CACHE_MAX_ENTRIES,
+    backend=create_backend(AUTH_USER_CACHE_BACKEND)
+)
+
+
+def invalidate_user_auth(session: Session, user_id: uuid.UUID) -> None:
+    """
+    Invalidate a cached user now and, in every worker, when the session commits.
+
+    Args:
+        session: Session performing the write
+        user_id: ID of the changed user
+    """
+    user_auth_cache.invalidate(user_id)
+
+    pending = session.info.get(_PENDING_USERS_KEY)
+    if pending is None:
+        pending = session.info[_PENDING_USERS_KEY] = set()
+        event.listen(session, "after_commit", _publish_pending_users, once=True)
+    pending.add(user_id)
+
+
+def _publish_pending_users(session: Session) -> None:
+    """Session after_commit hook: publish invalidations queued during the transaction."""
+    for user_id in session.info.pop(_PENDING_USERS_KEY, ()):
+        user_auth_cache.publish_invalidation(user_id)
@@ -13,10 +13,12 @@ class TokenBlacklist(SQLModel, table=True):
     This model stores tokens that have been explicitly invalidated through logout,
     preventing their reuse even if they haven't expired yet. Tokens are stored
     with their expiration time to enable periodic cleanup of expired entries.
+    Only a fixed-size digest of each token's jti is kept (see token_digest in
+    app.infrastructure.auth), which keeps the unique index small.
     
     Attributes:
         id: Unique identifier for the blacklist entry
-        token: The full JWT token string that has been invalidated
+        token_digest: SHA-256 hex digest identifying the invalidated token
         expires_at: When the token naturally expires (for cleanup purposes)
         blacklisted_at: Timestamp when the token was added to the blacklist
         user_id: Foreign key to the user who owned this token
@@ -28,7 +30,7 @@ class TokenBlacklist(SQLModel, table=True):
     __tablename__ = "token_blacklist"
     
     id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
-    token: str = Field(unique=True, index=True, nullable=False)
+    token_digest: str = Field(max_length=64, unique=True, index=True, nullable=False)
     expires_at: datetime = Field(nullable=False, index=True)
     blacklisted_at: datetime = Field(default_factory=get_pht_now, nullable=False)
     
@@ -1,10 +1,14 @@
 """Token blacklist repository for database operations."""
 from sqlmodel import Session, select
+from sqlalchemy import and_, delete
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional, Tuple
 import uuid
 
 from app.features.auth.models import TokenBlacklist
+from app.features.auth.revocation import revoked_tokens
+from app.features.users.models import User
+from app.infrastructure.auth import token_digest
 from app.common.utils import get_pht_now
 
 
@@ -12,7 +16,9 @@ class TokenBlacklistRepository:
     """Repository for TokenBlacklist database operations.
     
     This class handles all database queries related to token blacklisting,
-    following the repository pattern to abstract data access.
+    following the repository pattern to abstract data access. Tokens are
+    stored and looked up by their digest (see token_digest in
+    app.infrastructure.auth), never by the full JWT string.
     
     Requirements:
         - 1.1: Add tokens to blacklist
@@ -32,8 +38,9 @@ class TokenBlacklistRepository:
     def add_token(self, token: str, expires_at: datetime, user_id: uuid.UUID) -> TokenBlacklist:
         """Add a token to the blacklist.
         
-        Creates a new blacklist entry for the given token with its expiration
-        timestamp and associated user ID.
+        Creates a new blacklist entry for the digest of the given token with
+        its expiration timestamp and associated user ID, and records it in
+        this worker's in-memory revocation set.
         
         Args:
             token: The JWT token string to blacklist
@@ -47,23 +54,21 @@ class TokenBlacklistRepository:
             - 1.1: Store invalidated tokens with expiration timestamp
             - 1.3: Store token value for authentication checks
         """
+        digest = token_digest(token)
         blacklist_entry = TokenBlacklist(
-            token=token,
+            token_digest=digest,
             expires_at=expires_at,
             user_id=user_id
         )
         self.session.add(blacklist_entry)
         self.session.flush()
         self.session.refresh(blacklist_entry)
+        revoked_tokens.add(digest)
         return blacklist_entry
     
     def is_token_blacklisted(self, token: str) -> bool:
         """Check if a token is blacklisted and not expired.
         
-        Queries the blacklist for the given token and checks if it exists
-        and has not yet expired. Expired tokens are considered not blacklisted
-        to allow natural token expiration to take precedence.
-        
         Args:
             token: The JWT token string to check
             
@@ -74,19 +79,92 @@ class TokenBlacklistRepository:
             - 1.2: Check if tokens are blacklisted
             - 7.2: Ignore tokens whose expiration timestamp has passed
         """
-        statement = select(TokenBlacklist).where(
-            TokenBlacklist.token == token,
+        return self.is_digest_blacklisted(token_digest(token))
+    
+    def is_digest_blacklisted(self, digest: str) -> bool:
+        """Check if a token digest is blacklisted and not expired.
+        
+        Queries the blacklist for the given digest and checks if it exists
+        and has not yet expired. Expired tokens are considered not blacklisted
+        to allow natural token expiration to take precedence.
+        
+        Args:
+            digest: Digest of the token, from token_digest
+            
+        Returns:
+            True if the token is blacklisted and not expired, False otherwise
+        """
+        statement = select(TokenBlacklist.id).where(
+            TokenBlacklist.token_digest == digest,
             TokenBlacklist.expires_at > get_pht_now()
         )
-        result = self.session.exec(statement).first()
-        return result is not None
+        return self.session.exec(statement).first() is not None
+    
+    def get_active_digests(self) -> List[str]:
+        """Get the digest of every blacklisted token that has not expired yet.
+        
+        Used to load the in-memory revocation set.
+        
+        Returns:
+            List of token digests
+        """
+        statement = select(TokenBlacklist.token_digest).where(
+            TokenBlacklist.expires_at > get_pht_now()
+        )
+        return list(self.session.exec(statement).all())
+    
+    def get_user_for_token(
+        self,
+        user_id: uuid.UUID,
+        digest: str,
+        check_blacklist: bool = True
+    ) -> Tuple[Optional[User], bool]:
+        """Fetch a token's user and its blacklist status in one query.
+        
+        Selects the user LEFT JOINed with any unexpired blacklist entry for
+        the token, so authenticating a request takes a single round trip.
+        Only when the user does not exist is the blacklist checked on its
+        own, so a revoked token is still reported as revoked.
+        
+        Args:
+            user_id: UUID of the user named in the token
+            digest: Digest of the token, from token_digest
+            check_blacklist: False to only load the user, for tokens already
+                known not to be revoked
+            
+        Returns:
+            Tuple of (User or None if not found, whether the token is blacklisted)
+            
+        Requirements:
+            - 1.2: Check if tokens are blacklisted
+            - 7.2: Ignore tokens whose expiration timestamp has passed
+        """
+        if not check_blacklist:
+            return self.session.get(User, user_id), False
+        
+        statement = (
+            select(User, TokenBlacklist.id)
+            .outerjoin(
+                TokenBlacklist,
+                and_(
+                    TokenBlacklist.token_digest == digest,
+                    TokenBlacklist.expires_at > get_pht_now()
+                )
+            )
+            .where(User.id == user_id)
+        )
+        row = self.session.exec(statement).first()
+        if row is None:
+            return None, self.is_digest_blacklisted(digest)
+        user, blacklist_id = row
+        return user, blacklist_id is not None
     
     def remove_expired_tokens(self) -> int:
         """Remove all expired tokens from the blacklist.
         
         Deletes all blacklist entries where the expiration timestamp is
-        earlier than the current time. This prevents the blacklist from
-        growing indefinitely with old token records.
+        earlier than the current time, in a single DELETE. This prevents the
+        blacklist from growing indefinitely with old token records.
         
         Returns:
             Number of tokens removed from the blacklist
@@ -94,19 +172,9 @@ class TokenBlacklistRepository:
         Requirements:
             - 7.4: Delete all records where expiration timestamp is earlier than current time
         """
-        # Find all expired tokens
-        statement = select(TokenBlacklist).where(
+        statement = delete(TokenBlacklist).where(
             TokenBlacklist.expires_at < get_pht_now()
         )
-        expired_tokens = self.session.exec(statement).all()
-        
-        # Delete each expired token
-        count = 0
-        for token in expired_tokens:
-            self.session.delete(token)
-            count += 1
-        
-        # Flush changes to database
+        result = self.session.exec(statement)
         self.session.flush()
-        
-        return count
+        return result.rowcount
@@ -0,0 +1,131 @@
+"""
+In-memory set of revoked token digests in front of the token_blacklist table.
+
+Almost no token presented to the API is revoked, so get_current_user asks
+this set first and only queries token_blacklist for a possible hit. The set
+holds an 8-byte prefix of each revoked token's digest (token_digest in
+app.infrastructure.auth): a prefix collision is a false positive that costs
+one indexed lookup, never a wrongly accepted token.
+
+The set is loaded from the unexpired blacklist entries at startup (and on
+first use), and gains a digest whenever TokenBlacklistRepository.add_token
+revokes a token in this worker. Every TOKEN_REVOCATION_REFRESH_SECONDS it is
+reloaded from the table, so logouts handled by other workers are seen within
+that delay and expired entries are dropped.
+"""
+
+import logging
+import threading
+from time import monotonic
+from typing import Optional, Set
+
+from app.core.config import TOKEN_REVOCATION_REFRESH_SECONDS
+
+logger = logging.getLogger(__name__)
+
+# Bytes of the token digest kept per revoked token
+DIGEST_PREFIX_BYTES = 8
+
+
+def _prefix(digest: str) -> bytes:
+    """Shorten a hex token digest to the bytes kept in the set."""
+    return bytes.fromhex(digest[:DIGEST_PREFIX_BYTES * 2])
+
+
+class RevocationSet:
+    """
+    Thread-safe set of revoked token digests, periodically reloaded.
+
+    Attributes:
+        refresh_seconds: Seconds between reloads from the blacklist table
+        loads: Number of times the set was loaded from the table
+    """
+
+    def __init__(self, refresh_seconds: float):
+        """
+        Initialize an empty, not yet loaded set.
+
+        Args:
+            refresh_seconds: Seconds between reloads from the blacklist table
+        """
+        self.refresh_seconds = refresh_seconds
+        self.loads = 0
+        self._digests: Set[bytes] = set()
+        self._added_during_load: Optional[Set[bytes]] = None
+        self._refresh_at: Optional[float] = None
+        self._loaded = False
+        self._lock = threading.Lock()
+
+    def add(self, digest: str) -> None:
+        """
+        Record a token revoked by this worker.
+
+        Args:
+            digest: Digest of the revoked token
+        """
+        prefix = _prefix(digest)
+        with self._lock:
+            self._digests.add(prefix)
+            if self._added_during_load is not None:
+                self._added_during_load.add(prefix)
+
+    def load(self, token_blacklist_repo) -> None:
+        """
+        Replace the set with the unexpired tokens of the blacklist table.
+
+        Tokens added while the table is being read are kept.
+
+        Args:
+            token_blacklist_repo: TokenBlacklistRepository used to read the table
+        """
+        with self._lock:
+            self._added_during_load = set()
+        try:
+            digests = {_prefix(digest) for digest in token_blacklist_repo.get_active_digests()}
+        except Exception:
+            with self._lock:
+                self._added_during_load = None
+            raise
+        with self._lock:
+            self._digests = digests | self._added_during_load
+            self._added_during_load = None
+            self._refresh_at = monotonic() + self.refresh_seconds
+            self._loaded = True
+            self.loads += 1
+
+    def might_be_revoked(self, digest: str, token_blacklist_repo) -> bool:
+        """
+        Check whether a token may be revoked, reloading the set when it is due.
+
+        Args:
+            digest: Digest of the token
+            token_blacklist_repo: TokenBlacklistRepository used to reload the set
+
+        Returns:
+            False if the token is certainly not revoked, True if the blacklist
+            table must be checked (including while the set has never loaded)
+        """
+        with self._lock:
+            due = self._refresh_at is None or monotonic() >= self._refresh_at
+            if due:
+                # Let a single request reload; the others use the current set
+                self._refresh_at = monotonic() + self.refresh_seconds
+        if due:
+            try:
+                self.load(token_blacklist_repo)
+            except Exception as e:
+                logger.error(f"Failed to load revoked tokens: {str(e)}")
+        if not self._loaded:
+            return True
+        return _prefix(digest) in self._digests
+
+    def clear(self) -> None:
+        """Forget all digests; tokens are checked in the table until the next load."""
+        with self._lock:
+            self._digests = set()
+            self._refresh_at = None
+            self._loaded = False
+
+
+# Process-wide revocation set used by get_current_user
+revoked_tokens = RevocationSet(refresh_seconds=TOKEN_REVOCATION_REFRESH_SECONDS)
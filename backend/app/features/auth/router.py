@@ -5,6 +5,7 @@ This module provides HTTP endpoints for:
 - POST /api/v1/auth/register: Register new user and return JWT token (auto-login)
 - POST /api/v1/auth/login: Login existing user and return JWT token
 - POST /api/v1/auth/logout: Logout user by invalidating their JWT token
+- POST /api/v1/auth/logout-all: Logout user from every session
 """
 
 from fastapi import APIRouter, Depends, status
@@ -15,9 +16,8 @@ from app.features.auth.schemas import RegisterRequest, LoginRequest, TokenRespon
 from app.features.auth.service import AuthService
 from app.features.users.repository import UserRepository
 from app.features.auth.repository import TokenBlacklistRepository
-from app.infrastructure.auth import create_access_token
-from app.common.dependencies import get_current_user
-from app.features.users.models import User
+from app.infrastructure.auth import create_access_token, token_claims
+from app.common.dependencies import AuthenticatedUser, get_current_user
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 
 router = APIRouter(prefix="/api/v1/auth", tags=["Authentication"])
@@ -74,7 +74,7 @@ def register(
     )
     
     # Auto-login: Create JWT token for the newly registered user
-    token = create_access_token({"sub": str(user.id), "role": user.role})
+    token = create_access_token(token_claims(user))
     
     # Commit transaction (handled by get_session dependency)
     
@@ -125,7 +125,7 @@ def login(
 @router.post("/logout", response_model=LogoutResponse)
 def logout(
     credentials: HTTPAuthorizationCredentials = Depends(security),
-    current_user: User = Depends(get_current_user),
+    current_user: AuthenticatedUser = Depends(get_current_user),
     session: Session = Depends(get_session)
 ) -> LogoutResponse:
     """
@@ -195,3 +195,36 @@ def logout(
     auth_service.logout(token, current_user.id)
     
     return LogoutResponse()
+
+
+@router.post("/logout-all", response_model=LogoutResponse)
+def logout_all(
+    current_user: AuthenticatedUser = Depends(get_current_user),
+    session: Session = Depends(get_session)
+) -> LogoutResponse:
+    """
+    Logout user from every session by invalidating all their JWT tokens.
+    
+    Increments the user's token epoch with a single UPDATE. Every token issued
+    before the call, including the one used for it, is rejected afterwards;
+    nothing is added to the token blacklist.
+    
+    **Parameters:**
+    - **Authorization header**: Required. Must contain a valid Bearer token
+      - Format: `Authorization: Bearer <token>`
+    
+    **Response Format:**
+    ```json
+    {
+        "message": "Successfully logged out of all sessions"
+    }
+    ```
+    
+    **Error Responses:**
+    - **401 Unauthorized**: Token is invalid, expired or already invalidated
+    - **403 Forbidden**: User account has been deactivated
+    """
+    auth_service = AuthService(UserRepository(session))
+    auth_service.logout_all(current_user.id)
+    
+    return LogoutResponse(message="Successfully logged out of all sessions")
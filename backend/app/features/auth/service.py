@@ -14,11 +14,12 @@ from datetime import datetime
 import uuid
 from app.features.users.repository import UserRepository
 from app.features.users.models import User
-from app.infrastructure.auth import hash_password, verify_password, create_access_token, verify_token
+from app.infrastructure.auth import hash_password, verify_password, create_access_token, verify_token, token_claims
 from app.common.exceptions import (
     BadRequestException, 
     UnauthorizedException, 
     ForbiddenException,
+    NotFoundException,
     TokenBlacklistedException
 )
 from app.core import config
@@ -162,8 +163,7 @@ class AuthService:
             raise ForbiddenException("Account is deactivated")
         
         # Create JWT token (Requirement 1.5)
-        token_data = {"sub": str(user.id), "role": user.role}
-        access_token = create_access_token(token_data)
+        access_token = create_access_token(token_claims(user))
         
         logger.info(f"Login successful for {email} (role: {user.role})")
         
@@ -223,6 +223,24 @@ class AuthService:
         
         logger.info(f"User {user_id} logged out successfully, token blacklisted until {expires_at}")
     
+    def logout_all(self, user_id: uuid.UUID) -> None:
+        """
+        Logout user from every session by revoking all their issued tokens.
+        
+        Increments the user's token epoch; tokens carrying an older epoch are
+        rejected by get_current_user. No blacklist rows are written.
+        
+        Args:
+            user_id: UUID of the user logging out
+            
+        Raises:
+            NotFoundException: If the user does not exist
+        """
+        if self.user_repo.increment_token_epoch(user_id) is None:
+            raise NotFoundException("User")
+        
+        logger.info(f"User {user_id} logged out of all sessions")
+    
     def verify_token_not_blacklisted(self, token: str) -> None:
         """
         Verify that a token is not in the blacklist.
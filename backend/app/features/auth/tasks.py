@@ -14,6 +14,7 @@ from sqlmodel import Session
 
 from app.core.database import engine
 from app.features.auth.repository import TokenBlacklistRepository
+from app.features.auth.revocation import revoked_tokens
 
 logger = logging.getLogger(__name__)
 
@@ -74,3 +75,19 @@ def cleanup_expired_tokens(session: Optional[Session] = None) -> int:
     except Exception as e:
         logger.error(f"Error during token cleanup: {str(e)}", exc_info=True)
         raise
+
+
+def load_revoked_tokens(session: Optional[Session] = None) -> None:
+    """Load the unexpired blacklisted tokens into the in-memory revocation set.
+    
+    Run at startup so the first requests do not have to load the set.
+    
+    Args:
+        session: Optional database session. If not provided, creates a new session.
+    """
+    if session is not None:
+        revoked_tokens.load(TokenBlacklistRepository(session))
+    else:
+        with Session(engine) as db_session:
+            revoked_tokens.load(TokenBlacklistRepository(db_session))
+    logger.info("Loaded revoked tokens into the in-memory revocation set")
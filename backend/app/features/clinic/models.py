@@ -1,6 +1,7 @@
-"""ClinicStatus model for the vet clinic system."""
+"""Clinic models for the vet clinic system."""
 from sqlmodel import SQLModel, Field
-from datetime import datetime
+from datetime import date, datetime, time
+from typing import Optional
 
 from app.common.utils import get_pht_now
 
@@ -21,3 +22,53 @@ class ClinicStatus(SQLModel, table=True):
     id: int = Field(default=1, primary_key=True)
     status: str = Field(max_length=20, default="open")
     updated_at: datetime = Field(default_factory=get_pht_now)
+
+
+class ClinicWeeklyHours(SQLModel, table=True):
+    """Opening hours of the clinic on one day of the week.
+
+    Weekdays without a row are closed. While the table is empty the clinic
+    uses the default hours (8:00 AM - 8:00 PM every day).
+
+    Attributes:
+        weekday: Day of the week, 0 = Monday ... 6 = Sunday
+        open_time: Opening time
+        close_time: Closing time
+    """
+    __tablename__ = "clinic_weekly_hours"
+
+    weekday: int = Field(primary_key=True, ge=0, le=6)
+    open_time: time
+    close_time: time
+
+
+class ClinicBreak(SQLModel, table=True):
+    """A recurring break (e.g. lunch) on one day of the week.
+
+    Attributes:
+        id: Primary key
+        weekday: Day of the week, 0 = Monday ... 6 = Sunday
+        start_time: When the break starts
+        end_time: When the break ends
+    """
+    __tablename__ = "clinic_breaks"
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+    weekday: int = Field(index=True, ge=0, le=6)
+    start_time: time
+    end_time: time
+
+
+class ClinicClosure(SQLModel, table=True):
+    """A date the clinic is closed, such as a holiday.
+
+    Attributes:
+        day: The closed date
+        reason: Optional explanation shown to clients
+        created_at: When the closure was added
+    """
+    __tablename__ = "clinic_closures"
+
+    day: date = Field(primary_key=True)
+    reason: Optional[str] = Field(default=None, max_length=200)
+    created_at: datetime = Field(default_factory=get_pht_now)
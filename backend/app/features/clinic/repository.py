@@ -1,8 +1,11 @@
-"""Clinic status repository for database operations."""
-from sqlmodel import Session
-from datetime import datetime
+"""Clinic status and schedule repositories for database operations."""
+from sqlmodel import Session, select, delete
+from datetime import date, datetime
+from typing import List, Optional
 
-from app.features.clinic.models import ClinicStatus
+from app.features.clinic.models import ClinicStatus, ClinicWeeklyHours, ClinicBreak, ClinicClosure
+from app.features.clinic.schedule import ClinicSchedule, compile_schedule, invalidate_clinic_schedule
+from app.infrastructure.availability import notify_availability_changed
 from app.common.utils import get_pht_now
 
 
@@ -50,6 +53,7 @@ class ClinicStatusRepository:
         """Update clinic status.
         
         Updates the operational status of the clinic and sets the updated_at timestamp.
+        Cached available slots are invalidated since the status applies to every date.
         
         Args:
             new_status: New status value (open, close, closing_soon)
@@ -65,4 +69,121 @@ class ClinicStatusRepository:
         self.session.add(status)
         self.session.flush()
         self.session.refresh(status)
+        notify_availability_changed(self.session)
         return status
+
+
+class ClinicScheduleRepository:
+    """Repository for the clinic's weekly hours, breaks and closures.
+
+    Every write invalidates the compiled schedule and the cached available
+    slots, since opening hours affect every date.
+    """
+
+    def __init__(self, session: Session):
+        """Initialize the repository with a database session.
+
+        Args:
+            session: SQLModel database session
+        """
+        self.session = session
+
+    def get_weekly_hours(self) -> List[ClinicWeeklyHours]:
+        """Get the configured opening hours, Monday first.
+
+        Returns:
+            List of ClinicWeeklyHours rows (empty while the defaults apply)
+        """
+        statement = select(ClinicWeeklyHours).order_by(ClinicWeeklyHours.weekday)
+        return list(self.session.exec(statement).all())
+
+    def get_breaks(self) -> List[ClinicBreak]:
+        """Get the recurring breaks ordered by weekday and start time.
+
+        Returns:
+            List of ClinicBreak rows
+        """
+        statement = select(ClinicBreak).order_by(ClinicBreak.weekday, ClinicBreak.start_time)
+        return list(self.session.exec(statement).all())
+
+    def replace_weekly_hours(self, hours: List[ClinicWeeklyHours], breaks: List[ClinicBreak]) -> None:
+        """Replace the whole weekly schedule.
+
+        Args:
+            hours: New opening hours, one row per open weekday
+            breaks: New recurring breaks
+        """
+        self.session.exec(delete(ClinicBreak))
+        self.session.exec(delete(ClinicWeeklyHours))
+        self.session.add_all(hours + breaks)
+        self.session.flush()
+        self._invalidate()
+
+    def get_closures(self, from_date: Optional[date] = None) -> List[ClinicClosure]:
+        """Get dated closures in date order.
+
+        Args:
+            from_date: Optional first date to include
+
+        Returns:
+            List of ClinicClosure rows
+        """
+        statement = select(ClinicClosure).order_by(ClinicClosure.day)
+        if from_date:
+            statement = statement.where(ClinicClosure.day >= from_date)
+        return list(self.session.exec(statement).all())
+
+    def get_closure(self, day: date) -> Optional[ClinicClosure]:
+        """Get the closure of a date.
+
+        Args:
+            day: The date
+
+        Returns:
+            ClinicClosure if the date is closed, None otherwise
+        """
+        return self.session.get(ClinicClosure, day)
+
+    def add_closure(self, closure: ClinicClosure) -> ClinicClosure:
+        """Add a dated closure.
+
+        Args:
+            closure: ClinicClosure to add
+
+        Returns:
+            Created ClinicClosure
+        """
+        self.session.add(closure)
+        self.session.flush()
+        self.session.refresh(closure)
+        self._invalidate()
+        return closure
+
+    def delete_closure(self, closure: ClinicClosure) -> None:
+        """Delete a dated closure.
+
+        Args:
+            closure: ClinicClosure to delete
+        """
+        self.session.delete(closure)
+        self.session.flush()
+        self._invalidate()
+
+    def load_schedule(self) -> ClinicSchedule:
+        """Read the schedule tables and compile them.
+
+        Past closures are skipped since no booking can use them.
+
+        Returns:
+            Compiled ClinicSchedule
+        """
+        return compile_schedule(
+            self.get_weekly_hours(),
+            self.get_breaks(),
+            self.get_closures(from_date=get_pht_now().date())
+        )
+
+    def _invalidate(self) -> None:
+        """Drop the compiled schedule and every cached available slot."""
+        invalidate_clinic_schedule(self.session)
+        notify_availability_changed(self.session)
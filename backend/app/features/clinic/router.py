@@ -4,21 +4,34 @@ Clinic router for API endpoints.
 This module implements the HTTP endpoints for clinic status management:
 - GET /api/v1/clinic/status: Get current clinic status (public, no auth required)
 - PATCH /api/v1/clinic/status: Update clinic status (admin-only)
+- GET /api/v1/clinic/hours: Weekly opening hours and breaks (public)
+- PUT /api/v1/clinic/hours: Replace the weekly opening hours and breaks (admin-only)
+- GET /api/v1/clinic/closures: Upcoming dated closures (public)
+- POST /api/v1/clinic/closures: Close the clinic on a date (admin-only)
+- DELETE /api/v1/clinic/closures/{day}: Reopen a closed date (admin-only)
 
-The GET endpoint is public to allow anyone to check if the clinic is open.
-The PATCH endpoint requires admin authentication to update the status.
+The GET endpoints are public to allow anyone to check when the clinic is open.
+The other endpoints require admin authentication.
 
 Requirements: 8.1, 8.2, 8.3
 """
 
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Query, status
 from sqlmodel import Session
+from typing import List, Optional
+from datetime import date as date_type
 
 from app.core.database import get_session
-from app.common.dependencies import require_role
-from app.features.users.models import User
-from app.features.clinic.schemas import ClinicStatusResponse, ClinicStatusUpdateRequest
-from app.features.clinic.repository import ClinicStatusRepository
+from app.common.dependencies import AuthenticatedUser, require_role
+from app.features.clinic.schemas import (
+    ClinicStatusResponse,
+    ClinicStatusUpdateRequest,
+    ClinicHoursResponse,
+    ClinicHoursUpdateRequest,
+    ClinicClosureCreateRequest,
+    ClinicClosureResponse
+)
+from app.features.clinic.repository import ClinicStatusRepository, ClinicScheduleRepository
 from app.features.clinic.service import ClinicService
 
 
@@ -60,7 +73,7 @@ def get_clinic_status(
 @router.patch("/status", response_model=ClinicStatusResponse)
 def update_clinic_status(
     request: ClinicStatusUpdateRequest,
-    current_user: User = Depends(require_role(["admin"])),
+    current_user: AuthenticatedUser = Depends(require_role(["admin"])),
     session: Session = Depends(get_session)
 ) -> ClinicStatusResponse:
     """
@@ -108,3 +121,132 @@ def update_clinic_status(
     session.commit()
     
     return ClinicStatusResponse.model_validate(clinic_status)
+
+
+def _schedule_service(session: Session) -> ClinicService:
+    """Build a ClinicService with schedule access for a request's session."""
+    return ClinicService(ClinicStatusRepository(session), ClinicScheduleRepository(session))
+
+
+@router.get("/hours", response_model=ClinicHoursResponse)
+def get_clinic_hours(
+    session: Session = Depends(get_session)
+) -> ClinicHoursResponse:
+    """
+    Get the weekly opening hours and breaks (public endpoint, no auth required).
+    
+    Args:
+        session: Database session
+        
+    Returns:
+        Open weekdays (0 = Monday) with their hours and breaks, and whether
+        the default hours apply
+    """
+    return ClinicHoursResponse.model_validate(_schedule_service(session).get_hours())
+
+
+@router.put("/hours", response_model=ClinicHoursResponse)
+def update_clinic_hours(
+    request: ClinicHoursUpdateRequest,
+    current_user: AuthenticatedUser = Depends(require_role(["admin"])),
+    session: Session = Depends(get_session)
+) -> ClinicHoursResponse:
+    """
+    Replace the weekly opening hours and breaks (admin only).
+    
+    Weekdays that are not listed are closed. Booking validation and
+    available slots use the new hours as soon as the change is saved.
+    
+    Args:
+        request: Opening hours and breaks of each open weekday
+        current_user: Authenticated admin user (from JWT token)
+        session: Database session
+        
+    Returns:
+        The new weekly hours
+        
+    Raises:
+        400: If hours or breaks are invalid
+        403: If user is not an admin
+        
+    Example Request:
+        {
+            "days": [
+                {"weekday": 0, "open_time": "09:00", "close_time": "17:00",
+                 "breaks": [{"start_time": "12:00", "end_time": "13:00"}]}
+            ]
+        }
+    """
+    hours = _schedule_service(session).update_hours(request.days)
+    session.commit()
+    return ClinicHoursResponse.model_validate(hours)
+
+
+@router.get("/closures", response_model=List[ClinicClosureResponse])
+def get_clinic_closures(
+    from_date: Optional[date_type] = Query(None, description="First date to include (defaults to today)"),
+    session: Session = Depends(get_session)
+) -> List[ClinicClosureResponse]:
+    """
+    Get dated closures such as holidays (public endpoint, no auth required).
+    
+    Args:
+        from_date: First date to include (defaults to today)
+        session: Database session
+        
+    Returns:
+        Closures in date order
+    """
+    closures = _schedule_service(session).get_closures(from_date)
+    return [ClinicClosureResponse.model_validate(closure) for closure in closures]
+
+
+@router.post("/closures", response_model=ClinicClosureResponse, status_code=status.HTTP_201_CREATED)
+def create_clinic_closure(
+    request: ClinicClosureCreateRequest,
+    current_user: AuthenticatedUser = Depends(require_role(["admin"])),
+    session: Session = Depends(get_session)
+) -> ClinicClosureResponse:
+    """
+    Close the clinic on a date (admin only).
+    
+    Existing appointments on the date are kept; no new appointments can be
+    booked and no slots are offered.
+    
+    Args:
+        request: Date to close and optional reason
+        current_user: Authenticated admin user (from JWT token)
+        session: Database session
+        
+    Returns:
+        The created closure
+        
+    Raises:
+        400: If the date is in the past or already closed
+        403: If user is not an admin
+    """
+    closure = _schedule_service(session).add_closure(request.day, request.reason)
+    session.commit()
+    return ClinicClosureResponse.model_validate(closure)
+
+
+@router.delete("/closures/{day}", status_code=status.HTTP_204_NO_CONTENT)
+def delete_clinic_closure(
+    day: date_type,
+    current_user: AuthenticatedUser = Depends(require_role(["admin"])),
+    session: Session = Depends(get_session)
+) -> None:
+    """
+    Reopen a closed date (admin only).
+    
+    Args:
+        day: The closed date (YYYY-MM-DD)
+        current_user: Authenticated admin user (from JWT token)
+        session: Database session
+        
+    Raises:
+        403: If user is not an admin
+        404: If the date has no closure
+    """
+    _schedule_service(session).remove_closure(day)
+    session.commit()
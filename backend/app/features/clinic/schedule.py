@@ -0,0 +1,246 @@
+"""
+Compiled clinic schedule used by booking validation and slot generation.
+
+The weekly hours, breaks and closures tables are read once and compiled
+into a ClinicSchedule. Each date is then turned into a DaySchedule (its
+open periods with breaks cut out) the first time it is needed and kept, so
+checking a booking or generating slots never queries the hours tables.
+
+The process-wide clinic_schedule holder reloads the tables after
+CLINIC_SCHEDULE_TTL_SECONDS and whenever an admin edit commits through
+invalidate_clinic_schedule(). Other worker processes see an edit once
+their copy expires.
+"""
+
+import threading
+from dataclasses import dataclass
+from datetime import date, datetime, time
+from time import monotonic
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import event
+from sqlmodel import Session
+
+from app.core.config import CLINIC_SCHEDULE_TTL_SECONDS
+
+Interval = Tuple[datetime, datetime]
+TimeRange = Tuple[time, time]
+
+# Hours used while no weekly hours are configured
+DEFAULT_OPEN_TIME = time(8, 0)    # 8:00 AM
+DEFAULT_CLOSE_TIME = time(20, 0)  # 8:00 PM
+
+# Compiled days kept per schedule before the memo is reset
+_MAX_COMPILED_DAYS = 1024
+
+
+@dataclass(frozen=True)
+class DaySchedule:
+    """
+    Open periods of the clinic on one date.
+
+    Attributes:
+        day: The date
+        periods: Sorted, disjoint (start, end) open periods; empty when closed
+        closure_reason: Reason of a dated closure, if the date has one
+    """
+    day: date
+    periods: Tuple[Interval, ...]
+    closure_reason: Optional[str] = None
+
+    @property
+    def is_closed(self) -> bool:
+        """Whether the clinic is closed for the whole date."""
+        return not self.periods
+
+    @property
+    def opens_at(self) -> Optional[datetime]:
+        """Start of the first open period, or None when closed."""
+        return self.periods[0][0] if self.periods else None
+
+    @property
+    def closes_at(self) -> Optional[datetime]:
+        """End of the last open period, or None when closed."""
+        return self.periods[-1][1] if self.periods else None
+
+    def contains(self, start_time: datetime, end_time: datetime) -> bool:
+        """
+        Check that an interval fits inside a single open period.
+
+        Args:
+            start_time: Start of the interval
+            end_time: End of the interval
+
+        Returns:
+            True if the clinic is open for the whole interval
+        """
+        return any(start <= start_time and end_time <= end for start, end in self.periods)
+
+
+class ClinicSchedule:
+    """
+    Weekly hours, breaks and closures compiled for fast per-date lookups.
+
+    Attributes:
+        weekly_hours: Opening hours per weekday (0 = Monday); missing weekdays are closed
+        breaks: Break time ranges per weekday
+        closures: Closure reasons per closed date
+    """
+
+    def __init__(
+        self,
+        weekly_hours: Dict[int, TimeRange],
+        breaks: Optional[Dict[int, List[TimeRange]]] = None,
+        closures: Optional[Dict[date, Optional[str]]] = None
+    ):
+        """
+        Initialize a schedule.
+
+        Args:
+            weekly_hours: Opening hours per weekday
+            breaks: Break time ranges per weekday
+            closures: Closure reasons per closed date
+        """
+        self.weekly_hours = weekly_hours
+        self.breaks = {weekday: sorted(ranges) for weekday, ranges in (breaks or {}).items()}
+        self.closures = closures or {}
+        self._days: Dict[date, DaySchedule] = {}
+        self._lock = threading.Lock()
+
+    def day(self, target_date: date) -> DaySchedule:
+        """
+        Get the compiled schedule of a date, compiling it on first use.
+
+        Args:
+            target_date: The date
+
+        Returns:
+            DaySchedule for the date
+        """
+        compiled = self._days.get(target_date)
+        if compiled is None:
+            compiled = self._compile_day(target_date)
+            with self._lock:
+                if len(self._days) >= _MAX_COMPILED_DAYS:
+                    self._days.clear()
+                self._days[target_date] = compiled
+        return compiled
+
+    def _compile_day(self, target_date: date) -> DaySchedule:
+        """Cut the breaks out of a date's opening hours."""
+        if target_date in self.closures:
+            return DaySchedule(target_date, (), self.closures[target_date])
+        hours = self.weekly_hours.get(target_date.weekday())
+        if hours is None:
+            return DaySchedule(target_date, ())
+
+        periods = []
+        cursor, close_time = hours
+        for break_start, break_end in self.breaks.get(target_date.weekday(), []):
+            if break_start > cursor:
+                periods.append((cursor, min(break_start, close_time)))
+            cursor = max(cursor, break_end)
+        if cursor < close_time:
+            periods.append((cursor, close_time))
+
+        return DaySchedule(target_date, tuple(
+            (datetime.combine(target_date, start), datetime.combine(target_date, end))
+            for start, end in periods if start < end
+        ))
+
+
+def compile_schedule(
+    weekly_hours: Iterable,
+    breaks: Iterable,
+    closures: Iterable
+) -> ClinicSchedule:
+    """
+    Build a ClinicSchedule from table rows.
+
+    Args:
+        weekly_hours: ClinicWeeklyHours rows; none means the default hours every day
+        breaks: ClinicBreak rows
+        closures: ClinicClosure rows
+
+    Returns:
+        Compiled ClinicSchedule
+    """
+    hours = {row.weekday: (row.open_time, row.close_time) for row in weekly_hours}
+    if not hours:
+        hours = {weekday: (DEFAULT_OPEN_TIME, DEFAULT_CLOSE_TIME) for weekday in range(7)}
+    breaks_by_weekday: Dict[int, List[TimeRange]] = {}
+    for row in breaks:
+        breaks_by_weekday.setdefault(row.weekday, []).append((row.start_time, row.end_time))
+    return ClinicSchedule(hours, breaks_by_weekday, {row.day: row.reason for row in closures})
+
+
+# Schedule used when no schedule repository is available
+DEFAULT_SCHEDULE = compile_schedule([], [], [])
+
+
+class ClinicScheduleCache:
+    """
+    Thread-safe holder of the compiled schedule with a TTL.
+
+    Attributes:
+        ttl_seconds: How long a loaded schedule stays valid
+        loads: Number of times the schedule tables were read
+    """
+
+    def __init__(self, ttl_seconds: float):
+        """
+        Initialize an empty holder.
+
+        Args:
+            ttl_seconds: How long a loaded schedule stays valid
+        """
+        self.ttl_seconds = ttl_seconds
+        self.loads = 0
+        self._schedule: Optional[ClinicSchedule] = None
+        self._expires_at = 0.0
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    def get(self, schedule_repo) -> ClinicSchedule:
+        """
+        Return the compiled schedule, loading it through the repository if stale.
+
+        Args:
+            schedule_repo: ClinicScheduleRepository used to read the tables
+
+        Returns:
+            The current ClinicSchedule
+        """
+        with self._lock:
+            if self._schedule is not None and monotonic() < self._expires_at:
+                return self._schedule
+            generation = self._generation
+        schedule = schedule_repo.load_schedule()
+        with self._lock:
+            # Keep a schedule loaded before a concurrent invalidation for this call only
+            if generation == self._generation:
+                self._schedule = schedule
+                self._expires_at = monotonic() + self.ttl_seconds
+            self.loads += 1
+        return schedule
+
+    def invalidate(self) -> None:
+        """Drop the compiled schedule so the next lookup reloads it."""
+        with self._lock:
+            self._schedule = None
+            self._generation += 1
+
+
+# Process-wide compiled schedule used by AppointmentService
+clinic_schedule = ClinicScheduleCache(ttl_seconds=CLINIC_SCHEDULE_TTL_SECONDS)
+
+
+def invalidate_clinic_schedule(session: Session) -> None:
+    """
+    Drop the compiled schedule now and when the session commits.
+
+    Args:
+        session: Session performing the edit
+    """
+    clinic_schedule.invalidate()
+    event.listen(session, "after_commit", lambda _session: clinic_schedule.invalidate(), once=True)
@@ -1,15 +1,18 @@
 """
-Clinic status request and response schemas for the Vet Clinic Scheduling System.
+Clinic status and schedule request and response schemas for the Vet Clinic Scheduling System.
 
 This module defines Pydantic schemas for clinic status management:
 - ClinicStatusResponse: Schema for clinic status responses
 - ClinicStatusUpdateRequest: Schema for updating clinic status
+- ClinicHoursUpdateRequest / ClinicHoursResponse: Weekly opening hours and breaks
+- ClinicClosureCreateRequest / ClinicClosureResponse: Dated closures such as holidays
 
 Requirements: 8.1, 8.2
 """
 
 from pydantic import BaseModel, Field
-from datetime import datetime
+from datetime import date, datetime, time
+from typing import List, Optional
 
 
 class ClinicStatusResponse(BaseModel):
@@ -46,3 +49,85 @@ class ClinicStatusUpdateRequest(BaseModel):
     Requirements: 8.2
     """
     status: str = Field(..., description="New operational status: open, close, or closing_soon")
+
+
+class ClinicBreakSchema(BaseModel):
+    """
+    A recurring break within a day's opening hours.
+    
+    Attributes:
+        start_time: When the break starts
+        end_time: When the break ends
+    """
+    start_time: time = Field(..., description="When the break starts (HH:MM)")
+    end_time: time = Field(..., description="When the break ends (HH:MM)")
+
+
+class ClinicDayHours(BaseModel):
+    """
+    Opening hours and breaks of one day of the week.
+    
+    Attributes:
+        weekday: Day of the week, 0 = Monday ... 6 = Sunday
+        open_time: Opening time
+        close_time: Closing time
+        breaks: Breaks during the day, when no appointments are booked
+    """
+    weekday: int = Field(..., ge=0, le=6, description="Day of the week, 0 = Monday ... 6 = Sunday")
+    open_time: time = Field(..., description="Opening time (HH:MM)")
+    close_time: time = Field(..., description="Closing time (HH:MM)")
+    breaks: List[ClinicBreakSchema] = Field(default_factory=list, description="Breaks during the day")
+
+
+class ClinicHoursUpdateRequest(BaseModel):
+    """
+    Request schema for replacing the weekly opening hours.
+    
+    Weekdays that are not listed are closed.
+    
+    Attributes:
+        days: Opening hours of each open weekday
+    """
+    days: List[ClinicDayHours] = Field(..., description="Opening hours of each open weekday")
+
+
+class ClinicHoursResponse(BaseModel):
+    """
+    Response schema for the weekly opening hours.
+    
+    Attributes:
+        days: Opening hours of each open weekday, Monday first
+        is_default: True while no hours are configured and the defaults apply
+    """
+    days: List[ClinicDayHours]
+    is_default: bool
+
+
+class ClinicClosureCreateRequest(BaseModel):
+    """
+    Request schema for closing the clinic on a date.
+    
+    Attributes:
+        day: The date to close (today or later)
+        reason: Optional explanation, such as the holiday's name
+    """
+    day: date = Field(..., description="Date to close (YYYY-MM-DD)")
+    reason: Optional[str] = Field(None, max_length=200, description="Optional reason, e.g. the holiday")
+
+
+class ClinicClosureResponse(BaseModel):
+    """
+    Response schema for a dated closure.
+    
+    Attributes:
+        day: The closed date
+        reason: Optional explanation
+        created_at: When the closure was added
+    """
+    day: date
+    reason: Optional[str] = None
+    created_at: datetime
+    
+    class Config:
+        """Pydantic configuration."""
+        from_attributes = True
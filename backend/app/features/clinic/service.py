@@ -4,12 +4,21 @@ Clinic service layer for business logic.
 This module implements the business logic for clinic status management including:
 - Getting current clinic status (public access)
 - Updating clinic status (admin only)
+- Reading and replacing the weekly opening hours and breaks
+- Adding and removing dated closures such as holidays
 
 Requirements: 8.1, 8.2
 """
 
-from app.features.clinic.models import ClinicStatus
-from app.features.clinic.repository import ClinicStatusRepository
+from datetime import date
+from typing import Dict, List, Optional
+
+from app.features.clinic.models import ClinicStatus, ClinicWeeklyHours, ClinicBreak, ClinicClosure
+from app.features.clinic.repository import ClinicStatusRepository, ClinicScheduleRepository
+from app.features.clinic.schedule import DEFAULT_OPEN_TIME, DEFAULT_CLOSE_TIME
+from app.features.clinic.schemas import ClinicDayHours
+from app.common.exceptions import BadRequestException, NotFoundException
+from app.common.utils import get_pht_now
 
 
 class ClinicService:
@@ -23,14 +32,21 @@ class ClinicService:
     but only administrators can update it.
     """
     
-    def __init__(self, clinic_status_repo: ClinicStatusRepository):
+    def __init__(
+        self,
+        clinic_status_repo: ClinicStatusRepository,
+        schedule_repo: Optional[ClinicScheduleRepository] = None
+    ):
         """
         Initialize the service with a clinic status repository.
         
         Args:
             clinic_status_repo: ClinicStatusRepository instance for database operations
+            schedule_repo: Repository for opening hours and closures, needed by
+                the schedule methods
         """
         self.clinic_status_repo = clinic_status_repo
+        self.schedule_repo = schedule_repo
     
     def get_status(self) -> ClinicStatus:
         """
@@ -64,3 +80,130 @@ class ClinicService:
         Requirements: 8.2
         """
         return self.clinic_status_repo.update_status(new_status)
+
+    def get_hours(self) -> Dict[str, object]:
+        """
+        Get the weekly opening hours and breaks (public endpoint).
+        
+        Returns:
+            Dict with the open weekdays (Monday first, each with its breaks)
+            and is_default, True while no hours are configured
+        """
+        hours = self.schedule_repo.get_weekly_hours()
+        if not hours:
+            return {
+                "days": [
+                    {"weekday": weekday, "open_time": DEFAULT_OPEN_TIME,
+                     "close_time": DEFAULT_CLOSE_TIME, "breaks": []}
+                    for weekday in range(7)
+                ],
+                "is_default": True,
+            }
+        
+        breaks_by_weekday = {}
+        for clinic_break in self.schedule_repo.get_breaks():
+            breaks_by_weekday.setdefault(clinic_break.weekday, []).append(
+                {"start_time": clinic_break.start_time, "end_time": clinic_break.end_time}
+            )
+        return {
+            "days": [
+                {"weekday": row.weekday, "open_time": row.open_time, "close_time": row.close_time,
+                 "breaks": breaks_by_weekday.get(row.weekday, [])}
+                for row in hours
+            ],
+            "is_default": False,
+        }
+    
+    def update_hours(self, days: List[ClinicDayHours]) -> Dict[str, object]:
+        """
+        Replace the weekly opening hours and breaks (admin only).
+        
+        Weekdays that are not listed become closed. Existing appointments
+        are kept even if they now fall outside the hours.
+        
+        Args:
+            days: Opening hours of each open weekday
+        
+        Returns:
+            The new weekly hours, as returned by get_hours()
+        
+        Raises:
+            BadRequestException: If no weekday is open, a weekday is listed
+                twice, or hours or breaks are empty, reversed or overlapping
+        """
+        if not days:
+            raise BadRequestException("At least one weekday must be open")
+        if len({day.weekday for day in days}) != len(days):
+            raise BadRequestException("Each weekday can only be listed once")
+        
+        hours, breaks = [], []
+        for day in days:
+            if day.open_time >= day.close_time:
+                raise BadRequestException(f"Weekday {day.weekday}: close_time must be after open_time")
+            previous_end = day.open_time
+            for clinic_break in sorted(day.breaks, key=lambda item: item.start_time):
+                if clinic_break.start_time >= clinic_break.end_time:
+                    raise BadRequestException(f"Weekday {day.weekday}: break end_time must be after start_time")
+                if clinic_break.start_time < previous_end or clinic_break.end_time > day.close_time:
+                    raise BadRequestException(
+                        f"Weekday {day.weekday}: breaks must not overlap and must fall within opening hours"
+                    )
+                previous_end = clinic_break.end_time
+                breaks.append(ClinicBreak(
+                    weekday=day.weekday, start_time=clinic_break.start_time, end_time=clinic_break.end_time
+                ))
+            hours.append(ClinicWeeklyHours(
+                weekday=day.weekday, open_time=day.open_time, close_time=day.close_time
+            ))
+        
+        self.schedule_repo.replace_weekly_hours(hours, breaks)
+        return self.get_hours()
+    
+    def get_closures(self, from_date: Optional[date] = None) -> List[ClinicClosure]:
+        """
+        Get dated closures (public endpoint).
+        
+        Args:
+            from_date: First date to include (defaults to today)
+        
+        Returns:
+            List of ClinicClosure objects in date order
+        """
+        return self.schedule_repo.get_closures(from_date=from_date or get_pht_now().date())
+    
+    def add_closure(self, day: date, reason: Optional[str] = None) -> ClinicClosure:
+        """
+        Close the clinic on a date (admin only).
+        
+        Existing appointments on the date are kept; no new ones can be booked.
+        
+        Args:
+            day: The date to close
+            reason: Optional explanation, such as the holiday's name
+        
+        Returns:
+            Created ClinicClosure
+        
+        Raises:
+            BadRequestException: If the date is in the past or already closed
+        """
+        if day < get_pht_now().date():
+            raise BadRequestException("Cannot close the clinic on a past date")
+        if self.schedule_repo.get_closure(day):
+            raise BadRequestException(f"The clinic is already closed on {day.isoformat()}")
+        return self.schedule_repo.add_closure(ClinicClosure(day=day, reason=reason))
+    
+    def remove_closure(self, day: date) -> None:
+        """
+        Reopen the clinic on a closed date (admin only).
+        
+        Args:
+            day: The closed date
+        
+        Raises:
+            NotFoundException: If the date has no closure
+        """
+        closure = self.schedule_repo.get_closure(day)
+        if not closure:
+            raise NotFoundException("Closure")
+        self.schedule_repo.delete_closure(closure)
@@ -1,6 +1,7 @@
 """Pet repository for database operations."""
 from sqlmodel import Session, select
-from typing import Optional, List
+from sqlalchemy import func
+from typing import Optional, List, Tuple
 from datetime import datetime
 import uuid
 
@@ -46,6 +47,22 @@ class PetRepository:
         statement = select(Pet).where(Pet.owner_id == owner_id)
         return list(self.session.exec(statement).all())
     
+    def get_fingerprint(self, owner_id: Optional[uuid.UUID] = None) -> Tuple[int, Optional[datetime]]:
+        """Get the number of pets and the latest modification time.
+        
+        Used to build the ETag of the pet list without loading the pets.
+        
+        Args:
+            owner_id: Optional owner to restrict the pets to
+            
+        Returns:
+            Tuple of (pet count, max(updated_at) or None when there are no pets)
+        """
+        statement = select(func.count(Pet.id), func.max(Pet.updated_at))
+        if owner_id:
+            statement = statement.where(Pet.owner_id == owner_id)
+        return tuple(self.session.exec(statement).one())
+    
     def get_all(self) -> List[Pet]:
         """Get all pets in the system (admin only).
         
@@ -14,14 +14,14 @@ while admins can access all pets.
 Requirements: 3.1, 3.2, 3.3, 3.4, 3.5, 3.6, 4.4
 """
 
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Request, Response, status
 from sqlmodel import Session
 from typing import List
 import uuid
 
 from app.core.database import get_session
-from app.common.dependencies import get_current_user
-from app.features.users.models import User
+from app.common.dependencies import AuthenticatedUser, get_current_user
+from app.common.etag import LIST_CACHE_CONTROL, etag_matches, make_weak_etag, not_modified
 from app.features.pets.models import Pet
 from app.features.pets.schemas import PetCreateRequest, PetUpdateRequest, PetResponse
 from app.features.pets.repository import PetRepository
@@ -34,7 +34,7 @@ router = APIRouter(prefix="/api/v1/pets", tags=["Pets"])
 @router.post("", response_model=PetResponse, status_code=status.HTTP_201_CREATED)
 def create_pet(
     request: PetCreateRequest,
-    current_user: User = Depends(get_current_user),
+    current_user: AuthenticatedUser = Depends(get_current_user),
     session: Session = Depends(get_session)
 ) -> PetResponse:
     """
@@ -79,7 +79,9 @@ def create_pet(
 
 @router.get("", response_model=List[PetResponse])
 def get_pets(
-    current_user: User = Depends(get_current_user),
+    request: Request,
+    response: Response,
+    current_user: AuthenticatedUser = Depends(get_current_user),
     session: Session = Depends(get_session)
 ) -> List[PetResponse]:
     """
@@ -90,12 +92,17 @@ def get_pets(
     
     All pets include a computed vaccination_status field.
     
+    Responses carry a weak ETag (pet count, latest updated_at and today's
+    date); a matching If-None-Match header gets 304 Not Modified.
+    
     Args:
+        request: Incoming request (If-None-Match header)
+        response: Response used to set the ETag header
         current_user: Authenticated user (from JWT token)
         session: Database session
         
     Returns:
-        List of pets with computed vaccination_status
+        List of pets with computed vaccination_status, or 304 Not Modified
         
     Raises:
         401: If authentication fails
@@ -105,8 +112,14 @@ def get_pets(
     pet_repo = PetRepository(session)
     pet_service = PetService(pet_repo)
     
+    etag = make_weak_etag(*pet_service.get_pets_fingerprint(current_user), current_user.id)
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return not_modified(etag)
+    
     pets = pet_service.get_pets(current_user)
     
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = LIST_CACHE_CONTROL
     # Return responses with computed vaccination status
     return [PetResponse.from_pet(pet) for pet in pets]
 
@@ -114,7 +127,7 @@ def get_pets(
 @router.get("/{pet_id}", response_model=PetResponse)
 def get_pet(
     pet_id: uuid.UUID,
-    current_user: User = Depends(get_current_user),
+    current_user: AuthenticatedUser = Depends(get_current_user),
     session: Session = Depends(get_session)
 ) -> PetResponse:
     """
@@ -153,7 +166,7 @@ def get_pet(
 def update_pet(
     pet_id: uuid.UUID,
     request: PetUpdateRequest,
-    current_user: User = Depends(get_current_user),
+    current_user: AuthenticatedUser = Depends(get_current_user),
     session: Session = Depends(get_session)
 ) -> PetResponse:
     """
@@ -200,7 +213,7 @@ def update_pet(
 @router.delete("/{pet_id}", status_code=status.HTTP_204_NO_CONTENT)
 def delete_pet(
     pet_id: uuid.UUID,
-    current_user: User = Depends(get_current_user),
+    current_user: AuthenticatedUser = Depends(get_current_user),
     session: Session = Depends(get_session)
 ) -> None:
     """
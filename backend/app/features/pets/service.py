@@ -16,8 +16,9 @@ import uuid
 
 from app.features.pets.models import Pet
 from app.features.pets.repository import PetRepository
-from app.features.users.models import User
 from app.common.exceptions import NotFoundException, ForbiddenException
+from app.common.utils import get_pht_now
+from app.common.dependencies import AuthenticatedUser
 
 
 class PetService:
@@ -41,7 +42,7 @@ class PetService:
         self,
         name: str,
         species: str,
-        current_user: User,
+        current_user: AuthenticatedUser,
         breed: Optional[str] = None,
         date_of_birth: Optional[date] = None,
         last_vaccination: Optional[datetime] = None,
@@ -84,7 +85,7 @@ class PetService:
         
         return self.pet_repo.create(pet)
     
-    def get_pets(self, current_user: User) -> List[Pet]:
+    def get_pets(self, current_user: AuthenticatedUser) -> List[Pet]:
         """
         Get pets based on user role.
         
@@ -104,7 +105,24 @@ class PetService:
         else:
             return self.pet_repo.get_all_by_owner(current_user.id)
     
-    def get_pet_by_id(self, pet_id: uuid.UUID, current_user: User) -> Pet:
+    def get_pets_fingerprint(self, current_user: AuthenticatedUser) -> tuple:
+        """
+        Get a cheap fingerprint of the pets get_pets would return.
+        
+        The list's vaccination_status is computed against today's date,
+        so the date is part of the fingerprint.
+        
+        Args:
+            current_user: Authenticated user
+        
+        Returns:
+            Tuple of (pet count, latest updated_at, today's date)
+        """
+        owner_id = None if current_user.role == "admin" else current_user.id
+        count, last_updated = self.pet_repo.get_fingerprint(owner_id)
+        return count, last_updated, get_pht_now().date()
+    
+    def get_pet_by_id(self, pet_id: uuid.UUID, current_user: AuthenticatedUser) -> Pet:
         """
         Get a specific pet with ownership validation.
         
@@ -137,7 +155,7 @@ class PetService:
     def update_pet(
         self,
         pet_id: uuid.UUID,
-        current_user: User,
+        current_user: AuthenticatedUser,
         name: Optional[str] = None,
         species: Optional[str] = None,
         breed: Optional[str] = None,
@@ -195,7 +213,7 @@ class PetService:
         
         return self.pet_repo.update(pet)
     
-    def delete_pet(self, pet_id: uuid.UUID, current_user: User) -> None:
+    def delete_pet(self, pet_id: uuid.UUID, current_user: AuthenticatedUser) -> None:
         """
         Delete a pet with ownership validation.
         
@@ -0,0 +1 @@
+"""Resources feature module for vets and rooms that appointments are assigned to."""
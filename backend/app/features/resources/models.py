@@ -0,0 +1,37 @@
+"""Resource model for the vet clinic system."""
+from sqlmodel import SQLModel, Field
+from sqlalchemy import Column, JSON
+from datetime import datetime
+from typing import List, Optional
+
+from app.common.utils import get_pht_now
+
+
+class Resource(SQLModel, table=True):
+    """Resource model representing a vet or room that serves appointments.
+    
+    Each appointment is assigned to one resource, and a resource serves one
+    appointment at a time. While no resource is active, the whole clinic
+    acts as a single resource.
+    
+    The integer id lets the PostgreSQL double-booking constraint compare
+    resources with int4range, which GiST supports without extensions.
+    
+    Attributes:
+        id: Primary key
+        name: Display name (e.g. "Dr. Santos", "Surgery Room 1")
+        kind: vet or room
+        service_types: Service types the resource can provide
+        is_active: Whether new appointments can be assigned to the resource
+        created_at: Timestamp when the resource was created
+        updated_at: Timestamp when the resource was last updated
+    """
+    __tablename__ = "resources"
+    
+    id: Optional[int] = Field(default=None, primary_key=True)
+    name: str = Field(max_length=100, unique=True, nullable=False)
+    kind: str = Field(max_length=20, nullable=False)  # vet, room
+    service_types: List[str] = Field(default_factory=list, sa_column=Column(JSON, nullable=False))
+    is_active: bool = Field(default=True)
+    created_at: datetime = Field(default_factory=get_pht_now)
+    updated_at: datetime = Field(default_factory=get_pht_now)
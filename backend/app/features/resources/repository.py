@@ -0,0 +1,96 @@
+"""Resource repository for database operations."""
+from sqlmodel import Session, select
+from typing import List, Optional
+
+from app.features.resources.models import Resource
+from app.infrastructure.availability import notify_availability_changed
+
+
+class ResourceRepository:
+    """Repository for Resource database operations.
+    
+    This class handles all database queries related to resources,
+    following the repository pattern to abstract data access.
+    
+    Resources change which slots are available on every date, so creating
+    or updating one clears the availability cache when the session commits.
+    """
+    
+    def __init__(self, session: Session):
+        """Initialize the repository with a database session.
+        
+        Args:
+            session: SQLModel database session
+        """
+        self.session = session
+    
+    def create(self, resource: Resource) -> Resource:
+        """Create a new resource.
+        
+        Args:
+            resource: Resource object to create
+            
+        Returns:
+            Created Resource object with generated ID
+        """
+        self.session.add(resource)
+        self.session.flush()
+        self.session.refresh(resource)
+        notify_availability_changed(self.session)
+        return resource
+    
+    def update(self, resource: Resource) -> Resource:
+        """Save changes to a resource.
+        
+        Args:
+            resource: Resource object with modified fields
+            
+        Returns:
+            Updated Resource object
+        """
+        self.session.add(resource)
+        self.session.flush()
+        self.session.refresh(resource)
+        notify_availability_changed(self.session)
+        return resource
+    
+    def get_by_id(self, resource_id: int) -> Optional[Resource]:
+        """Get resource by ID.
+        
+        Args:
+            resource_id: ID of the resource
+            
+        Returns:
+            Resource object if found, None otherwise
+        """
+        return self.session.get(Resource, resource_id)
+    
+    def get_by_name(self, name: str) -> Optional[Resource]:
+        """Get resource by name.
+        
+        Args:
+            name: Display name of the resource
+            
+        Returns:
+            Resource object if found, None otherwise
+        """
+        return self.session.exec(select(Resource).where(Resource.name == name)).first()
+    
+    def get_all(self) -> List[Resource]:
+        """Get all resources ordered by ID.
+        
+        Returns:
+            List of Resource objects
+        """
+        return list(self.session.exec(select(Resource).order_by(Resource.id)).all())
+    
+    def get_active(self) -> List[Resource]:
+        """Get active resources ordered by ID.
+        
+        The ID order is the order in which bookings fill resources.
+        
+        Returns:
+            List of active Resource objects
+        """
+        statement = select(Resource).where(Resource.is_active.is_(True)).order_by(Resource.id)
+        return list(self.session.exec(statement).all())
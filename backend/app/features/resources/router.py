@@ -0,0 +1,116 @@
+"""
+Resource router for API endpoints.
+
+This module implements the HTTP endpoints for resource management:
+- GET /api/v1/resources: List vets and rooms
+- POST /api/v1/resources: Create a resource (admin only)
+- PATCH /api/v1/resources/{resource_id}: Update or deactivate a resource (admin only)
+
+Bookings are assigned to a free active resource that provides the service.
+"""
+
+from fastapi import APIRouter, Depends, status
+from sqlmodel import Session
+from typing import List
+
+from app.core.database import get_session
+from app.common.dependencies import AuthenticatedUser, get_current_user, require_role
+from app.features.resources.schemas import ResourceCreateRequest, ResourceUpdateRequest, ResourceResponse
+from app.features.resources.repository import ResourceRepository
+from app.features.resources.service import ResourceService
+
+
+router = APIRouter(prefix="/api/v1/resources", tags=["Resources"])
+
+
+@router.get("", response_model=List[ResourceResponse])
+def get_resources(
+    current_user: AuthenticatedUser = Depends(get_current_user),
+    session: Session = Depends(get_session)
+) -> List[ResourceResponse]:
+    """
+    List all resources, active or not.
+    
+    Args:
+        current_user: Authenticated user (from JWT token)
+        session: Database session
+        
+    Returns:
+        Resources ordered by ID
+        
+    Raises:
+        401: If authentication fails
+    """
+    resources = ResourceService(ResourceRepository(session)).get_resources()
+    return [ResourceResponse.model_validate(resource) for resource in resources]
+
+
+@router.post("", response_model=ResourceResponse, status_code=status.HTTP_201_CREATED)
+def create_resource(
+    request: ResourceCreateRequest,
+    current_user: AuthenticatedUser = Depends(require_role(["admin"])),
+    session: Session = Depends(get_session)
+) -> ResourceResponse:
+    """
+    Create a vet or room (admin only).
+    
+    Args:
+        request: Name, kind and service types of the resource
+        current_user: Authenticated admin user (from JWT token)
+        session: Database session
+        
+    Returns:
+        The created resource
+        
+    Raises:
+        401: If authentication fails
+        403: If user is not an admin
+        400: If the name is already taken
+        422: If request data is invalid
+    """
+    resource = ResourceService(ResourceRepository(session)).create_resource(
+        name=request.name,
+        kind=request.kind.value,
+        service_types=[service_type.value for service_type in request.service_types]
+    )
+    session.commit()
+    return ResourceResponse.model_validate(resource)
+
+
+@router.patch("/{resource_id}", response_model=ResourceResponse)
+def update_resource(
+    resource_id: int,
+    request: ResourceUpdateRequest,
+    current_user: AuthenticatedUser = Depends(require_role(["admin"])),
+    session: Session = Depends(get_session)
+) -> ResourceResponse:
+    """
+    Update or deactivate a resource (admin only).
+    
+    Args:
+        resource_id: ID of the resource
+        request: Fields to change
+        current_user: Authenticated admin user (from JWT token)
+        session: Database session
+        
+    Returns:
+        The updated resource
+        
+    Raises:
+        401: If authentication fails
+        403: If user is not an admin
+        404: If the resource doesn't exist
+        400: If the new name is already taken
+        422: If request data is invalid
+    """
+    resource = ResourceService(ResourceRepository(session)).update_resource(
+        resource_id,
+        name=request.name,
+        service_types=(
+            [service_type.value for service_type in request.service_types]
+            if request.service_types is not None else None
+        ),
+        is_active=request.is_active
+    )
+    session.commit()
+    return ResourceResponse.model_validate(resource)
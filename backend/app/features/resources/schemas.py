@@ -0,0 +1,68 @@
+"""
+Resource request and response schemas for the Vet Clinic Scheduling System.
+
+This module defines Pydantic schemas for resource management:
+- ResourceCreateRequest: Schema for creating a resource
+- ResourceUpdateRequest: Schema for updating a resource
+- ResourceResponse: Schema for resource responses
+"""
+
+from pydantic import BaseModel, Field
+from datetime import datetime
+from typing import List, Optional
+
+from app.common.enums import ResourceKind, ServiceType
+
+
+class ResourceCreateRequest(BaseModel):
+    """
+    Request schema for creating a resource.
+    
+    Attributes:
+        name: Display name (unique)
+        kind: vet or room
+        service_types: Service types the resource can provide
+    """
+    name: str = Field(..., min_length=1, max_length=100, description="Display name")
+    kind: ResourceKind = Field(..., description="Kind of resource: vet or room")
+    service_types: List[ServiceType] = Field(..., min_length=1, description="Service types the resource can provide")
+
+
+class ResourceUpdateRequest(BaseModel):
+    """
+    Request schema for updating a resource. All fields are optional.
+    
+    Attributes:
+        name: New display name
+        service_types: New list of service types
+        is_active: Whether new appointments can be assigned to the resource
+    """
+    name: Optional[str] = Field(None, min_length=1, max_length=100, description="Display name")
+    service_types: Optional[List[ServiceType]] = Field(None, min_length=1, description="Service types the resource can provide")
+    is_active: Optional[bool] = Field(None, description="Whether new appointments can be assigned to the resource")
+
+
+class ResourceResponse(BaseModel):
+    """
+    Response schema for a resource.
+    
+    Attributes:
+        id: Resource ID
+        name: Display name
+        kind: vet or room
+        service_types: Service types the resource can provide
+        is_active: Whether new appointments can be assigned to the resource
+        created_at: Timestamp when the resource was created
+        updated_at: Timestamp when the resource was last updated
+    """
+    id: int
+    name: str
+    kind: str
+    service_types: List[str]
+    is_active: bool
+    created_at: datetime
+    updated_at: datetime
+    
+    class Config:
+        """Pydantic configuration."""
+        from_attributes = True
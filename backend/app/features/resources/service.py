@@ -0,0 +1,105 @@
+"""
+Resource service layer for business logic.
+
+This module implements the business logic for resource management including:
+- Listing resources
+- Creating resources (admin only)
+- Updating and deactivating resources (admin only)
+
+Deactivating a resource stops new bookings on it; its existing
+appointments stay assigned to it.
+"""
+
+from typing import List, Optional
+
+from app.features.resources.models import Resource
+from app.features.resources.repository import ResourceRepository
+from app.common.exceptions import BadRequestException, NotFoundException
+from app.common.utils import get_pht_now
+
+
+class ResourceService:
+    """
+    Service layer for resource management operations.
+    
+    Authorization is handled at the router layer: anyone signed in can list
+    resources, only administrators can create or change them.
+    """
+    
+    def __init__(self, resource_repo: ResourceRepository):
+        """
+        Initialize the service with a resource repository.
+        
+        Args:
+            resource_repo: ResourceRepository instance for database operations
+        """
+        self.resource_repo = resource_repo
+    
+    def get_resources(self) -> List[Resource]:
+        """
+        Get all resources, active or not.
+        
+        Returns:
+            List of Resource objects ordered by ID
+        """
+        return self.resource_repo.get_all()
+    
+    def create_resource(self, name: str, kind: str, service_types: List[str]) -> Resource:
+        """
+        Create a resource.
+        
+        Args:
+            name: Display name (unique)
+            kind: vet or room
+            service_types: Service types the resource can provide
+            
+        Returns:
+            Created Resource object
+            
+        Raises:
+            BadRequestException: If the name is already taken
+        """
+        if self.resource_repo.get_by_name(name):
+            raise BadRequestException(f"Resource '{name}' already exists")
+        
+        resource = Resource(name=name, kind=kind, service_types=list(service_types))
+        return self.resource_repo.create(resource)
+    
+    def update_resource(
+        self,
+        resource_id: int,
+        name: Optional[str] = None,
+        service_types: Optional[List[str]] = None,
+        is_active: Optional[bool] = None
+    ) -> Resource:
+        """
+        Update a resource. Fields left as None are unchanged.
+        
+        Args:
+            resource_id: ID of the resource
+            name: New display name
+            service_types: New list of service types
+            is_active: Whether new appointments can be assigned to the resource
+            
+        Returns:
+            Updated Resource object
+            
+        Raises:
+            NotFoundException: If the resource doesn't exist
+            BadRequestException: If the new name is already taken
+        """
+        resource = self.resource_repo.get_by_id(resource_id)
+        if not resource:
+            raise NotFoundException("Resource")
+        
+        if name is not None and name != resource.name:
+            if self.resource_repo.get_by_name(name):
+                raise BadRequestException(f"Resource '{name}' already exists")
+            resource.name = name
+        if service_types is not None:
+            resource.service_types = list(service_types)
+        if is_active is not None:
+            resource.is_active = is_active
+        resource.updated_at = get_pht_now()
+        
+        return self.resource_repo.update(resource)
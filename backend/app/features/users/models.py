@@ -23,7 +23,10 @@ class User(SQLModel, table=True):
         city: User's city location (optional)
         preferences: User preferences stored as JSON (optional)
         is_active: Whether the user account is active
+        token_epoch: Tokens issued with an older epoch are rejected; incremented
+            to log the user out of every session
         created_at: Timestamp when the user was created
+        updated_at: Timestamp when the user was last updated
         pets: Relationship to pets owned by this user
     """
     __tablename__ = "users"
@@ -37,7 +40,9 @@ class User(SQLModel, table=True):
     city: Optional[str] = Field(default=None, max_length=100, nullable=True)
     preferences: Optional[Dict[str, Any]] = Field(default=None, sa_column=Column(JSON, nullable=True))
     is_active: bool = Field(default=True)
+    token_epoch: int = Field(default=0, nullable=False, sa_column_kwargs={"server_default": "0"})
     created_at: datetime = Field(default_factory=get_pht_now)
+    updated_at: datetime = Field(default_factory=get_pht_now)
     
     # Relationships
     pets: List["Pet"] = Relationship(back_populates="owner", cascade_delete=True)
@@ -1,9 +1,13 @@
 """User repository for database operations."""
 from sqlmodel import Session, select
-from typing import Optional, List
+from sqlalchemy import func, update
+from typing import Optional, List, Tuple
+from datetime import datetime
 import uuid
 
 from app.features.users.models import User
+from app.features.auth.cache import invalidate_user_auth
+from app.common.utils import get_pht_now
 
 
 class UserRepository:
@@ -72,6 +76,11 @@ class UserRepository:
     def update_user_profile(self, user_id: uuid.UUID, updates: dict) -> Optional[User]:
         """Update user profile with provided fields.
         
+        Also used to change a user's role or deactivate the account, so the
+        user's cached authentication snapshot is invalidated. Deactivating the
+        account or changing the password also revokes every issued token by
+        incrementing token_epoch.
+        
         Args:
             user_id: UUID of the user to update
             updates: Dictionary of fields to update
@@ -87,12 +96,40 @@ class UserRepository:
         for key, value in updates.items():
             if hasattr(user, key):
                 setattr(user, key, value)
+        if "hashed_password" in updates or updates.get("is_active") is False:
+            user.token_epoch += 1
+        user.updated_at = get_pht_now()
         
         self.session.add(user)
         self.session.flush()
         self.session.refresh(user)
+        invalidate_user_auth(self.session, user_id)
         return user
     
+    def increment_token_epoch(self, user_id: uuid.UUID) -> Optional[int]:
+        """Revoke every token issued to a user with a single UPDATE.
+        
+        The epoch is incremented in the database without loading the user; a
+        copy of the user already in the session gets the new value on next access.
+        
+        Args:
+            user_id: UUID of the user
+            
+        Returns:
+            The new token epoch, or None if the user does not exist
+        """
+        statement = (
+            update(User)
+            .where(User.id == user_id)
+            .values(token_epoch=User.token_epoch + 1)
+            .returning(User.token_epoch)
+            .execution_options(synchronize_session="fetch")
+        )
+        token_epoch = self.session.exec(statement).scalar_one_or_none()
+        if token_epoch is not None:
+            invalidate_user_auth(self.session, user_id)
+        return token_epoch
+    
     def email_exists_for_other_user(self, email: str, user_id: uuid.UUID) -> bool:
         """Check if an email is already used by a different user.
         
@@ -125,8 +162,20 @@ class UserRepository:
         
         self.session.delete(user)
         self.session.flush()
+        invalidate_user_auth(self.session, user_id)
         return True
 
+    def get_fingerprint(self) -> Tuple[int, Optional[datetime]]:
+        """Get the number of users and the latest modification time.
+        
+        Used to build the ETag of the user list without loading the users.
+        
+        Returns:
+            Tuple of (user count, max(updated_at) or None when there are no users)
+        """
+        statement = select(func.count(User.id), func.max(User.updated_at))
+        return tuple(self.session.exec(statement).one())
+
     def get_all_users(self) -> List[User]:
         """Get all users in the system (admin only).
         
@@ -7,7 +7,7 @@ This module provides HTTP endpoints for:
 - POST /api/v1/users/profile/delete: Permanently delete current user's account
 """
 
-from fastapi import APIRouter, Depends, Response, status
+from fastapi import APIRouter, Depends, Request, Response, status
 from sqlmodel import Session
 from typing import List
 
@@ -15,15 +15,17 @@ from app.core.database import get_session
 from app.features.users.schemas import UserProfileResponse, UserProfileUpdate, DeleteAccountRequest
 from app.features.users.service import UserService
 from app.features.users.repository import UserRepository
-from app.common.dependencies import get_current_user, require_role
-from app.features.users.models import User
+from app.common.dependencies import AuthenticatedUser, get_current_user, require_role
+from app.common.etag import LIST_CACHE_CONTROL, etag_matches, make_weak_etag, not_modified
 
 router = APIRouter(prefix="/api/v1/users", tags=["Users"])
 
 
 @router.get("", response_model=List[UserProfileResponse])
 def get_all_users(
-    current_user: User = Depends(require_role(["admin"])),
+    request: Request,
+    response: Response,
+    current_user: AuthenticatedUser = Depends(require_role(["admin"])),
     session: Session = Depends(get_session)
 ) -> List[UserProfileResponse]:
     """
@@ -35,16 +37,25 @@ def get_all_users(
     
     **Authorization:** Admin only
     
+    **Caching:** Responses carry a weak ETag (user count and latest
+    updated_at); a matching If-None-Match header gets 304 Not Modified.
+    
     **Response:** List of user profiles
     """
     user_repo = UserRepository(session)
+    etag = make_weak_etag(*user_repo.get_fingerprint(), current_user.id)
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return not_modified(etag)
+    
     users = user_repo.get_all_users()
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = LIST_CACHE_CONTROL
     return [UserProfileResponse.model_validate(user) for user in users]
 
 
 @router.get("/profile", response_model=UserProfileResponse)
 def get_profile(
-    current_user: User = Depends(get_current_user),
+    current_user: AuthenticatedUser = Depends(get_current_user),
     session: Session = Depends(get_session)
 ) -> UserProfileResponse:
     """
@@ -140,7 +151,7 @@ def get_profile(
 @router.patch("/profile", response_model=UserProfileResponse)
 def update_profile(
     updates: UserProfileUpdate,
-    current_user: User = Depends(get_current_user),
+    current_user: AuthenticatedUser = Depends(get_current_user),
     session: Session = Depends(get_session)
 ) -> UserProfileResponse:
     """
@@ -291,7 +302,7 @@ def update_profile(
 @router.post("/profile/delete", status_code=status.HTTP_204_NO_CONTENT)
 def delete_account(
     request: DeleteAccountRequest,
-    current_user: User = Depends(get_current_user),
+    current_user: AuthenticatedUser = Depends(get_current_user),
     session: Session = Depends(get_session)
 ) -> Response:
     """
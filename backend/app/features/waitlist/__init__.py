@@ -0,0 +1 @@
+"""Waitlist feature module for offering freed appointment slots."""
@@ -0,0 +1,68 @@
+"""Waitlist models for the vet clinic system."""
+from sqlmodel import SQLModel, Field
+from sqlalchemy import Index
+from datetime import date, datetime
+from typing import Optional
+import uuid
+
+from app.common.utils import get_pht_now
+
+
+class WaitlistEntry(SQLModel, table=True):
+    """An owner's request to be offered a freed slot.
+    
+    Attributes:
+        id: Unique identifier for the entry
+        user_id: Foreign key to the owner waiting for a slot
+        pet_id: Foreign key to the pet the slot is for
+        service_type: Service the slot must fit (vaccination, routine, surgery, emergency)
+        from_date: First acceptable date
+        to_date: Last acceptable date (inclusive)
+        status: waiting (queued) or offered (a slot is held for the owner)
+        created_at: When the owner joined the waitlist (FIFO order)
+        offered_start_time: Start of the offered slot
+        offered_end_time: End of the offered slot
+        offer_expires_at: When the hold on the offered slot lapses
+        offered_resource_id: Resource the offered slot is on, if any
+        hold_id: ID of the slot hold backing the offer
+    """
+    __tablename__ = "waitlist_entries"
+    
+    id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
+    user_id: uuid.UUID = Field(foreign_key="users.id", index=True, ondelete="CASCADE")
+    pet_id: uuid.UUID = Field(foreign_key="pets.id", ondelete="CASCADE")
+    service_type: str = Field(max_length=20, nullable=False)
+    from_date: date = Field(nullable=False)
+    to_date: date = Field(nullable=False)
+    status: str = Field(max_length=20, default="waiting")  # waiting, offered
+    created_at: datetime = Field(default_factory=get_pht_now)
+    offered_start_time: Optional[datetime] = Field(default=None)
+    offered_end_time: Optional[datetime] = Field(default=None)
+    offer_expires_at: Optional[datetime] = Field(default=None)
+    offered_resource_id: Optional[int] = Field(default=None)
+    hold_id: Optional[uuid.UUID] = Field(default=None)
+
+
+class WaitlistEntryDay(SQLModel, table=True):
+    """One row per date a waiting entry accepts, indexed for matching.
+    
+    A freed slot is matched with a single range scan on
+    (day, service_type, created_at), which returns the oldest waiters for
+    that date and service first in O(log n). Rows exist only while their
+    entry is waiting.
+    
+    Attributes:
+        entry_id: Foreign key to the waitlist entry
+        day: Date the entry accepts
+        service_type: Copy of the entry's service type (index key)
+        created_at: Copy of the entry's created_at (FIFO order)
+    """
+    __tablename__ = "waitlist_entry_days"
+    __table_args__ = (
+        Index("ix_waitlist_entry_days_queue", "day", "service_type", "created_at", "entry_id"),
+    )
+    
+    entry_id: uuid.UUID = Field(foreign_key="waitlist_entries.id", primary_key=True, ondelete="CASCADE")
+    day: date = Field(primary_key=True)
+    service_type: str = Field(max_length=20, nullable=False)
+    created_at: datetime = Field(nullable=False)
@@ -0,0 +1,151 @@
+"""Waitlist repository for database operations."""
+from sqlmodel import Session, select, delete
+from datetime import date, datetime, timedelta
+from typing import List, Optional
+import uuid
+
+from app.features.waitlist.models import WaitlistEntry, WaitlistEntryDay
+
+
+class WaitlistRepository:
+    """Repository for WaitlistEntry database operations.
+
+    This class handles all database queries related to the waitlist,
+    following the repository pattern to abstract data access.
+    """
+
+    def __init__(self, session: Session):
+        """Initialize the repository with a database session.
+
+        Args:
+            session: SQLModel database session
+        """
+        self.session = session
+
+    def create(self, entry: WaitlistEntry) -> WaitlistEntry:
+        """Add a waiting entry and index every date it accepts.
+
+        Args:
+            entry: WaitlistEntry to add
+
+        Returns:
+            Created WaitlistEntry
+        """
+        self.session.add(entry)
+        self.session.flush()
+        day = entry.from_date
+        while day <= entry.to_date:
+            self.session.add(WaitlistEntryDay(
+                entry_id=entry.id, day=day,
+                service_type=entry.service_type, created_at=entry.created_at
+            ))
+            day += timedelta(days=1)
+        self.session.flush()
+        self.session.refresh(entry)
+        return entry
+
+    def get_by_id(self, entry_id: uuid.UUID) -> Optional[WaitlistEntry]:
+        """Get a waitlist entry by ID.
+
+        Args:
+            entry_id: UUID of the entry
+
+        Returns:
+            WaitlistEntry if found, None otherwise
+        """
+        return self.session.get(WaitlistEntry, entry_id)
+
+    def get_all(self, user_id: Optional[uuid.UUID] = None) -> List[WaitlistEntry]:
+        """Get waitlist entries in FIFO order.
+
+        Args:
+            user_id: Optional owner to restrict the entries to
+
+        Returns:
+            List of WaitlistEntry objects, oldest first
+        """
+        statement = select(WaitlistEntry).order_by(WaitlistEntry.created_at, WaitlistEntry.id)
+        if user_id:
+            statement = statement.where(WaitlistEntry.user_id == user_id)
+        return list(self.session.exec(statement).all())
+
+    def get_next_waiting(self, day: date, service_type: str, limit: int) -> List[WaitlistEntry]:
+        """Get the oldest waiting entries for a date and service type.
+
+        Reads the head of the ix_waitlist_entry_days_queue index range for
+        (day, service_type), so the cost does not grow with the number of
+        entries on other dates or services.
+
+        Args:
+            day: Date of the freed slot
+            service_type: Service the waiters asked for
+            limit: Maximum number of entries to return
+
+        Returns:
+            Up to limit waiting entries, oldest first
+        """
+        statement = (
+            select(WaitlistEntry)
+            .join(WaitlistEntryDay, WaitlistEntryDay.entry_id == WaitlistEntry.id)
+            .where(WaitlistEntryDay.day == day, WaitlistEntryDay.service_type == service_type)
+            .order_by(WaitlistEntryDay.created_at, WaitlistEntryDay.entry_id)
+            .limit(limit)
+        )
+        return list(self.session.exec(statement).all())
+
+    def get_expired_offers(self, now: datetime) -> List[WaitlistEntry]:
+        """Claim offered entries whose offer has lapsed.
+
+        The rows are locked with FOR UPDATE SKIP LOCKED (ignored by SQLite),
+        so when several workers expire offers at once each lapsed offer is
+        claimed by one of them. The caller deletes the claimed entries in
+        the same transaction, so they are gone once the lock is released.
+
+        Args:
+            now: Current PHT time
+
+        Returns:
+            Offered entries with offer_expires_at at or before now, oldest offer first
+        """
+        statement = (
+            select(WaitlistEntry)
+            .where(WaitlistEntry.status == "offered", WaitlistEntry.offer_expires_at <= now)
+            .order_by(WaitlistEntry.offer_expires_at, WaitlistEntry.id)
+            .with_for_update(skip_locked=True)
+        )
+        return list(self.session.exec(statement).all())
+
+    def mark_offered(self, entry: WaitlistEntry) -> WaitlistEntry:
+        """Save an offer and take the entry out of the matching index.
+
+        Args:
+            entry: Entry with status and offer fields already set
+
+        Returns:
+            Updated WaitlistEntry
+        """
+        self._delete_days(entry.id)
+        self.session.add(entry)
+        self.session.flush()
+        self.session.refresh(entry)
+        return entry
+
+    def delete(self, entry: WaitlistEntry) -> None:
+        """Delete a waitlist entry and its index rows.
+
+        Args:
+            entry: WaitlistEntry to delete
+        """
+        self._delete_days(entry.id)
+        self.session.delete(entry)
+        self.session.flush()
+
+    def _delete_days(self, entry_id: uuid.UUID) -> None:
+        """Delete the index rows of an entry.
+
+        Done explicitly because SQLite does not enforce ON DELETE CASCADE.
+
+        Args:
+            entry_id: UUID of the entry
+        """
+        self.session.exec(delete(WaitlistEntryDay).where(WaitlistEntryDay.entry_id == entry_id))
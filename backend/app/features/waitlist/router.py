@@ -0,0 +1,129 @@
+"""
+Waitlist router for API endpoints.
+
+This module implements the HTTP endpoints for the waitlist:
+- POST /api/v1/waitlist: Join the waitlist for a service and date range
+- GET /api/v1/waitlist: List waitlist entries (filtered by role)
+- DELETE /api/v1/waitlist/{entry_id}: Leave the waitlist
+
+When an appointment is cancelled or rescheduled, the freed slot is offered
+to the oldest matching waiter (see WaitlistService.offer_freed_slot).
+"""
+
+from fastapi import APIRouter, Depends, status
+from sqlmodel import Session
+from typing import List
+import uuid
+
+from app.core.database import get_session
+from app.common.dependencies import AuthenticatedUser, get_current_user
+from app.features.waitlist.schemas import WaitlistJoinRequest, WaitlistEntryResponse
+from app.features.waitlist.repository import WaitlistRepository
+from app.features.waitlist.service import WaitlistService
+from app.features.appointments.repository import AppointmentRepository
+from app.features.pets.repository import PetRepository
+
+
+router = APIRouter(prefix="/api/v1/waitlist", tags=["Waitlist"])
+
+
+def build_waitlist_service(session: Session) -> WaitlistService:
+    """
+    Create a WaitlistService bound to a session.
+    
+    Args:
+        session: Database session
+        
+    Returns:
+        WaitlistService instance
+    """
+    return WaitlistService(
+        WaitlistRepository(session), PetRepository(session), AppointmentRepository(session)
+    )
+
+
+@router.post("", response_model=WaitlistEntryResponse, status_code=status.HTTP_201_CREATED)
+def join_waitlist(
+    request: WaitlistJoinRequest,
+    current_user: AuthenticatedUser = Depends(get_current_user),
+    session: Session = Depends(get_session)
+) -> WaitlistEntryResponse:
+    """
+    Join the waitlist for a service and date range.
+    
+    Args:
+        request: Pet, service type and date range
+        current_user: Authenticated user (from JWT token)
+        session: Database session
+        
+    Returns:
+        The created waitlist entry
+        
+    Raises:
+        401: If authentication fails
+        403: If a pet owner joins for another user's pet
+        404: If the pet doesn't exist
+        400: If the date range is invalid or too long
+        422: If request data is invalid
+    """
+    waitlist_service = build_waitlist_service(session)
+    entry = waitlist_service.join_waitlist(
+        pet_id=request.pet_id,
+        service_type=request.service_type.value,
+        from_date=request.from_date,
+        to_date=request.to_date,
+        current_user=current_user
+    )
+    session.commit()
+    return WaitlistEntryResponse.model_validate(entry)
+
+
+@router.get("", response_model=List[WaitlistEntryResponse])
+def get_waitlist(
+    current_user: AuthenticatedUser = Depends(get_current_user),
+    session: Session = Depends(get_session)
+) -> List[WaitlistEntryResponse]:
+    """
+    List waitlist entries, oldest first.
+    
+    - Admin users: All entries
+    - Pet owners: Only their own entries
+    
+    Args:
+        current_user: Authenticated user (from JWT token)
+        session: Database session
+        
+    Returns:
+        Waitlist entries, including any pending offers
+        
+    Raises:
+        401: If authentication fails
+    """
+    entries = build_waitlist_service(session).get_entries(current_user)
+    return [WaitlistEntryResponse.model_validate(entry) for entry in entries]
+
+
+@router.delete("/{entry_id}", status_code=status.HTTP_204_NO_CONTENT)
+def leave_waitlist(
+    entry_id: uuid.UUID,
+    current_user: AuthenticatedUser = Depends(get_current_user),
+    session: Session = Depends(get_session)
+) -> None:
+    """
+    Leave the waitlist.
+    
+    Args:
+        entry_id: UUID of the waitlist entry
+        current_user: Authenticated user (the owner, or an admin)
+        session: Database session
+        
+    Returns:
+        No content (204 status code)
+        
+    Raises:
+        401: If authentication fails
+        403: If a pet owner removes another user's entry
+        404: If the entry doesn't exist
+    """
+    build_waitlist_service(session).leave_waitlist(entry_id, current_user)
+    session.commit()
@@ -0,0 +1,69 @@
+"""
+Waitlist request and response schemas for the Vet Clinic Scheduling System.
+
+This module defines Pydantic schemas for waitlist API operations:
+- WaitlistJoinRequest: Schema for joining the waitlist
+- WaitlistEntryResponse: Schema for waitlist entries, including any offer
+"""
+
+from pydantic import BaseModel, Field
+from datetime import date, datetime
+from typing import Optional
+import uuid
+
+from app.common.enums import ServiceType
+
+
+class WaitlistJoinRequest(BaseModel):
+    """
+    Request schema for joining the waitlist.
+    
+    Attributes:
+        pet_id: UUID of the pet the slot is for
+        service_type: Type of service the slot must fit
+        from_date: First acceptable date
+        to_date: Last acceptable date (inclusive)
+    """
+    pet_id: uuid.UUID = Field(..., description="UUID of the pet the slot is for")
+    service_type: ServiceType = Field(..., description="Type of service: vaccination, routine, surgery, or emergency")
+    from_date: date = Field(..., description="First acceptable date")
+    to_date: date = Field(..., description="Last acceptable date (inclusive)")
+
+
+class WaitlistEntryResponse(BaseModel):
+    """
+    Response schema for a waitlist entry.
+    
+    When status is "offered", the offered slot is held for the owner until
+    offer_expires_at; booking it with POST /api/v1/appointments claims it.
+    
+    Attributes:
+        id: Unique identifier of the entry
+        user_id: Owner waiting for a slot
+        pet_id: Pet the slot is for
+        service_type: Service the slot must fit
+        from_date: First acceptable date
+        to_date: Last acceptable date
+        status: waiting or offered
+        created_at: When the owner joined the waitlist
+        offered_start_time: Start of the offered slot
+        offered_end_time: End of the offered slot
+        offer_expires_at: When the offer lapses
+        hold_id: ID of the slot hold backing the offer
+    """
+    id: uuid.UUID
+    user_id: uuid.UUID
+    pet_id: uuid.UUID
+    service_type: str
+    from_date: date
+    to_date: date
+    status: str
+    created_at: datetime
+    offered_start_time: Optional[datetime] = None
+    offered_end_time: Optional[datetime] = None
+    offer_expires_at: Optional[datetime] = None
+    hold_id: Optional[uuid.UUID] = None
+    
+    class Config:
+        """Pydantic configuration."""
+        from_attributes = True
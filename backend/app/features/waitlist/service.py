@@ -0,0 +1,284 @@
+"""
+Waitlist service layer for business logic.
+
+This module implements the business logic for the waitlist including:
+- Joining the waitlist for a pet, service type and date range
+- Listing and leaving waitlist entries
+- Offering a freed slot to the oldest matching waiter
+
+An offer is a slot hold in the waiter's name lasting WAITLIST_OFFER_MINUTES.
+The waiter claims it by booking the slot; other users see it as busy until
+then. The hold is only taken once the transaction that freed the slot
+commits, so a cancellation that rolls back leaves no hold behind. An offered
+entry leaves the queue. When the offer lapses, expire_offers (run
+periodically) removes the entry and offers the slot to the next waiter; the
+owner can join again.
+"""
+
+import logging
+from datetime import date, datetime, timedelta
+from typing import List, Optional
+import uuid
+
+from sqlalchemy import event
+from sqlmodel import Session
+
+from app.features.waitlist.models import WaitlistEntry
+from app.features.waitlist.repository import WaitlistRepository
+from app.features.appointments.repository import AppointmentRepository
+from app.features.appointments.holds import SlotHold, slot_holds
+from app.features.pets.repository import PetRepository
+from app.features.resources.models import Resource
+from app.features.resources.repository import ResourceRepository
+from app.common.exceptions import BadRequestException, ForbiddenException, NotFoundException
+from app.common.utils import SERVICE_DURATIONS, get_pht_now
+from app.common.dependencies import AuthenticatedUser
+from app.core.config import SLOT_HOLDS_PER_USER, WAITLIST_MAX_DAYS, WAITLIST_OFFER_MINUTES
+
+logger = logging.getLogger(__name__)
+
+# Waiters read per service type for one freed slot. Candidates are skipped
+# only when their own holds conflict, so a small batch is enough.
+_MATCH_BATCH_SIZE = 5
+
+# Session.info key holding offer holds to take once the transaction commits
+_PENDING_HOLDS_KEY = "waitlist_pending_offer_holds"
+
+
+class WaitlistService:
+    """
+    Service layer for waitlist operations.
+
+    This class implements business logic and authorization rules for the
+    waitlist, coordinating between the router layer and repository layer.
+    AppointmentService calls offer_freed_slot whenever a booking is
+    cancelled or moved.
+    """
+
+    def __init__(
+        self,
+        waitlist_repo: WaitlistRepository,
+        pet_repo: PetRepository,
+        appointment_repo: AppointmentRepository,
+        resource_repo: Optional[ResourceRepository] = None
+    ):
+        """
+        Initialize the service with required repositories.
+
+        Args:
+            waitlist_repo: Repository for waitlist database operations
+            pet_repo: Repository for pet database operations
+            appointment_repo: Repository used to check that an offered slot is free
+            resource_repo: Optional repository used by expire_offers to look up
+                the resource of a lapsed offer
+        """
+        self.waitlist_repo = waitlist_repo
+        self.pet_repo = pet_repo
+        self.appointment_repo = appointment_repo
+        self.resource_repo = resource_repo
+
+    def join_waitlist(
+        self,
+        pet_id: uuid.UUID,
+        service_type: str,
+        from_date: date,
+        to_date: date,
+        current_user: AuthenticatedUser
+    ) -> WaitlistEntry:
+        """
+        Add a pet to the waitlist for a service and date range.
+
+        Args:
+            pet_id: UUID of the pet the slot is for
+            service_type: Type of service the slot must fit
+            from_date: First acceptable date
+            to_date: Last acceptable date (inclusive)
+            current_user: The authenticated user joining the waitlist
+
+        Returns:
+            Created WaitlistEntry
+
+        Raises:
+            NotFoundException: If the pet doesn't exist
+            ForbiddenException: If a pet owner joins for another user's pet
+            BadRequestException: If the date range is in the past, reversed
+                or longer than WAITLIST_MAX_DAYS
+        """
+        pet = self.pet_repo.get_by_id(pet_id)
+        if not pet:
+            raise NotFoundException("Pet")
+        if current_user.role == "pet_owner" and pet.owner_id != current_user.id:
+            raise ForbiddenException("You can only join the waitlist for your own pets")
+
+        if from_date < get_pht_now().date():
+            raise BadRequestException("Waitlist dates must not be in the past")
+        if to_date < from_date:
+            raise BadRequestException("to_date must be on or after from_date")
+        if (to_date - from_date).days + 1 > WAITLIST_MAX_DAYS:
+            raise BadRequestException(f"Waitlist range cannot exceed {WAITLIST_MAX_DAYS} days")
+
+        entry = WaitlistEntry(
+            user_id=pet.owner_id,
+            pet_id=pet_id,
+            service_type=service_type,
+            from_date=from_date,
+            to_date=to_date,
+            status="waiting"
+        )
+        return self.waitlist_repo.create(entry)
+
+    def get_entries(self, current_user: AuthenticatedUser) -> List[WaitlistEntry]:
+        """
+        Get waitlist entries visible to the user.
+
+        Args:
+            current_user: The authenticated user
+
+        Returns:
+            All entries for admins, the user's own entries for pet owners
+        """
+        if current_user.role == "admin":
+            return self.waitlist_repo.get_all()
+        return self.waitlist_repo.get_all(user_id=current_user.id)
+
+    def leave_waitlist(self, entry_id: uuid.UUID, current_user: AuthenticatedUser) -> None:
+        """
+        Remove a waitlist entry.
+
+        A pending offer's hold is left to expire or be booked.
+
+        Args:
+            entry_id: UUID of the entry
+            current_user: The authenticated user (the owner or an admin)
+
+        Raises:
+            NotFoundException: If the entry doesn't exist
+            ForbiddenException: If a pet owner removes another user's entry
+        """
+        entry = self.waitlist_repo.get_by_id(entry_id)
+        if not entry:
+            raise NotFoundException("Waitlist entry")
+        if current_user.role != "admin" and entry.user_id != current_user.id:
+            raise ForbiddenException("You can only remove your own waitlist entries")
+
+        self.waitlist_repo.delete(entry)
+
+    def offer_freed_slot(
+        self,
+        start_time: datetime,
+        end_time: datetime,
+        resource: Optional[Resource] = None
+    ) -> Optional[WaitlistEntry]:
+        """
+        Offer a freed time range to the oldest matching waiter.
+
+        Waiters match when the range's date is in their date range and their
+        service fits in the range (and is provided by the resource the range
+        was freed on, if any). For each fitting service type the oldest
+        waiters are read from the head of the queue index, and the earliest
+        joined candidate whose slot is free for them is offered it. The
+        offer is saved in the current transaction and its hold is taken when
+        the transaction commits. The cost is a few index lookups per freed
+        slot, independent of the size of the waitlist.
+
+        Args:
+            start_time: Start of the freed range
+            end_time: End of the freed range
+            resource: Resource the range was freed on, or None when the
+                clinic is a single resource
+
+        Returns:
+            The entry that received the offer, or None if nobody matched
+        """
+        now = get_pht_now()
+        if start_time <= now or (resource is not None and not resource.is_active):
+            return None
+
+        free_minutes = (end_time - start_time).total_seconds() / 60
+        candidates = []
+        for service_type, minutes in SERVICE_DURATIONS.items():
+            if minutes <= free_minutes and (resource is None or service_type in resource.service_types):
+                candidates.extend(self.waitlist_repo.get_next_waiting(
+                    start_time.date(), service_type, _MATCH_BATCH_SIZE
+                ))
+        candidates.sort(key=lambda entry: (entry.created_at, entry.id))
+
+        for entry in candidates:
+            offer_end = start_time + timedelta(minutes=SERVICE_DURATIONS[entry.service_type])
+            if resource is None:
+                busy = self.appointment_repo.check_overlap(start_time, offer_end, hold_owner_id=entry.user_id)
+            else:
+                busy_ids = self.appointment_repo.get_busy_resource_ids(
+                    start_time, offer_end, hold_owner_id=entry.user_id
+                )
+                busy = None in busy_ids or resource.id in busy_ids
+            if busy:
+                continue
+            # The hold is taken once the offer is committed (see _place_pending_holds)
+            hold = SlotHold(
+                id=uuid.uuid4(),
+                user_id=entry.user_id,
+                start_time=start_time,
+                end_time=offer_end,
+                service_type=entry.service_type,
+                expires_at=now + timedelta(minutes=WAITLIST_OFFER_MINUTES),
+                resource_id=resource.id if resource else None
+            )
+
+            entry.status = "offered"
+            entry.offered_start_time = hold.start_time
+            entry.offered_end_time = hold.end_time
+            entry.offer_expires_at = hold.expires_at
+            entry.offered_resource_id = hold.resource_id
+            entry.hold_id = hold.id
+            offered = self.waitlist_repo.mark_offered(entry)
+            session = self.waitlist_repo.session
+            session.info.setdefault(_PENDING_HOLDS_KEY, []).append(hold)
+            return offered
+
+        return None
+
+    def expire_offers(self, now: Optional[datetime] = None) -> int:
+        """
+        Pass lapsed offers on to the next matching waiter.
+
+        Each offered entry whose offer has expired is removed, and its slot
+        is offered again as if it had just been freed. If the waiter booked
+        the slot, it is busy and nobody else is offered it.
+
+        Args:
+            now: Current PHT time (defaults to now)
+
+        Returns:
+            Number of lapsed offers processed
+        """
+        now = now or get_pht_now()
+        expired = self.waitlist_repo.get_expired_offers(now)
+        for entry in expired:
+            start_time, end_time = entry.offered_start_time, entry.offered_end_time
+            resource = None
+            if entry.offered_resource_id is not None and self.resource_repo is not None:
+                resource = self.resource_repo.get_by_id(entry.offered_resource_id)
+            self.waitlist_repo.delete(entry)
+            self.offer_freed_slot(start_time, end_time, resource)
+        return len(expired)
+
+
+@event.listens_for(Session, "after_commit")
+def _place_pending_holds(session: Session) -> None:
+    """Session after_commit hook: take the holds of offers saved in the transaction."""
+    holds = session.info.pop(_PENDING_HOLDS_KEY, ())
+    if not holds:
+        return
+    now = get_pht_now()
+    for hold in holds:
+        if slot_holds.place(hold, now, SLOT_HOLDS_PER_USER) is None:
+            # Another user held the range after the offer was made; the offer
+            # stays bookable for the waiter if the slot is still free
+            logger.warning(f"Could not hold offered waitlist slot {hold.start_time} for user {hold.user_id}")
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_pending_holds(session: Session) -> None:
+    """Session after_rollback hook: the offers were not saved, so drop their holds."""
+    session.info.pop(_PENDING_HOLDS_KEY, None)
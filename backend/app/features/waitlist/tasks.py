@@ -0,0 +1,55 @@
+"""Background tasks for the waitlist.
+
+This module contains tasks scheduled periodically by the application
+lifespan, such as passing lapsed slot offers on to the next waiter.
+"""
+
+import logging
+from typing import Optional
+from sqlmodel import Session
+
+from app.core.database import engine
+from app.features.appointments.repository import AppointmentRepository
+from app.features.pets.repository import PetRepository
+from app.features.resources.repository import ResourceRepository
+from app.features.waitlist.repository import WaitlistRepository
+from app.features.waitlist.service import WaitlistService
+
+logger = logging.getLogger(__name__)
+
+
+def _expire(session: Session) -> int:
+    """Process lapsed offers in a session and commit, which takes the new offers' holds."""
+    service = WaitlistService(
+        WaitlistRepository(session), PetRepository(session), AppointmentRepository(session),
+        resource_repo=ResourceRepository(session)
+    )
+    count = service.expire_offers()
+    session.commit()
+    return count
+
+
+def expire_waitlist_offers(session: Optional[Session] = None) -> int:
+    """Offer the slots of lapsed waitlist offers to the next waiters.
+    
+    Args:
+        session: Optional database session. If not provided, creates a new session.
+                 This parameter is primarily for testing purposes.
+    
+    Returns:
+        Number of lapsed offers processed
+    """
+    try:
+        if session is not None:
+            expired_count = _expire(session)
+        else:
+            with Session(engine) as db_session:
+                expired_count = _expire(db_session)
+        
+        if expired_count:
+            logger.info(f"Passed on {expired_count} lapsed waitlist offer(s)")
+        return expired_count
+            
+    except Exception as e:
+        logger.error(f"Error during waitlist offer expiry: {str(e)}", exc_info=True)
+        raise
@@ -1,7 +1,9 @@
 """Authentication infrastructure for JWT and password hashing"""
 from datetime import datetime, timedelta
-from typing import Dict, Any
+from typing import Dict, Any, Optional
+import hashlib
 import logging
+import uuid
 import bcrypt
 from jose import JWTError, jwt
 from app.core import config
@@ -141,7 +143,7 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
 
 def create_access_token(data: Dict[str, Any]) -> str:
     """
-    Create a JWT access token with expiration.
+    Create a JWT access token with expiration and a unique ID (jti).
     
     Args:
         data: Dictionary containing token payload data (e.g., {"sub": user_id, "role": role})
@@ -158,6 +160,7 @@ def create_access_token(data: Dict[str, Any]) -> str:
         to_encode = data.copy()
         expire = get_pht_now() + timedelta(minutes=config.JWT_EXPIRE_MINUTES)
         to_encode.update({"exp": expire})
+        to_encode.setdefault("jti", uuid.uuid4().hex)
         
         logger.debug(f"Creating JWT token for user: {data.get('sub')}")
         encoded_jwt = jwt.encode(
@@ -207,3 +210,41 @@ def verify_token(token: str) -> Dict[str, Any]:
     except Exception as e:
         logger.error(f"Unexpected error during token verification: {str(e)}")
         raise UnauthorizedException("Could not validate credentials")
+
+
+def token_claims(user) -> Dict[str, Any]:
+    """
+    Build the claims identifying a user in an access token.
+    
+    Args:
+        user: User the token is issued to
+        
+    Returns:
+        Claims with the user ID, role and current token epoch
+    """
+    return {"sub": str(user.id), "role": user.role, "epoch": user.token_epoch}
+
+
+def token_digest(token: str, payload: Optional[Dict[str, Any]] = None) -> str:
+    """
+    Compute the fixed-size key a token is revoked under.
+    
+    The key is the SHA-256 of the token's jti claim. Tokens issued before
+    tokens carried a jti (or strings that are not JWTs) are keyed on the
+    SHA-256 of the whole token instead.
+    
+    Args:
+        token: The JWT token string
+        payload: Already decoded claims of the token, to avoid decoding it again
+        
+    Returns:
+        64-character hex digest
+    """
+    if payload is None:
+        try:
+            payload = jwt.get_unverified_claims(token)
+        except JWTError:
+            payload = {}
+    jti = payload.get("jti")
+    value = f"jti:{jti}" if jti else token
+    return hashlib.sha256(value.encode("utf-8")).hexdigest()
@@ -0,0 +1,52 @@
+"""Notifications for writes that change availability on every date.
+
+Clinic status, opening hours, breaks, closures and bookable resources all
+change which slots are free. The repositories writing them call
+notify_availability_changed(); features that keep derived availability
+(such as the appointments available-slots cache) register a listener with
+on_availability_changed(), so the writing features do not import them.
+"""
+
+from typing import Callable, List
+
+from sqlalchemy import event
+from sqlmodel import Session
+
+Listener = Callable[[], None]
+
+_listeners: List[Listener] = []
+
+
+def on_availability_changed(listener: Listener) -> Listener:
+    """
+    Register a callback run whenever availability changes on every date.
+
+    Args:
+        listener: Callback without arguments
+
+    Returns:
+        The listener, so this can be used as a decorator
+    """
+    _listeners.append(listener)
+    return listener
+
+
+def _notify() -> None:
+    """Run every registered listener."""
+    for listener in _listeners:
+        listener()
+
+
+def notify_availability_changed(session: Session) -> None:
+    """
+    Notify listeners now and again when the session commits.
+
+    Notifying now keeps requests in this transaction from reading stale
+    availability; notifying on commit drops anything computed from the old
+    state while the transaction was open.
+
+    Args:
+        session: Session performing the write
+    """
+    _notify()
+    event.listen(session, "after_commit", lambda _session: _notify(), once=True)
@@ -0,0 +1,165 @@
+"""Event backends for sharing messages between worker processes.
+
+Features that publish messages to every worker (appointment change events,
+authentication cache invalidations) deliver them through one of these:
+- InMemoryEventBackend: messages stay in the publishing process
+- FileEventBackend: workers on the same host share messages through an
+  append-only NDJSON file that every worker tails, a local stand-in for a
+  message broker such as Redis pub/sub; the file is rotated once it grows
+  past a size limit so it does not grow forever
+
+A backend is started once with a delivery callback, then publish() hands
+each message to the callback of every started backend sharing the channel.
+"""
+
+import fcntl
+import json
+import logging
+import os
+import threading
+import time
+from typing import Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+Deliver = Callable[[dict], None]
+
+
+class InMemoryEventBackend:
+    """Deliver events to subscribers of the publishing process only."""
+
+    def __init__(self):
+        """Initialize the backend without a delivery callback."""
+        self._deliver: Optional[Deliver] = None
+
+    def start(self, deliver: Deliver) -> None:
+        """
+        Start delivering published events.
+
+        Args:
+            deliver: Callback that fans an event out to local subscribers
+        """
+        self._deliver = deliver
+
+    def publish(self, message: dict) -> None:
+        """
+        Publish an event.
+
+        Args:
+            message: JSON-serializable event
+        """
+        if self._deliver:
+            self._deliver(message)
+
+
+class FileEventBackend:
+    """
+    Share events between worker processes through an append-only file.
+
+    Each publish appends one JSON line; a daemon thread in every worker
+    tails the file and delivers new lines to that worker's subscribers.
+    Single small appends are atomic, so workers do not interleave lines.
+
+    Once the file reaches max_bytes, the publishing worker renames it to
+    ``<path>.1`` (replacing the previous one) and starts a new file. Appends
+    hold a shared lock and rotation an exclusive one on ``<path>.lock``, so
+    no line is written to a file after it was rotated. Tailers notice the
+    new inode, read what is left of ``<path>.1`` and continue at the start
+    of the new file.
+    """
+
+    def __init__(self, path: str, poll_interval: float = 0.2, max_bytes: int = 10 * 1024 * 1024):
+        """
+        Initialize the backend.
+
+        Args:
+            path: Event file shared by all workers
+            poll_interval: Seconds between checks for new lines
+            max_bytes: Size at which the file is rotated
+        """
+        self.path = path
+        self.rotated_path = path + ".1"
+        self.lock_path = path + ".lock"
+        self.poll_interval = poll_interval
+        self.max_bytes = max_bytes
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self, deliver: Deliver) -> None:
+        """
+        Start tailing the event file from its current end.
+
+        Args:
+            deliver: Callback that fans an event out to local subscribers
+        """
+        with open(self.path, "a") as events_file:
+            stat = os.fstat(events_file.fileno())
+        self._thread = threading.Thread(
+            target=self._tail, args=(deliver, stat.st_ino, stat.st_size),
+            daemon=True, name="event-file-tail"
+        )
+        self._thread.start()
+
+    def publish(self, message: dict) -> None:
+        """
+        Append an event to the shared file, rotating it when it is full.
+
+        Args:
+            message: JSON-serializable event
+        """
+        with open(self.lock_path, "a") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_SH)
+            with open(self.path, "a", encoding="utf-8") as events_file:
+                events_file.write(json.dumps(message) + "\n")
+                full = events_file.tell() >= self.max_bytes
+            if full:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+                self._rotate()
+
+    def _rotate(self) -> None:
+        """Move a full event file aside; call with the exclusive lock held."""
+        try:
+            # Another worker may have rotated while we waited for the lock
+            if os.path.getsize(self.path) >= self.max_bytes:
+                os.replace(self.path, self.rotated_path)
+                open(self.path, "a").close()
+        except OSError as e:
+            logger.error(f"Error rotating events file {self.path}: {str(e)}")
+
+    def _read_from(self, path: str, inode: int, offset: int) -> Optional[str]:
+        """Return the text of path after offset, or None if path is another file."""
+        try:
+            with open(path, "r", encoding="utf-8") as events_file:
+                if os.fstat(events_file.fileno()).st_ino != inode:
+                    return None
+                events_file.seek(offset)
+                return events_file.read()
+        except FileNotFoundError:
+            return None
+
+    def _tail(self, deliver: Deliver, inode: int, offset: int) -> None:
+        """Deliver lines appended after offset, following rotations, forever."""
+        buffered = ""
+        while True:
+            try:
+                text = self._read_from(self.path, inode, offset)
+                if text is None and os.path.exists(self.path):
+                    # The file was rotated: finish the old one, then start the new one
+                    new_inode = os.stat(self.path).st_ino
+                    rest = self._read_from(self.rotated_path, inode, offset)
+                    if rest is None:
+                        logger.warning(f"Events file {self.path} rotated more than once between reads; events were skipped")
+                        buffered = ""
+                    else:
+                        buffered += rest
+                    inode, offset = new_inode, 0
+                    text = self._read_from(self.path, inode, offset)
+                text = text or ""
+                buffered += text
+                offset += len(text.encode("utf-8"))
+                *lines, buffered = buffered.split("\n")
+                for line in lines:
+                    if line:
+                        deliver(json.loads(line))
+            except Exception as e:
+                logger.error(f"Error reading events file {self.path}: {str(e)}")
+            time.sleep(self.poll_interval)
@@ -2,7 +2,7 @@
 Main FastAPI application entry point.
 
 This module initializes the FastAPI application with:
-- All feature routers (auth, pets, appointments, clinic)
+- All feature routers (auth, pets, appointments, clinic, resources, waitlist)
 - CORS middleware configuration
 - Database table creation on startup
 - API documentation at /docs
@@ -18,19 +18,30 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from contextlib import asynccontextmanager
 
-from app.core.config import BACKEND_CORS_ORIGINS, LOG_LEVEL
+from app.core.config import (
+    BACKEND_CORS_ORIGINS,
+    LOG_LEVEL,
+    IDEMPOTENCY_KEY_CLEANUP_INTERVAL_MINUTES,
+    APPOINTMENT_TOMBSTONE_CLEANUP_INTERVAL_MINUTES,
+    WAITLIST_EXPIRY_INTERVAL_MINUTES
+)
 from app.core.database import init_db
 from app.features.auth.router import router as auth_router
 from app.features.users.router import router as users_router
 from app.features.pets.router import router as pets_router
 from app.features.appointments.router import router as appointments_router
 from app.features.clinic.router import router as clinic_router
-from app.features.auth.tasks import cleanup_expired_tokens
+from app.features.resources.router import router as resources_router
+from app.features.waitlist.router import router as waitlist_router
+from app.features.auth.tasks import cleanup_expired_tokens, load_revoked_tokens
+from app.features.appointments.tasks import cleanup_expired_idempotency_keys, cleanup_expired_tombstones
+from app.features.waitlist.tasks import expire_waitlist_offers
 from app.common.exceptions import (
     TokenBlacklistedException,
     ProfileUpdateForbiddenException,
     AppointmentRescheduleForbiddenException,
-    TimeSlotUnavailableException
+    TimeSlotUnavailableException,
+    ChangesExpiredException
 )
 from app.common.error_responses import ErrorResponse
 
@@ -48,6 +59,9 @@ logger = logging.getLogger(__name__)
 
 # Background task control
 cleanup_task = None
+idempotency_cleanup_task = None
+tombstone_cleanup_task = None
+waitlist_expiry_task = None
 
 
 async def periodic_token_cleanup(interval_hours: int = 24):
@@ -85,6 +99,90 @@ async def periodic_token_cleanup(interval_hours: int = 24):
             continue
 
 
+async def periodic_idempotency_key_cleanup(interval_minutes: int = 60):
+    """
+    Periodically purge expired appointment Idempotency-Keys.
+    
+    Runs like periodic_token_cleanup: sleeps for the interval, then removes
+    keys whose replay window has passed, until the application shuts down.
+    
+    Args:
+        interval_minutes: Minutes between cleanup runs (default: 60 minutes)
+    """
+    logger.info(f"Idempotency key cleanup task started. Will run every {interval_minutes} minutes.")
+    
+    while True:
+        try:
+            await asyncio.sleep(interval_minutes * 60)
+            
+            # The DELETE is blocking, so keep it off the event loop
+            count = await asyncio.to_thread(cleanup_expired_idempotency_keys)
+            logger.info(f"Scheduled cleanup completed: removed {count} expired idempotency key(s)")
+            
+        except asyncio.CancelledError:
+            logger.info("Idempotency key cleanup task cancelled, shutting down...")
+            break
+        except Exception as e:
+            logger.error(f"Error in periodic idempotency key cleanup: {str(e)}", exc_info=True)
+            continue
+
+
+async def periodic_tombstone_cleanup(interval_minutes: int = 60):
+    """
+    Periodically purge appointment tombstones past the delta-sync retention window.
+    
+    Runs like periodic_idempotency_key_cleanup: sleeps for the interval, then
+    removes tombstones older than APPOINTMENT_TOMBSTONE_RETENTION_DAYS, until
+    the application shuts down.
+    
+    Args:
+        interval_minutes: Minutes between cleanup runs (default: 60 minutes)
+    """
+    logger.info(f"Tombstone cleanup task started. Will run every {interval_minutes} minutes.")
+    
+    while True:
+        try:
+            await asyncio.sleep(interval_minutes * 60)
+            
+            # The DELETE is blocking, so keep it off the event loop
+            count = await asyncio.to_thread(cleanup_expired_tombstones)
+            logger.info(f"Scheduled cleanup completed: removed {count} expired appointment tombstone(s)")
+            
+        except asyncio.CancelledError:
+            logger.info("Tombstone cleanup task cancelled, shutting down...")
+            break
+        except Exception as e:
+            logger.error(f"Error in periodic tombstone cleanup: {str(e)}", exc_info=True)
+            continue
+
+
+async def periodic_waitlist_offer_expiry(interval_minutes: int = 1):
+    """
+    Periodically pass lapsed waitlist offers on to the next waiter.
+    
+    Runs like periodic_idempotency_key_cleanup: sleeps for the interval, then
+    re-offers the slots of expired offers, until the application shuts down.
+    
+    Args:
+        interval_minutes: Minutes between runs (default: 1 minute)
+    """
+    logger.info(f"Waitlist offer expiry task started. Will run every {interval_minutes} minute(s).")
+    
+    while True:
+        try:
+            await asyncio.sleep(interval_minutes * 60)
+            
+            # The queries are blocking, so keep them off the event loop
+            await asyncio.to_thread(expire_waitlist_offers)
+            
+        except asyncio.CancelledError:
+            logger.info("Waitlist offer expiry task cancelled, shutting down...")
+            break
+        except Exception as e:
+            logger.error(f"Error in periodic waitlist offer expiry: {str(e)}", exc_info=True)
+            continue
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """
@@ -96,7 +194,7 @@ async def lifespan(app: FastAPI):
     
     Requirements: 12.8, 7.3
     """
-    global cleanup_task
+    global cleanup_task, idempotency_cleanup_task, tombstone_cleanup_task, waitlist_expiry_task
     
     # Startup: Create database tables
     logger.info("Starting Vet Clinic Scheduling System API...")
@@ -108,9 +206,24 @@ async def lifespan(app: FastAPI):
         logger.error(f"Failed to initialize database: {str(e)}")
         raise
     
-    # Start background task for token cleanup
-    logger.info("Starting background task for token cleanup...")
+    # Load revoked tokens; if this fails the set loads on the first request
+    try:
+        load_revoked_tokens()
+    except Exception as e:
+        logger.error(f"Failed to load revoked tokens: {str(e)}")
+    
+    # Start background tasks for token, idempotency key and tombstone cleanup and waitlist offer expiry
+    logger.info("Starting background tasks for token, idempotency key and tombstone cleanup and waitlist offer expiry...")
     cleanup_task = asyncio.create_task(periodic_token_cleanup(interval_hours=24))
+    idempotency_cleanup_task = asyncio.create_task(
+        periodic_idempotency_key_cleanup(interval_minutes=IDEMPOTENCY_KEY_CLEANUP_INTERVAL_MINUTES)
+    )
+    tombstone_cleanup_task = asyncio.create_task(
+        periodic_tombstone_cleanup(interval_minutes=APPOINTMENT_TOMBSTONE_CLEANUP_INTERVAL_MINUTES)
+    )
+    waitlist_expiry_task = asyncio.create_task(
+        periodic_waitlist_offer_expiry(interval_minutes=WAITLIST_EXPIRY_INTERVAL_MINUTES)
+    )
     
     yield
     
@@ -123,6 +236,24 @@ async def lifespan(app: FastAPI):
             await cleanup_task
         except asyncio.CancelledError:
             logger.info("Token cleanup task cancelled successfully")
+    if idempotency_cleanup_task:
+        idempotency_cleanup_task.cancel()
+        try:
+            await idempotency_cleanup_task
+        except asyncio.CancelledError:
+            pass
+    if tombstone_cleanup_task:
+        tombstone_cleanup_task.cancel()
+        try:
+            await tombstone_cleanup_task
+        except asyncio.CancelledError:
+            pass
+    if waitlist_expiry_task:
+        waitlist_expiry_task.cancel()
+        try:
+            await waitlist_expiry_task
+        except asyncio.CancelledError:
+            pass
     logger.info("Shutdown complete.")
 
 
@@ -145,6 +276,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["ETag", "Idempotent-Replayed"],
 )
 
 logger.info(f"CORS configured with origins: {BACKEND_CORS_ORIGINS}")
@@ -228,12 +360,32 @@ async def time_slot_unavailable_exception_handler(request: Request, exc: TimeSlo
     )
 
 
+@app.exception_handler(ChangesExpiredException)
+async def changes_expired_exception_handler(request: Request, exc: ChangesExpiredException):
+    """
+    Handle ChangesExpiredException with consistent error response format.
+    
+    Returns HTTP 410 with error type "changes_expired", telling delta-sync
+    clients to reload the full appointment list.
+    """
+    error_response = ErrorResponse.create(
+        detail=exc.detail,
+        error_type="changes_expired"
+    )
+    return JSONResponse(
+        status_code=exc.status_code,
+        content=error_response.model_dump()
+    )
+
+
 # Include all feature routers
 app.include_router(auth_router)
 app.include_router(users_router)
 app.include_router(pets_router)
 app.include_router(appointments_router)
 app.include_router(clinic_router)
+app.include_router(resources_router)
+app.include_router(waitlist_router)
 
 logger.info("All routers registered successfully")
 
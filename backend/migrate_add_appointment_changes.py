@@ -0,0 +1,61 @@
+"""
+Migration script for the appointment delta-sync endpoint.
+
+Adds an index on appointments.updated_at and the appointment_tombstones
+table that records deleted appointments. New databases get both
+automatically when the tables are created.
+"""
+
+import sys
+from sqlalchemy import text
+from app.core.database import engine
+from app.features.appointments.models import AppointmentTombstone
+
+def migrate_add_appointment_changes():
+    """Add the updated_at index and the appointment_tombstones table."""
+    
+    print("=" * 60)
+    print("MIGRATION: Add appointment delta-sync support")
+    print("=" * 60)
+    
+    try:
+        with engine.connect() as conn:
+            # Index on updated_at
+            print("\n1. Checking index on appointments.updated_at...")
+            result = conn.execute(text("""
+                SELECT indexname
+                FROM pg_indexes
+                WHERE tablename = 'appointments' AND indexname = 'ix_appointments_updated_at'
+            """))
+            
+            if result.fetchone():
+                print("   ℹ️  Index already exists.")
+            else:
+                conn.execute(text("""
+                    CREATE INDEX ix_appointments_updated_at ON appointments(updated_at)
+                """))
+                conn.commit()
+                print("   ✓ Index added")
+            
+            # Tombstones table (create_all skips tables that already exist)
+            print("\n2. Creating appointment_tombstones table if missing...")
+            AppointmentTombstone.__table__.create(conn, checkfirst=True)
+            conn.commit()
+            print("   ✓ appointment_tombstones table ready")
+            
+            print("\n" + "=" * 60)
+            print("✅ Migration completed successfully!")
+            print("=" * 60)
+            print("\nDeletions from now on are reported by GET /api/v1/appointments/changes.")
+            print("Clients should do one full reload after this migration.")
+            
+    except Exception as e:
+        print(f"\n❌ Error during migration: {e}")
+        print("\nPlease check:")
+        print("  1. DATABASE_URL is correct in .env file")
+        print("  2. Database server is running")
+        print("  3. You have permission to create tables and indexes")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    migrate_add_appointment_changes()
@@ -0,0 +1,40 @@
+"""
+Migration script for Idempotency-Key support on POST /api/v1/appointments.
+
+Adds the appointment_idempotency_keys table. New databases get it
+automatically when the tables are created.
+"""
+
+import sys
+from app.core.database import engine
+from app.features.users.models import User  # noqa: F401 (users table for the foreign key)
+from app.features.appointments.models import AppointmentIdempotencyKey
+
+def migrate_add_appointment_idempotency_keys():
+    """Create the appointment_idempotency_keys table if it is missing."""
+    
+    print("=" * 60)
+    print("MIGRATION: Add appointment Idempotency-Key table")
+    print("=" * 60)
+    
+    try:
+        with engine.connect() as conn:
+            print("\n1. Creating appointment_idempotency_keys table if missing...")
+            AppointmentIdempotencyKey.__table__.create(conn, checkfirst=True)
+            conn.commit()
+            print("   ✓ appointment_idempotency_keys table ready")
+            
+            print("\n" + "=" * 60)
+            print("✅ Migration completed successfully!")
+            print("=" * 60)
+            
+    except Exception as e:
+        print(f"\n❌ Error during migration: {e}")
+        print("\nPlease check:")
+        print("  1. DATABASE_URL is correct in .env file")
+        print("  2. Database server is running")
+        print("  3. You have permission to create tables")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    migrate_add_appointment_idempotency_keys()
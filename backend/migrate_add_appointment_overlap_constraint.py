@@ -0,0 +1,104 @@
+"""
+Migration script to add the double-booking exclusion constraint to appointments.
+
+The constraint rejects overlapping pending/confirmed appointments inside the
+database, so two concurrent bookings cannot both pass the overlap check.
+New databases get it automatically when the tables are created; this script
+adds it to existing PostgreSQL databases.
+"""
+
+import sys
+from sqlalchemy import text
+from app.core.database import engine
+from app.features.appointments.models import APPOINTMENT_OVERLAP_CONSTRAINT
+
+def migrate_add_overlap_constraint():
+    """Add the appointments_no_overlap exclusion constraint."""
+
+    print("=" * 60)
+    print("MIGRATION: Add double-booking exclusion constraint")
+    print("=" * 60)
+    print("\nThis script will:")
+    print("  1. Check if the constraint already exists")
+    print("  2. Check for existing overlapping pending/confirmed appointments")
+    print(f"  3. Add the '{APPOINTMENT_OVERLAP_CONSTRAINT}' exclusion constraint")
+
+    response = input("\nDo you want to continue? (yes/no): ")
+
+    if response.lower() != 'yes':
+        print("\n❌ Migration cancelled.")
+        return
+
+    print("\n" + "=" * 60)
+    print("Starting migration...")
+    print("=" * 60)
+
+    try:
+        with engine.connect() as conn:
+            # Check if constraint already exists
+            print(f"\n1. Checking if '{APPOINTMENT_OVERLAP_CONSTRAINT}' exists...")
+            result = conn.execute(text("""
+                SELECT conname
+                FROM pg_constraint
+                WHERE conname = :name
+            """), {"name": APPOINTMENT_OVERLAP_CONSTRAINT})
+
+            if result.fetchone():
+                print("   ℹ️  Constraint already exists. No migration needed.")
+                return
+
+            print("   ✓ Constraint does not exist. Proceeding with migration...")
+
+            # The constraint cannot be added while conflicting rows exist
+            print("\n2. Checking for overlapping active appointments...")
+            conflicts = conn.execute(text("""
+                SELECT a.id, b.id, a.start_time, a.end_time
+                FROM appointments a
+                JOIN appointments b
+                  ON a.id < b.id
+                 AND a.start_time < b.end_time
+                 AND a.end_time > b.start_time
+                WHERE a.status IN ('pending', 'confirmed')
+                  AND b.status IN ('pending', 'confirmed')
+            """)).fetchall()
+
+            if conflicts:
+                print(f"   ❌ Found {len(conflicts)} overlapping pair(s):")
+                for first_id, second_id, start_time, end_time in conflicts:
+                    print(f"      {first_id} overlaps {second_id} ({start_time} - {end_time})")
+                print("\nCancel or reschedule these appointments, then run the migration again.")
+                sys.exit(1)
+
+            print("   ✓ No overlapping appointments found")
+
+            # Add exclusion constraint
+            print(f"\n3. Adding '{APPOINTMENT_OVERLAP_CONSTRAINT}' constraint...")
+            conn.execute(text(f"""
+                ALTER TABLE appointments
+                ADD CONSTRAINT {APPOINTMENT_OVERLAP_CONSTRAINT}
+                EXCLUDE USING gist (tsrange(start_time, end_time, '[)') WITH &&)
+                WHERE (status IN ('pending', 'confirmed'))
+            """))
+            conn.commit()
+            print("   ✓ Constraint added successfully")
+
+            print("\n" + "=" * 60)
+            print("✅ Migration completed successfully!")
+            print("=" * 60)
+
+            print("\nThe appointments table now includes:")
+            print("  ✓ GiST exclusion constraint on tsrange(start_time, end_time)")
+            print("    for pending and confirmed appointments")
+            print("\nConcurrent bookings for the same slot now fail with 409 Conflict.")
+
+    except Exception as e:
+        print(f"\n❌ Error during migration: {e}")
+        print("\nPlease check:")
+        print("  1. DATABASE_URL is correct in .env file")
+        print("  2. Database server is running")
+        print("  3. You have permission to ALTER tables")
+        print("  4. The appointments table exists")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    migrate_add_overlap_constraint()
@@ -0,0 +1,85 @@
+"""
+Migration script for multi-resource scheduling (vets and rooms).
+
+Adds the resources table and the appointments.resource_id column with its
+(resource_id, start_time) index, and widens the appointments_no_overlap
+exclusion constraint from "no two appointments overlap" to "no two
+appointments on the same resource overlap". Existing appointments keep a
+NULL resource and still block every resource, in the constraint as in the
+application. New databases get all of this automatically when the tables
+are created.
+
+Safe to run again: databases migrated with an earlier version of this
+script, whose constraint only made resource-less appointments conflict with
+each other, get the current constraint.
+"""
+
+import sys
+from sqlalchemy import text
+from app.core.database import engine
+from app.features.resources.models import Resource
+from app.features.appointments.models import APPOINTMENT_OVERLAP_CONSTRAINT, APPOINTMENT_OVERLAP_EXCLUSION
+
+def migrate_add_appointment_resources():
+    """Create the resources table and make the overlap constraint per resource."""
+
+    print("=" * 60)
+    print("MIGRATION: Add resources (vets and rooms) to appointments")
+    print("=" * 60)
+
+    try:
+        with engine.connect() as conn:
+            print("\n1. Creating resources table if missing...")
+            Resource.__table__.create(conn, checkfirst=True)
+            print("   ✓ resources table ready")
+
+            print("\n2. Checking if 'resource_id' column exists...")
+            result = conn.execute(text("""
+                SELECT column_name
+                FROM information_schema.columns
+                WHERE table_name='appointments' AND column_name='resource_id'
+            """))
+
+            if result.fetchone():
+                print("   ℹ️  Column 'resource_id' already exists.")
+            else:
+                conn.execute(text("""
+                    ALTER TABLE appointments
+                    ADD COLUMN resource_id INTEGER REFERENCES resources(id)
+                """))
+                print("   ✓ Column 'resource_id' added (existing rows have no resource)")
+
+            print("\n3. Creating per-resource index if missing...")
+            conn.execute(text("""
+                CREATE INDEX IF NOT EXISTS ix_appointments_resource_start
+                ON appointments (resource_id, start_time)
+            """))
+            print("   ✓ ix_appointments_resource_start ready")
+
+            print(f"\n4. Replacing '{APPOINTMENT_OVERLAP_CONSTRAINT}' with the per-resource version...")
+            conn.execute(text(
+                f"ALTER TABLE appointments DROP CONSTRAINT IF EXISTS {APPOINTMENT_OVERLAP_CONSTRAINT}"
+            ))
+            conn.execute(text(
+                f"ALTER TABLE appointments ADD CONSTRAINT {APPOINTMENT_OVERLAP_CONSTRAINT} "
+                f"{APPOINTMENT_OVERLAP_EXCLUSION}"
+            ))
+            conn.commit()
+            print("   ✓ Constraint now allows overlaps on different resources")
+
+            print("\n" + "=" * 60)
+            print("✅ Migration completed successfully!")
+            print("=" * 60)
+            print("\nCreate vets and rooms with POST /api/v1/resources to start")
+            print("booking several appointments at the same time.")
+
+    except Exception as e:
+        print(f"\n❌ Error during migration: {e}")
+        print("\nPlease check:")
+        print("  1. DATABASE_URL is correct in .env file")
+        print("  2. Database server is running (PostgreSQL)")
+        print("  3. You have permission to alter tables")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    migrate_add_appointment_resources()
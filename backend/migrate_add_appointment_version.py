@@ -0,0 +1,54 @@
+"""
+Migration script to add the 'version' column to appointments table.
+
+The column backs optimistic concurrency on the appointment PATCH endpoints
+(If-Match / 409 Conflict). Existing rows start at version 1. New databases
+get the column automatically when the tables are created.
+"""
+
+import sys
+from sqlalchemy import text
+from app.core.database import engine
+
+def migrate_add_appointment_version():
+    """Add version column to appointments table."""
+    
+    print("=" * 60)
+    print("MIGRATION: Add version column to appointments table")
+    print("=" * 60)
+    
+    try:
+        with engine.connect() as conn:
+            print("\n1. Checking if 'version' column exists...")
+            result = conn.execute(text("""
+                SELECT column_name
+                FROM information_schema.columns
+                WHERE table_name='appointments' AND column_name='version'
+            """))
+            
+            if result.fetchone():
+                print("   ℹ️  Column 'version' already exists. No migration needed.")
+                return
+            
+            print("\n2. Adding 'version' column (existing rows start at 1)...")
+            conn.execute(text("""
+                ALTER TABLE appointments
+                ADD COLUMN version INTEGER NOT NULL DEFAULT 1
+            """))
+            conn.commit()
+            print("   ✓ Column 'version' added successfully")
+            
+            print("\n" + "=" * 60)
+            print("✅ Migration completed successfully!")
+            print("=" * 60)
+            
+    except Exception as e:
+        print(f"\n❌ Error during migration: {e}")
+        print("\nPlease check:")
+        print("  1. DATABASE_URL is correct in .env file")
+        print("  2. Database server is running")
+        print("  3. You have permission to alter tables")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    migrate_add_appointment_version()
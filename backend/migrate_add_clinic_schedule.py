@@ -0,0 +1,44 @@
+"""
+Migration script for configurable clinic hours and closures.
+
+Adds the clinic_weekly_hours, clinic_breaks and clinic_closures tables. While
+clinic_weekly_hours is empty the clinic keeps its default hours (8:00 AM -
+8:00 PM every day). New databases get the tables automatically when the
+tables are created.
+"""
+
+import sys
+from app.core.database import engine
+from app.features.clinic.models import ClinicWeeklyHours, ClinicBreak, ClinicClosure
+
+def migrate_add_clinic_schedule():
+    """Create the clinic schedule tables if they are missing."""
+    
+    print("=" * 60)
+    print("MIGRATION: Add clinic hours, breaks and closures tables")
+    print("=" * 60)
+    
+    try:
+        with engine.connect() as conn:
+            for step, model in enumerate([ClinicWeeklyHours, ClinicBreak, ClinicClosure], start=1):
+                print(f"\n{step}. Creating {model.__tablename__} table if missing...")
+                model.__table__.create(conn, checkfirst=True)
+                print(f"   ✓ {model.__tablename__} table ready")
+            conn.commit()
+            
+            print("\n" + "=" * 60)
+            print("✅ Migration completed successfully!")
+            print("=" * 60)
+            print("\nSet the weekly hours with PUT /api/v1/clinic/hours; until then")
+            print("the default hours apply.")
+            
+    except Exception as e:
+        print(f"\n❌ Error during migration: {e}")
+        print("\nPlease check:")
+        print("  1. DATABASE_URL is correct in .env file")
+        print("  2. Database server is running")
+        print("  3. You have permission to create tables")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    migrate_add_clinic_schedule()
@@ -0,0 +1,53 @@
+"""
+Migration script to add 'token_epoch' column to users table.
+
+Access tokens carry the user's token epoch; logging out of all sessions (and
+changing the password or deactivating the account) increments it, revoking
+every token issued before. Existing rows start at 0, which matches tokens
+issued without an epoch claim. New databases get the column automatically
+when the tables are created.
+"""
+
+import sys
+from sqlalchemy import text
+from app.core.database import engine
+
+def migrate_add_user_token_epoch():
+    """Add token_epoch column to users table."""
+    
+    print("=" * 60)
+    print("MIGRATION: Add token_epoch column to users table")
+    print("=" * 60)
+    
+    try:
+        with engine.connect() as conn:
+            print("\n1. Checking if 'token_epoch' column exists...")
+            result = conn.execute(text("""
+                SELECT column_name
+                FROM information_schema.columns
+                WHERE table_name='users' AND column_name='token_epoch'
+            """))
+            
+            if result.fetchone():
+                print("   ℹ️  Column 'token_epoch' already exists. No migration needed.")
+                return
+            
+            print("\n2. Adding 'token_epoch' column...")
+            conn.execute(text("ALTER TABLE users ADD COLUMN token_epoch INTEGER NOT NULL DEFAULT 0"))
+            conn.commit()
+            print("   ✓ Column 'token_epoch' added successfully")
+            
+            print("\n" + "=" * 60)
+            print("✅ Migration completed successfully!")
+            print("=" * 60)
+            
+    except Exception as e:
+        print(f"\n❌ Error during migration: {e}")
+        print("\nPlease check:")
+        print("  1. DATABASE_URL is correct in .env file")
+        print("  2. Database server is running")
+        print("  3. You have permission to alter tables")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    migrate_add_user_token_epoch()
@@ -0,0 +1,53 @@
+"""
+Migration script to add 'updated_at' column to users table.
+
+The user list endpoint derives its ETag from the latest users.updated_at.
+Existing rows are backfilled from created_at. New databases get the column
+automatically when the tables are created.
+"""
+
+import sys
+from sqlalchemy import text
+from app.core.database import engine
+
+def migrate_add_user_updated_at():
+    """Add updated_at column to users table."""
+    
+    print("=" * 60)
+    print("MIGRATION: Add updated_at column to users table")
+    print("=" * 60)
+    
+    try:
+        with engine.connect() as conn:
+            print("\n1. Checking if 'updated_at' column exists...")
+            result = conn.execute(text("""
+                SELECT column_name
+                FROM information_schema.columns
+                WHERE table_name='users' AND column_name='updated_at'
+            """))
+            
+            if result.fetchone():
+                print("   ℹ️  Column 'updated_at' already exists. No migration needed.")
+                return
+            
+            print("\n2. Adding 'updated_at' column and backfilling from created_at...")
+            conn.execute(text("ALTER TABLE users ADD COLUMN updated_at TIMESTAMP"))
+            conn.execute(text("UPDATE users SET updated_at = created_at"))
+            conn.execute(text("ALTER TABLE users ALTER COLUMN updated_at SET NOT NULL"))
+            conn.commit()
+            print("   ✓ Column 'updated_at' added successfully")
+            
+            print("\n" + "=" * 60)
+            print("✅ Migration completed successfully!")
+            print("=" * 60)
+            
+    except Exception as e:
+        print(f"\n❌ Error during migration: {e}")
+        print("\nPlease check:")
+        print("  1. DATABASE_URL is correct in .env file")
+        print("  2. Database server is running")
+        print("  3. You have permission to alter tables")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    migrate_add_user_updated_at()
@@ -0,0 +1,60 @@
+"""
+Migration script for the appointment waitlist.
+
+Adds the waitlist_entries and waitlist_entry_days tables, and the
+waitlist_entries.offered_resource_id column to databases that created the
+table before it existed. New databases get all of this automatically when
+the tables are created.
+"""
+
+import sys
+from sqlalchemy import text
+from app.core.database import engine
+from app.features.users.models import User  # noqa: F401 (users table for the foreign key)
+from app.features.pets.models import Pet  # noqa: F401 (pets table for the foreign key)
+from app.features.waitlist.models import WaitlistEntry, WaitlistEntryDay
+
+def migrate_add_waitlist():
+    """Create the waitlist tables if they are missing."""
+    
+    print("=" * 60)
+    print("MIGRATION: Add waitlist tables")
+    print("=" * 60)
+    
+    try:
+        with engine.connect() as conn:
+            print("\n1. Creating waitlist_entries table if missing...")
+            WaitlistEntry.__table__.create(conn, checkfirst=True)
+            print("   ✓ waitlist_entries table ready")
+            
+            print("\n2. Creating waitlist_entry_days table and queue index if missing...")
+            WaitlistEntryDay.__table__.create(conn, checkfirst=True)
+            print("   ✓ waitlist_entry_days table ready")
+            
+            print("\n3. Checking if 'offered_resource_id' column exists...")
+            result = conn.execute(text("""
+                SELECT column_name
+                FROM information_schema.columns
+                WHERE table_name='waitlist_entries' AND column_name='offered_resource_id'
+            """))
+            if result.fetchone():
+                print("   ℹ️  Column 'offered_resource_id' already exists.")
+            else:
+                conn.execute(text("ALTER TABLE waitlist_entries ADD COLUMN offered_resource_id INTEGER"))
+                print("   ✓ Column 'offered_resource_id' added")
+            conn.commit()
+            
+            print("\n" + "=" * 60)
+            print("✅ Migration completed successfully!")
+            print("=" * 60)
+            
+    except Exception as e:
+        print(f"\n❌ Error during migration: {e}")
+        print("\nPlease check:")
+        print("  1. DATABASE_URL is correct in .env file")
+        print("  2. Database server is running")
+        print("  3. You have permission to create tables")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    migrate_add_waitlist()
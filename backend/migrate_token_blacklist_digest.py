@@ -0,0 +1,71 @@
+"""
+Migration script to key the token blacklist on token digests.
+
+Replaces token_blacklist.token (the full JWT, unique-indexed) with
+token_blacklist.token_digest, a 64-character SHA-256 hex digest of the
+token's jti claim. Existing rows come from tokens issued without a jti, so
+they are backfilled with the digest of the whole token, which is what
+token_digest() computes for such tokens; they stay revoked. New databases
+get the column automatically when the tables are created.
+"""
+
+import sys
+from sqlalchemy import text
+from app.core.database import engine
+from app.infrastructure.auth import token_digest
+
+def migrate_token_blacklist_digest():
+    """Replace the token column of token_blacklist with token_digest."""
+
+    print("=" * 60)
+    print("MIGRATION: Store token digests in token_blacklist")
+    print("=" * 60)
+
+    try:
+        with engine.connect() as conn:
+            print("\n1. Checking if 'token_digest' column exists...")
+            result = conn.execute(text("""
+                SELECT column_name
+                FROM information_schema.columns
+                WHERE table_name='token_blacklist' AND column_name='token_digest'
+            """))
+
+            if result.fetchone():
+                print("   ℹ️  Column 'token_digest' already exists. No migration needed.")
+                return
+
+            print("\n2. Adding 'token_digest' column...")
+            conn.execute(text("ALTER TABLE token_blacklist ADD COLUMN token_digest VARCHAR(64)"))
+
+            print("\n3. Backfilling digests of existing tokens...")
+            rows = conn.execute(text("SELECT id, token FROM token_blacklist")).fetchall()
+            if rows:
+                conn.execute(
+                    text("UPDATE token_blacklist SET token_digest = :digest WHERE id = :id"),
+                    [{"id": row.id, "digest": token_digest(row.token)} for row in rows]
+                )
+            print(f"   ✓ {len(rows)} row(s) backfilled")
+
+            print("\n4. Indexing 'token_digest' and dropping the 'token' column...")
+            conn.execute(text("ALTER TABLE token_blacklist ALTER COLUMN token_digest SET NOT NULL"))
+            conn.execute(text(
+                "CREATE UNIQUE INDEX ix_token_blacklist_token_digest ON token_blacklist (token_digest)"
+            ))
+            conn.execute(text("ALTER TABLE token_blacklist DROP COLUMN token"))
+            conn.commit()
+            print("   ✓ token_blacklist now stores token digests only")
+
+            print("\n" + "=" * 60)
+            print("✅ Migration completed successfully!")
+            print("=" * 60)
+
+    except Exception as e:
+        print(f"\n❌ Error during migration: {e}")
+        print("\nPlease check:")
+        print("  1. DATABASE_URL is correct in .env file")
+        print("  2. Database server is running")
+        print("  3. You have permission to alter tables")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    migrate_token_blacklist_digest()
@@ -26,7 +26,7 @@ def reset_password(email: str, new_password: str):
             
             # Update password
             conn.execute(
-                text("UPDATE users SET hashed_password = :hashed WHERE email = :email"),
+                text("UPDATE users SET hashed_password = :hashed, token_epoch = token_epoch + 1 WHERE email = :email"),
                 {"hashed": hashed, "email": email}
             )
             conn.commit()
@@ -0,0 +1,66 @@
+"""Shared fixtures and helpers for the appointment test modules.
+
+Fixtures:
+- engine: Empty in-memory SQLite database with every table
+- holds: Empty slot hold store in place of the process-wide one
+
+Helpers (``from conftest import tomorrow_at, appointment_service``):
+- tomorrow_at: Tomorrow at a given hour, within clinic hours
+- appointment_service: AppointmentService bound to a session
+"""
+
+import pytest
+from sqlmodel import Session, create_engine, SQLModel
+from sqlmodel.pool import StaticPool
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+from app.common.utils import get_pht_now
+from app.features.appointments.cache import availability_cache
+from app.features.appointments.holds import InMemoryHoldStore
+from app.features.appointments.repository import AppointmentRepository
+from app.features.appointments.service import AppointmentService
+from app.features.clinic.repository import ClinicStatusRepository
+from app.features.pets.repository import PetRepository
+
+
+def tomorrow_at(hour: int, minute: int = 0) -> datetime:
+    """Return tomorrow's date at the given time (within clinic hours)."""
+    tomorrow = get_pht_now().date() + timedelta(days=1)
+    return datetime(tomorrow.year, tomorrow.month, tomorrow.day, hour, minute)
+
+
+def appointment_service(session: Session, *args, **kwargs) -> AppointmentService:
+    """Create an AppointmentService bound to a session.
+
+    Extra arguments (waitlist, resource_repo, schedule_repo, ...) are passed
+    on to AppointmentService.
+    """
+    return AppointmentService(
+        AppointmentRepository(session), PetRepository(session), ClinicStatusRepository(session),
+        *args, **kwargs
+    )
+
+
+@pytest.fixture(name="engine")
+def engine_fixture():
+    """Create an in-memory database engine with every table."""
+    engine = create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    SQLModel.metadata.create_all(engine)
+    return engine
+
+
+@pytest.fixture(name="holds")
+def holds_fixture():
+    """Replace the process-wide hold store with an empty one."""
+    holds = InMemoryHoldStore()
+    with patch("app.features.appointments.service.slot_holds", holds), \
+         patch("app.features.appointments.repository.slot_holds", holds), \
+         patch("app.features.waitlist.service.slot_holds", holds):
+        availability_cache.clear()
+        yield holds
+    availability_cache.clear()
@@ -0,0 +1,175 @@
+"""Unit and benchmark tests for the appointment availability engine.
+
+This module tests:
+- merge_busy_intervals sorting and merging
+- find_free_slots sweep-line generation
+- Equivalence with, and work saved against, the previous nested overlap loop
+"""
+
+import pytest
+import random
+from datetime import datetime, timedelta
+
+from app.features.appointments.availability import (
+    merge_busy_intervals,
+    find_free_slots
+)
+
+
+DAY_START = datetime(2030, 1, 7, 8, 0)
+DAY_END = datetime(2030, 1, 7, 20, 0)
+
+
+def at(hour: int, minute: int = 0) -> datetime:
+    """Return a datetime on the test day."""
+    return DAY_START.replace(hour=hour, minute=minute)
+
+
+def legacy_free_slots(busy, duration, step, not_before=None):
+    """Reference implementation: the nested loop previously used by get_available_slots."""
+    def has_overlap(slot_start, slot_end):
+        for start, end in busy:
+            if start < slot_end and end > slot_start:
+                return True
+        return False
+
+    slots = []
+    current_start = DAY_START
+    while current_start + duration <= DAY_END:
+        slot_end = current_start + duration
+        if not (not_before is not None and current_start <= not_before):
+            if not has_overlap(current_start, slot_end):
+                slots.append((current_start, slot_end))
+        current_start += step
+    return slots
+
+
+def random_busy_day(count: int, seed: int):
+    """Generate a reproducible day of possibly overlapping appointments."""
+    rng = random.Random(seed)
+    busy = []
+    for _ in range(count):
+        start = DAY_START + timedelta(minutes=rng.randrange(0, 12 * 60, 5))
+        busy.append((start, start + timedelta(minutes=rng.choice([15, 30, 45, 120]))))
+    return busy
+
+
+class CountingIntervals(list):
+    """List of busy intervals that counts how many intervals are read.
+
+    Counting interval reads instead of timing the run keeps the benchmark
+    deterministic: it does not depend on machine load.
+    """
+
+    def __init__(self, intervals):
+        super().__init__(intervals)
+        self.reads = 0
+
+    def __getitem__(self, index):
+        self.reads += 1
+        return super().__getitem__(index)
+
+    def __iter__(self):
+        for interval in super().__iter__():
+            self.reads += 1
+            yield interval
+
+
+class TestMergeBusyIntervals:
+    """Test that busy intervals are sorted and merged."""
+
+    def test_merges_overlapping_and_touching_intervals(self):
+        """Overlapping and back-to-back intervals collapse into one."""
+        busy = [(at(10), at(11)), (at(9), at(10)), (at(10, 30), at(10, 45)), (at(14), at(15))]
+
+        assert merge_busy_intervals(busy) == [(at(9), at(11)), (at(14), at(15))]
+
+    def test_empty_input_returns_empty_list(self):
+        """No appointments means no busy intervals."""
+        assert merge_busy_intervals([]) == []
+
+
+class TestFindFreeSlots:
+    """Test sweep-line slot generation."""
+
+    def test_skips_slots_overlapping_busy_intervals(self):
+        """Slots touching a busy interval boundary are still free."""
+        busy = merge_busy_intervals([(at(9), at(10))])
+
+        slots = find_free_slots(
+            at(8), at(11), busy, timedelta(minutes=60), timedelta(minutes=30)
+        )
+
+        assert slots == [(at(8), at(9)), (at(10), at(11))]
+
+    def test_not_before_skips_past_candidates(self):
+        """Candidates at or before the cut-off are not returned."""
+        slots = find_free_slots(
+            at(8), at(10), [], timedelta(minutes=30), timedelta(minutes=30), not_before=at(9)
+        )
+
+        assert slots == [(at(9, 30), at(10))]
+
+
+@pytest.mark.parametrize("count", [10, 100, 1000])
+def test_sweep_matches_legacy_loop(count):
+    """The sweep produces exactly the slots of the nested loop."""
+    busy = random_busy_day(count, seed=count)
+    duration = timedelta(minutes=45)
+    step = timedelta(minutes=5)
+
+    expected = legacy_free_slots(busy, duration, step, not_before=at(9, 10))
+    actual = find_free_slots(
+        DAY_START, DAY_END, merge_busy_intervals(busy), duration, step, not_before=at(9, 10)
+    )
+
+    assert actual == expected
+
+
+@pytest.mark.parametrize("count", [10, 100, 1000])
+def test_sweep_matches_legacy_loop_on_sparse_grids(count):
+    """The sweep also matches the nested loop when busy intervals are tiny and scattered.
+
+    Most candidates then fall between busy intervals, which exercises the
+    pointer skipping over intervals that end before a candidate starts.
+    """
+    rng = random.Random(count)
+    busy = []
+    for _ in range(count):
+        start = DAY_START + timedelta(seconds=rng.randrange(0, 12 * 3600))
+        busy.append((start, start + timedelta(seconds=1)))
+    duration = timedelta(minutes=1)
+    step = timedelta(minutes=5)
+
+    expected = legacy_free_slots(busy, duration, step)
+    actual = find_free_slots(DAY_START, DAY_END, merge_busy_intervals(busy), duration, step)
+
+    assert actual == expected
+
+
+@pytest.mark.parametrize("count,min_ratio", [(10, 1), (100, 10), (1000, 50)])
+def test_benchmark_sweep_against_legacy_loop(count, min_ratio):
+    """Benchmark: the sweep reads far fewer intervals than the nested loop.
+
+    Busy intervals are spread thinly so most candidates are checked against
+    every appointment by the legacy loop, which is its worst case. The sweep
+    must stay linear in slots + appointments.
+    """
+    rng = random.Random(count)
+    raw = []
+    for _ in range(count):
+        start = DAY_START + timedelta(seconds=rng.randrange(0, 12 * 3600))
+        raw.append((start, start + timedelta(seconds=1)))
+    duration = timedelta(minutes=1)
+    step = timedelta(minutes=5)
+    candidates = int((DAY_END - DAY_START - duration) / step) + 1
+
+    legacy_busy = CountingIntervals(raw)
+    expected = legacy_free_slots(legacy_busy, duration, step)
+
+    sweep_busy = CountingIntervals(merge_busy_intervals(raw))
+    actual = find_free_slots(DAY_START, DAY_END, sweep_busy, duration, step)
+
+    assert actual == expected
+    assert sweep_busy.reads <= 2 * (candidates + count)
+    assert legacy_busy.reads >= min_ratio * sweep_busy.reads
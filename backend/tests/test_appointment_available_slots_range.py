@@ -0,0 +1,183 @@
+"""Unit tests for multi-day slot availability.
+
+This module tests:
+- AppointmentRepository.get_appointments_in_range (single range query)
+- AppointmentService.get_available_slots_range (one pass over all days)
+"""
+
+import pytest
+from datetime import datetime, date, timedelta
+import uuid
+from unittest.mock import Mock
+from sqlmodel import Session, create_engine, SQLModel
+
+from app.features.appointments.service import AppointmentService, MAX_AVAILABILITY_RANGE_DAYS
+from app.features.appointments.repository import AppointmentRepository
+from app.features.appointments.models import Appointment
+from app.features.appointments.cache import availability_cache
+from app.features.users.models import User
+from app.features.pets.models import Pet
+from app.features.clinic.models import ClinicStatus
+from app.common.exceptions import BadRequestException
+from app.common.utils import get_pht_now
+
+
+@pytest.fixture(name="session")
+def session_fixture():
+    """Create a test database session with one user and one pet."""
+    engine = create_engine("sqlite:///:memory:")
+    SQLModel.metadata.create_all(engine)
+
+    with Session(engine) as session:
+        user = User(
+            full_name="Test User",
+            email="test@example.com",
+            hashed_password="hashed_password_here",
+            role="pet_owner"
+        )
+        session.add(user)
+        session.commit()
+
+        pet = Pet(name="Fluffy", species="Dog", owner_id=user.id)
+        session.add(pet)
+        session.commit()
+
+        session.info['test_user_id'] = user.id
+        session.info['test_pet_id'] = pet.id
+        yield session
+
+
+@pytest.fixture
+def mock_appointment_repo():
+    """Create a mock AppointmentRepository."""
+    return Mock()
+
+
+@pytest.fixture
+def mock_clinic_status_repo():
+    """Create a mock ClinicStatusRepository reporting the clinic as open."""
+    repo = Mock()
+    repo.get_current_status.return_value = ClinicStatus(status="open")
+    return repo
+
+
+@pytest.fixture
+def appointment_service(mock_appointment_repo, mock_clinic_status_repo):
+    """Create an AppointmentService instance with mocked dependencies and an empty cache."""
+    availability_cache.clear()
+    return AppointmentService(
+        appointment_repo=mock_appointment_repo,
+        pet_repo=Mock(),
+        clinic_status_repo=mock_clinic_status_repo
+    )
+
+
+def _appointment(start: datetime, minutes: int, status: str = "pending") -> Appointment:
+    """Build an unsaved appointment starting at the given time."""
+    return Appointment(
+        pet_id=uuid.uuid4(),
+        user_id=uuid.uuid4(),
+        start_time=start,
+        end_time=start + timedelta(minutes=minutes),
+        service_type="routine",
+        status=status
+    )
+
+
+def test_get_appointments_in_range_returns_active_overlaps_ordered(session: Session):
+    """Only pending/confirmed appointments inside the window are returned, by start time."""
+    repository = AppointmentRepository(session)
+    base = datetime(2030, 1, 7, 9, 0)
+    for offset_days, status in [(2, "confirmed"), (0, "pending"), (1, "cancelled"), (10, "pending")]:
+        appt = _appointment(base + timedelta(days=offset_days), 30, status)
+        appt.pet_id = session.info['test_pet_id']
+        appt.user_id = session.info['test_user_id']
+        session.add(appt)
+    session.commit()
+
+    result = repository.get_appointments_in_range(
+        datetime(2030, 1, 7, 8, 0), datetime(2030, 1, 9, 20, 0)
+    )
+
+    assert [a.start_time for a in result] == [base, base + timedelta(days=2)]
+
+
+def test_range_uses_one_status_read_and_one_query(
+    appointment_service, mock_appointment_repo, mock_clinic_status_repo
+):
+    """A seven-day range reads clinic status once and issues one appointment query."""
+    start = get_pht_now().date() + timedelta(days=1)
+    mock_appointment_repo.get_appointments_in_range.return_value = []
+
+    days = appointment_service.get_available_slots_range(
+        start, start + timedelta(days=6), "vaccination"
+    )
+
+    assert len(days) == 7
+    assert days[0]["date"] == start.isoformat()
+    mock_clinic_status_repo.get_current_status.assert_called_once()
+    mock_appointment_repo.get_appointments_in_range.assert_called_once()
+    mock_appointment_repo.get_appointments_for_day.assert_not_called()
+
+
+def test_range_matches_single_day_results(appointment_service, mock_appointment_repo):
+    """Each day in the range yields the same slots as the single-day endpoint."""
+    start = get_pht_now().date() + timedelta(days=1)
+    second = start + timedelta(days=1)
+    busy = [
+        _appointment(datetime(start.year, start.month, start.day, 9, 0), 45),
+        _appointment(datetime(second.year, second.month, second.day, 14, 0), 120),
+    ]
+    mock_appointment_repo.get_appointments_in_range.return_value = busy
+
+    days = appointment_service.get_available_slots_range(start, second, "routine")
+
+    for day, appts in zip(days, [[busy[0]], [busy[1]]]):
+        availability_cache.clear()
+        mock_appointment_repo.get_appointments_for_day.return_value = appts
+        expected = appointment_service.get_available_slots(
+            date.fromisoformat(day["date"]), "routine"
+        )
+        assert day["slots"] == expected
+    assert {"start_time": f"{start.isoformat()}T09:00:00", "end_time": f"{start.isoformat()}T09:45:00"} not in days[0]["slots"]
+
+
+def test_range_rejects_end_before_start(appointment_service):
+    """end_date before start_date raises BadRequestException."""
+    start = get_pht_now().date() + timedelta(days=3)
+
+    with pytest.raises(BadRequestException) as exc_info:
+        appointment_service.get_available_slots_range(start, start - timedelta(days=1), "routine")
+
+    assert "end_date must be on or after start_date" in str(exc_info.value.detail)
+
+
+def test_range_rejects_too_long_window(appointment_service):
+    """Ranges longer than the configured maximum are rejected."""
+    start = get_pht_now().date() + timedelta(days=1)
+
+    with pytest.raises(BadRequestException):
+        appointment_service.get_available_slots_range(
+            start, start + timedelta(days=MAX_AVAILABILITY_RANGE_DAYS), "routine"
+        )
+
+
+def test_range_rejects_past_dates(appointment_service):
+    """Ranges starting in the past are rejected."""
+    yesterday = get_pht_now().date() - timedelta(days=1)
+
+    with pytest.raises(BadRequestException) as exc_info:
+        appointment_service.get_available_slots_range(yesterday, yesterday + timedelta(days=2), "routine")
+
+    assert "Cannot view slots for past dates" in str(exc_info.value.detail)
+
+
+def test_range_rejects_when_clinic_closed(appointment_service, mock_clinic_status_repo):
+    """A closed clinic has no availability."""
+    mock_clinic_status_repo.get_current_status.return_value = ClinicStatus(status="close")
+    start = get_pht_now().date() + timedelta(days=1)
+
+    with pytest.raises(BadRequestException) as exc_info:
+        appointment_service.get_available_slots_range(start, start, "routine")
+
+    assert "Clinic is closed" in str(exc_info.value.detail)
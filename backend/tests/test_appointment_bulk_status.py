@@ -0,0 +1,179 @@
+"""Tests for bulk appointment status updates.
+
+This module tests:
+- AppointmentService.bulk_update_status (per-item results, versions, one UPDATE)
+- Availability and loaded appointments refreshed after a bulk cancellation
+- PATCH /api/v1/appointments/status
+
+The PostgreSQL test needs a disposable database and is skipped unless
+TEST_POSTGRES_URL is set.
+"""
+
+import os
+import uuid
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+from sqlmodel import Session, create_engine, SQLModel
+from datetime import timedelta
+
+from app.main import app
+from app.core.database import get_session
+from app.common.exceptions import ForbiddenException
+from app.features.appointments.cache import availability_cache
+from app.features.appointments.models import Appointment
+from app.features.clinic.models import ClinicStatus
+from app.features.pets.models import Pet
+from app.features.users.models import User
+from app.infrastructure.auth import create_access_token
+from conftest import tomorrow_at, appointment_service
+
+TEST_POSTGRES_URL = os.environ.get("TEST_POSTGRES_URL")
+
+
+def _populate(session: Session) -> None:
+    """Add an open clinic, an owner, an admin and four appointments tomorrow.
+
+    The appointments start at 9, 10, 11 and 12 o'clock with statuses
+    pending, pending, cancelled and completed.
+    """
+    session.add(ClinicStatus(id=1, status="open"))
+    owner = User(full_name="Owner", email="owner@example.com", hashed_password="x", role="pet_owner")
+    admin = User(full_name="Admin", email="admin@example.com", hashed_password="x", role="admin")
+    session.add_all([owner, admin])
+    session.flush()
+    pet = Pet(name="Fluffy", species="Dog", owner_id=owner.id)
+    session.add(pet)
+    session.flush()
+    appointments = [
+        Appointment(
+            pet_id=pet.id, user_id=owner.id, start_time=tomorrow_at(hour),
+            end_time=tomorrow_at(hour) + timedelta(minutes=30), service_type="vaccination", status=status
+        )
+        for hour, status in [(9, "pending"), (10, "pending"), (11, "cancelled"), (12, "completed")]
+    ]
+    session.add_all(appointments)
+    session.commit()
+    session.info.update(owner=owner, admin=admin, appointments=appointments)
+
+
+@pytest.fixture(name="session")
+def session_fixture(engine):
+    """Create a populated in-memory session."""
+    availability_cache.clear()
+
+    with Session(engine) as session:
+        _populate(session)
+        yield session
+    availability_cache.clear()
+
+
+def test_reports_per_item_results_in_request_order(session: Session):
+    """Pending appointments are confirmed; final, missing and repeated IDs are reported."""
+    pending_a, pending_b, cancelled, completed = session.info["appointments"]
+    missing = uuid.uuid4()
+    ids = [pending_a.id, cancelled.id, missing, completed.id, pending_b.id, pending_a.id]
+
+    result = appointment_service(session).bulk_update_status(ids, "confirmed", session.info["admin"])
+    session.commit()
+
+    assert result["updated"] == 2
+    assert [(item["id"], item["ok"]) for item in result["results"]] == [
+        (pending_a.id, True), (cancelled.id, False), (missing, False), (completed.id, False), (pending_b.id, True)
+    ]
+    assert result["results"][0] == {"id": pending_a.id, "ok": True, "status": "confirmed", "version": 2}
+    assert result["results"][1]["error"] == "Cannot change status of cancelled appointment"
+    assert result["results"][2]["error"] == "Appointment not found"
+    assert (pending_a.status, pending_a.version, cancelled.status) == ("confirmed", 2, "cancelled")
+
+
+def test_all_valid_ids_take_one_statement(session: Session):
+    """When every appointment can change, the whole batch is a single UPDATE."""
+    # Reload the rows expired by the fixture's commit before counting statements
+    ids = [appointment.id for appointment in session.info["appointments"][:2]]
+    admin = session.info["admin"]
+    session.refresh(admin)
+    statements = []
+    listener = lambda conn, cursor, statement, *args: statements.append(statement)
+    engine = session.get_bind()
+    event.listen(engine, "before_cursor_execute", listener)
+    try:
+        appointment_service(session).bulk_update_status(ids, "confirmed", admin)
+    finally:
+        event.remove(engine, "before_cursor_execute", listener)
+
+    assert len(statements) == 1
+    assert statements[0].startswith("UPDATE appointments")
+    assert "RETURNING" in statements[0]
+
+
+def test_bulk_cancel_frees_the_slots(session: Session):
+    """Cancelled appointments stop blocking their slots, including cached availability."""
+    pending_a, pending_b, _, _ = session.info["appointments"]
+    service = appointment_service(session)
+    tomorrow = tomorrow_at(0).date()
+    starts = [slot["start_time"] for slot in service.get_available_slots(tomorrow, "vaccination")]
+    assert tomorrow_at(9).isoformat() not in starts
+
+    service.bulk_update_status([pending_a.id, pending_b.id], "cancelled", session.info["admin"])
+    session.commit()
+
+    starts = [slot["start_time"] for slot in service.get_available_slots(tomorrow, "vaccination")]
+    assert tomorrow_at(9).isoformat() in starts and tomorrow_at(10).isoformat() in starts
+
+
+def test_owners_cannot_bulk_update(session: Session):
+    """Bulk updates are admin only."""
+    pending_a = session.info["appointments"][0]
+
+    with pytest.raises(ForbiddenException):
+        appointment_service(session).bulk_update_status([pending_a.id], "cancelled", session.info["owner"])
+
+
+@pytest.mark.skipif(not TEST_POSTGRES_URL, reason="TEST_POSTGRES_URL is not set")
+def test_bulk_update_on_postgres():
+    """The UPDATE ... RETURNING and version bump work on PostgreSQL."""
+    engine = create_engine(TEST_POSTGRES_URL)
+    SQLModel.metadata.drop_all(engine)
+    SQLModel.metadata.create_all(engine)
+    try:
+        with Session(engine) as session:
+            _populate(session)
+            pending_a, pending_b, cancelled, _ = session.info["appointments"]
+
+            result = appointment_service(session).bulk_update_status(
+                [pending_a.id, pending_b.id, cancelled.id], "confirmed", session.info["admin"]
+            )
+            session.commit()
+
+            assert result["updated"] == 2
+            assert [item.get("version") for item in result["results"]] == [2, 2, None]
+    finally:
+        SQLModel.metadata.drop_all(engine)
+        engine.dispose()
+
+
+def test_bulk_status_endpoint(session: Session):
+    """Admins get per-item results; owners and invalid bodies are rejected."""
+    pending_a, _, _, completed = session.info["appointments"]
+    owner, admin = session.info["owner"], session.info["admin"]
+    admin_headers = {"Authorization": f"Bearer {create_access_token({'sub': str(admin.id), 'role': 'admin'})}"}
+    owner_headers = {"Authorization": f"Bearer {create_access_token({'sub': str(owner.id), 'role': 'pet_owner'})}"}
+    payload = {"ids": [str(pending_a.id), str(completed.id)], "status": "confirmed"}
+    app.dependency_overrides[get_session] = lambda: session
+    client = TestClient(app)
+
+    try:
+        forbidden = client.patch("/api/v1/appointments/status", json=payload, headers=owner_headers)
+        empty = client.patch("/api/v1/appointments/status", json={"ids": [], "status": "confirmed"}, headers=admin_headers)
+        unknown = client.patch("/api/v1/appointments/status", json={**payload, "status": "done"}, headers=admin_headers)
+        updated = client.patch("/api/v1/appointments/status", json=payload, headers=admin_headers)
+    finally:
+        app.dependency_overrides.clear()
+
+    assert forbidden.status_code == 403
+    assert empty.status_code == 422
+    assert unknown.status_code == 422
+    assert updated.status_code == 200
+    assert updated.json()["updated"] == 1
+    assert [item["ok"] for item in updated.json()["results"]] == [True, False]
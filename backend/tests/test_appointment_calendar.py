@@ -0,0 +1,145 @@
+"""Tests for the calendar month endpoint.
+
+This module tests:
+- AppointmentRepository.get_calendar_entries (projected columns, month window)
+- AppointmentService.get_calendar_month grouping and role filtering
+- GET /api/v1/appointments/calendar
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+from sqlmodel import Session, create_engine, SQLModel
+from sqlmodel.pool import StaticPool
+from datetime import datetime, timedelta
+from unittest.mock import Mock
+
+from app.main import app
+from app.core.database import get_session
+from app.common.exceptions import BadRequestException
+from app.features.appointments.models import Appointment
+from app.features.appointments.repository import AppointmentRepository
+from app.features.appointments.service import AppointmentService
+from app.features.pets.models import Pet
+from app.features.users.models import User
+from app.infrastructure.auth import create_access_token
+
+
+@pytest.fixture(name="engine")
+def engine_fixture():
+    """Create an in-memory database shared across connections."""
+    engine = create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    SQLModel.metadata.create_all(engine)
+    return engine
+
+
+@pytest.fixture(name="session")
+def session_fixture(engine):
+    """Create an admin and two owners with appointments around January 2030."""
+    with Session(engine) as session:
+        admin = User(full_name="Admin", email="admin@example.com", hashed_password="x", role="admin")
+        session.add(admin)
+        owners = []
+        for name in ["Fluffy", "Rex"]:
+            owner = User(full_name="Owner", email=f"{name}@example.com", hashed_password="x", role="pet_owner")
+            session.add(owner)
+            session.flush()
+            pet = Pet(name=name, species="Dog", owner_id=owner.id)
+            session.add(pet)
+            session.flush()
+            owners.append((owner, pet))
+
+        (_, fluffy), (_, rex) = owners
+        for pet, start, status in [
+            (fluffy, datetime(2030, 1, 7, 9, 0), "pending"),
+            (rex, datetime(2030, 1, 7, 8, 0), "confirmed"),
+            (rex, datetime(2030, 1, 31, 19, 30), "cancelled"),
+            (fluffy, datetime(2029, 12, 31, 23, 0), "pending"),
+            (fluffy, datetime(2030, 2, 1, 0, 0), "pending"),
+        ]:
+            session.add(Appointment(
+                pet_id=pet.id, user_id=pet.owner_id, start_time=start,
+                end_time=start + timedelta(minutes=30), service_type="vaccination", status=status
+            ))
+        session.commit()
+        session.info['admin'] = admin
+        session.info['owners'] = owners
+        yield session
+
+
+def _service(session: Session) -> AppointmentService:
+    """Create a service backed by the real repository."""
+    return AppointmentService(AppointmentRepository(session), Mock(), Mock())
+
+
+def test_repository_selects_only_calendar_columns(engine, session: Session):
+    """One query selects the calendar columns and pets.name, not whole appointments."""
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        rows = AppointmentRepository(session).get_calendar_entries(
+            datetime(2030, 1, 1), datetime(2030, 2, 1)
+        )
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+    assert len(statements) == 1
+    assert "appointments.notes" not in statements[0]
+    assert [(row[1], row[4]) for row in rows] == [
+        (datetime(2030, 1, 7, 8, 0), "Rex"),
+        (datetime(2030, 1, 7, 9, 0), "Fluffy"),
+        (datetime(2030, 1, 31, 19, 30), "Rex"),
+    ]
+
+
+def test_admin_month_groups_appointments_by_day(session: Session):
+    """Each day carries its total, status counts and labels in time order."""
+    calendar = _service(session).get_calendar_month("2030-01", session.info['admin'])
+
+    assert calendar["month"] == "2030-01"
+    assert [day["date"] for day in calendar["days"]] == ["2030-01-07", "2030-01-31"]
+    first = calendar["days"][0]
+    assert first["total"] == 2
+    assert first["by_status"] == {"confirmed": 1, "pending": 1}
+    assert [(a["time"], a["pet_name"]) for a in first["appointments"]] == [("08:00", "Rex"), ("09:00", "Fluffy")]
+
+
+def test_pet_owner_sees_only_own_pets(session: Session):
+    """Pet owners only get summaries for their own pets."""
+    owner, _ = session.info['owners'][0]
+
+    calendar = _service(session).get_calendar_month("2030-01", owner)
+
+    assert [a["pet_name"] for day in calendar["days"] for a in day["appointments"]] == ["Fluffy"]
+
+
+@pytest.mark.parametrize("month", ["2030-13", "2030/01", "2030-01-07", "January"])
+def test_invalid_month_is_rejected(session: Session, month):
+    """Malformed months raise BadRequestException."""
+    with pytest.raises(BadRequestException):
+        _service(session).get_calendar_month(month, session.info['admin'])
+
+
+def test_calendar_endpoint(session: Session):
+    """The endpoint returns the compact month structure."""
+    app.dependency_overrides[get_session] = lambda: session
+    admin = session.info['admin']
+    token = create_access_token({"sub": str(admin.id), "role": admin.role})
+    try:
+        response = TestClient(app).get(
+            "/api/v1/appointments/calendar", params={"month": "2030-01"},
+            headers={"Authorization": f"Bearer {token}"}
+        )
+    finally:
+        app.dependency_overrides.clear()
+
+    assert response.status_code == 200
+    assert response.json()["days"][1]["appointments"][0]["time"] == "19:30"
@@ -0,0 +1,220 @@
+"""Tests for the appointment delta-sync endpoint.
+
+This module tests:
+- Tombstones written for deleted appointments (including pet delete cascades)
+- AppointmentRepository.get_changed_since / get_deleted_since
+- AppointmentService.get_changes paging and next_since
+- GET /api/v1/appointments/changes
+- Tombstone retention (periodic purge and 410 for older since values)
+"""
+
+import asyncio
+import pytest
+from fastapi.testclient import TestClient
+from sqlmodel import Session, create_engine, select, SQLModel
+from sqlmodel.pool import StaticPool
+from datetime import datetime, timedelta, timezone
+from unittest.mock import Mock, patch
+
+from app.main import app, periodic_tombstone_cleanup
+from app.core.database import get_session
+from app.common.exceptions import ChangesExpiredException
+from app.common.utils import get_pht_now
+from app.core.config import APPOINTMENT_TOMBSTONE_RETENTION_DAYS
+from app.features.appointments.models import Appointment, AppointmentTombstone
+from app.features.appointments.repository import AppointmentRepository
+from app.features.appointments.service import AppointmentService, CHANGES_OVERLAP_SECONDS
+from app.features.appointments.tasks import cleanup_expired_tombstones
+from app.features.pets.models import Pet
+from app.features.users.models import User
+from app.infrastructure.auth import create_access_token
+
+BASE = datetime(2030, 1, 7, 9, 0)
+
+
+@pytest.fixture(name="session")
+def session_fixture():
+    """Create an admin and two owners, each with a pet and two appointments."""
+    engine = create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    SQLModel.metadata.create_all(engine)
+
+    with Session(engine) as session:
+        admin = User(full_name="Admin", email="admin@example.com", hashed_password="x", role="admin")
+        session.add(admin)
+        owners = []
+        for i in range(2):
+            owner = User(full_name="Owner", email=f"owner{i}@example.com", hashed_password="x", role="pet_owner")
+            session.add(owner)
+            session.flush()
+            pet = Pet(name=f"Pet {i}", species="Dog", owner_id=owner.id)
+            session.add(pet)
+            session.flush()
+            for minutes in (0, 1):
+                session.add(Appointment(
+                    pet_id=pet.id, user_id=owner.id, start_time=BASE, end_time=BASE + timedelta(minutes=30),
+                    service_type="vaccination", updated_at=BASE + timedelta(minutes=i * 10 + minutes)
+                ))
+            owners.append((owner, pet))
+        session.commit()
+        session.info['admin'] = admin
+        session.info['owners'] = owners
+        yield session
+
+
+def _service(session: Session) -> AppointmentService:
+    """Create a service backed by the real repository."""
+    return AppointmentService(AppointmentRepository(session), Mock(), Mock())
+
+
+class TestTombstones:
+    """Test that deletions leave tombstones."""
+
+    def test_repository_delete_records_tombstone(self, session: Session):
+        """Deleting an appointment records its ID and the pet owner."""
+        owner, pet = session.info['owners'][0]
+        appointment = session.exec(select(Appointment).where(Appointment.pet_id == pet.id)).first()
+
+        AppointmentRepository(session).delete(appointment)
+        session.commit()
+
+        tombstone = session.get(AppointmentTombstone, appointment.id)
+        assert tombstone.owner_id == owner.id
+
+    def test_pet_delete_cascade_records_tombstones(self, session: Session):
+        """Appointments removed with their pet are also reported as deleted."""
+        _, pet = session.info['owners'][1]
+
+        session.delete(pet)
+        session.commit()
+
+        assert len(session.exec(select(AppointmentTombstone)).all()) == 2
+
+
+class TestGetChanges:
+    """Test the service and repository queries."""
+
+    def test_returns_only_rows_changed_since(self, session: Session):
+        """Appointments updated before since are left out."""
+        changes = _service(session).get_changes(session.info['admin'], BASE + timedelta(minutes=1))
+
+        assert [a.updated_at for a in changes["appointments"]] == [
+            BASE + timedelta(minutes=1), BASE + timedelta(minutes=10), BASE + timedelta(minutes=11)
+        ]
+        assert changes["has_more"] is False
+
+    def test_pet_owner_only_sees_own_changes_and_deletions(self, session: Session):
+        """Other owners' appointments and deletions are not reported."""
+        (owner, pet), (_, other_pet) = session.info['owners']
+        repository = AppointmentRepository(session)
+        for target in [pet, other_pet]:
+            repository.delete(session.exec(select(Appointment).where(Appointment.pet_id == target.id)).first())
+        session.commit()
+
+        changes = _service(session).get_changes(owner, get_pht_now() - timedelta(hours=1))
+
+        assert {a.pet_id for a in changes["appointments"]} == {pet.id}
+        assert [t.owner_id for t in changes["deleted"]] == [owner.id]
+
+    def test_truncated_page_resumes_from_last_timestamp(self, session: Session):
+        """A full page sets has_more and next_since to the last row's timestamp."""
+        changes = _service(session).get_changes(session.info['admin'], BASE, limit=3)
+
+        assert len(changes["appointments"]) == 3
+        assert changes["has_more"] is True
+        assert changes["next_since"] == BASE + timedelta(minutes=10)
+
+    def test_complete_sync_overlaps_recent_seconds(self, session: Session):
+        """next_since trails the server time so late commits are picked up."""
+        now = datetime(2030, 1, 8, 12, 0)
+
+        with patch("app.features.appointments.service.get_pht_now", return_value=now):
+            changes = _service(session).get_changes(session.info['admin'], BASE)
+
+        assert changes["next_since"] == now - timedelta(seconds=CHANGES_OVERLAP_SECONDS)
+
+    def test_timezone_aware_since_is_converted_to_clinic_time(self, session: Session):
+        """A UTC timestamp is compared in clinic (PHT) time."""
+        since = (BASE + timedelta(minutes=10) - timedelta(hours=8)).replace(tzinfo=timezone.utc)
+
+        changes = _service(session).get_changes(session.info['admin'], since)
+
+        assert len(changes["appointments"]) == 2
+
+
+def test_changes_endpoint_reports_updates_and_deletions(session: Session):
+    """The endpoint returns changed appointments and tombstones."""
+    owner, pet = session.info['owners'][0]
+    appointment = session.exec(select(Appointment).where(Appointment.pet_id == pet.id)).first()
+    AppointmentRepository(session).delete(appointment)
+    session.commit()
+    app.dependency_overrides[get_session] = lambda: session
+    token = create_access_token({"sub": str(owner.id), "role": owner.role})
+    try:
+        response = TestClient(app).get(
+            "/api/v1/appointments/changes",
+            params={"since": (get_pht_now() - timedelta(hours=1)).isoformat()},
+            headers={"Authorization": f"Bearer {token}"}
+        )
+    finally:
+        app.dependency_overrides.clear()
+
+    assert response.status_code == 200
+    body = response.json()
+    assert len(body["appointments"]) == 1
+    assert body["deleted"][0]["appointment_id"] == str(appointment.id)
+    assert body["has_more"] is False
+
+
+class TestTombstoneRetention:
+    """Test that tombstones are purged and older syncs are refused."""
+
+    def test_cleanup_removes_only_tombstones_past_retention(self, session: Session):
+        """Tombstones older than the retention window are deleted; recent ones stay."""
+        now = get_pht_now()
+        old_id, recent_id = session.exec(select(Appointment.id)).all()[:2]
+        session.add(AppointmentTombstone(
+            appointment_id=old_id, deleted_at=now - timedelta(days=APPOINTMENT_TOMBSTONE_RETENTION_DAYS + 1)
+        ))
+        session.add(AppointmentTombstone(appointment_id=recent_id, deleted_at=now - timedelta(days=1)))
+        session.commit()
+
+        removed = cleanup_expired_tombstones(session)
+
+        assert removed == 1
+        assert session.exec(select(AppointmentTombstone.appointment_id)).all() == [recent_id]
+
+    def test_periodic_cleanup_runs_on_interval_and_survives_errors(self):
+        """The loop purges tombstones after each interval and keeps going after a failed run."""
+        with patch('app.main.cleanup_expired_tombstones', side_effect=[RuntimeError("db down"), 1]) as mock_cleanup, \
+             patch('app.main.asyncio.sleep') as mock_sleep:
+            mock_sleep.side_effect = [None, None, asyncio.CancelledError()]
+
+            asyncio.run(periodic_tombstone_cleanup(interval_minutes=5))
+
+        mock_sleep.assert_any_call(300)
+        assert mock_cleanup.call_count == 2
+
+    def test_since_older_than_retention_is_gone(self, session: Session):
+        """The service refuses, and the endpoint answers 410 with changes_expired."""
+        admin = session.info['admin']
+        since = get_pht_now() - timedelta(days=APPOINTMENT_TOMBSTONE_RETENTION_DAYS, minutes=1)
+
+        with pytest.raises(ChangesExpiredException):
+            _service(session).get_changes(admin, since)
+
+        app.dependency_overrides[get_session] = lambda: session
+        token = create_access_token({"sub": str(admin.id), "role": admin.role})
+        try:
+            response = TestClient(app).get(
+                "/api/v1/appointments/changes", params={"since": since.isoformat()},
+                headers={"Authorization": f"Bearer {token}"}
+            )
+        finally:
+            app.dependency_overrides.clear()
+
+        assert response.status_code == 410
+        assert response.json()["error_type"] == "changes_expired"
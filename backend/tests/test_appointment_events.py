@@ -0,0 +1,253 @@
+"""Tests for appointment change events (Server-Sent Events feed).
+
+This module tests:
+- Events queued by AppointmentService for each kind of change
+- Publishing only after commit and discarding on rollback
+- AppointmentEventBroadcaster fan-out with the memory and file backends
+- SSE formatting and access control of GET /api/v1/appointments/events
+"""
+
+import asyncio
+import json
+import os
+import pytest
+import time
+from fastapi.testclient import TestClient
+from sqlmodel import Session
+from datetime import timedelta
+from unittest.mock import Mock, patch
+import uuid
+
+from app.main import app
+from app.core.database import get_session
+from app.features.appointments import events
+from app.features.appointments.events import (
+    AppointmentEventBroadcaster,
+    build_event,
+    format_sse
+)
+from app.features.appointments.models import Appointment
+from app.features.appointments.repository import AppointmentRepository
+from app.features.appointments.service import AppointmentService
+from app.features.clinic.models import ClinicStatus
+from app.features.pets.models import Pet
+from app.features.users.models import User
+from app.infrastructure.auth import create_access_token
+from app.infrastructure.events import FileEventBackend, InMemoryEventBackend
+from conftest import tomorrow_at
+
+
+class RecordingBackend(InMemoryEventBackend):
+    """In-memory backend that also records what was published."""
+
+    def __init__(self):
+        super().__init__()
+        self.published = []
+
+    def publish(self, message: dict) -> None:
+        self.published.append(message)
+        super().publish(message)
+
+
+@pytest.fixture
+def backend():
+    """Route published events to a recording backend."""
+    backend = RecordingBackend()
+    with patch.object(events, "appointment_events", AppointmentEventBroadcaster(backend)):
+        yield backend
+
+
+@pytest.fixture(name="session")
+def session_fixture(engine):
+    """Create a test database session with an admin, an owner and a pet."""
+    with Session(engine) as session:
+        admin = User(full_name="Admin", email="admin@example.com", hashed_password="x", role="admin")
+        owner = User(full_name="Owner", email="owner@example.com", hashed_password="x", role="pet_owner")
+        session.add_all([admin, owner, ClinicStatus(id=1, status="open")])
+        session.flush()
+        pet = Pet(name="Fluffy", species="Dog", owner_id=owner.id)
+        session.add(pet)
+        session.commit()
+        session.info['admin'] = admin
+        session.info['owner'] = owner
+        session.info['pet_id'] = pet.id
+        yield session
+
+
+def _appointment(**overrides) -> Appointment:
+    """Build an unsaved appointment."""
+    values = dict(
+        pet_id=uuid.uuid4(), user_id=uuid.uuid4(), start_time=tomorrow_at(10),
+        end_time=tomorrow_at(10) + timedelta(minutes=30), service_type="vaccination"
+    )
+    values.update(overrides)
+    return Appointment(**values)
+
+
+class TestServiceQueuesEvents:
+    """Test which event each service operation queues."""
+
+    @pytest.fixture
+    def service_and_repo(self):
+        """Create a service with mocked repositories that accept every change."""
+        owner_id = uuid.uuid4()
+        appointment_repo = Mock()
+        appointment_repo.check_overlap.return_value = False
+        appointment_repo.check_time_slot_available.return_value = True
+        appointment_repo.get_appointment_by_id.return_value = _appointment()
+        appointment_repo.get_by_id.return_value = _appointment()
+        appointment_repo.update_appointment_times.return_value = _appointment()
+        pet_repo = Mock()
+        pet_repo.get_by_id.return_value = Pet(name="Fluffy", species="Dog", owner_id=owner_id)
+        clinic_status_repo = Mock()
+        clinic_status_repo.get_current_status.return_value = ClinicStatus(status="open")
+        admin = User(full_name="Admin", email="a@example.com", hashed_password="x", role="admin")
+        owner = User(id=owner_id, full_name="Owner", email="o@example.com", hashed_password="x", role="pet_owner")
+        service = AppointmentService(appointment_repo, pet_repo, clinic_status_repo)
+        return service, appointment_repo, admin, owner
+
+    def test_each_change_queues_its_event(self, service_and_repo):
+        """Create, status change, reschedule and delete each queue one event."""
+        service, appointment_repo, admin, owner = service_and_repo
+
+        service.create_appointment(uuid.uuid4(), tomorrow_at(10), "vaccination", owner)
+        service.update_appointment_status(uuid.uuid4(), "confirmed", admin)
+        service.reschedule_appointment(uuid.uuid4(), owner.id, tomorrow_at(12), tomorrow_at(13))
+        service.cancel_appointment(uuid.uuid4(), admin)
+
+        assert [c.args[0] for c in appointment_repo.queue_event.call_args_list] == [
+            "created", "status_changed", "rescheduled", "deleted"
+        ]
+
+    def test_rejected_change_queues_nothing(self, service_and_repo):
+        """A change that fails validation does not queue an event."""
+        service, appointment_repo, _, owner = service_and_repo
+
+        with pytest.raises(Exception):
+            service.update_appointment_status(uuid.uuid4(), "confirmed", owner)
+
+        appointment_repo.queue_event.assert_not_called()
+
+
+class TestPublishAfterCommit:
+    """Test that events wait for the transaction outcome."""
+
+    def _create(self, session: Session):
+        """Create an appointment through the service."""
+        service = AppointmentService(
+            AppointmentRepository(session), Mock(get_by_id=Mock(return_value=Mock(owner_id=session.info['owner'].id))),
+            Mock(get_current_status=Mock(return_value=ClinicStatus(status="open")))
+        )
+        return service.create_appointment(
+            session.info['pet_id'], tomorrow_at(10), "vaccination", session.info['owner']
+        )
+
+    def test_event_is_published_on_commit(self, session: Session, backend):
+        """Nothing is published before commit; the created event is published after."""
+        appointment = self._create(session)
+        assert backend.published == []
+
+        session.commit()
+
+        assert [m["type"] for m in backend.published] == ["created"]
+        assert backend.published[0]["appointment"]["id"] == str(appointment.id)
+
+    def test_event_is_dropped_on_rollback(self, session: Session, backend):
+        """Rolled back changes never reach subscribers."""
+        self._create(session)
+        session.rollback()
+        session.commit()
+
+        assert backend.published == []
+
+
+class TestBroadcaster:
+    """Test fan-out to subscriber queues."""
+
+    def test_memory_backend_delivers_to_every_subscriber(self):
+        """Each subscriber receives the event, including from another thread."""
+        broadcaster = AppointmentEventBroadcaster(InMemoryEventBackend())
+        message = build_event("created", _appointment())
+
+        async def scenario():
+            with broadcaster.subscribe() as first, broadcaster.subscribe() as second:
+                await asyncio.to_thread(broadcaster.publish, message)
+                received = [await asyncio.wait_for(q.get(), 1) for q in (first, second)]
+            return received, broadcaster.subscriber_count()
+
+        received, remaining = asyncio.run(scenario())
+
+        assert received == [message, message]
+        assert remaining == 0
+
+    def test_slow_subscriber_drops_events_instead_of_blocking(self):
+        """A full queue drops new events."""
+        broadcaster = AppointmentEventBroadcaster(InMemoryEventBackend(), queue_size=1)
+
+        async def scenario():
+            with broadcaster.subscribe() as queue:
+                broadcaster.publish({"type": "created", "n": 1})
+                broadcaster.publish({"type": "created", "n": 2})
+                await asyncio.sleep(0)
+                return queue.qsize(), queue.get_nowait()
+
+        assert asyncio.run(scenario()) == (1, {"type": "created", "n": 1})
+
+    def test_file_backend_shares_events_between_workers(self, tmp_path):
+        """An event published by one worker reaches subscribers of another."""
+        path = str(tmp_path / "events.ndjson")
+        worker_a = AppointmentEventBroadcaster(FileEventBackend(path, poll_interval=0.01))
+        worker_b = AppointmentEventBroadcaster(FileEventBackend(path, poll_interval=0.01))
+
+        async def scenario():
+            with worker_a.subscribe() as queue_a, worker_b.subscribe() as queue_b:
+                worker_a.publish({"type": "deleted", "n": 1})
+                return [await asyncio.wait_for(q.get(), 2) for q in (queue_a, queue_b)]
+
+        assert asyncio.run(scenario()) == [{"type": "deleted", "n": 1}] * 2
+
+
+    def test_file_backend_rotates_without_losing_events(self, tmp_path):
+        """A full file is moved aside and tailers keep receiving every event."""
+        path = str(tmp_path / "events.ndjson")
+        publisher = FileEventBackend(path, poll_interval=0.01, max_bytes=200)
+        received = []
+        FileEventBackend(path, poll_interval=0.01, max_bytes=200).start(received.append)
+
+        # Batches stay under max_bytes, so the file rotates at most once between reads
+        for batch in range(4):
+            for n in range(batch * 5, batch * 5 + 5):
+                publisher.publish({"type": "created", "n": n})
+            deadline = time.monotonic() + 2
+            while len(received) < batch * 5 + 5 and time.monotonic() < deadline:
+                time.sleep(0.01)
+
+        assert [message["n"] for message in received] == list(range(20))
+        assert os.path.getsize(path) < 200
+        assert os.path.exists(path + ".1")
+
+
+def test_format_sse():
+    """Events are framed with their type and JSON data."""
+    message = build_event("rescheduled", _appointment())
+
+    text = format_sse(message)
+
+    assert text.startswith("event: rescheduled\ndata: ")
+    assert text.endswith("\n\n")
+    assert json.loads(text.split("data: ", 1)[1]) == message
+
+
+def test_events_endpoint_requires_admin(session: Session):
+    """Pet owners cannot subscribe to the clinic-wide feed."""
+    app.dependency_overrides[get_session] = lambda: session
+    owner = session.info['owner']
+    token = create_access_token({"sub": str(owner.id), "role": owner.role})
+    try:
+        response = TestClient(app).get(
+            "/api/v1/appointments/events", headers={"Authorization": f"Bearer {token}"}
+        )
+    finally:
+        app.dependency_overrides.clear()
+
+    assert response.status_code == 403
@@ -0,0 +1,171 @@
+"""Tests for appointment listings with embedded pet and owner data.
+
+This module tests:
+- parse_expand validation
+- AppointmentRepository loading pets and owners in the list query itself
+- GET /api/v1/appointments?expand=pet,owner response shape
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+from sqlmodel import Session, create_engine, select, SQLModel
+from sqlmodel.pool import StaticPool
+from datetime import datetime, timedelta
+
+from app.main import app
+from app.core.database import get_session
+from app.common.exceptions import BadRequestException
+from app.features.appointments.models import Appointment
+from app.features.appointments.repository import AppointmentRepository
+from app.features.appointments.service import parse_expand
+from app.features.pets.models import Pet
+from app.features.users.models import User
+from app.infrastructure.auth import create_access_token
+
+BASE = datetime(2030, 1, 7, 9, 0)
+
+
+@pytest.fixture(name="engine")
+def engine_fixture():
+    """Create an in-memory database shared across connections."""
+    engine = create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    SQLModel.metadata.create_all(engine)
+    return engine
+
+
+@pytest.fixture(name="session")
+def session_fixture(engine):
+    """Create a session with an admin and three owners, each with a booked pet."""
+    with Session(engine) as session:
+        admin = User(full_name="Admin", email="admin@example.com", hashed_password="x", role="admin")
+        session.add(admin)
+        for i in range(3):
+            owner = User(
+                full_name=f"Owner {i}", email=f"owner{i}@example.com",
+                hashed_password="x", role="pet_owner", phone=f"0917000000{i}"
+            )
+            session.add(owner)
+            session.flush()
+            pet = Pet(name=f"Pet {i}", species="Dog", owner_id=owner.id)
+            session.add(pet)
+            session.flush()
+            session.add(Appointment(
+                pet_id=pet.id, user_id=owner.id, start_time=BASE + timedelta(hours=i),
+                end_time=BASE + timedelta(hours=i, minutes=30), service_type="vaccination"
+            ))
+        session.commit()
+        session.info['admin'] = admin
+        yield session
+
+
+def _count_queries(engine, action):
+    """Run action and return (result, number of SELECT statements issued)."""
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, *args):
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        result = action()
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+    return result, len(statements)
+
+
+class TestParseExpand:
+    """Test ?expand= parsing."""
+
+    def test_parses_comma_separated_values(self):
+        """Whitespace and empty parts are ignored."""
+        assert parse_expand(" pet, owner ,") == {"pet", "owner"}
+        assert parse_expand(None) == frozenset()
+
+    def test_rejects_unknown_values(self):
+        """Unknown expansions raise BadRequestException."""
+        with pytest.raises(BadRequestException) as exc_info:
+            parse_expand("pet,medical_history")
+
+        assert "medical_history" in exc_info.value.detail
+
+
+class TestRepositoryExpand:
+    """Test that expansions are loaded by the list query itself."""
+
+    def test_get_all_loads_pet_and_owner_in_one_query(self, engine, session: Session):
+        """Reading pet and owner fields after get_all issues no further queries."""
+        session.expunge_all()
+        repository = AppointmentRepository(session)
+
+        def read():
+            appointments = repository.get_all(expand={"pet", "owner"})
+            return [(a.pet.name, a.pet.owner.email) for a in appointments]
+
+        rows, queries = _count_queries(engine, read)
+
+        assert rows == [(f"Pet {i}", f"owner{i}@example.com") for i in range(3)]
+        assert queries == 1
+
+    def test_get_by_owner_id_loads_pet_and_owner_in_one_query(self, engine, session: Session):
+        """The ownership join is reused to populate the pet."""
+        owner = session.exec(select(User).where(User.email == "owner1@example.com")).one()
+        session.expunge_all()
+        repository = AppointmentRepository(session)
+
+        def read():
+            appointments = repository.get_by_owner_id(owner.id, expand={"pet", "owner"})
+            return [(a.pet.name, a.pet.owner.full_name) for a in appointments]
+
+        rows, queries = _count_queries(engine, read)
+
+        assert rows == [("Pet 1", "Owner 1")]
+        assert queries == 1
+
+
+class TestExpandEndpoint:
+    """Test the expanded response shape."""
+
+    @pytest.fixture
+    def client(self, session: Session):
+        """Create a test client authenticated as the admin."""
+        app.dependency_overrides[get_session] = lambda: session
+        admin = session.info['admin']
+        client = TestClient(app)
+        client.headers["Authorization"] = "Bearer " + create_access_token(
+            {"sub": str(admin.id), "role": admin.role}
+        )
+        yield client
+        app.dependency_overrides.clear()
+
+    def test_expanded_listing_embeds_pet_and_owner(self, client):
+        """Each appointment carries its pet and the owner's contact details."""
+        response = client.get("/api/v1/appointments", params={"expand": "pet,owner"})
+
+        assert response.status_code == 200
+        first = response.json()["items"][0]
+        assert first["pet"]["name"] == "Pet 0"
+        assert first["owner"] == {
+            "id": first["owner"]["id"], "full_name": "Owner 0",
+            "email": "owner0@example.com", "phone": "09170000000"
+        }
+
+    def test_only_requested_expansions_are_included(self, client):
+        """Without expand the response is unchanged; expand=pet omits the owner."""
+        plain = client.get("/api/v1/appointments").json()["items"][0]
+        pet_only = client.get("/api/v1/appointments", params={"expand": "pet"}).json()["items"][0]
+
+        assert "pet" not in plain and "owner" not in plain
+        assert plain["notes"] is None
+        assert "pet" in pet_only and "owner" not in pet_only
+
+    def test_unknown_expansion_is_rejected(self, client):
+        """An unknown expansion returns 400."""
+        response = client.get("/api/v1/appointments", params={"expand": "vet"})
+
+        assert response.status_code == 400
@@ -0,0 +1,149 @@
+"""Tests for the streaming appointment export.
+
+This module tests:
+- AppointmentRepository.iter_for_export (filters, order, server-side cursor)
+- NDJSON/CSV serializers writing in chunks as rows arrive
+- GET /api/v1/appointments/export
+"""
+
+import csv
+import io
+import json
+import pytest
+from fastapi.testclient import TestClient
+from sqlmodel import Session, create_engine, SQLModel
+from sqlmodel.pool import StaticPool
+from datetime import datetime, timedelta
+from unittest.mock import Mock, patch
+
+from app.main import app
+from app.core.database import get_session
+from app.common.exceptions import BadRequestException
+from app.features.appointments import export
+from app.features.appointments.models import Appointment
+from app.features.appointments.repository import AppointmentRepository
+from app.features.appointments.service import AppointmentService
+from app.features.pets.models import Pet
+from app.features.users.models import User
+from app.infrastructure.auth import create_access_token
+
+BASE = datetime(2030, 1, 7, 9, 0)
+
+
+@pytest.fixture(name="session")
+def session_fixture():
+    """Create an admin and an owner with five appointments, two cancelled."""
+    engine = create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    SQLModel.metadata.create_all(engine)
+
+    with Session(engine) as session:
+        admin = User(full_name="Admin", email="admin@example.com", hashed_password="x", role="admin")
+        owner = User(full_name="Owner", email="owner@example.com", hashed_password="x", role="pet_owner")
+        session.add_all([admin, owner])
+        session.flush()
+        pet = Pet(name="Fluffy", species="Dog", owner_id=owner.id)
+        session.add(pet)
+        session.flush()
+        for hours in [4, 0, 3, 1, 2]:
+            session.add(Appointment(
+                pet_id=pet.id, user_id=owner.id, start_time=BASE + timedelta(hours=hours),
+                end_time=BASE + timedelta(hours=hours, minutes=30), service_type="vaccination",
+                status="cancelled" if hours % 2 else "pending", notes='Says "hi", twice'
+            ))
+        session.commit()
+        session.info['admin'] = admin
+        session.info['owner'] = owner
+        yield session
+
+
+def test_iter_for_export_streams_filtered_rows_in_order(session: Session):
+    """Rows are plain columns, filtered and ordered by start time, fetched in batches."""
+    repository = AppointmentRepository(session)
+
+    with patch.object(session, "exec", wraps=session.exec) as exec_spy:
+        rows = list(repository.iter_for_export(status="pending", batch_size=2))
+
+    assert [row.start_time.hour for row in rows] == [9, 11, 13]
+    assert not isinstance(rows[0], Appointment)
+    statement = exec_spy.call_args.args[0]
+    assert statement.get_execution_options()["yield_per"] == 2
+
+
+def test_serializers_emit_chunks_before_reading_all_rows():
+    """Chunks are written while rows are still being read."""
+    consumed = []
+
+    def rows():
+        for i in range(5):
+            consumed.append(i)
+            yield (i, "pending")
+
+    with patch.object(export, "EXPORT_CHUNK_ROWS", 2):
+        chunks = export.iter_csv(rows(), ["n", "status"])
+        first = next(chunks)
+
+        assert first == "n,status\r\n0,pending\r\n1,pending\r\n"
+        assert consumed == [0, 1]
+        assert "".join(chunks).count("\r\n") == 3
+
+
+def test_unsupported_format_is_rejected_before_querying():
+    """An unknown format raises BadRequestException without touching the database."""
+    appointment_repo = Mock()
+
+    with pytest.raises(BadRequestException):
+        AppointmentService(appointment_repo, Mock(), Mock()).export_appointments("xml")
+
+    appointment_repo.iter_for_export.assert_not_called()
+
+
+class TestExportEndpoint:
+    """Test the HTTP endpoint."""
+
+    @pytest.fixture
+    def client(self, session: Session):
+        """Create a test client using the test session."""
+        app.dependency_overrides[get_session] = lambda: session
+        yield TestClient(app)
+        app.dependency_overrides.clear()
+
+    def _headers(self, user: User) -> dict:
+        """Build an Authorization header for the user."""
+        token = create_access_token({"sub": str(user.id), "role": user.role})
+        return {"Authorization": f"Bearer {token}"}
+
+    def test_ndjson_export(self, client, session: Session):
+        """NDJSON exports one JSON object per appointment line."""
+        response = client.get(
+            "/api/v1/appointments/export", params={"status": "cancelled"},
+            headers=self._headers(session.info['admin'])
+        )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        lines = [json.loads(line) for line in response.text.splitlines()]
+        assert [line["start_time"] for line in lines] == ["2030-01-07T10:00:00", "2030-01-07T12:00:00"]
+        assert lines[0]["notes"] == 'Says "hi", twice'
+
+    def test_csv_export(self, client, session: Session):
+        """CSV exports a header and one row per appointment."""
+        response = client.get(
+            "/api/v1/appointments/export", params={"format": "csv"},
+            headers=self._headers(session.info['admin'])
+        )
+
+        assert response.status_code == 200
+        assert 'filename="appointments.csv"' in response.headers["content-disposition"]
+        rows = list(csv.DictReader(io.StringIO(response.text)))
+        assert len(rows) == 5
+        assert rows[0]["notes"] == 'Says "hi", twice'
+
+    def test_pet_owner_is_forbidden(self, client, session: Session):
+        """Only admins can export."""
+        response = client.get("/api/v1/appointments/export", headers=self._headers(session.info['owner']))
+
+        assert response.status_code == 403
@@ -0,0 +1,212 @@
+"""Tests for short-lived slot holds.
+
+This module tests:
+- InMemoryHoldStore conflicts, replacement, per-user cap and expiry sweeping
+- FileHoldStore sharing holds between store instances (workers)
+- Holds counting as busy in check_overlap and get_available_slots
+- Booking a held slot (holder vs other users)
+- POST /api/v1/appointments/holds and DELETE /api/v1/appointments/holds/{id}
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlmodel import Session
+from datetime import datetime, timedelta
+import uuid
+
+from app.main import app
+from app.core.database import get_session
+from app.common.exceptions import BadRequestException, TimeSlotUnavailableException
+from app.common.utils import get_pht_now
+from app.features.appointments.holds import FileHoldStore, InMemoryHoldStore, SlotHold
+from app.features.appointments.repository import AppointmentRepository
+from app.features.clinic.models import ClinicStatus
+from app.features.pets.models import Pet
+from app.features.users.models import User
+from app.infrastructure.auth import create_access_token
+from conftest import tomorrow_at, appointment_service
+
+NOW = datetime(2030, 1, 7, 8, 0)
+USER_A = uuid.uuid4()
+USER_B = uuid.uuid4()
+
+
+def _hold(user_id, hour: int, minutes: int = 30, expires_in: int = 5) -> SlotHold:
+    """Build a hold on 2030-01-07 starting at the given hour."""
+    start = NOW.replace(hour=hour)
+    return SlotHold(
+        id=uuid.uuid4(), user_id=user_id, start_time=start,
+        end_time=start + timedelta(minutes=minutes), service_type="vaccination",
+        expires_at=NOW + timedelta(minutes=expires_in)
+    )
+
+
+@pytest.fixture(params=["memory", "file"])
+def store(request, tmp_path):
+    """Create an empty hold store of each kind."""
+    if request.param == "memory":
+        return InMemoryHoldStore()
+    return FileHoldStore(str(tmp_path / "holds.json"))
+
+
+class TestHoldStore:
+    """Test the hold stores."""
+
+    def test_other_users_overlapping_hold_is_rejected(self, store):
+        """A range held by one user cannot be held by another."""
+        assert store.place(_hold(USER_A, 10), NOW, 3) == []
+
+        assert store.place(_hold(USER_B, 10, minutes=15), NOW, 3) is None
+        assert store.place(_hold(USER_B, 11), NOW, 3) == []
+
+    def test_own_overlapping_hold_is_replaced(self, store):
+        """Re-holding an overlapping range replaces the user's previous hold."""
+        first = _hold(USER_A, 10)
+        store.place(first, NOW, 3)
+
+        released = store.place(_hold(USER_A, 10, minutes=45), NOW, 3)
+
+        assert released == [first]
+        assert store.get(first.id, NOW) is None
+
+    def test_per_user_cap_releases_oldest(self, store):
+        """Going over the cap releases the hold that expires first."""
+        oldest = _hold(USER_A, 9, expires_in=1)
+        store.place(oldest, NOW, 2)
+        store.place(_hold(USER_A, 10, expires_in=2), NOW, 2)
+
+        released = store.place(_hold(USER_A, 11, expires_in=3), NOW, 2)
+
+        assert released == [oldest]
+        assert len(store.overlapping(NOW, NOW + timedelta(hours=12), NOW)) == 2
+
+    def test_expired_holds_are_swept(self, store):
+        """Expired holds disappear and no longer block other users."""
+        hold = _hold(USER_A, 10, expires_in=5)
+        store.place(hold, NOW, 3)
+        later = NOW + timedelta(minutes=5)
+
+        assert store.get(hold.id, later) is None
+        assert store.overlapping(NOW, NOW + timedelta(hours=12), later) == []
+        assert store.place(_hold(USER_B, 10), later, 3) == []
+
+    def test_release(self, store):
+        """Released holds are gone."""
+        hold = _hold(USER_A, 10)
+        store.place(hold, NOW, 3)
+
+        assert store.release(hold.id) == hold
+        assert store.release(hold.id) is None
+
+
+def test_file_store_is_shared_between_instances(tmp_path):
+    """Two FileHoldStore instances on one file see each other's holds (like two workers)."""
+    path = str(tmp_path / "holds.json")
+    worker_1, worker_2 = FileHoldStore(path), FileHoldStore(path)
+    hold = _hold(USER_A, 10)
+
+    worker_1.place(hold, NOW, 3)
+
+    assert worker_2.get(hold.id, NOW) == hold
+    assert worker_2.place(_hold(USER_B, 10), NOW, 3) is None
+
+
+@pytest.fixture(name="session")
+def session_fixture(engine, holds):
+    """Create a session with an open clinic and two owners, each with a pet."""
+    with Session(engine) as session:
+        session.add(ClinicStatus(id=1, status="open"))
+        owners = []
+        for email in ["a@example.com", "b@example.com"]:
+            user = User(full_name="Owner", email=email, hashed_password="x", role="pet_owner")
+            session.add(user)
+            session.flush()
+            pet = Pet(name="Fluffy", species="Dog", owner_id=user.id)
+            session.add(pet)
+            session.flush()
+            owners.append((user, pet))
+        session.commit()
+        session.info['owners'] = owners
+        yield session
+
+
+class TestHoldsAsBusy:
+    """Test that holds block other users."""
+
+    def test_check_overlap_ignores_only_the_holders_own_holds(self, session: Session):
+        """A hold is busy for everyone except the user who took it."""
+        (owner_a, _), (owner_b, _) = session.info['owners']
+        appointment_service(session).hold_slot(tomorrow_at(10), "vaccination", owner_a)
+        repository = AppointmentRepository(session)
+        start, end = tomorrow_at(10), tomorrow_at(10) + timedelta(minutes=30)
+
+        assert repository.check_overlap(start, end, hold_owner_id=owner_b.id)
+        assert not repository.check_overlap(start, end, hold_owner_id=owner_a.id)
+
+    def test_held_slot_is_not_available(self, session: Session):
+        """get_available_slots drops the held slot, also after it was cached."""
+        (owner_a, _), _ = session.info['owners']
+        service = appointment_service(session)
+        held = tomorrow_at(10).isoformat()
+        assert held in [slot["start_time"] for slot in service.get_available_slots(tomorrow_at(10).date(), "vaccination")]
+
+        service.hold_slot(tomorrow_at(10), "vaccination", owner_a)
+        slots = service.get_available_slots(tomorrow_at(10).date(), "vaccination")
+
+        assert held not in [slot["start_time"] for slot in slots]
+
+    def test_other_user_cannot_book_or_hold_a_held_slot(self, session: Session):
+        """Booking or holding someone else's held range is rejected."""
+        (owner_a, _), (owner_b, pet_b) = session.info['owners']
+        service = appointment_service(session)
+        service.hold_slot(tomorrow_at(10), "vaccination", owner_a)
+
+        with pytest.raises(BadRequestException):
+            service.create_appointment(pet_b.id, tomorrow_at(10), "vaccination", owner_b)
+        with pytest.raises(TimeSlotUnavailableException):
+            service.hold_slot(tomorrow_at(10), "vaccination", owner_b)
+
+    def test_holder_books_and_hold_is_released(self, session: Session, holds):
+        """The holder can book the held slot; the hold is then released."""
+        (owner_a, pet_a), _ = session.info['owners']
+        service = appointment_service(session)
+        hold = service.hold_slot(tomorrow_at(10), "vaccination", owner_a)
+
+        service.create_appointment(pet_a.id, tomorrow_at(10), "vaccination", owner_a)
+
+        assert holds.get(hold.id, get_pht_now()) is None
+
+    def test_booked_slot_cannot_be_held(self, session: Session):
+        """A slot taken by an appointment cannot be held."""
+        (owner_a, pet_a), (owner_b, _) = session.info['owners']
+        appointment_service(session).create_appointment(pet_a.id, tomorrow_at(10), "vaccination", owner_a)
+
+        with pytest.raises(TimeSlotUnavailableException):
+            appointment_service(session).hold_slot(tomorrow_at(10), "vaccination", owner_b)
+
+
+def test_hold_endpoints(session: Session):
+    """Hold, conflict, forbidden release, release and release again."""
+    (owner_a, _), (owner_b, _) = session.info['owners']
+    headers_a = {"Authorization": f"Bearer {create_access_token({'sub': str(owner_a.id), 'role': 'pet_owner'})}"}
+    headers_b = {"Authorization": f"Bearer {create_access_token({'sub': str(owner_b.id), 'role': 'pet_owner'})}"}
+    payload = {"start_time": tomorrow_at(10).isoformat(), "service_type": "vaccination"}
+    app.dependency_overrides[get_session] = lambda: session
+    client = TestClient(app)
+
+    try:
+        created = client.post("/api/v1/appointments/holds", json=payload, headers=headers_a)
+        conflict = client.post("/api/v1/appointments/holds", json=payload, headers=headers_b)
+        hold_url = f"/api/v1/appointments/holds/{created.json()['id']}"
+        forbidden = client.delete(hold_url, headers=headers_b)
+        released = client.delete(hold_url, headers=headers_a)
+        missing = client.delete(hold_url, headers=headers_a)
+    finally:
+        app.dependency_overrides.clear()
+
+    assert created.status_code == 201
+    assert created.json()["end_time"] == (tomorrow_at(10) + timedelta(minutes=30)).isoformat()
+    assert conflict.status_code == 409
+    assert forbidden.status_code == 403
+    assert released.status_code == 204
+    assert missing.status_code == 404
@@ -0,0 +1,190 @@
+"""Tests for Idempotency-Key support on appointment creation.
+
+This module tests:
+- AppointmentService replaying a stored response without re-validating
+- Key reuse with a different payload and concurrent duplicates
+- Expired key purge (repository, cleanup task and periodic loop)
+- POST /api/v1/appointments with the Idempotency-Key header
+"""
+
+import asyncio
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.exc import IntegrityError
+from sqlmodel import Session, select
+from datetime import timedelta
+from unittest.mock import Mock, patch
+import uuid
+
+from app.main import app, periodic_idempotency_key_cleanup
+from app.core.database import get_session
+from app.common.exceptions import BadRequestException, IdempotencyKeyInProgressException
+from app.common.utils import get_pht_now
+from app.features.appointments.models import Appointment, AppointmentIdempotencyKey
+from app.features.appointments.repository import AppointmentRepository
+from app.features.appointments.service import AppointmentService
+from app.features.appointments.tasks import cleanup_expired_idempotency_keys
+from app.features.clinic.models import ClinicStatus
+from app.features.pets.models import Pet
+from app.features.users.models import User
+from app.infrastructure.auth import create_access_token
+from conftest import tomorrow_at, appointment_service
+
+
+@pytest.fixture(name="session")
+def session_fixture(engine):
+    """Create a session with an open clinic and an owner with one pet."""
+    with Session(engine) as session:
+        session.add(ClinicStatus(id=1, status="open"))
+        owner = User(full_name="Owner", email="owner@example.com", hashed_password="x", role="pet_owner")
+        session.add(owner)
+        session.flush()
+        pet = Pet(name="Fluffy", species="Dog", owner_id=owner.id)
+        session.add(pet)
+        session.commit()
+        session.info['fixture'] = (owner, pet)
+        yield session
+
+
+class TestServiceIdempotency:
+    """Test create_appointment_idempotent."""
+
+    def test_retry_replays_original_response_without_validation(self, session: Session):
+        """A retried key returns the stored body and books nothing new."""
+        owner, pet = session.info['fixture']
+        body, replayed = appointment_service(session).create_appointment_idempotent(
+            "key-1", pet.id, tomorrow_at(10), "routine", owner
+        )
+        session.commit()
+
+        pet_repo, clinic_status_repo = Mock(), Mock()
+        retry_service = AppointmentService(AppointmentRepository(session), pet_repo, clinic_status_repo)
+        retry_body, retry_replayed = retry_service.create_appointment_idempotent(
+            "key-1", pet.id, tomorrow_at(10), "routine", owner
+        )
+
+        assert (replayed, retry_replayed) == (False, True)
+        assert retry_body == body
+        assert not pet_repo.get_by_id.called
+        assert not clinic_status_repo.get_current_status.called
+        assert len(session.exec(select(Appointment)).all()) == 1
+
+    def test_key_reuse_with_different_payload_is_rejected(self, session: Session):
+        """The same key for another slot raises BadRequestException."""
+        owner, pet = session.info['fixture']
+        appointment_service(session).create_appointment_idempotent("key-1", pet.id, tomorrow_at(10), "routine", owner)
+        session.commit()
+
+        with pytest.raises(BadRequestException):
+            appointment_service(session).create_appointment_idempotent("key-1", pet.id, tomorrow_at(11), "routine", owner)
+
+    def test_keys_are_scoped_per_user(self, session: Session):
+        """Another user's identical key does not replay the first user's booking."""
+        owner, pet = session.info['fixture']
+        admin = User(full_name="Admin", email="admin@example.com", hashed_password="x", role="admin")
+        session.add(admin)
+        session.commit()
+        appointment_service(session).create_appointment_idempotent("key-1", pet.id, tomorrow_at(10), "routine", owner)
+        session.commit()
+
+        _, replayed = appointment_service(session).create_appointment_idempotent(
+            "key-1", pet.id, tomorrow_at(12), "routine", admin
+        )
+
+        assert replayed is False
+
+    def test_expired_key_is_processed_again(self, session: Session):
+        """Once the replay window has passed, the key books afresh."""
+        owner, pet = session.info['fixture']
+        appointment_service(session).create_appointment_idempotent("key-1", pet.id, tomorrow_at(10), "routine", owner)
+        record = session.get(AppointmentIdempotencyKey, (owner.id, "key-1"))
+        record.expires_at = get_pht_now() - timedelta(minutes=1)
+        session.commit()
+
+        _, replayed = appointment_service(session).create_appointment_idempotent(
+            "key-1", pet.id, tomorrow_at(12), "routine", owner
+        )
+
+        assert replayed is False
+
+    def test_failed_booking_does_not_store_the_key(self, session: Session):
+        """A rejected booking leaves no key behind once the transaction rolls back."""
+        owner, pet = session.info['fixture']
+
+        with pytest.raises(BadRequestException):
+            appointment_service(session).create_appointment_idempotent(
+                "key-1", pet.id, tomorrow_at(10) - timedelta(days=3), "routine", owner
+            )
+        session.rollback()
+
+        assert session.get(AppointmentIdempotencyKey, (owner.id, "key-1")) is None
+
+    def test_concurrent_duplicate_gets_conflict(self):
+        """A key claimed by an in-flight request raises IdempotencyKeyInProgressException."""
+        appointment_repo = Mock()
+        appointment_repo.get_idempotency_key.return_value = None
+        appointment_repo.save_idempotency_key.side_effect = IntegrityError("INSERT", {}, Exception("duplicate key"))
+        service = AppointmentService(appointment_repo, Mock(), Mock())
+        user = User(id=uuid.uuid4(), full_name="Owner", email="o@example.com", hashed_password="x", role="pet_owner")
+
+        with pytest.raises(IdempotencyKeyInProgressException) as exc_info:
+            service.create_appointment_idempotent("key-1", uuid.uuid4(), tomorrow_at(10), "routine", user)
+
+        assert exc_info.value.status_code == 409
+        assert not appointment_repo.create.called
+
+
+class TestCleanup:
+    """Test purging expired keys."""
+
+    def test_cleanup_removes_only_expired_keys(self, session: Session):
+        """Expired keys are deleted; live keys stay."""
+        owner, _ = session.info['fixture']
+        now = get_pht_now()
+        for key, expires_at in [("old", now - timedelta(hours=1)), ("live", now + timedelta(hours=1))]:
+            session.add(AppointmentIdempotencyKey(
+                user_id=owner.id, key=key, request_hash="h", expires_at=expires_at
+            ))
+        session.commit()
+
+        removed = cleanup_expired_idempotency_keys(session)
+
+        assert removed == 1
+        assert [r.key for r in session.exec(select(AppointmentIdempotencyKey)).all()] == ["live"]
+
+    def test_periodic_cleanup_runs_on_interval(self):
+        """The loop sleeps for the interval, then purges keys."""
+        with patch('app.main.cleanup_expired_idempotency_keys', return_value=2) as mock_cleanup, \
+             patch('app.main.asyncio.sleep') as mock_sleep:
+            mock_sleep.side_effect = [None, asyncio.CancelledError()]
+
+            asyncio.run(periodic_idempotency_key_cleanup(interval_minutes=5))
+
+        mock_sleep.assert_any_call(300)
+        mock_cleanup.assert_called_once()
+
+
+def test_endpoint_replays_with_header(session: Session):
+    """Two POSTs with the same key create one appointment; the retry is marked replayed."""
+    owner, pet = session.info['fixture']
+    token = create_access_token({"sub": str(owner.id), "role": owner.role})
+    headers = {"Authorization": f"Bearer {token}", "Idempotency-Key": "booking-123"}
+    payload = {"pet_id": str(pet.id), "start_time": tomorrow_at(10).isoformat(), "service_type": "routine"}
+    app.dependency_overrides[get_session] = lambda: session
+    client = TestClient(app)
+
+    try:
+        first = client.post("/api/v1/appointments", json=payload, headers=headers)
+        retry = client.post("/api/v1/appointments", json=payload, headers=headers)
+        without_key = client.post(
+            "/api/v1/appointments", json=payload, headers={"Authorization": f"Bearer {token}"}
+        )
+    finally:
+        app.dependency_overrides.clear()
+
+    assert first.status_code == retry.status_code == 201
+    assert "Idempotent-Replayed" not in first.headers
+    assert retry.headers["Idempotent-Replayed"] == "true"
+    assert retry.json() == first.json()
+    assert without_key.status_code == 400
+    assert len(session.exec(select(Appointment)).all()) == 1
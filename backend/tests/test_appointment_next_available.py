@@ -0,0 +1,169 @@
+"""Unit tests for the earliest-available-slot search.
+
+This module tests:
+- AppointmentService.find_next_available (windowed range queries, early stop)
+- The day and time caps of the search
+- GET /api/v1/appointments/next-available
+"""
+
+import pytest
+from datetime import datetime, timedelta
+import uuid
+from unittest.mock import Mock, patch
+from fastapi.testclient import TestClient
+from sqlmodel import Session, create_engine, SQLModel
+from sqlmodel.pool import StaticPool
+
+from app.main import app
+from app.core.database import get_session
+from app.features.appointments.service import AppointmentService
+from app.features.appointments.models import Appointment
+from app.features.appointments.cache import availability_cache
+from app.features.clinic.models import ClinicStatus
+from app.common.exceptions import BadRequestException
+from app.common.utils import get_pht_now
+
+
+@pytest.fixture
+def mock_appointment_repo():
+    """Create a mock AppointmentRepository whose calendar is fully booked for eight days."""
+    tomorrow = get_pht_now().date() + timedelta(days=1)
+    booked = [
+        _appointment(datetime(day.year, day.month, day.day, 8, 0), 12 * 60)
+        for day in (tomorrow + timedelta(days=offset) for offset in range(8))
+    ]
+    repo = Mock()
+    repo.get_appointments_in_range.side_effect = lambda start, end: [
+        appt for appt in booked if appt.start_time < end and appt.end_time > start
+    ]
+    return repo
+
+
+@pytest.fixture
+def mock_clinic_status_repo():
+    """Create a mock ClinicStatusRepository reporting the clinic as open."""
+    repo = Mock()
+    repo.get_current_status.return_value = ClinicStatus(status="open")
+    return repo
+
+
+@pytest.fixture
+def appointment_service(mock_appointment_repo, mock_clinic_status_repo):
+    """Create an AppointmentService instance with mocked dependencies and an empty cache."""
+    availability_cache.clear()
+    yield AppointmentService(
+        appointment_repo=mock_appointment_repo,
+        pet_repo=Mock(),
+        clinic_status_repo=mock_clinic_status_repo
+    )
+    availability_cache.clear()
+
+
+def _appointment(start: datetime, minutes: int) -> Appointment:
+    """Build an unsaved pending appointment starting at the given time."""
+    return Appointment(
+        pet_id=uuid.uuid4(),
+        user_id=uuid.uuid4(),
+        start_time=start,
+        end_time=start + timedelta(minutes=minutes),
+        service_type="routine",
+        status="pending"
+    )
+
+
+def _tomorrow_at(hour: int, days: int = 1) -> datetime:
+    """Return a date some days ahead at the given hour."""
+    day = get_pht_now().date() + timedelta(days=days)
+    return datetime(day.year, day.month, day.day, hour, 0)
+
+
+def test_finds_first_opening_after_booked_days(appointment_service, mock_appointment_repo):
+    """Eight booked days are skipped with one range query per week."""
+    result = appointment_service.find_next_available("surgery", _tomorrow_at(0), limit=2)
+
+    assert [slot["start_time"] for slot in result["slots"]] == [
+        _tomorrow_at(8, days=9).isoformat(), _tomorrow_at(8, days=9).replace(minute=30).isoformat()
+    ]
+    assert result["searched_through"] == _tomorrow_at(0, days=9).date().isoformat()
+    assert mock_appointment_repo.get_appointments_in_range.call_count == 2
+    mock_appointment_repo.get_appointments_for_day.assert_not_called()
+
+
+def test_stops_at_limit_and_respects_after(appointment_service, mock_appointment_repo):
+    """Slots start at or after `after`; the scan stops on the day the limit is reached."""
+    after = _tomorrow_at(15, days=9)
+
+    result = appointment_service.find_next_available("vaccination", after, limit=3)
+
+    assert [slot["start_time"] for slot in result["slots"]] == [
+        after.isoformat(), after.replace(minute=30).isoformat(), after.replace(hour=16).isoformat()
+    ]
+    assert result["searched_through"] == after.date().isoformat()
+    mock_appointment_repo.get_appointments_in_range.assert_called_once()
+
+
+def test_cached_window_needs_no_query(appointment_service, mock_appointment_repo):
+    """A repeated search is served from the availability cache."""
+    appointment_service.find_next_available("routine", _tomorrow_at(0))
+    calls = mock_appointment_repo.get_appointments_in_range.call_count
+
+    result = appointment_service.find_next_available("routine", _tomorrow_at(0))
+
+    assert result["slots"][0]["start_time"] == _tomorrow_at(8, days=9).isoformat()
+    assert mock_appointment_repo.get_appointments_in_range.call_count == calls
+
+
+def test_day_cap_ends_search(appointment_service):
+    """Nothing is returned when every day up to NEXT_AVAILABLE_MAX_DAYS is booked."""
+    with patch("app.features.appointments.service.NEXT_AVAILABLE_MAX_DAYS", 5):
+        result = appointment_service.find_next_available("routine", _tomorrow_at(0))
+
+    assert result == {"slots": [], "searched_through": _tomorrow_at(0, days=5).date().isoformat()}
+
+
+def test_time_cap_ends_search(appointment_service):
+    """With no time budget a single day is scanned."""
+    with patch("app.features.appointments.service.NEXT_AVAILABLE_MAX_SECONDS", 0):
+        result = appointment_service.find_next_available("routine", _tomorrow_at(0))
+
+    assert result == {"slots": [], "searched_through": _tomorrow_at(0).date().isoformat()}
+
+
+def test_rejects_when_clinic_closed(appointment_service, mock_clinic_status_repo):
+    """A closed clinic raises BadRequestException."""
+    mock_clinic_status_repo.get_current_status.return_value = ClinicStatus(status="close")
+
+    with pytest.raises(BadRequestException):
+        appointment_service.find_next_available("routine")
+
+
+def test_next_available_endpoint():
+    """The endpoint is public and limits the number of slots requested."""
+    engine = create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    SQLModel.metadata.create_all(engine)
+    availability_cache.clear()
+
+    with Session(engine) as session:
+        session.add(ClinicStatus(id=1, status="open"))
+        session.commit()
+        app.dependency_overrides[get_session] = lambda: session
+        client = TestClient(app)
+        try:
+            found = client.get(
+                "/api/v1/appointments/next-available",
+                params={"service_type": "surgery", "after": _tomorrow_at(10).isoformat(), "limit": 2}
+            )
+            too_many = client.get("/api/v1/appointments/next-available", params={"limit": 21})
+        finally:
+            app.dependency_overrides.clear()
+            availability_cache.clear()
+
+    assert found.status_code == 200
+    assert [slot["start_time"] for slot in found.json()["slots"]] == [
+        _tomorrow_at(10).isoformat(), _tomorrow_at(10).replace(minute=30).isoformat()
+    ]
+    assert too_many.status_code == 422
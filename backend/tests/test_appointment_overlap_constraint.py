@@ -0,0 +1,195 @@
+"""Tests for database-enforced double-booking prevention.
+
+This module tests:
+- AppointmentService mapping constraint violations to TimeSlotUnavailableException
+- The PostgreSQL appointments_no_overlap exclusion constraint
+- Parallel bookings for the same slot (exactly one succeeds)
+
+The PostgreSQL tests need a disposable database and are skipped unless
+TEST_POSTGRES_URL is set, e.g.
+TEST_POSTGRES_URL=postgresql://postgres@localhost:5432/vet_clinic_test
+"""
+
+import os
+import pytest
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from unittest.mock import Mock, patch
+import uuid
+
+from sqlalchemy.exc import IntegrityError
+from sqlmodel import Session, SQLModel, create_engine
+
+from app.features.appointments.models import Appointment
+from app.features.appointments.repository import AppointmentRepository
+from app.features.appointments.service import AppointmentService
+from app.features.clinic.models import ClinicStatus
+from app.features.clinic.repository import ClinicStatusRepository
+from app.features.pets.models import Pet
+from app.features.pets.repository import PetRepository
+from app.features.users.models import User
+from app.common.exceptions import BadRequestException, TimeSlotUnavailableException
+from conftest import tomorrow_at
+
+TEST_POSTGRES_URL = os.environ.get("TEST_POSTGRES_URL")
+
+requires_postgres = pytest.mark.skipif(
+    not TEST_POSTGRES_URL, reason="TEST_POSTGRES_URL is not set"
+)
+
+
+class TestConstraintViolationMapping:
+    """Test that the service reports constraint violations as 409 conflicts."""
+
+    @pytest.fixture
+    def service_and_repo(self):
+        """Create a service whose pre-checks all pass."""
+        owner_id = uuid.uuid4()
+        appointment_repo = Mock()
+        appointment_repo.check_overlap.return_value = False
+        pet_repo = Mock()
+        pet_repo.get_by_id.return_value = Pet(name="Fluffy", species="Dog", owner_id=owner_id)
+        clinic_status_repo = Mock()
+        clinic_status_repo.get_current_status.return_value = ClinicStatus(status="open")
+        user = User(
+            id=owner_id, full_name="Owner", email="owner@example.com",
+            hashed_password="x", role="pet_owner"
+        )
+        service = AppointmentService(appointment_repo, pet_repo, clinic_status_repo)
+        return service, appointment_repo, user
+
+    def test_overlap_violation_raises_time_slot_unavailable(self, service_and_repo):
+        """An exclusion violation at insert time becomes TimeSlotUnavailableException."""
+        service, appointment_repo, user = service_and_repo
+        appointment_repo.create.side_effect = IntegrityError(
+            "INSERT", {}, Exception('violates exclusion constraint "appointments_no_overlap"')
+        )
+
+        with pytest.raises(TimeSlotUnavailableException) as exc_info:
+            service.create_appointment(uuid.uuid4(), tomorrow_at(10), "routine", user)
+
+        assert exc_info.value.status_code == 409
+
+    def test_other_integrity_errors_are_not_masked(self, service_and_repo):
+        """Unrelated integrity errors propagate unchanged."""
+        service, appointment_repo, user = service_and_repo
+        appointment_repo.create.side_effect = IntegrityError(
+            "INSERT", {}, Exception('violates foreign key constraint "appointments_pet_id_fkey"')
+        )
+
+        with pytest.raises(IntegrityError):
+            service.create_appointment(uuid.uuid4(), tomorrow_at(10), "routine", user)
+
+
+@pytest.fixture(name="pg_engine")
+def pg_engine_fixture():
+    """Create all tables in the PostgreSQL test database and drop them afterwards."""
+    engine = create_engine(TEST_POSTGRES_URL, pool_size=12, max_overflow=0)
+    SQLModel.metadata.drop_all(engine)
+    SQLModel.metadata.create_all(engine)
+    yield engine
+    SQLModel.metadata.drop_all(engine)
+    engine.dispose()
+
+
+@pytest.fixture(name="pg_owner")
+def pg_owner_fixture(pg_engine):
+    """Create an open clinic, a pet owner and a pet; return the owner and pet ID."""
+    with Session(pg_engine) as session:
+        session.add(ClinicStatus(id=1, status="open"))
+        user = User(
+            full_name="Owner", email="owner@example.com",
+            hashed_password="x", role="pet_owner"
+        )
+        session.add(user)
+        session.flush()
+        pet = Pet(name="Fluffy", species="Dog", owner_id=user.id)
+        session.add(pet)
+        session.commit()
+        session.refresh(user)
+        session.expunge(user)
+        return user, pet.id
+
+
+def _book_in_parallel(pg_engine, user, pet_id, start_time, attempts):
+    """Fire parallel bookings for the same slot, each in its own session."""
+    barrier = threading.Barrier(attempts)
+
+    def book():
+        with Session(pg_engine) as session:
+            service = AppointmentService(
+                AppointmentRepository(session),
+                PetRepository(session),
+                ClinicStatusRepository(session)
+            )
+            barrier.wait()
+            try:
+                service.create_appointment(pet_id, start_time, "routine", user)
+                session.commit()
+                return "booked"
+            except TimeSlotUnavailableException:
+                session.rollback()
+                return "conflict"
+            except BadRequestException:
+                session.rollback()
+                return "occupied"
+
+    with ThreadPoolExecutor(max_workers=attempts) as executor:
+        return [future.result() for future in [executor.submit(book) for _ in range(attempts)]]
+
+
+@requires_postgres
+def test_constraint_rejects_overlapping_active_appointments(pg_engine, pg_owner):
+    """The database refuses an overlapping pending appointment even without the pre-check."""
+    user, pet_id = pg_owner
+    with Session(pg_engine) as session:
+        repository = AppointmentRepository(session)
+        for start, status in [(tomorrow_at(10), "pending"), (tomorrow_at(13), "cancelled")]:
+            repository.create(Appointment(
+                pet_id=pet_id, user_id=user.id, start_time=start,
+                end_time=start + timedelta(hours=1), service_type="routine", status=status
+            ))
+        session.commit()
+
+        # Back-to-back and over a cancelled appointment are both allowed
+        for start in [tomorrow_at(11), tomorrow_at(13)]:
+            repository.create(Appointment(
+                pet_id=pet_id, user_id=user.id, start_time=start,
+                end_time=start + timedelta(hours=1), service_type="routine", status="pending"
+            ))
+        session.commit()
+
+        with pytest.raises(IntegrityError):
+            repository.create(Appointment(
+                pet_id=pet_id, user_id=user.id, start_time=tomorrow_at(10) + timedelta(minutes=30),
+                end_time=tomorrow_at(11), service_type="routine", status="confirmed"
+            ))
+        session.rollback()
+
+
+@requires_postgres
+def test_parallel_bookings_for_same_slot_book_once(pg_engine, pg_owner):
+    """Only one of many simultaneous bookings for a slot succeeds."""
+    user, pet_id = pg_owner
+
+    results = _book_in_parallel(pg_engine, user, pet_id, tomorrow_at(10), attempts=10)
+
+    assert results.count("booked") == 1
+    assert results.count("conflict") + results.count("occupied") == 9
+
+
+@requires_postgres
+def test_parallel_bookings_passing_pre_check_book_once(pg_engine, pg_owner):
+    """When every request passes the overlap pre-check, the constraint still books only one."""
+    user, pet_id = pg_owner
+
+    with patch.object(AppointmentRepository, "check_overlap", return_value=False):
+        results = _book_in_parallel(pg_engine, user, pet_id, tomorrow_at(15), attempts=10)
+
+    assert results.count("booked") == 1
+    assert results.count("conflict") == 9
+    with Session(pg_engine) as session:
+        assert len(AppointmentRepository(session).get_appointments_for_day(
+            tomorrow_at(8), tomorrow_at(20)
+        )) == 1
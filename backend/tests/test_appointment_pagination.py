@@ -0,0 +1,232 @@
+"""Tests for keyset pagination of the appointment list.
+
+This module tests:
+- encode_cursor / decode_cursor round trips and malformed cursors
+- AppointmentRepository ordering and keyset predicate on (start_time, id)
+- AppointmentService page size cap and next_cursor
+- GET /api/v1/appointments returning items and next_cursor
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlmodel import Session, create_engine, SQLModel
+from sqlmodel.pool import StaticPool
+from datetime import datetime, timedelta
+from unittest.mock import Mock, patch
+import uuid
+
+from app.main import app
+from app.core.database import get_session
+from app.common.exceptions import BadRequestException
+from app.common.pagination import encode_cursor, decode_cursor
+from app.features.appointments.models import Appointment
+from app.features.appointments.repository import AppointmentRepository
+from app.features.appointments.service import AppointmentService
+from app.features.pets.models import Pet
+from app.features.users.models import User
+from app.infrastructure.auth import create_access_token
+
+BASE = datetime(2030, 1, 7, 9, 0)
+
+
+@pytest.fixture(name="session")
+def session_fixture():
+    """Create a test database session with two owners, each with a pet."""
+    engine = create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    SQLModel.metadata.create_all(engine)
+
+    with Session(engine) as session:
+        owners = []
+        for email in ["owner@example.com", "other@example.com"]:
+            user = User(full_name="Owner", email=email, hashed_password="x", role="pet_owner")
+            session.add(user)
+            session.flush()
+            pet = Pet(name="Fluffy", species="Dog", owner_id=user.id)
+            session.add(pet)
+            session.flush()
+            owners.append((user, pet))
+        session.commit()
+        session.info['owners'] = owners
+        yield session
+
+
+def _add_appointments(session: Session, pet: Pet, starts, status: str = "pending"):
+    """Insert appointments for a pet at the given start times."""
+    for start in starts:
+        session.add(Appointment(
+            pet_id=pet.id, user_id=pet.owner_id, start_time=start,
+            end_time=start + timedelta(minutes=30), service_type="vaccination", status=status
+        ))
+    session.commit()
+
+
+def _read_all_pages(repository: AppointmentRepository, page_size: int, **filters):
+    """Walk every page of get_all, returning the pages."""
+    pages, after = [], None
+    while True:
+        page = repository.get_all(limit=page_size, after=after, **filters)
+        if not page:
+            return pages
+        pages.append(page)
+        after = (page[-1].start_time, page[-1].id)
+
+
+class TestCursor:
+    """Test cursor encoding."""
+
+    def test_round_trip(self):
+        """A decoded cursor returns the encoded sort key."""
+        row_id = uuid.uuid4()
+
+        assert decode_cursor(encode_cursor(BASE, row_id)) == (BASE, row_id)
+
+    @pytest.mark.parametrize("cursor", ["not-a-cursor", "e30", encode_cursor(BASE, uuid.uuid4())[:-6]])
+    def test_malformed_cursor_is_rejected(self, cursor):
+        """Garbage and truncated cursors raise BadRequestException."""
+        with pytest.raises(BadRequestException) as exc_info:
+            decode_cursor(cursor)
+
+        assert exc_info.value.status_code == 400
+
+
+class TestRepositoryKeyset:
+    """Test ordering and the keyset predicate against SQLite."""
+
+    def test_pages_cover_all_rows_once_with_equal_start_times(self, session: Session):
+        """Rows sharing a start time are split across pages without gaps or repeats."""
+        _, pet = session.info['owners'][0]
+        _add_appointments(session, pet, [BASE] * 3 + [BASE + timedelta(hours=1)] * 2 + [BASE - timedelta(days=1)])
+
+        pages = _read_all_pages(AppointmentRepository(session), page_size=2)
+        rows = [row for page in pages for row in page]
+
+        assert [len(page) for page in pages] == [2, 2, 2]
+        assert len({row.id for row in rows}) == 6
+        assert [(r.start_time, str(r.id)) for r in rows] == sorted((r.start_time, str(r.id)) for r in rows)
+
+    def test_filters_apply_on_every_page(self, session: Session):
+        """Status and date filters still hold when paging."""
+        _, pet = session.info['owners'][0]
+        _add_appointments(session, pet, [BASE + timedelta(hours=h) for h in range(5)])
+        _add_appointments(session, pet, [BASE + timedelta(hours=h, minutes=30) for h in range(5)], "cancelled")
+
+        pages = _read_all_pages(
+            AppointmentRepository(session), page_size=2,
+            status="pending", from_date=BASE + timedelta(hours=1)
+        )
+        rows = [row for page in pages for row in page]
+
+        assert [r.start_time.hour for r in rows] == [10, 11, 12, 13]
+        assert all(r.status == "pending" for r in rows)
+
+    def test_owner_pages_only_contain_owner_appointments(self, session: Session):
+        """get_by_owner_id pages never include other owners' appointments."""
+        (owner, pet), (_, other_pet) = session.info['owners']
+        _add_appointments(session, pet, [BASE + timedelta(hours=h) for h in range(3)])
+        _add_appointments(session, other_pet, [BASE + timedelta(hours=h) for h in range(3)])
+        repository = AppointmentRepository(session)
+
+        first = repository.get_by_owner_id(owner.id, limit=2)
+        second = repository.get_by_owner_id(owner.id, limit=2, after=(first[-1].start_time, first[-1].id))
+
+        assert [r.pet_id for r in first + second] == [pet.id] * 3
+
+
+class TestServicePaging:
+    """Test page size handling in AppointmentService."""
+
+    @pytest.fixture
+    def admin(self):
+        """Create an admin user."""
+        return User(full_name="Admin", email="admin@example.com", hashed_password="x", role="admin")
+
+    def _service(self, rows):
+        """Create a service whose repository returns the given rows."""
+        appointment_repo = Mock()
+        appointment_repo.get_all.return_value = rows
+        return AppointmentService(appointment_repo, Mock(), Mock()), appointment_repo
+
+    def _rows(self, count):
+        """Build unsaved appointments one hour apart."""
+        return [
+            Appointment(
+                id=uuid.uuid4(), pet_id=uuid.uuid4(), user_id=uuid.uuid4(),
+                start_time=BASE + timedelta(hours=i), end_time=BASE + timedelta(hours=i, minutes=30),
+                service_type="vaccination"
+            )
+            for i in range(count)
+        ]
+
+    def test_returns_cursor_of_last_row_when_more_rows_exist(self, admin):
+        """An extra row means another page; the cursor points at the last row shown."""
+        rows = self._rows(4)
+        service, appointment_repo = self._service(rows)
+
+        page, next_cursor = service.get_appointments(admin, limit=3)
+
+        assert page == rows[:3]
+        assert decode_cursor(next_cursor) == (rows[2].start_time, rows[2].id)
+        assert appointment_repo.get_all.call_args.kwargs["limit"] == 4
+
+    def test_last_page_has_no_cursor(self, admin):
+        """A short page ends the listing."""
+        service, _ = self._service(self._rows(2))
+
+        page, next_cursor = service.get_appointments(admin, limit=3)
+
+        assert len(page) == 2
+        assert next_cursor is None
+
+    def test_page_size_is_capped(self, admin):
+        """Page sizes above the maximum are clamped."""
+        service, appointment_repo = self._service([])
+
+        with patch("app.features.appointments.service.APPOINTMENTS_MAX_PAGE_SIZE", 5):
+            service.get_appointments(admin, limit=500)
+
+        assert appointment_repo.get_all.call_args.kwargs["limit"] == 6
+
+    def test_cursor_is_decoded_for_repository(self, admin):
+        """The cursor is passed to the repository as a (start_time, id) key."""
+        service, appointment_repo = self._service([])
+        row_id = uuid.uuid4()
+
+        service.get_appointments(admin, cursor=encode_cursor(BASE, row_id))
+
+        assert appointment_repo.get_all.call_args.kwargs["after"] == (BASE, row_id)
+
+
+def test_endpoint_follows_next_cursor(session: Session):
+    """Following next_cursor visits every appointment of the owner exactly once."""
+    owner, pet = session.info['owners'][0]
+    _add_appointments(session, pet, [BASE + timedelta(hours=h) for h in range(5)])
+    token = create_access_token({"sub": str(owner.id), "role": owner.role})
+    app.dependency_overrides[get_session] = lambda: session
+    client = TestClient(app)
+
+    try:
+        seen, params = [], {"limit": 2}
+        while True:
+            response = client.get(
+                "/api/v1/appointments", params=params,
+                headers={"Authorization": f"Bearer {token}"}
+            )
+            assert response.status_code == 200
+            body = response.json()
+            seen.extend(item["id"] for item in body["items"])
+            if body["next_cursor"] is None:
+                break
+            params = {"limit": 2, "cursor": body["next_cursor"]}
+
+        assert len(seen) == len(set(seen)) == 5
+        bad = client.get(
+            "/api/v1/appointments", params={"cursor": "garbage"},
+            headers={"Authorization": f"Bearer {token}"}
+        )
+        assert bad.status_code == 400
+    finally:
+        app.dependency_overrides.clear()
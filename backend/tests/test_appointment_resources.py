@@ -0,0 +1,314 @@
+"""Tests for multi-resource scheduling (vets and rooms).
+
+This module tests:
+- index_busy_by_resource and find_free_slots_on_any
+- Booking assigning a free qualifying resource, up to the resource count
+- Available slots staying open while at least one qualifying resource is free
+- Unassigned appointments, holds and rescheduling with resources
+- The per-resource PostgreSQL exclusion constraint
+- GET/POST/PATCH /api/v1/resources
+
+The PostgreSQL test needs a disposable database and is skipped unless
+TEST_POSTGRES_URL is set.
+"""
+
+import os
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.exc import IntegrityError
+from sqlmodel import Session, create_engine, SQLModel
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+from app.main import app
+from app.core.database import get_session
+from app.common.exceptions import BadRequestException
+from app.features.appointments.availability import find_free_slots_on_any, index_busy_by_resource
+from app.features.appointments.models import Appointment
+from app.features.appointments.service import AppointmentService
+from app.features.clinic.models import ClinicStatus
+from app.features.pets.models import Pet
+from app.features.resources.models import Resource
+from app.features.resources.repository import ResourceRepository
+from app.features.users.models import User
+from app.infrastructure.auth import create_access_token
+from conftest import tomorrow_at, appointment_service
+
+TEST_POSTGRES_URL = os.environ.get("TEST_POSTGRES_URL")
+BASE = datetime(2030, 1, 7, 8, 0)
+
+
+def _busy(resource_id, hour: int, minutes: int = 60):
+    """Build a busy item on 2030-01-07 for the availability helpers."""
+    start = BASE.replace(hour=hour)
+    return SimpleNamespace(start_time=start, end_time=start + timedelta(minutes=minutes), resource_id=resource_id)
+
+
+class TestAvailabilityHelpers:
+    """Test per-resource busy indexing and slot generation."""
+
+    def test_slot_is_free_while_any_resource_is_free(self):
+        """A slot is offered unless every resource is busy."""
+        busy = index_busy_by_resource([_busy(1, 9), _busy(2, 9), _busy(1, 10)])
+
+        slots = find_free_slots_on_any(
+            BASE, BASE.replace(hour=12), busy, [1, 2],
+            duration=timedelta(hours=1), step=timedelta(hours=1)
+        )
+
+        assert [start.hour for start, _ in slots] == [8, 10, 11]
+
+    def test_unassigned_busy_interval_blocks_every_resource(self):
+        """Intervals without a resource count for all resources."""
+        busy = index_busy_by_resource([_busy(None, 8), _busy(1, 9)])
+
+        slots = find_free_slots_on_any(
+            BASE, BASE.replace(hour=10), busy, [1, 2],
+            duration=timedelta(hours=1), step=timedelta(hours=1)
+        )
+
+        assert [start.hour for start, _ in slots] == [9]
+
+
+@pytest.fixture(name="session")
+def session_fixture(engine, holds):
+    """Create a session with an open clinic, three vets, two surgery rooms and four owners."""
+    with Session(engine) as session:
+        session.add(ClinicStatus(id=1, status="open"))
+        for name in ["Dr. A", "Dr. B", "Dr. C"]:
+            session.add(Resource(name=name, kind="vet", service_types=["vaccination", "routine"]))
+        for name in ["Surgery 1", "Surgery 2"]:
+            session.add(Resource(name=name, kind="room", service_types=["surgery"]))
+        owners = []
+        for index in range(4):
+            user = User(full_name="Owner", email=f"o{index}@example.com", hashed_password="x", role="pet_owner")
+            session.add(user)
+            session.flush()
+            pet = Pet(name="Fluffy", species="Dog", owner_id=user.id)
+            session.add(pet)
+            session.flush()
+            owners.append((user, pet))
+        session.commit()
+        session.info['owners'] = owners
+        yield session
+
+
+def _service(session: Session) -> AppointmentService:
+    """Create a resource-aware AppointmentService bound to a session."""
+    return appointment_service(session, resource_repo=ResourceRepository(session))
+
+
+def _starts(slots) -> list:
+    """Extract the start times of available slots."""
+    return [slot["start_time"] for slot in slots]
+
+
+class TestBookingWithResources:
+    """Test resource assignment when booking."""
+
+    def test_books_one_appointment_per_qualifying_resource(self, session: Session):
+        """Three vets take three simultaneous vaccinations; the fourth is rejected."""
+        service = _service(session)
+        booked = [
+            service.create_appointment(pet.id, tomorrow_at(10), "vaccination", user)
+            for user, pet in session.info['owners'][:3]
+        ]
+        user, pet = session.info['owners'][3]
+
+        with pytest.raises(BadRequestException):
+            service.create_appointment(pet.id, tomorrow_at(10), "vaccination", user)
+        assert sorted(appointment.resource_id for appointment in booked) == [1, 2, 3]
+
+    def test_surgery_goes_to_a_room(self, session: Session):
+        """Only resources providing the service are used."""
+        user, pet = session.info['owners'][0]
+
+        appointment = _service(session).create_appointment(pet.id, tomorrow_at(10), "surgery", user)
+
+        assert session.get(Resource, appointment.resource_id).kind == "room"
+
+    def test_slot_stays_available_until_every_resource_is_busy(self, session: Session):
+        """available-slots keeps 10:00 until all three vets are booked."""
+        service = _service(session)
+        target = tomorrow_at(10)
+        for user, pet in session.info['owners'][:2]:
+            service.create_appointment(pet.id, target, "vaccination", user)
+        assert target.isoformat() in _starts(service.get_available_slots(target.date(), "vaccination"))
+
+        user, pet = session.info['owners'][2]
+        service.create_appointment(pet.id, target, "vaccination", user)
+
+        assert target.isoformat() not in _starts(service.get_available_slots(target.date(), "vaccination"))
+        range_days = service.get_available_slots_range(target.date(), target.date(), "vaccination")
+        assert target.isoformat() not in _starts(range_days[0]["slots"])
+
+    def test_service_without_resources_has_no_slots(self, session: Session):
+        """With resources configured, a service nobody provides cannot be booked."""
+        user, pet = session.info['owners'][0]
+        service = _service(session)
+
+        assert service.get_available_slots(tomorrow_at(10).date(), "emergency") == []
+        with pytest.raises(BadRequestException):
+            service.create_appointment(pet.id, tomorrow_at(10), "emergency", user)
+
+    def test_unassigned_appointment_blocks_all_resources(self, session: Session):
+        """An appointment booked before resources existed blocks every resource."""
+        user, pet = session.info['owners'][0]
+        session.add(Appointment(
+            pet_id=pet.id, user_id=user.id, start_time=tomorrow_at(10),
+            end_time=tomorrow_at(10) + timedelta(minutes=30), service_type="vaccination"
+        ))
+        session.commit()
+        other, other_pet = session.info['owners'][1]
+
+        with pytest.raises(BadRequestException):
+            _service(session).create_appointment(other_pet.id, tomorrow_at(10), "vaccination", other)
+
+    def test_deactivating_every_resource_restores_single_resource_mode(self, session: Session):
+        """Without active resources the clinic is one resource again."""
+        for resource in ResourceRepository(session).get_all():
+            resource.is_active = False
+        session.commit()
+        (user, pet), (other, other_pet) = session.info['owners'][:2]
+        service = _service(session)
+        service.create_appointment(pet.id, tomorrow_at(10), "vaccination", user)
+
+        with pytest.raises(BadRequestException):
+            service.create_appointment(other_pet.id, tomorrow_at(10), "vaccination", other)
+
+
+class TestHoldsAndRescheduleWithResources:
+    """Test holds and reschedules on resources."""
+
+    def test_hold_takes_one_resource_only(self, session: Session):
+        """A hold blocks one vet; others can still book the same time."""
+        (user, _), (other, other_pet) = session.info['owners'][:2]
+        service = _service(session)
+
+        hold = service.hold_slot(tomorrow_at(10), "vaccination", user)
+        appointment = service.create_appointment(other_pet.id, tomorrow_at(10), "vaccination", other)
+
+        assert hold.resource_id is not None
+        assert appointment.resource_id != hold.resource_id
+
+    def test_reschedule_keeps_resource_when_free_and_moves_when_busy(self, session: Session):
+        """The current resource is preferred; a busy one is swapped for a free one."""
+        (user, pet), (other, other_pet) = session.info['owners'][:2]
+        service = _service(session)
+        appointment = service.create_appointment(pet.id, tomorrow_at(10), "vaccination", user)
+        original = appointment.resource_id
+        service.create_appointment(other_pet.id, tomorrow_at(14), "vaccination", other)
+
+        moved = service.reschedule_appointment(
+            appointment.id, user.id, tomorrow_at(11), tomorrow_at(11) + timedelta(minutes=30)
+        )
+        assert moved.resource_id == original
+
+        moved = service.reschedule_appointment(
+            appointment.id, user.id, tomorrow_at(14), tomorrow_at(14) + timedelta(minutes=30)
+        )
+        assert moved.resource_id != original
+
+
+@pytest.mark.skipif(not TEST_POSTGRES_URL, reason="TEST_POSTGRES_URL is not set")
+def test_constraint_is_per_resource():
+    """PostgreSQL allows overlaps on different resources and rejects them on the same one."""
+    engine = create_engine(TEST_POSTGRES_URL)
+    SQLModel.metadata.drop_all(engine)
+    SQLModel.metadata.create_all(engine)
+    try:
+        with Session(engine) as session:
+            user = User(full_name="Owner", email="owner@example.com", hashed_password="x", role="pet_owner")
+            vet_a = Resource(name="Dr. A", kind="vet", service_types=["routine"])
+            vet_b = Resource(name="Dr. B", kind="vet", service_types=["routine"])
+            session.add_all([user, vet_a, vet_b])
+            session.flush()
+            pet = Pet(name="Fluffy", species="Dog", owner_id=user.id)
+            session.add(pet)
+            session.flush()
+
+            def book(resource_id):
+                session.add(Appointment(
+                    pet_id=pet.id, user_id=user.id, start_time=tomorrow_at(10),
+                    end_time=tomorrow_at(11), service_type="routine", resource_id=resource_id
+                ))
+                session.flush()
+
+            book(vet_a.id)
+            book(vet_b.id)
+            with pytest.raises(IntegrityError):
+                book(vet_a.id)
+            session.rollback()
+    finally:
+        SQLModel.metadata.drop_all(engine)
+        engine.dispose()
+
+
+@pytest.mark.skipif(not TEST_POSTGRES_URL, reason="TEST_POSTGRES_URL is not set")
+def test_constraint_appointment_without_resource_blocks_every_resource():
+    """PostgreSQL treats an appointment without a resource as busy on every resource."""
+    engine = create_engine(TEST_POSTGRES_URL)
+    SQLModel.metadata.drop_all(engine)
+    SQLModel.metadata.create_all(engine)
+    try:
+        with Session(engine) as session:
+            user = User(full_name="Owner", email="owner@example.com", hashed_password="x", role="pet_owner")
+            vet = Resource(name="Dr. A", kind="vet", service_types=["routine"])
+            session.add_all([user, vet])
+            session.flush()
+            pet = Pet(name="Fluffy", species="Dog", owner_id=user.id)
+            session.add(pet)
+            session.commit()
+            pet_id, user_id, vet_id = pet.id, user.id, vet.id
+
+            def book(hour, resource_id):
+                session.add(Appointment(
+                    pet_id=pet_id, user_id=user_id, start_time=tomorrow_at(hour),
+                    end_time=tomorrow_at(hour + 1), service_type="routine", resource_id=resource_id
+                ))
+                session.commit()
+
+            # Either order of a resource-less and a resource booking conflicts
+            for hour, first, second in [(9, None, vet_id), (11, vet_id, None), (13, None, None)]:
+                book(hour, first)
+                with pytest.raises(IntegrityError):
+                    book(hour, second)
+                session.rollback()
+    finally:
+        SQLModel.metadata.drop_all(engine)
+        engine.dispose()
+
+
+def test_resource_endpoints(session: Session):
+    """Admins create and deactivate resources; owners can only list them."""
+    owner, _ = session.info['owners'][0]
+    admin = User(full_name="Admin", email="admin@example.com", hashed_password="x", role="admin")
+    session.add(admin)
+    session.commit()
+    admin_headers = {"Authorization": f"Bearer {create_access_token({'sub': str(admin.id), 'role': 'admin'})}"}
+    owner_headers = {"Authorization": f"Bearer {create_access_token({'sub': str(owner.id), 'role': 'pet_owner'})}"}
+    payload = {"name": "Dr. D", "kind": "vet", "service_types": ["emergency"]}
+    app.dependency_overrides[get_session] = lambda: session
+    client = TestClient(app)
+
+    try:
+        forbidden = client.post("/api/v1/resources", json=payload, headers=owner_headers)
+        created = client.post("/api/v1/resources", json=payload, headers=admin_headers)
+        duplicate = client.post("/api/v1/resources", json=payload, headers=admin_headers)
+        slots = client.get(
+            "/api/v1/appointments/available-slots",
+            params={"date": tomorrow_at(10).date().isoformat(), "service_type": "emergency"}
+        )
+        deactivated = client.patch(
+            f"/api/v1/resources/{created.json()['id']}", json={"is_active": False}, headers=admin_headers
+        )
+        listed = client.get("/api/v1/resources", headers=owner_headers)
+    finally:
+        app.dependency_overrides.clear()
+
+    assert forbidden.status_code == 403
+    assert created.status_code == 201
+    assert duplicate.status_code == 400
+    assert slots.status_code == 200 and len(slots.json()) > 0
+    assert deactivated.json()["is_active"] is False
+    assert [resource["name"] for resource in listed.json()][-1] == "Dr. D"
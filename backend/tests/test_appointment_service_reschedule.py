@@ -450,7 +450,8 @@ class TestTimeSlotAvailability:
         mock_appointment_repo.check_time_slot_available.assert_called_once_with(
             new_start,
             new_end,
-            exclude_appointment_id=test_appointment_id
+            exclude_appointment_id=test_appointment_id,
+            hold_owner_id=test_user_id
         )
 
 
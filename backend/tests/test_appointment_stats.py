@@ -0,0 +1,140 @@
+"""Tests for the admin appointment statistics endpoint.
+
+This module tests:
+- AppointmentRepository.count_by_status_and_service_type (one GROUP BY query)
+- AppointmentService.get_appointment_stats aggregation
+- GET /api/v1/appointments/stats access control
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+from sqlmodel import Session, create_engine, SQLModel
+from sqlmodel.pool import StaticPool
+from datetime import datetime, time, timedelta
+from unittest.mock import Mock
+
+from app.main import app
+from app.core.database import get_session
+from app.features.appointments.models import Appointment
+from app.features.appointments.repository import AppointmentRepository
+from app.features.appointments.service import AppointmentService
+from app.features.pets.models import Pet
+from app.features.users.models import User
+from app.infrastructure.auth import create_access_token
+from app.common.utils import get_pht_now
+
+
+@pytest.fixture(name="engine")
+def engine_fixture():
+    """Create an in-memory database shared across connections."""
+    engine = create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    SQLModel.metadata.create_all(engine)
+    return engine
+
+
+@pytest.fixture(name="session")
+def session_fixture(engine):
+    """Create a session with an admin, a pet owner and a mix of appointments."""
+    with Session(engine) as session:
+        admin = User(full_name="Admin", email="admin@example.com", hashed_password="x", role="admin")
+        owner = User(full_name="Owner", email="owner@example.com", hashed_password="x", role="pet_owner")
+        session.add_all([admin, owner])
+        session.flush()
+        pet = Pet(name="Fluffy", species="Dog", owner_id=owner.id)
+        session.add(pet)
+        session.flush()
+
+        today = datetime.combine(get_pht_now().date(), time(10, 0))
+        for start, service_type, status in [
+            (today, "vaccination", "pending"),
+            (today + timedelta(hours=2), "surgery", "confirmed"),
+            (today + timedelta(days=1), "vaccination", "pending"),
+            (today - timedelta(days=1), "routine", "completed"),
+            (today - timedelta(days=2), "vaccination", "cancelled"),
+        ]:
+            session.add(Appointment(
+                pet_id=pet.id, user_id=owner.id, start_time=start,
+                end_time=start + timedelta(minutes=30), service_type=service_type, status=status
+            ))
+        session.commit()
+        session.info['admin'] = admin
+        session.info['owner'] = owner
+        yield session
+
+
+def _service(session: Session) -> AppointmentService:
+    """Create a service backed by the real repository."""
+    return AppointmentService(AppointmentRepository(session), Mock(), Mock())
+
+
+def test_stats_are_computed_by_one_query(engine, session: Session):
+    """All counters come from a single SELECT."""
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        stats = _service(session).get_appointment_stats()
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+    assert len(statements) == 1
+    assert "GROUP BY" in statements[0]
+    assert stats == {
+        "total": 5,
+        "by_status": {"pending": 2, "confirmed": 1, "cancelled": 1, "completed": 1},
+        "by_service_type": {"vaccination": 3, "routine": 1, "surgery": 1, "emergency": 0},
+        "today": {
+            "total": 2,
+            "by_status": {"pending": 1, "confirmed": 1, "cancelled": 0, "completed": 0}
+        }
+    }
+
+
+def test_empty_table_reports_zeros():
+    """Every known status and service type is present even with no rows."""
+    appointment_repo = Mock()
+    appointment_repo.count_by_status_and_service_type.return_value = []
+
+    stats = AppointmentService(appointment_repo, Mock(), Mock()).get_appointment_stats()
+
+    assert stats["total"] == 0
+    assert set(stats["by_status"]) == {"pending", "confirmed", "cancelled", "completed"}
+    assert set(stats["by_service_type"]) == {"vaccination", "routine", "surgery", "emergency"}
+    assert stats["today"]["total"] == 0
+
+
+class TestStatsEndpoint:
+    """Test the HTTP endpoint."""
+
+    @pytest.fixture
+    def client(self, session: Session):
+        """Create a test client using the test session."""
+        app.dependency_overrides[get_session] = lambda: session
+        yield TestClient(app)
+        app.dependency_overrides.clear()
+
+    def _headers(self, user: User) -> dict:
+        """Build an Authorization header for the user."""
+        token = create_access_token({"sub": str(user.id), "role": user.role})
+        return {"Authorization": f"Bearer {token}"}
+
+    def test_admin_gets_counts(self, client, session: Session):
+        """Admins receive the dashboard counters."""
+        response = client.get("/api/v1/appointments/stats", headers=self._headers(session.info['admin']))
+
+        assert response.status_code == 200
+        assert response.json()["today"]["by_status"]["pending"] == 1
+
+    def test_pet_owner_is_forbidden(self, client, session: Session):
+        """Pet owners cannot read clinic-wide statistics."""
+        response = client.get("/api/v1/appointments/stats", headers=self._headers(session.info['owner']))
+
+        assert response.status_code == 403
@@ -0,0 +1,204 @@
+"""Tests for optimistic concurrency on appointment updates.
+
+This module tests:
+- parse_if_match_version header parsing
+- The version column bumping on update and rejecting stale UPDATEs
+- AppointmentService rejecting stale expected versions with 409
+- PATCH /status and /reschedule honouring If-Match and returning ETag
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlmodel import Session
+from datetime import timedelta
+
+from app.main import app
+from app.core.database import get_session
+from app.common.etag import parse_if_match_version
+from app.common.exceptions import AppointmentVersionConflictException, BadRequestException
+from app.features.appointments.models import Appointment
+from app.features.appointments.repository import AppointmentRepository
+from app.features.clinic.models import ClinicStatus
+from app.features.pets.models import Pet
+from app.features.users.models import User
+from app.infrastructure.auth import create_access_token
+from conftest import tomorrow_at, appointment_service
+
+
+@pytest.fixture(name="session")
+def session_fixture(engine):
+    """Create a session with an open clinic, an admin, an owner, a pet and one appointment."""
+    with Session(engine) as session:
+        session.add(ClinicStatus(id=1, status="open"))
+        admin = User(full_name="Admin", email="admin@example.com", hashed_password="x", role="admin")
+        owner = User(full_name="Owner", email="owner@example.com", hashed_password="x", role="pet_owner")
+        session.add(admin)
+        session.add(owner)
+        session.flush()
+        pet = Pet(name="Fluffy", species="Dog", owner_id=owner.id)
+        session.add(pet)
+        session.flush()
+        appointment = Appointment(
+            pet_id=pet.id, user_id=owner.id, start_time=tomorrow_at(10),
+            end_time=tomorrow_at(10) + timedelta(minutes=30), service_type="vaccination"
+        )
+        session.add(appointment)
+        session.commit()
+        session.info['fixture'] = (admin, owner, appointment)
+        yield session
+
+
+def _auth(user: User, if_match: str = None) -> dict:
+    """Build request headers for a user, optionally with If-Match."""
+    headers = {"Authorization": f"Bearer {create_access_token({'sub': str(user.id), 'role': user.role})}"}
+    if if_match is not None:
+        headers["If-Match"] = if_match
+    return headers
+
+
+class TestParseIfMatch:
+    """Test If-Match header parsing."""
+
+    @pytest.mark.parametrize("header,expected", [(None, None), ("*", None), ('"3"', 3), ("4", 4)])
+    def test_valid_values(self, header, expected):
+        """Quoted and bare versions parse; absent and * mean no precondition."""
+        assert parse_if_match_version(header) == expected
+
+    def test_malformed_value_is_rejected(self):
+        """A non-numeric tag raises BadRequestException."""
+        with pytest.raises(BadRequestException):
+            parse_if_match_version('W/"abc"')
+
+
+class TestVersionColumn:
+    """Test the mapper's version_id_col behaviour."""
+
+    def test_new_appointments_start_at_version_one_and_updates_bump_it(self, session: Session):
+        """Each update increments the version."""
+        _, _, appointment = session.info['fixture']
+        assert appointment.version == 1
+
+        AppointmentRepository(session).update_appointment_times(
+            appointment.id, tomorrow_at(11), tomorrow_at(11) + timedelta(minutes=30)
+        )
+        session.commit()
+
+        assert appointment.version == 2
+
+    def test_concurrent_update_loses_with_conflict(self, session: Session, engine):
+        """Two sessions that read the same version cannot both write."""
+        admin, _, appointment = session.info['fixture']
+        with Session(engine) as other_session:
+            other = appointment_service(other_session)
+            other_copy = other_session.get(Appointment, appointment.id)
+            assert other_copy.version == 1
+
+            appointment_service(session).update_appointment_status(appointment.id, "confirmed", admin)
+            session.commit()
+
+            with pytest.raises(AppointmentVersionConflictException) as exc_info:
+                other.update_appointment_status(appointment.id, "cancelled", admin)
+            other_session.rollback()
+
+        session.refresh(appointment)
+        assert exc_info.value.status_code == 409
+        assert appointment.status == "confirmed"
+        assert appointment.version == 2
+
+
+class TestServiceExpectedVersion:
+    """Test If-Match checks in AppointmentService."""
+
+    def test_stale_version_is_rejected_before_changing_anything(self, session: Session):
+        """A status update based on an old version raises 409 and leaves the row alone."""
+        admin, _, appointment = session.info['fixture']
+
+        with pytest.raises(AppointmentVersionConflictException):
+            appointment_service(session).update_appointment_status(
+                appointment.id, "confirmed", admin, expected_version=7
+            )
+
+        assert appointment.status == "pending"
+        assert appointment.version == 1
+
+    def test_stale_version_blocks_reschedule(self, session: Session):
+        """A reschedule based on an old version raises 409."""
+        _, owner, appointment = session.info['fixture']
+
+        with pytest.raises(AppointmentVersionConflictException):
+            appointment_service(session).reschedule_appointment(
+                appointment.id, owner.id, tomorrow_at(12), tomorrow_at(12) + timedelta(minutes=30),
+                expected_version=0
+            )
+
+    def test_current_version_is_accepted(self, session: Session):
+        """A matching version updates normally."""
+        admin, _, appointment = session.info['fixture']
+
+        updated = appointment_service(session).update_appointment_status(
+            appointment.id, "confirmed", admin, expected_version=1
+        )
+
+        assert updated.status == "confirmed"
+        assert updated.version == 2
+
+
+class TestPatchEndpoints:
+    """Test If-Match and ETag on the PATCH endpoints."""
+
+    @pytest.fixture
+    def client(self, session: Session):
+        """Create a test client using the test session."""
+        app.dependency_overrides[get_session] = lambda: session
+        yield TestClient(app)
+        app.dependency_overrides.clear()
+
+    def test_status_update_with_if_match(self, client: TestClient, session: Session):
+        """The first update with the current version wins; replaying it gets 409."""
+        admin, _, appointment = session.info['fixture']
+        url = f"/api/v1/appointments/{appointment.id}/status"
+
+        first = client.patch(url, json={"status": "confirmed"}, headers=_auth(admin, '"1"'))
+        stale = client.patch(url, json={"status": "cancelled"}, headers=_auth(admin, '"1"'))
+
+        assert first.status_code == 200
+        assert first.json()["version"] == 2
+        assert first.headers["ETag"] == '"2"'
+        assert stale.status_code == 409
+
+    def test_status_update_without_if_match_still_works(self, client: TestClient, session: Session):
+        """If-Match is optional."""
+        admin, _, appointment = session.info['fixture']
+
+        response = client.patch(
+            f"/api/v1/appointments/{appointment.id}/status",
+            json={"status": "confirmed"}, headers=_auth(admin)
+        )
+
+        assert response.status_code == 200
+
+    def test_reschedule_with_stale_if_match(self, client: TestClient, session: Session):
+        """Rescheduling from an outdated copy is rejected with 409."""
+        _, owner, appointment = session.info['fixture']
+
+        response = client.patch(
+            f"/api/v1/appointments/{appointment.id}/reschedule",
+            json={
+                "start_time": tomorrow_at(12).isoformat(),
+                "end_time": (tomorrow_at(12) + timedelta(minutes=30)).isoformat()
+            },
+            headers=_auth(owner, '"5"')
+        )
+
+        assert response.status_code == 409
+
+    def test_malformed_if_match_is_rejected(self, client: TestClient, session: Session):
+        """A non-version If-Match value gets 400."""
+        admin, _, appointment = session.info['fixture']
+
+        response = client.patch(
+            f"/api/v1/appointments/{appointment.id}/status",
+            json={"status": "confirmed"}, headers=_auth(admin, "abc")
+        )
+
+        assert response.status_code == 400
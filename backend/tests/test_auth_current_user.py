@@ -0,0 +1,130 @@
+"""Tests for authenticating requests in get_current_user.
+
+This module tests:
+- TokenBlacklistRepository.get_user_for_token (user and blacklist status together)
+- The number of queries issued per authenticated request
+- Rejection of blacklisted tokens, unknown users and deactivated accounts
+"""
+
+import uuid
+import pytest
+from datetime import timedelta
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+from sqlmodel import Session, create_engine, SQLModel
+from sqlmodel.pool import StaticPool
+
+from app.main import app
+from app.core.database import get_session
+from app.common.utils import get_pht_now
+from app.features.auth.cache import user_auth_cache
+from app.features.auth.repository import TokenBlacklistRepository
+from app.features.auth.revocation import revoked_tokens
+from app.features.users.models import User
+from app.features.users.repository import UserRepository
+from app.infrastructure.auth import create_access_token, token_digest
+
+PROFILE_URL = "/api/v1/users/profile"
+
+
+@pytest.fixture(name="session")
+def session_fixture():
+    """Create a session with one active user."""
+    engine = create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    SQLModel.metadata.create_all(engine)
+    user_auth_cache.clear()
+    revoked_tokens.clear()
+    with Session(engine) as session:
+        user = User(full_name="Owner", email="owner@example.com", hashed_password="x", role="pet_owner")
+        session.add(user)
+        session.commit()
+        session.info["user"] = user
+        yield session
+    user_auth_cache.clear()
+    revoked_tokens.clear()
+
+
+@pytest.fixture(name="client")
+def client_fixture(session: Session):
+    """Create a test client with database session override."""
+    app.dependency_overrides[get_session] = lambda: session
+    yield TestClient(app)
+    app.dependency_overrides.clear()
+
+
+def _headers(user_id: uuid.UUID, role: str = "pet_owner") -> dict:
+    """Build an Authorization header for a user."""
+    token = create_access_token({"sub": str(user_id), "role": role})
+    return {"Authorization": f"Bearer {token}"}
+
+
+def _blacklist(session: Session, headers: dict, user_id: uuid.UUID, expires_in: timedelta) -> None:
+    """Blacklist the token in a header."""
+    token = headers["Authorization"].split(" ", 1)[1]
+    TokenBlacklistRepository(session).add_token(token, get_pht_now() + expires_in, user_id)
+    session.commit()
+
+
+def test_authenticated_request_takes_one_query(session: Session, client: TestClient):
+    """A possibly revoked token is checked in the same SELECT that loads the user."""
+    user = session.info["user"]
+    headers = _headers(user.id)
+    # Put the token in the revocation set without blacklisting it
+    revoked_tokens.load(TokenBlacklistRepository(session))
+    revoked_tokens.add(token_digest(headers["Authorization"].split(" ", 1)[1]))
+    session.expire_all()
+    statements = []
+    listener = lambda conn, cursor, statement, *args: statements.append(statement)
+    engine = session.get_bind()
+    event.listen(engine, "before_cursor_execute", listener)
+    try:
+        response = client.get(PROFILE_URL, headers=headers)
+    finally:
+        event.remove(engine, "before_cursor_execute", listener)
+
+    assert response.status_code == 200
+    assert len(statements) == 1
+    assert "LEFT OUTER JOIN token_blacklist" in statements[0]
+
+
+def test_get_user_for_token(session: Session):
+    """The user comes back with the token's blacklist status; expired entries are ignored."""
+    user = session.info["user"]
+    repo = TokenBlacklistRepository(session)
+    revoked, expired = "revoked-token", "expired-token"
+    repo.add_token(revoked, get_pht_now() + timedelta(hours=1), user.id)
+    repo.add_token(expired, get_pht_now() - timedelta(hours=1), user.id)
+    session.commit()
+
+    assert repo.get_user_for_token(user.id, token_digest("fresh-token")) == (user, False)
+    assert repo.get_user_for_token(user.id, token_digest(revoked)) == (user, True)
+    assert repo.get_user_for_token(user.id, token_digest(expired)) == (user, False)
+    assert repo.get_user_for_token(uuid.uuid4(), token_digest(revoked)) == (None, True)
+    assert repo.get_user_for_token(uuid.uuid4(), token_digest("fresh-token")) == (None, False)
+
+
+def test_rejected_requests(session: Session, client: TestClient):
+    """Blacklisted tokens, unknown users and deactivated accounts are rejected."""
+    user = session.info["user"]
+    revoked = _headers(user.id)
+    _blacklist(session, revoked, user.id, timedelta(hours=1))
+    deleted = _headers(uuid.uuid4())
+    _blacklist(session, deleted, user.id, timedelta(hours=1))
+
+    blacklisted = client.get(PROFILE_URL, headers=revoked)
+    blacklisted_unknown = client.get(PROFILE_URL, headers=deleted)
+    unknown = client.get(PROFILE_URL, headers=_headers(uuid.uuid4()))
+    UserRepository(session).update_user_profile(user.id, {"is_active": False})
+    session.commit()
+    # A different claim keeps this token distinct from the revoked one
+    deactivated = client.get(PROFILE_URL, headers=_headers(user.id, role="admin"))
+
+    assert blacklisted.status_code == 401
+    assert blacklisted.json()["error_type"] == "token_blacklisted"
+    assert blacklisted_unknown.status_code == 401
+    assert unknown.status_code == 404
+    assert deactivated.status_code == 403
@@ -0,0 +1,130 @@
+"""Tests for per-user token epochs and logging out of all sessions.
+
+This module tests:
+- POST /api/v1/auth/logout-all revoking every token with one UPDATE
+- Tokens without an epoch claim (issued before the column existed)
+- Password changes revoking existing tokens
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+from sqlmodel import Session, create_engine, SQLModel
+from sqlmodel.pool import StaticPool
+
+from app.main import app
+from app.core.database import get_session
+from app.features.auth.cache import user_auth_cache
+from app.features.auth.revocation import revoked_tokens
+from app.features.users.models import User
+from app.features.users.repository import UserRepository
+from app.infrastructure.auth import create_access_token, hash_password, token_claims
+
+PROFILE_URL = "/api/v1/users/profile"
+LOGIN_URL = "/api/v1/auth/login"
+LOGOUT_ALL_URL = "/api/v1/auth/logout-all"
+
+
+@pytest.fixture(name="session")
+def session_fixture():
+    """Create a session with one active user and empty auth caches."""
+    engine = create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    SQLModel.metadata.create_all(engine)
+    user_auth_cache.clear()
+    revoked_tokens.clear()
+    with Session(engine) as session:
+        user = User(
+            full_name="Owner",
+            email="owner@example.com",
+            hashed_password=hash_password("Password123!"),
+            role="pet_owner"
+        )
+        session.add(user)
+        session.commit()
+        session.info["user"] = user
+        yield session
+    user_auth_cache.clear()
+    revoked_tokens.clear()
+
+
+@pytest.fixture(name="client")
+def client_fixture(session: Session):
+    """Create a test client with database session override."""
+    app.dependency_overrides[get_session] = lambda: session
+    yield TestClient(app)
+    app.dependency_overrides.clear()
+
+
+def _headers(token: str) -> dict:
+    """Build an Authorization header for a token."""
+    return {"Authorization": f"Bearer {token}"}
+
+
+def test_logout_all_revokes_every_token(session: Session, client: TestClient):
+    """All tokens issued before the call are rejected; new logins work."""
+    user = session.info["user"]
+    first = create_access_token(token_claims(user))
+    second = client.post(LOGIN_URL, json={"email": user.email, "password": "Password123!"}).json()["access_token"]
+    assert client.get(PROFILE_URL, headers=_headers(second)).status_code == 200
+
+    response = client.post(LOGOUT_ALL_URL, headers=_headers(first))
+
+    assert response.status_code == 200
+    assert response.json()["message"] == "Successfully logged out of all sessions"
+    for token in (first, second):
+        rejected = client.get(PROFILE_URL, headers=_headers(token))
+        assert rejected.status_code == 401
+        assert rejected.json()["error_type"] == "token_blacklisted"
+    fresh = client.post(LOGIN_URL, json={"email": user.email, "password": "Password123!"}).json()["access_token"]
+    assert client.get(PROFILE_URL, headers=_headers(fresh)).status_code == 200
+
+
+def test_logout_all_is_a_single_update(session: Session):
+    """The epoch is bumped in the database without loading the user or touching the blacklist."""
+    user_id = session.info["user"].id
+    repo = UserRepository(session)
+    statements = []
+    listener = lambda conn, cursor, statement, *args: statements.append(statement)
+    engine = session.get_bind()
+    event.listen(engine, "before_cursor_execute", listener)
+    try:
+        epoch = repo.increment_token_epoch(user_id)
+    finally:
+        event.remove(engine, "before_cursor_execute", listener)
+    session.commit()
+
+    assert epoch == 1
+    assert len(statements) == 1
+    assert statements[0].lstrip().upper().startswith("UPDATE USERS")
+    assert session.info["user"].token_epoch == 1
+
+
+def test_tokens_without_epoch_claim(session: Session, client: TestClient):
+    """Tokens issued without an epoch count as epoch 0."""
+    user = session.info["user"]
+    legacy = create_access_token({"sub": str(user.id), "role": user.role})
+
+    before = client.get(PROFILE_URL, headers=_headers(legacy))
+    UserRepository(session).increment_token_epoch(user.id)
+    session.commit()
+    after = client.get(PROFILE_URL, headers=_headers(legacy))
+
+    assert before.status_code == 200
+    assert after.status_code == 401
+
+
+def test_password_change_revokes_tokens(session: Session, client: TestClient):
+    """Changing the password bumps the epoch, so cached snapshots are dropped too."""
+    user = session.info["user"]
+    token = create_access_token(token_claims(user))
+    assert client.get(PROFILE_URL, headers=_headers(token)).status_code == 200
+
+    UserRepository(session).update_user_profile(user.id, {"hashed_password": hash_password("NewPassword1!")})
+    session.commit()
+
+    assert client.get(PROFILE_URL, headers=_headers(token)).status_code == 401
+    assert create_access_token(token_claims(user)) != token
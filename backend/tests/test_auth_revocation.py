@@ -0,0 +1,156 @@
+"""Tests for the in-memory set of revoked tokens.
+
+This module tests:
+- RevocationSet (loading, local additions, reloads, load failures)
+- get_current_user skipping the blacklist table for unrevoked tokens
+- Logouts from other workers seen after the refresh interval
+"""
+
+import uuid
+import pytest
+from datetime import timedelta
+from time import monotonic
+from types import SimpleNamespace
+from unittest.mock import patch
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+from sqlmodel import Session, create_engine, SQLModel
+from sqlmodel.pool import StaticPool
+
+from app.main import app
+from app.core.database import get_session
+from app.common.utils import get_pht_now
+from app.features.auth.cache import user_auth_cache
+from app.features.auth.models import TokenBlacklist
+from app.features.auth.repository import TokenBlacklistRepository
+from app.features.auth.revocation import RevocationSet, revoked_tokens
+from app.features.auth.tasks import load_revoked_tokens
+from app.features.users.models import User
+from app.infrastructure.auth import create_access_token, token_digest
+
+PROFILE_URL = "/api/v1/users/profile"
+
+
+class TestRevocationSet:
+    """Test the revocation set on its own."""
+
+    def test_loads_adds_and_reloads(self):
+        """Only loaded or added tokens are possible hits; reloads pick up other workers' logouts."""
+        elsewhere, here, later, fresh = (token_digest(name) for name in ("elsewhere", "here", "later", "fresh"))
+        table = [elsewhere]
+        repo = SimpleNamespace(get_active_digests=lambda: list(table))
+        revoked = RevocationSet(refresh_seconds=60)
+
+        assert revoked.might_be_revoked(elsewhere, repo)
+        assert not revoked.might_be_revoked(fresh, repo)
+        revoked.add(here)
+        table.append(later)
+
+        assert revoked.might_be_revoked(here, repo)
+        assert not revoked.might_be_revoked(later, repo)
+        with patch("app.features.auth.revocation.monotonic", return_value=monotonic() + 61):
+            assert revoked.might_be_revoked(later, repo)
+        assert revoked.loads == 2
+
+    def test_failed_load_falls_back_to_the_table(self):
+        """Until a load succeeds every token is a possible hit."""
+        def fail():
+            raise RuntimeError("database unavailable")
+
+        revoked = RevocationSet(refresh_seconds=60)
+
+        assert revoked.might_be_revoked(token_digest("fresh"), SimpleNamespace(get_active_digests=fail))
+        assert revoked.loads == 0
+
+
+@pytest.fixture(name="session")
+def session_fixture():
+    """Create a session with one active user and empty auth caches."""
+    engine = create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    SQLModel.metadata.create_all(engine)
+    user_auth_cache.clear()
+    revoked_tokens.clear()
+    with Session(engine) as session:
+        user = User(full_name="Owner", email="owner@example.com", hashed_password="x", role="pet_owner")
+        session.add(user)
+        session.commit()
+        session.info["user"] = user
+        yield session
+    user_auth_cache.clear()
+    revoked_tokens.clear()
+
+
+@pytest.fixture(name="client")
+def client_fixture(session: Session):
+    """Create a test client with database session override."""
+    app.dependency_overrides[get_session] = lambda: session
+    yield TestClient(app)
+    app.dependency_overrides.clear()
+
+
+def _token(user_id: uuid.UUID, role: str = "pet_owner") -> str:
+    """Create an access token for a user."""
+    return create_access_token({"sub": str(user_id), "role": role})
+
+
+def test_unrevoked_token_skips_the_blacklist(session: Session, client: TestClient):
+    """Once the set is loaded, the blacklist table is not queried for a fresh token."""
+    user = session.info["user"]
+    load_revoked_tokens(session)
+    session.refresh(user)
+    statements = []
+    listener = lambda conn, cursor, statement, *args: statements.append(statement)
+    engine = session.get_bind()
+    event.listen(engine, "before_cursor_execute", listener)
+    try:
+        response = client.get(PROFILE_URL, headers={"Authorization": f"Bearer {_token(user.id)}"})
+    finally:
+        event.remove(engine, "before_cursor_execute", listener)
+
+    assert response.status_code == 200
+    assert not any("token_blacklist" in statement for statement in statements)
+    assert revoked_tokens.loads >= 1
+
+
+def test_logout_here_and_elsewhere(session: Session, client: TestClient):
+    """A local logout applies at once; another worker's logout after the refresh interval."""
+    user = session.info["user"]
+    local, remote = _token(user.id), _token(user.id, role="admin")
+    load_revoked_tokens(session)
+
+    logout = client.post("/api/v1/auth/logout", headers={"Authorization": f"Bearer {local}"})
+    after_logout = client.get(PROFILE_URL, headers={"Authorization": f"Bearer {local}"})
+    # Another worker blacklists a token without touching this worker's set
+    session.add(TokenBlacklist(
+        token_digest=token_digest(remote), expires_at=get_pht_now() + timedelta(hours=1), user_id=user.id
+    ))
+    session.commit()
+    before_refresh = client.get(PROFILE_URL, headers={"Authorization": f"Bearer {remote}"})
+    with patch("app.features.auth.revocation.monotonic", return_value=monotonic() + 3600):
+        after_refresh = client.get(PROFILE_URL, headers={"Authorization": f"Bearer {remote}"})
+
+    assert logout.status_code == 200
+    assert after_logout.status_code == 401
+    assert before_refresh.status_code == 200
+    assert after_refresh.status_code == 401
+    assert after_refresh.json()["error_type"] == "token_blacklisted"
+
+
+def test_expired_entries_are_not_loaded(session: Session):
+    """Only unexpired blacklist entries end up in the set."""
+    user = session.info["user"]
+    repo = TokenBlacklistRepository(session)
+    repo.add_token("active", get_pht_now() + timedelta(hours=1), user.id)
+    repo.add_token("expired", get_pht_now() - timedelta(hours=1), user.id)
+    session.commit()
+    revoked_tokens.clear()
+
+    load_revoked_tokens(session)
+
+    assert repo.get_active_digests() == [token_digest("active")]
+    assert revoked_tokens.might_be_revoked(token_digest("active"), repo)
+    assert not revoked_tokens.might_be_revoked(token_digest("expired"), repo)
@@ -0,0 +1,153 @@
+"""Tests for the authenticated user cache.
+
+This module tests:
+- UserAuthCache (TTL, LRU bound, stale loads after an invalidation)
+- Cross-worker invalidation through the file backend
+- get_current_user serving known users from the cache
+- Invalidation by UserRepository.update_user_profile and delete_user
+"""
+
+import time
+import uuid
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+from sqlmodel import Session, create_engine, SQLModel
+from sqlmodel.pool import StaticPool
+
+from app.main import app
+from app.core.database import get_session
+from app.infrastructure.events import FileEventBackend
+from app.features.auth.cache import AuthenticatedUser, UserAuthCache, user_auth_cache
+from app.features.auth.revocation import revoked_tokens
+from app.features.users.models import User
+from app.features.users.repository import UserRepository
+from app.infrastructure.auth import create_access_token
+
+PROFILE_URL = "/api/v1/users/profile"
+ADMIN_URL = "/api/v1/users"
+
+
+def _snapshot(role: str = "pet_owner") -> AuthenticatedUser:
+    """Build a snapshot of an arbitrary user."""
+    return AuthenticatedUser(id=uuid.uuid4(), role=role, is_active=True, email="user@example.com")
+
+
+class TestUserAuthCache:
+    """Test the cache on its own."""
+
+    def test_lru_bound_and_ttl(self):
+        """The least recently used entry is evicted; expired entries are misses."""
+        cache = UserAuthCache(ttl_seconds=60, max_entries=2)
+        first, second, third = _snapshot(), _snapshot(), _snapshot()
+        for user in (first, second):
+            cache.set(user, cache.generation)
+        cache.get(first.id)
+        cache.set(third, cache.generation)
+
+        assert cache.get(second.id) is None
+        assert cache.get(first.id) is first and cache.get(third.id) is third
+
+        expired = UserAuthCache(ttl_seconds=0.01, max_entries=2)
+        expired.set(first, expired.generation)
+        time.sleep(0.02)
+        assert expired.get(first.id) is None
+
+    def test_load_racing_an_invalidation_is_not_cached(self):
+        """A snapshot loaded before an invalidation is not stored."""
+        cache = UserAuthCache(ttl_seconds=60, max_entries=10)
+        user = _snapshot()
+        generation = cache.generation
+        cache.invalidate(user.id)
+        cache.set(user, generation)
+
+        assert cache.get(user.id) is None
+
+    def test_file_backend_shares_invalidations(self, tmp_path):
+        """An invalidation published by one worker reaches another worker's cache."""
+        path = str(tmp_path / "auth_user_events.ndjson")
+        worker_a = UserAuthCache(60, 10, FileEventBackend(path, poll_interval=0.01))
+        worker_b = UserAuthCache(60, 10, FileEventBackend(path, poll_interval=0.01))
+        user = _snapshot()
+        worker_a.set(user, worker_a.generation)
+        worker_b.set(user, worker_b.generation)
+
+        worker_a.publish_invalidation(user.id)
+        deadline = time.monotonic() + 2
+        while worker_b.get(user.id) is not None and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        assert worker_a.get(user.id) is None
+        assert worker_b.get(user.id) is None
+
+
+@pytest.fixture(name="session")
+def session_fixture():
+    """Create a session with a pet owner and an empty user cache."""
+    engine = create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    SQLModel.metadata.create_all(engine)
+    user_auth_cache.clear()
+    revoked_tokens.clear()
+    with Session(engine) as session:
+        user = User(full_name="Owner", email="owner@example.com", hashed_password="x", role="pet_owner")
+        session.add(user)
+        session.commit()
+        session.info["user"] = user
+        yield session
+    user_auth_cache.clear()
+    revoked_tokens.clear()
+
+
+@pytest.fixture(name="client")
+def client_fixture(session: Session):
+    """Create a test client with database session override."""
+    app.dependency_overrides[get_session] = lambda: session
+    yield TestClient(app)
+    app.dependency_overrides.clear()
+
+
+def _headers(user_id: uuid.UUID) -> dict:
+    """Build an Authorization header for a user."""
+    return {"Authorization": f"Bearer {create_access_token({'sub': str(user_id)})}"}
+
+
+def test_known_user_is_not_reloaded(session: Session, client: TestClient):
+    """After the first request a known user with an unrevoked token needs no query."""
+    user_id = session.info["user"].id
+    headers = _headers(user_id)
+    client.get(ADMIN_URL, headers=headers)
+    statements = []
+    listener = lambda conn, cursor, statement, *args: statements.append(statement)
+    engine = session.get_bind()
+    event.listen(engine, "before_cursor_execute", listener)
+    try:
+        response = client.get(ADMIN_URL, headers=headers)
+    finally:
+        event.remove(engine, "before_cursor_execute", listener)
+
+    assert response.status_code == 403
+    assert statements == []
+    assert user_auth_cache.stats()["hits"] == 1
+
+
+def test_role_change_and_deletion_invalidate(session: Session, client: TestClient):
+    """Updates take effect on the next request, and deleted users are rejected."""
+    user_id = session.info["user"].id
+    headers = _headers(user_id)
+    repo = UserRepository(session)
+
+    as_owner = client.get(ADMIN_URL, headers=headers)
+    repo.update_user_profile(user_id, {"role": "admin"})
+    session.commit()
+    as_admin = client.get(ADMIN_URL, headers=headers)
+    repo.delete_user(user_id)
+    session.commit()
+    deleted = client.get(ADMIN_URL, headers=headers)
+
+    assert as_owner.status_code == 403
+    assert as_admin.status_code == 200
+    assert deleted.status_code == 404
@@ -0,0 +1,197 @@
+"""Unit tests for the available-slots cache.
+
+This module tests:
+- TTL expiry, LRU eviction and hit/miss counters of AvailabilityCache
+- Invalidation by AppointmentRepository writes and clinic status changes
+- AppointmentService serving repeated lookups from the cache
+"""
+
+import pytest
+from datetime import datetime, date, timedelta
+from unittest.mock import Mock, patch
+from sqlmodel import Session, create_engine, SQLModel
+
+from app.features.appointments.cache import AvailabilityCache, availability_cache
+from app.features.appointments.models import Appointment
+from app.features.appointments.repository import AppointmentRepository
+from app.features.appointments.service import AppointmentService
+from app.features.clinic.models import ClinicStatus
+from app.features.clinic.repository import ClinicStatusRepository
+from app.features.users.models import User
+from app.features.pets.models import Pet
+from app.common.utils import get_pht_now
+
+SLOTS = [{"start_time": "2030-01-07T08:00:00", "end_time": "2030-01-07T08:30:00"}]
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    """Start every test with an empty process-wide cache."""
+    availability_cache.clear()
+    yield
+    availability_cache.clear()
+
+
+@pytest.fixture(name="session")
+def session_fixture():
+    """Create a test database session with one user and one pet."""
+    engine = create_engine("sqlite:///:memory:")
+    SQLModel.metadata.create_all(engine)
+
+    with Session(engine) as session:
+        user = User(
+            full_name="Test User",
+            email="test@example.com",
+            hashed_password="hashed_password_here",
+            role="pet_owner"
+        )
+        session.add(user)
+        session.commit()
+
+        pet = Pet(name="Fluffy", species="Dog", owner_id=user.id)
+        session.add(pet)
+        session.commit()
+
+        session.info['test_user_id'] = user.id
+        session.info['test_pet_id'] = pet.id
+        yield session
+
+
+def _new_appointment(session: Session, start: datetime) -> Appointment:
+    """Build an unsaved appointment for the fixture pet."""
+    return Appointment(
+        pet_id=session.info['test_pet_id'],
+        user_id=session.info['test_user_id'],
+        start_time=start,
+        end_time=start + timedelta(minutes=30),
+        service_type="vaccination",
+        status="pending"
+    )
+
+
+class TestAvailabilityCache:
+    """Test cache bookkeeping."""
+
+    def test_counts_hits_and_misses(self):
+        """A miss is recorded before the entry exists, then hits."""
+        cache = AvailabilityCache(ttl_seconds=60, max_entries=10)
+
+        assert cache.get(date(2030, 1, 7), "routine") is None
+        cache.set(date(2030, 1, 7), "routine", SLOTS)
+
+        assert cache.get(date(2030, 1, 7), "routine") == SLOTS
+        assert cache.stats() == {"hits": 1, "misses": 1, "hit_ratio": 0.5, "size": 1}
+
+    def test_entries_expire_after_ttl(self):
+        """Expired entries count as misses and are dropped."""
+        cache = AvailabilityCache(ttl_seconds=30, max_entries=10)
+        with patch("app.features.appointments.cache.monotonic", return_value=100.0):
+            cache.set(date(2030, 1, 7), "routine", SLOTS)
+        with patch("app.features.appointments.cache.monotonic", return_value=131.0):
+            assert cache.get(date(2030, 1, 7), "routine") is None
+
+        assert cache.stats()["size"] == 0
+
+    def test_evicts_least_recently_used_entry(self):
+        """When full, the entry used least recently is evicted."""
+        cache = AvailabilityCache(ttl_seconds=60, max_entries=2)
+        cache.set(date(2030, 1, 7), "routine", SLOTS)
+        cache.set(date(2030, 1, 8), "routine", SLOTS)
+        cache.get(date(2030, 1, 7), "routine")
+
+        cache.set(date(2030, 1, 9), "routine", SLOTS)
+
+        assert cache.get(date(2030, 1, 8), "routine") is None
+        assert cache.get(date(2030, 1, 7), "routine") == SLOTS
+
+    def test_invalidate_dates_drops_every_service_type(self):
+        """Invalidating a date removes all service types for it, and only it."""
+        cache = AvailabilityCache(ttl_seconds=60, max_entries=10)
+        cache.set(date(2030, 1, 7), "routine", SLOTS)
+        cache.set(date(2030, 1, 7), "surgery", SLOTS)
+        cache.set(date(2030, 1, 8), "routine", SLOTS)
+
+        cache.invalidate_dates([date(2030, 1, 7)])
+
+        assert cache.stats()["size"] == 1
+        assert cache.get(date(2030, 1, 8), "routine") == SLOTS
+
+
+class TestWriteThroughInvalidation:
+    """Test that repository writes invalidate exactly the affected dates."""
+
+    def test_create_invalidates_appointment_date(self, session: Session):
+        """Creating an appointment drops its date but keeps other dates."""
+        availability_cache.set(date(2030, 1, 7), "routine", SLOTS)
+        availability_cache.set(date(2030, 1, 8), "routine", SLOTS)
+
+        AppointmentRepository(session).create(_new_appointment(session, datetime(2030, 1, 7, 9, 0)))
+
+        assert availability_cache.get(date(2030, 1, 7), "routine") is None
+        assert availability_cache.get(date(2030, 1, 8), "routine") == SLOTS
+
+    def test_entries_cached_before_commit_are_invalidated_on_commit(self, session: Session):
+        """Slots re-cached between flush and commit are dropped when the write commits."""
+        AppointmentRepository(session).create(_new_appointment(session, datetime(2030, 1, 7, 9, 0)))
+        availability_cache.set(date(2030, 1, 7), "routine", SLOTS)
+
+        session.commit()
+
+        assert availability_cache.get(date(2030, 1, 7), "routine") is None
+
+    def test_update_appointment_times_invalidates_old_and_new_dates(self, session: Session):
+        """Rescheduling frees the old day and fills the new one."""
+        repository = AppointmentRepository(session)
+        appointment = repository.create(_new_appointment(session, datetime(2030, 1, 7, 9, 0)))
+        session.commit()
+        availability_cache.set(date(2030, 1, 7), "routine", SLOTS)
+        availability_cache.set(date(2030, 1, 9), "routine", SLOTS)
+
+        repository.update_appointment_times(
+            appointment.id, datetime(2030, 1, 9, 10, 0), datetime(2030, 1, 9, 10, 30)
+        )
+
+        assert availability_cache.get(date(2030, 1, 7), "routine") is None
+        assert availability_cache.get(date(2030, 1, 9), "routine") is None
+
+    def test_update_and_delete_invalidate_appointment_date(self, session: Session):
+        """Status changes and deletions free the appointment's day."""
+        repository = AppointmentRepository(session)
+        appointment = repository.create(_new_appointment(session, datetime(2030, 1, 7, 9, 0)))
+        session.commit()
+
+        availability_cache.set(date(2030, 1, 7), "routine", SLOTS)
+        appointment.status = "cancelled"
+        repository.update(appointment)
+        assert availability_cache.get(date(2030, 1, 7), "routine") is None
+
+        availability_cache.set(date(2030, 1, 7), "routine", SLOTS)
+        repository.delete(appointment)
+        assert availability_cache.get(date(2030, 1, 7), "routine") is None
+
+    def test_clinic_status_change_clears_cache(self, session: Session):
+        """Changing the clinic status affects every date."""
+        availability_cache.set(date(2030, 1, 7), "routine", SLOTS)
+        availability_cache.set(date(2030, 1, 8), "surgery", SLOTS)
+
+        ClinicStatusRepository(session).update_status("close")
+
+        assert availability_cache.stats()["size"] == 0
+
+
+def test_service_serves_repeated_lookups_from_cache():
+    """The second lookup for the same date and service type does not touch the database."""
+    appointment_repo = Mock()
+    appointment_repo.get_appointments_for_day.return_value = []
+    clinic_status_repo = Mock()
+    clinic_status_repo.get_current_status.return_value = ClinicStatus(status="open")
+    service = AppointmentService(appointment_repo, Mock(), clinic_status_repo)
+    target_date = get_pht_now().date() + timedelta(days=1)
+
+    first = service.get_available_slots(target_date, "routine")
+    second = service.get_available_slots(target_date, "routine")
+
+    assert first == second
+    appointment_repo.get_appointments_for_day.assert_called_once()
+    clinic_status_repo.get_current_status.assert_called_once()
+    assert availability_cache.stats()["hits"] == 1
@@ -0,0 +1,280 @@
+"""Tests for configurable clinic hours, breaks and closures.
+
+This module tests:
+- compile_schedule and DaySchedule (breaks, closed weekdays, closures)
+- ClinicScheduleCache (loads once, reloads after an edit commits)
+- Booking validation and available slots following the compiled schedule
+- GET/PUT /api/v1/clinic/hours and GET/POST/DELETE /api/v1/clinic/closures
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+from sqlmodel import Session, create_engine, SQLModel
+from sqlmodel.pool import StaticPool
+from datetime import date, datetime, time, timedelta
+from types import SimpleNamespace
+
+from app.main import app
+from app.core.database import get_session
+from app.common.exceptions import BadRequestException
+from app.common.utils import get_pht_now
+from app.features.appointments.cache import availability_cache
+from app.features.appointments.repository import AppointmentRepository
+from app.features.appointments.service import AppointmentService
+from app.features.clinic.models import ClinicStatus, ClinicClosure
+from app.features.clinic.repository import ClinicStatusRepository, ClinicScheduleRepository
+from app.features.clinic.schedule import ClinicScheduleCache, DEFAULT_SCHEDULE, clinic_schedule, compile_schedule
+from app.features.clinic.schemas import ClinicDayHours
+from app.features.clinic.service import ClinicService
+from app.features.pets.models import Pet
+from app.features.pets.repository import PetRepository
+from app.features.users.models import User
+from app.infrastructure.auth import create_access_token
+
+MONDAY = date(2030, 1, 7)
+WEEKDAY_HOURS = [
+    ClinicDayHours(
+        weekday=weekday, open_time=time(9), close_time=time(17),
+        breaks=[{"start_time": time(12), "end_time": time(13)}]
+    )
+    for weekday in range(5)
+]
+
+
+def _next_monday() -> date:
+    """Return the first Monday after today."""
+    today = get_pht_now().date()
+    return today + timedelta(days=7 - today.weekday())
+
+
+def _at(day: date, hour: int, minute: int = 0) -> datetime:
+    """Combine a date and a time of day."""
+    return datetime.combine(day, time(hour, minute))
+
+
+class TestCompiledSchedule:
+    """Test compiling weekly hours, breaks and closures into per-date schedules."""
+
+    def test_breaks_split_the_day(self):
+        """A lunch break leaves two open periods."""
+        schedule = compile_schedule(
+            [SimpleNamespace(weekday=0, open_time=time(9), close_time=time(17))],
+            [SimpleNamespace(weekday=0, start_time=time(12), end_time=time(13))],
+            []
+        )
+
+        monday = schedule.day(MONDAY)
+
+        assert monday.periods == ((_at(MONDAY, 9), _at(MONDAY, 12)), (_at(MONDAY, 13), _at(MONDAY, 17)))
+        assert monday.contains(_at(MONDAY, 11, 30), _at(MONDAY, 12))
+        assert not monday.contains(_at(MONDAY, 11, 30), _at(MONDAY, 12, 30))
+        assert schedule.day(MONDAY + timedelta(days=1)).is_closed
+
+    def test_closure_and_defaults(self):
+        """Closures close a date; without weekly hours every day is 8:00-20:00."""
+        schedule = compile_schedule([], [], [SimpleNamespace(day=MONDAY, reason="Holiday")])
+
+        assert schedule.day(MONDAY).is_closed
+        assert schedule.day(MONDAY).closure_reason == "Holiday"
+        assert DEFAULT_SCHEDULE.day(MONDAY + timedelta(days=6)).periods == (
+            (_at(MONDAY + timedelta(days=6), 8), _at(MONDAY + timedelta(days=6), 20)),
+        )
+
+    def test_cache_loads_once_until_invalidated(self):
+        """The tables are read once per TTL or edit, not per lookup."""
+        repo = SimpleNamespace(load_schedule=lambda: compile_schedule([], [], []))
+        cache = ClinicScheduleCache(ttl_seconds=60)
+
+        first = cache.get(repo)
+        assert cache.get(repo) is first
+        cache.invalidate()
+
+        assert cache.get(repo) is not first
+        assert cache.loads == 2
+
+
+@pytest.fixture(name="session")
+def session_fixture():
+    """Create a session with an open clinic, an owner with a pet and an admin.
+
+    The weekly hours are Monday to Friday 9:00-17:00 with a 12:00-13:00 break.
+    """
+    engine = create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    SQLModel.metadata.create_all(engine)
+    clinic_schedule.invalidate()
+    availability_cache.clear()
+
+    with Session(engine) as session:
+        session.add(ClinicStatus(id=1, status="open"))
+        owner = User(full_name="Owner", email="owner@example.com", hashed_password="x", role="pet_owner")
+        admin = User(full_name="Admin", email="admin@example.com", hashed_password="x", role="admin")
+        session.add_all([owner, admin])
+        session.flush()
+        pet = Pet(name="Fluffy", species="Dog", owner_id=owner.id)
+        session.add(pet)
+        session.commit()
+        ClinicService(ClinicStatusRepository(session), ClinicScheduleRepository(session)).update_hours(WEEKDAY_HOURS)
+        session.commit()
+        session.info.update(owner=owner, admin=admin, pet=pet)
+        yield session
+
+    clinic_schedule.invalidate()
+    availability_cache.clear()
+
+
+def _service(session: Session) -> AppointmentService:
+    """Create an AppointmentService that follows the configured schedule."""
+    return AppointmentService(
+        AppointmentRepository(session), PetRepository(session), ClinicStatusRepository(session),
+        schedule_repo=ClinicScheduleRepository(session)
+    )
+
+
+class TestScheduleInBooking:
+    """Test slot generation and validation against the configured schedule."""
+
+    def test_slots_follow_hours_and_skip_the_break(self, session: Session):
+        """Slots start at opening, stop before the break, resume after it, and none on Saturday."""
+        monday = _next_monday()
+        service = _service(session)
+
+        starts = [slot["start_time"] for slot in service.get_available_slots(monday, "routine")]
+
+        assert starts[0] == _at(monday, 9).isoformat()
+        assert _at(monday, 11).isoformat() in starts
+        assert _at(monday, 11, 30).isoformat() not in starts
+        assert _at(monday, 13).isoformat() in starts
+        assert starts[-1] == _at(monday, 16).isoformat()
+        assert service.get_available_slots(monday + timedelta(days=5), "routine") == []
+
+    def test_booking_outside_hours_or_in_break_is_rejected(self, session: Session):
+        """Early, break-overlapping and weekend bookings fail; a slot ending at the break is fine."""
+        monday = _next_monday()
+        owner, pet = session.info["owner"], session.info["pet"]
+        service = _service(session)
+
+        for start in [_at(monday, 8), _at(monday, 12), _at(monday, 11, 30), _at(monday + timedelta(days=5), 10)]:
+            with pytest.raises(BadRequestException):
+                service.create_appointment(pet.id, start, "routine", owner)
+        appointment = service.create_appointment(pet.id, _at(monday, 11, 30), "vaccination", owner)
+
+        assert appointment.end_time == _at(monday, 12)
+
+    def test_closure_blocks_slots_booking_and_reschedule(self, session: Session):
+        """A closed date has no slots and cannot be booked or rescheduled into."""
+        monday = _next_monday()
+        owner, pet = session.info["owner"], session.info["pet"]
+        service = _service(session)
+        appointment = service.create_appointment(pet.id, _at(monday, 9), "vaccination", owner)
+        tuesday = monday + timedelta(days=1)
+        ClinicScheduleRepository(session).add_closure(ClinicClosure(day=tuesday, reason="Holiday"))
+        session.commit()
+
+        assert service.get_available_slots(tuesday, "vaccination") == []
+        with pytest.raises(BadRequestException) as exc_info:
+            service.create_appointment(pet.id, _at(tuesday, 9), "vaccination", owner)
+        assert "Holiday" in exc_info.value.detail
+        with pytest.raises(BadRequestException):
+            service.reschedule_appointment(
+                appointment.id, owner.id, _at(tuesday, 9), _at(tuesday, 9, 30)
+            )
+
+    def test_reschedule_outside_hours_or_into_break_is_rejected(self, session: Session):
+        """Rescheduling follows the same hours and breaks as booking."""
+        monday = _next_monday()
+        owner, pet = session.info["owner"], session.info["pet"]
+        service = _service(session)
+        appointment = service.create_appointment(pet.id, _at(monday, 9), "vaccination", owner)
+
+        with pytest.raises(BadRequestException) as exc_info:
+            service.reschedule_appointment(
+                appointment.id, owner.id, _at(monday, 11, 45), _at(monday, 12, 15)
+            )
+        assert "break" in exc_info.value.detail
+        for start, end in [(_at(monday, 8, 30), _at(monday, 9)), (_at(monday, 16, 45), _at(monday, 17, 15))]:
+            with pytest.raises(BadRequestException):
+                service.reschedule_appointment(appointment.id, owner.id, start, end)
+
+        moved = service.reschedule_appointment(
+            appointment.id, owner.id, _at(monday, 13), _at(monday, 13, 30)
+        )
+        assert moved.start_time == _at(monday, 13)
+
+    def test_hours_are_not_queried_per_request(self, session: Session):
+        """Once compiled, validation and slot generation do not read the hours tables."""
+        monday = _next_monday()
+        service = _service(session)
+        service.get_available_slots(monday, "routine")
+        queries = []
+        listener = lambda conn, cursor, statement, *args: queries.append(statement)
+        engine = session.get_bind()
+        event.listen(engine, "before_cursor_execute", listener)
+        try:
+            for offset in range(1, 5):
+                service.get_available_slots(monday + timedelta(days=offset), "routine")
+            service.create_appointment(
+                session.info["pet"].id, _at(monday, 10), "routine", session.info["owner"]
+            )
+        finally:
+            event.remove(engine, "before_cursor_execute", listener)
+
+        assert queries
+        assert not any("clinic_weekly_hours" in q or "clinic_breaks" in q or "clinic_closures" in q for q in queries)
+
+
+def test_clinic_schedule_endpoints(session: Session):
+    """Admins edit hours and closures; the public reads them; edits apply at once."""
+    owner, admin = session.info["owner"], session.info["admin"]
+    admin_headers = {"Authorization": f"Bearer {create_access_token({'sub': str(admin.id), 'role': 'admin'})}"}
+    owner_headers = {"Authorization": f"Bearer {create_access_token({'sub': str(owner.id), 'role': 'pet_owner'})}"}
+    saturday = _next_monday() + timedelta(days=5)
+    saturday_hours = {"days": [{"weekday": 5, "open_time": "10:00", "close_time": "12:00"}]}
+    slots_url = "/api/v1/appointments/available-slots"
+    slots_params = {"date": saturday.isoformat(), "service_type": "vaccination"}
+    app.dependency_overrides[get_session] = lambda: session
+    client = TestClient(app)
+
+    try:
+        closed_saturday = client.get(slots_url, params=slots_params)
+        forbidden = client.put("/api/v1/clinic/hours", json=saturday_hours, headers=owner_headers)
+        invalid = client.put(
+            "/api/v1/clinic/hours",
+            json={"days": [{"weekday": 5, "open_time": "12:00", "close_time": "10:00"}]},
+            headers=admin_headers
+        )
+        updated = client.put("/api/v1/clinic/hours", json=saturday_hours, headers=admin_headers)
+        open_saturday = client.get(slots_url, params=slots_params)
+        hours = client.get("/api/v1/clinic/hours")
+        closure = {"day": saturday.isoformat(), "reason": "Holiday"}
+        created = client.post("/api/v1/clinic/closures", json=closure, headers=admin_headers)
+        duplicate = client.post("/api/v1/clinic/closures", json=closure, headers=admin_headers)
+        closures = client.get("/api/v1/clinic/closures")
+        holiday_slots = client.get(slots_url, params=slots_params)
+        removed = client.delete(f"/api/v1/clinic/closures/{saturday.isoformat()}", headers=admin_headers)
+        missing = client.delete(f"/api/v1/clinic/closures/{saturday.isoformat()}", headers=admin_headers)
+    finally:
+        app.dependency_overrides.clear()
+
+    assert closed_saturday.json() == []
+    assert forbidden.status_code == 403
+    assert invalid.status_code == 400
+    assert updated.status_code == 200
+    assert [slot["start_time"] for slot in open_saturday.json()] == [
+        _at(saturday, 10).isoformat(), _at(saturday, 10, 30).isoformat(),
+        _at(saturday, 11).isoformat(), _at(saturday, 11, 30).isoformat()
+    ]
+    assert hours.json() == {
+        "days": [{"weekday": 5, "open_time": "10:00:00", "close_time": "12:00:00", "breaks": []}],
+        "is_default": False
+    }
+    assert created.status_code == 201
+    assert duplicate.status_code == 400
+    assert [item["day"] for item in closures.json()] == [saturday.isoformat()]
+    assert holiday_slots.json() == []
+    assert removed.status_code == 204
+    assert missing.status_code == 404
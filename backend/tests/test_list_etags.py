@@ -0,0 +1,202 @@
+"""Tests for weak ETags and 304 responses on list endpoints.
+
+This module tests:
+- etag_matches weak comparison, lists and wildcard
+- GET /api/v1/appointments, /api/v1/pets and /api/v1/users returning ETag
+- 304 Not Modified on a matching If-None-Match, without loading the rows
+- The ETag changing after create, update and delete
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+from sqlmodel import Session, create_engine, SQLModel
+from sqlmodel.pool import StaticPool
+from datetime import datetime, timedelta
+
+from app.main import app
+from app.core.database import get_session
+from app.common.etag import etag_matches, make_weak_etag
+from app.features.appointments.models import Appointment
+from app.features.pets.models import Pet
+from app.features.users.models import User
+from app.infrastructure.auth import create_access_token
+
+BASE = datetime(2030, 1, 7, 9, 0)
+
+
+@pytest.fixture(name="engine")
+def engine_fixture():
+    """Create an in-memory database engine."""
+    engine = create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    SQLModel.metadata.create_all(engine)
+    return engine
+
+
+@pytest.fixture(name="session")
+def session_fixture(engine):
+    """Create a session with an admin and an owner with one pet and appointment."""
+    with Session(engine) as session:
+        admin = User(full_name="Admin", email="admin@example.com", hashed_password="x", role="admin")
+        owner = User(full_name="Owner", email="owner@example.com", hashed_password="x", role="pet_owner")
+        session.add(admin)
+        session.add(owner)
+        session.flush()
+        pet = Pet(name="Fluffy", species="Dog", owner_id=owner.id)
+        session.add(pet)
+        session.flush()
+        session.add(Appointment(
+            pet_id=pet.id, user_id=owner.id, start_time=BASE,
+            end_time=BASE + timedelta(minutes=30), service_type="vaccination"
+        ))
+        session.commit()
+        session.info['users'] = (admin, owner, pet)
+        yield session
+
+
+@pytest.fixture(name="client")
+def client_fixture(session: Session):
+    """Create a test client using the test session."""
+    app.dependency_overrides[get_session] = lambda: session
+    yield TestClient(app)
+    app.dependency_overrides.clear()
+
+
+def _auth(user: User, etag: str = None) -> dict:
+    """Build request headers for a user, optionally with If-None-Match."""
+    headers = {"Authorization": f"Bearer {create_access_token({'sub': str(user.id), 'role': user.role})}"}
+    if etag:
+        headers["If-None-Match"] = etag
+    return headers
+
+
+class TestEtagMatches:
+    """Test If-None-Match comparison."""
+
+    def test_weak_comparison_ignores_prefix(self):
+        """W/"x" and "x" match each other."""
+        etag = make_weak_etag(1, None)
+
+        assert etag_matches(etag, etag)
+        assert etag_matches(etag.removeprefix("W/"), etag)
+
+    def test_list_and_wildcard(self):
+        """Any tag in a comma-separated list, or *, matches."""
+        etag = make_weak_etag(2, BASE)
+
+        assert etag_matches(f'W/"other", {etag}', etag)
+        assert etag_matches("*", etag)
+        assert not etag_matches('W/"other"', etag)
+        assert not etag_matches(None, etag)
+
+
+@pytest.mark.parametrize("path,role", [
+    ("/api/v1/appointments", "owner"),
+    ("/api/v1/appointments?expand=pet,owner", "admin"),
+    ("/api/v1/pets", "owner"),
+    ("/api/v1/users", "admin"),
+])
+def test_matching_if_none_match_returns_304(client: TestClient, session: Session, path, role):
+    """A second request with the returned ETag gets an empty 304."""
+    admin, owner, _ = session.info['users']
+    user = admin if role == "admin" else owner
+
+    first = client.get(path, headers=_auth(user))
+    second = client.get(path, headers=_auth(user, first.headers["ETag"]))
+
+    assert first.status_code == 200
+    assert first.headers["ETag"].startswith('W/"')
+    assert first.headers["Cache-Control"] == "private, no-cache"
+    assert second.status_code == 304
+    assert second.content == b""
+    assert second.headers["ETag"] == first.headers["ETag"]
+
+
+def test_304_does_not_load_appointment_rows(client: TestClient, session: Session, engine):
+    """Revalidation runs only the aggregate query, never a row SELECT."""
+    _, owner, _ = session.info['users']
+    etag = client.get("/api/v1/appointments", headers=_auth(owner)).headers["ETag"]
+    statements = []
+    listener = lambda conn, cursor, statement, *args: statements.append(statement)
+    event.listen(engine, "before_cursor_execute", listener)
+
+    try:
+        response = client.get("/api/v1/appointments", headers=_auth(owner, etag))
+    finally:
+        event.remove(engine, "before_cursor_execute", listener)
+
+    appointment_selects = [s for s in statements if "FROM appointments" in s]
+    assert response.status_code == 304
+    assert len(appointment_selects) == 1
+    assert "count(" in appointment_selects[0]
+
+
+def test_etag_differs_per_query_and_user(client: TestClient, session: Session):
+    """Different filters or users never share an ETag."""
+    admin, owner, _ = session.info['users']
+
+    owner_tag = client.get("/api/v1/appointments", headers=_auth(owner)).headers["ETag"]
+    admin_tag = client.get("/api/v1/appointments", headers=_auth(admin)).headers["ETag"]
+    filtered_tag = client.get("/api/v1/appointments?status=pending", headers=_auth(owner)).headers["ETag"]
+
+    assert len({owner_tag, admin_tag, filtered_tag}) == 3
+
+
+def test_appointment_etag_changes_on_create_update_and_delete(client: TestClient, session: Session):
+    """Creating, changing or deleting an appointment invalidates the ETag."""
+    admin, owner, pet = session.info['users']
+    seen = [client.get("/api/v1/appointments", headers=_auth(admin)).headers["ETag"]]
+
+    appointment = Appointment(
+        pet_id=pet.id, user_id=owner.id, start_time=BASE + timedelta(days=1),
+        end_time=BASE + timedelta(days=1, minutes=30), service_type="routine"
+    )
+    session.add(appointment)
+    session.commit()
+    seen.append(client.get("/api/v1/appointments", headers=_auth(admin)).headers["ETag"])
+
+    appointment.status = "confirmed"
+    appointment.updated_at = appointment.updated_at + timedelta(seconds=1)
+    session.commit()
+    seen.append(client.get("/api/v1/appointments", headers=_auth(admin)).headers["ETag"])
+
+    session.delete(appointment)
+    session.commit()
+    response = client.get("/api/v1/appointments", headers=_auth(admin, seen[-1]))
+
+    assert len(set(seen)) == 3
+    assert response.status_code == 200
+
+
+def test_expanded_etag_changes_when_pet_changes(client: TestClient, session: Session):
+    """With expand=pet, renaming the pet invalidates the ETag."""
+    admin, _, pet = session.info['users']
+    path = "/api/v1/appointments?expand=pet"
+    etag = client.get(path, headers=_auth(admin)).headers["ETag"]
+
+    pet.name = "Rex"
+    pet.updated_at = pet.updated_at + timedelta(seconds=1)
+    session.commit()
+    response = client.get(path, headers=_auth(admin, etag))
+
+    assert response.status_code == 200
+    assert response.json()["items"][0]["pet"]["name"] == "Rex"
+
+
+def test_user_etag_changes_on_profile_update(client: TestClient, session: Session):
+    """Updating a profile bumps users.updated_at and invalidates the user list ETag."""
+    admin, owner, _ = session.info['users']
+    owner.updated_at = owner.updated_at - timedelta(days=1)
+    admin.updated_at = admin.updated_at - timedelta(days=1)
+    session.commit()
+    etag = client.get("/api/v1/users", headers=_auth(admin)).headers["ETag"]
+
+    update = client.patch("/api/v1/users/profile", json={"city": "Cebu"}, headers=_auth(owner))
+    response = client.get("/api/v1/users", headers=_auth(admin, etag))
+
+    assert update.status_code == 200
+    assert response.status_code == 200
@@ -4,6 +4,7 @@ from datetime import datetime, timedelta
 import uuid
 from sqlmodel import Session, create_engine, SQLModel, select
 from app.features.auth.models import TokenBlacklist
+from app.infrastructure.auth import token_digest
 from app.features.users.models import User
 from app.features.pets.models import Pet
 from app.features.appointments.models import Appointment
@@ -46,7 +47,7 @@ def test_token_blacklist_creation(session: Session):
     
     # Act
     blacklist_entry = TokenBlacklist(
-        token=token,
+        token_digest=token_digest(token),
         expires_at=expires_at,
         user_id=user_id
     )
@@ -56,7 +57,7 @@ def test_token_blacklist_creation(session: Session):
     
     # Assert
     assert blacklist_entry.id is not None
-    assert blacklist_entry.token == token
+    assert blacklist_entry.token_digest == token_digest(token)
     assert blacklist_entry.expires_at == expires_at
     assert blacklist_entry.user_id == user_id
     assert blacklist_entry.blacklisted_at is not None
@@ -71,7 +72,7 @@ def test_token_blacklist_default_blacklisted_at(session: Session):
     
     # Act
     blacklist_entry = TokenBlacklist(
-        token="test.token.2",
+        token_digest=token_digest("test.token.2"),
         expires_at=datetime.utcnow() + timedelta(hours=1),
         user_id=user_id
     )
@@ -90,7 +91,7 @@ def test_token_blacklist_model_structure():
     """Test that the model has the correct structure and field definitions."""
     # Verify model has the expected fields
     assert 'id' in TokenBlacklist.model_fields
-    assert 'token' in TokenBlacklist.model_fields
+    assert 'token_digest' in TokenBlacklist.model_fields
     assert 'expires_at' in TokenBlacklist.model_fields
     assert 'blacklisted_at' in TokenBlacklist.model_fields
     assert 'user_id' in TokenBlacklist.model_fields
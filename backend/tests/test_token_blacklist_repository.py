@@ -5,6 +5,8 @@ import uuid
 from sqlmodel import Session, create_engine, SQLModel
 
 from app.features.auth.models import TokenBlacklist
+from app.infrastructure.auth import create_access_token, token_digest
+from app.common.utils import get_pht_now
 from app.features.auth.repository import TokenBlacklistRepository
 from app.features.users.models import User
 from app.features.pets.models import Pet  # Import Pet to resolve relationship
@@ -61,7 +63,7 @@ def test_add_token(session: Session, repository: TokenBlacklistRepository):
     
     # Assert
     assert result.id is not None
-    assert result.token == token
+    assert result.token_digest == token_digest(token)
     assert result.expires_at == expires_at
     assert result.user_id == user_id
     assert result.blacklisted_at is not None
@@ -230,3 +232,45 @@ def test_add_token_with_duplicate_token_raises_error(
     with pytest.raises(Exception):  # SQLAlchemy will raise an IntegrityError
         repository.add_token(token, expires_at, user_id)
         session.commit()
+
+
+def test_tokens_are_stored_by_jti_digest(
+    session: Session, repository: TokenBlacklistRepository
+):
+    """Test that only a fixed-size digest of the token's jti is stored.
+    
+    Tokens for the same user issued in the same second get distinct jti
+    claims, so revoking one leaves the other valid.
+    """
+    # Arrange
+    user_id = session.info['test_user_id']
+    token = create_access_token({"sub": str(user_id)})
+    other_token = create_access_token({"sub": str(user_id)})
+    
+    # Act
+    result = repository.add_token(token, get_pht_now() + timedelta(hours=1), user_id)
+    session.commit()
+    
+    # Assert
+    assert len(result.token_digest) == 64
+    assert token not in result.token_digest
+    assert token_digest(token) != token_digest(other_token)
+    assert repository.is_token_blacklisted(token) is True
+    assert repository.is_token_blacklisted(other_token) is False
+
+
+def test_legacy_token_without_jti_is_keyed_on_whole_token(
+    session: Session, repository: TokenBlacklistRepository
+):
+    """Test that tokens issued before the jti claim can still be revoked."""
+    # Arrange
+    user_id = session.info['test_user_id']
+    legacy_token = create_access_token({"sub": str(user_id), "jti": None})
+    
+    # Act
+    repository.add_token(legacy_token, get_pht_now() + timedelta(hours=1), user_id)
+    session.commit()
+    
+    # Assert
+    assert repository.is_token_blacklisted(legacy_token) is True
+    assert repository.is_token_blacklisted(create_access_token({"sub": str(user_id)})) is False
@@ -15,6 +15,7 @@ from sqlmodel import Session, create_engine, SQLModel
 
 from app.features.auth.tasks import cleanup_expired_tokens
 from app.features.auth.models import TokenBlacklist
+from app.infrastructure.auth import token_digest
 from app.features.users.models import User
 from app.features.pets.models import Pet  # Import Pet to resolve relationship
 from app.features.appointments.models import Appointment  # Import Appointment to resolve relationships
@@ -62,14 +63,14 @@ def test_cleanup_expired_tokens_removes_expired_tokens(session: Session):
     
     # Expired token (expired 1 hour ago)
     expired_token = TokenBlacklist(
-        token="expired.jwt.token",
+        token_digest=token_digest("expired.jwt.token"),
         expires_at=datetime.utcnow() - timedelta(hours=1),
         user_id=user_id
     )
     
     # Valid token (expires in 1 hour)
     valid_token = TokenBlacklist(
-        token="valid.jwt.token",
+        token_digest=token_digest("valid.jwt.token"),
         expires_at=datetime.utcnow() + timedelta(hours=1),
         user_id=user_id
     )
@@ -90,13 +91,13 @@ def test_cleanup_expired_tokens_removes_expired_tokens(session: Session):
     # Verify expired token is gone
     from sqlmodel import select
     expired_result = session.exec(
-        select(TokenBlacklist).where(TokenBlacklist.token == "expired.jwt.token")
+        select(TokenBlacklist).where(TokenBlacklist.token_digest == token_digest("expired.jwt.token"))
     ).first()
     assert expired_result is None
     
     # Verify valid token still exists
     valid_result = session.exec(
-        select(TokenBlacklist).where(TokenBlacklist.token == "valid.jwt.token")
+        select(TokenBlacklist).where(TokenBlacklist.token_digest == token_digest("valid.jwt.token"))
     ).first()
     assert valid_result is not None
 
@@ -128,13 +129,13 @@ def test_cleanup_expired_tokens_with_no_expired_tokens(session: Session):
     user_id = session.info['test_user_id']
     
     valid_token1 = TokenBlacklist(
-        token="valid1.jwt.token",
+        token_digest=token_digest("valid1.jwt.token"),
         expires_at=datetime.utcnow() + timedelta(hours=1),
         user_id=user_id
     )
     
     valid_token2 = TokenBlacklist(
-        token="valid2.jwt.token",
+        token_digest=token_digest("valid2.jwt.token"),
         expires_at=datetime.utcnow() + timedelta(hours=2),
         user_id=user_id
     )
@@ -152,12 +153,12 @@ def test_cleanup_expired_tokens_with_no_expired_tokens(session: Session):
     # Verify both tokens still exist
     from sqlmodel import select
     token1_result = session.exec(
-        select(TokenBlacklist).where(TokenBlacklist.token == "valid1.jwt.token")
+        select(TokenBlacklist).where(TokenBlacklist.token_digest == token_digest("valid1.jwt.token"))
     ).first()
     assert token1_result is not None
     
     token2_result = session.exec(
-        select(TokenBlacklist).where(TokenBlacklist.token == "valid2.jwt.token")
+        select(TokenBlacklist).where(TokenBlacklist.token_digest == token_digest("valid2.jwt.token"))
     ).first()
     assert token2_result is not None
 
@@ -176,7 +177,7 @@ def test_cleanup_expired_tokens_with_mixed_tokens(session: Session):
     # Create 3 expired tokens
     for i in range(3):
         expired_token = TokenBlacklist(
-            token=f"expired{i}.jwt.token",
+            token_digest=token_digest(f"expired{i}.jwt.token"),
             expires_at=datetime.utcnow() - timedelta(hours=i+1),
             user_id=user_id
         )
@@ -185,7 +186,7 @@ def test_cleanup_expired_tokens_with_mixed_tokens(session: Session):
     # Create 2 valid tokens
     for i in range(2):
         valid_token = TokenBlacklist(
-            token=f"valid{i}.jwt.token",
+            token_digest=token_digest(f"valid{i}.jwt.token"),
             expires_at=datetime.utcnow() + timedelta(hours=i+1),
             user_id=user_id
         )
@@ -203,14 +204,14 @@ def test_cleanup_expired_tokens_with_mixed_tokens(session: Session):
     from sqlmodel import select
     for i in range(3):
         expired_result = session.exec(
-            select(TokenBlacklist).where(TokenBlacklist.token == f"expired{i}.jwt.token")
+            select(TokenBlacklist).where(TokenBlacklist.token_digest == token_digest(f"expired{i}.jwt.token"))
         ).first()
         assert expired_result is None
     
     # Verify all valid tokens still exist
     for i in range(2):
         valid_result = session.exec(
-            select(TokenBlacklist).where(TokenBlacklist.token == f"valid{i}.jwt.token")
+            select(TokenBlacklist).where(TokenBlacklist.token_digest == token_digest(f"valid{i}.jwt.token"))
         ).first()
         assert valid_result is not None
 
@@ -228,7 +229,7 @@ def test_cleanup_expired_tokens_returns_correct_count(session: Session):
     
     for i in range(5):
         expired_token = TokenBlacklist(
-            token=f"expired{i}.jwt.token",
+            token_digest=token_digest(f"expired{i}.jwt.token"),
             expires_at=datetime.utcnow() - timedelta(minutes=i+1),
             user_id=user_id
         )
@@ -0,0 +1,345 @@
+"""Tests for the waitlist and freed-slot offers.
+
+This module tests:
+- WaitlistService.join_waitlist validation
+- Offering a freed slot in FIFO order to waiters whose date and service fit
+- The offer's slot hold (busy for others, bookable by the waiter), taken on commit
+- Lapsed offers passed on to the next waiter, each claimed by one worker
+- Offers triggered by cancel, status cancellation and reschedule
+- The queue lookup using the (day, service_type, created_at) index
+- POST/GET/DELETE /api/v1/waitlist
+"""
+
+import os
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+from sqlmodel import Session, create_engine, SQLModel
+from datetime import timedelta
+from unittest.mock import patch
+
+from app.main import app
+from app.core.database import get_session
+from app.common.exceptions import BadRequestException, ForbiddenException
+from app.common.utils import get_pht_now
+from app.features.appointments.models import Appointment
+from app.features.appointments.repository import AppointmentRepository
+from app.features.appointments.service import AppointmentService
+from app.features.clinic.models import ClinicStatus
+from app.features.pets.models import Pet
+from app.features.pets.repository import PetRepository
+from app.features.users.models import User
+from app.features.waitlist.models import WaitlistEntry
+from app.features.waitlist.repository import WaitlistRepository
+from app.features.waitlist.service import WaitlistService
+from app.features.waitlist.tasks import expire_waitlist_offers
+from app.infrastructure.auth import create_access_token
+from conftest import tomorrow_at, appointment_service
+
+
+TEST_POSTGRES_URL = os.environ.get("TEST_POSTGRES_URL")
+
+requires_postgres = pytest.mark.skipif(
+    not TEST_POSTGRES_URL, reason="TEST_POSTGRES_URL is not set"
+)
+
+
+@pytest.fixture(name="session")
+def session_fixture(engine, holds):
+    """Create a session with an open clinic and three owners, each with a pet.
+
+    The first owner has a vaccination booked tomorrow at 10:00.
+    """
+    with Session(engine) as session:
+        session.add(ClinicStatus(id=1, status="open"))
+        owners = []
+        for email in ["a@example.com", "b@example.com", "c@example.com"]:
+            user = User(full_name="Owner", email=email, hashed_password="x", role="pet_owner")
+            session.add(user)
+            session.flush()
+            pet = Pet(name="Fluffy", species="Dog", owner_id=user.id)
+            session.add(pet)
+            session.flush()
+            owners.append((user, pet))
+        appointment = Appointment(
+            pet_id=owners[0][1].id, user_id=owners[0][0].id, start_time=tomorrow_at(10),
+            end_time=tomorrow_at(10) + timedelta(minutes=30), service_type="vaccination"
+        )
+        session.add(appointment)
+        session.commit()
+        session.info['owners'] = owners
+        session.info['appointment'] = appointment
+        yield session
+
+
+def _waitlist(session: Session) -> WaitlistService:
+    """Create a WaitlistService bound to a session."""
+    return WaitlistService(WaitlistRepository(session), PetRepository(session), AppointmentRepository(session))
+
+
+def _service(session: Session) -> AppointmentService:
+    """Create an AppointmentService with a waitlist, bound to a session."""
+    return appointment_service(session, _waitlist(session))
+
+
+def _join(session: Session, owner_index: int, service_type: str = "vaccination", days: int = 1) -> WaitlistEntry:
+    """Put an owner's pet on the waitlist starting tomorrow."""
+    user, pet = session.info['owners'][owner_index]
+    tomorrow = tomorrow_at(0).date()
+    entry = _waitlist(session).join_waitlist(
+        pet.id, service_type, tomorrow, tomorrow + timedelta(days=days - 1), user
+    )
+    session.commit()
+    return entry
+
+
+class TestJoinWaitlist:
+    """Test join_waitlist validation."""
+
+    def test_rejects_invalid_ranges(self, session: Session):
+        """Past, reversed and overlong ranges raise BadRequestException."""
+        user, pet = session.info['owners'][1]
+        today = get_pht_now().date()
+        service = _waitlist(session)
+
+        for from_date, to_date in [
+            (today - timedelta(days=1), today),
+            (today + timedelta(days=2), today + timedelta(days=1)),
+            (today, today + timedelta(days=31)),
+        ]:
+            with pytest.raises(BadRequestException):
+                service.join_waitlist(pet.id, "vaccination", from_date, to_date, user)
+
+    def test_owner_cannot_join_for_another_users_pet(self, session: Session):
+        """Pet owners can only wait for their own pets."""
+        (_, other_pet), (user, _), _ = session.info['owners']
+        today = get_pht_now().date()
+
+        with pytest.raises(ForbiddenException):
+            _waitlist(session).join_waitlist(other_pet.id, "vaccination", today, today, user)
+
+
+class TestOfferFreedSlot:
+    """Test matching freed slots to waiters."""
+
+    def test_oldest_matching_waiter_gets_a_hold(self, session: Session, holds):
+        """On cancel, the first waiter is offered the slot; the second keeps waiting."""
+        owner_a, _ = session.info['owners'][0]
+        first, second = _join(session, 1), _join(session, 2)
+
+        _service(session).cancel_appointment(session.info['appointment'].id, owner_a)
+        session.commit()
+
+        assert first.status == "offered"
+        assert first.offered_start_time == tomorrow_at(10)
+        assert second.status == "waiting"
+        hold = holds.get(first.hold_id, get_pht_now())
+        assert hold.user_id == first.user_id
+        assert hold.end_time == tomorrow_at(10) + timedelta(minutes=30)
+
+    def test_only_services_that_fit_and_dates_in_range_match(self, session: Session):
+        """A 30-minute gap skips surgery waiters and waiters for other dates."""
+        owner_a, _ = session.info['owners'][0]
+        surgery = _join(session, 1, service_type="surgery")
+        user, pet = session.info['owners'][2]
+        later = _waitlist(session).join_waitlist(
+            pet.id, "vaccination", tomorrow_at(0).date() + timedelta(days=1),
+            tomorrow_at(0).date() + timedelta(days=3), user
+        )
+        emergency = _join(session, 2, service_type="emergency")
+
+        _service(session).cancel_appointment(session.info['appointment'].id, owner_a)
+
+        assert (surgery.status, later.status, emergency.status) == ("waiting", "waiting", "offered")
+        assert emergency.offered_end_time == tomorrow_at(10) + timedelta(minutes=15)
+
+    def test_offered_slot_is_bookable_only_by_the_waiter(self, session: Session, holds):
+        """Others cannot book the offered slot; the waiter can, which releases the hold."""
+        (owner_a, pet_a), (owner_b, pet_b), _ = session.info['owners']
+        entry = _join(session, 1)
+        service = _service(session)
+        service.cancel_appointment(session.info['appointment'].id, owner_a)
+        session.commit()
+
+        with pytest.raises(BadRequestException):
+            service.create_appointment(pet_a.id, tomorrow_at(10), "vaccination", owner_a)
+        service.create_appointment(pet_b.id, tomorrow_at(10), "vaccination", owner_b)
+
+        assert holds.get(entry.hold_id, get_pht_now()) is None
+
+    def test_status_cancellation_offers_the_slot(self, session: Session):
+        """Setting the status to cancelled frees the slot too."""
+        admin = User(full_name="Admin", email="admin@example.com", hashed_password="x", role="admin")
+        session.add(admin)
+        session.commit()
+        entry = _join(session, 1)
+
+        _service(session).update_appointment_status(session.info['appointment'].id, "cancelled", admin)
+
+        assert entry.status == "offered"
+
+    def test_reschedule_offers_the_old_slot(self, session: Session):
+        """Moving an appointment away offers its old time."""
+        owner_a, _ = session.info['owners'][0]
+        entry = _join(session, 1)
+
+        _service(session).reschedule_appointment(
+            session.info['appointment'].id, owner_a.id, tomorrow_at(14), tomorrow_at(14) + timedelta(minutes=30)
+        )
+
+        assert entry.offered_start_time == tomorrow_at(10)
+
+    def test_nobody_waiting_offers_nothing(self, session: Session):
+        """Without waiters the freed slot is simply free."""
+        assert _waitlist(session).offer_freed_slot(tomorrow_at(10), tomorrow_at(11)) is None
+
+    def test_hold_is_taken_only_when_the_offer_commits(self, session: Session, holds):
+        """A cancellation that rolls back leaves neither an offer nor a hold."""
+        owner_a, _ = session.info['owners'][0]
+        entry = _join(session, 1)
+
+        _service(session).cancel_appointment(session.info['appointment'].id, owner_a)
+        hold_id = entry.hold_id
+        assert holds.get(hold_id, get_pht_now()) is None
+        session.rollback()
+        session.commit()
+
+        assert holds.get(hold_id, get_pht_now()) is None
+        assert session.get(WaitlistEntry, entry.id).status == "waiting"
+        assert holds.overlapping(tomorrow_at(10), tomorrow_at(11), get_pht_now()) == []
+
+
+class TestExpireOffers:
+    """Test passing lapsed offers on to the next waiter."""
+
+    def test_lapsed_offer_goes_to_the_next_waiter(self, session: Session, holds):
+        """The ignored entry is removed and the slot is held for the next waiter."""
+        owner_a, _ = session.info['owners'][0]
+        first, second = _join(session, 1), _join(session, 2)
+        _service(session).cancel_appointment(session.info['appointment'].id, owner_a)
+        session.commit()
+        later = first.offer_expires_at + timedelta(minutes=1)
+
+        with patch("app.features.waitlist.service.get_pht_now", return_value=later), \
+             patch("app.features.appointments.repository.get_pht_now", return_value=later):
+            assert expire_waitlist_offers(session) == 1
+            hold = holds.get(second.hold_id, later)
+
+        assert session.get(WaitlistEntry, first.id) is None
+        assert second.status == "offered"
+        assert second.offered_start_time == tomorrow_at(10)
+        assert hold.user_id == second.user_id
+
+    def test_booked_offer_is_not_passed_on(self, session: Session):
+        """If the waiter booked the offered slot, nobody else is offered it."""
+        (owner_a, _), (owner_b, pet_b), _ = session.info['owners']
+        first, second = _join(session, 1), _join(session, 2)
+        service = _service(session)
+        service.cancel_appointment(session.info['appointment'].id, owner_a)
+        session.commit()
+        service.create_appointment(pet_b.id, tomorrow_at(10), "vaccination", owner_b)
+        session.commit()
+        later = first.offer_expires_at + timedelta(minutes=1)
+
+        with patch("app.features.waitlist.service.get_pht_now", return_value=later), \
+             patch("app.features.appointments.repository.get_pht_now", return_value=later):
+            assert expire_waitlist_offers(session) == 1
+
+        assert second.status == "waiting"
+
+    def test_unexpired_offers_are_kept(self, session: Session):
+        """Offers still within WAITLIST_OFFER_MINUTES are left alone."""
+        owner_a, _ = session.info['owners'][0]
+        entry = _join(session, 1)
+        _service(session).cancel_appointment(session.info['appointment'].id, owner_a)
+        session.commit()
+
+        assert expire_waitlist_offers(session) == 0
+        assert entry.status == "offered"
+
+
+@requires_postgres
+def test_lapsed_offer_is_claimed_by_one_worker():
+    """Two workers expiring at once never both claim the same lapsed offer."""
+    engine = create_engine(TEST_POSTGRES_URL)
+    SQLModel.metadata.drop_all(engine)
+    SQLModel.metadata.create_all(engine)
+    try:
+        with Session(engine) as session:
+            user = User(full_name="Owner", email="a@example.com", hashed_password="x", role="pet_owner")
+            session.add(user)
+            session.flush()
+            pet = Pet(name="Fluffy", species="Dog", owner_id=user.id)
+            session.add(pet)
+            session.flush()
+            tomorrow = tomorrow_at(0).date()
+            session.add(WaitlistEntry(
+                user_id=user.id, pet_id=pet.id, service_type="vaccination",
+                from_date=tomorrow, to_date=tomorrow, status="offered",
+                offered_start_time=tomorrow_at(10), offered_end_time=tomorrow_at(10) + timedelta(minutes=30),
+                offer_expires_at=get_pht_now() - timedelta(minutes=1)
+            ))
+            session.commit()
+
+        now = get_pht_now()
+        with Session(engine) as worker_a, Session(engine) as worker_b:
+            claimed = WaitlistRepository(worker_a).get_expired_offers(now)
+            assert len(claimed) == 1
+            assert WaitlistRepository(worker_b).get_expired_offers(now) == []
+
+            WaitlistRepository(worker_a).delete(claimed[0])
+            worker_a.commit()
+            assert WaitlistRepository(worker_b).get_expired_offers(now) == []
+    finally:
+        SQLModel.metadata.drop_all(engine)
+        engine.dispose()
+
+
+def test_queue_lookup_uses_the_index(session: Session):
+    """The freed-slot lookup is an index range scan without a sort."""
+    _join(session, 1, days=5)
+    queries = []
+    listener = lambda conn, cursor, statement, parameters, *args: queries.append((statement, parameters))
+    engine = session.get_bind()
+    event.listen(engine, "before_cursor_execute", listener)
+    try:
+        WaitlistRepository(session).get_next_waiting(tomorrow_at(0).date(), "vaccination", 5)
+    finally:
+        event.remove(engine, "before_cursor_execute", listener)
+
+    statement, parameters = queries[-1]
+    plan = session.connection().exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters).fetchall()
+    details = [row[-1] for row in plan]
+    assert any("ix_waitlist_entry_days_queue" in detail for detail in details)
+    assert not any("TEMP B-TREE" in detail for detail in details)
+
+
+def test_waitlist_endpoints(session: Session):
+    """Join, list, see the offer after a cancellation, and leave."""
+    (owner_a, _), (owner_b, pet_b), _ = session.info['owners']
+    headers_a = {"Authorization": f"Bearer {create_access_token({'sub': str(owner_a.id), 'role': 'pet_owner'})}"}
+    headers_b = {"Authorization": f"Bearer {create_access_token({'sub': str(owner_b.id), 'role': 'pet_owner'})}"}
+    tomorrow = tomorrow_at(0).date().isoformat()
+    payload = {"pet_id": str(pet_b.id), "service_type": "vaccination", "from_date": tomorrow, "to_date": tomorrow}
+    app.dependency_overrides[get_session] = lambda: session
+    client = TestClient(app)
+
+    try:
+        joined = client.post("/api/v1/waitlist", json=payload, headers=headers_b)
+        cancelled = client.delete(f"/api/v1/appointments/{session.info['appointment'].id}", headers=headers_a)
+        listed = client.get("/api/v1/waitlist", headers=headers_b)
+        others = client.get("/api/v1/waitlist", headers=headers_a)
+        entry_url = f"/api/v1/waitlist/{joined.json()['id']}"
+        forbidden = client.delete(entry_url, headers=headers_a)
+        left = client.delete(entry_url, headers=headers_b)
+    finally:
+        app.dependency_overrides.clear()
+
+    assert joined.status_code == 201
+    assert joined.json()["status"] == "waiting"
+    assert cancelled.status_code == 204
+    assert listed.json()[0]["status"] == "offered"
+    assert listed.json()[0]["offered_start_time"] == tomorrow_at(10).isoformat()
+    assert others.json() == []
+    assert forbidden.status_code == 403
+    assert left.status_code == 204
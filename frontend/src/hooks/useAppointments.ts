@@ -8,6 +8,7 @@ import { useState, useCallback, useEffect } from 'react';
 import { apiClient } from '../lib/api-client';
 import type {
   Appointment,
+  AppointmentPage,
   AppointmentCreateRequest,
   AppointmentUpdateStatusRequest,
   AppointmentRescheduleRequest,
@@ -36,8 +37,17 @@ export function useAppointments(filters?: AppointmentFilters, options = { enable
       if (activeFilters.from_date) params.from_date = activeFilters.from_date;
       if (activeFilters.to_date) params.to_date = activeFilters.to_date;
 
-      // GET /api/v1/appointments
-      const data = await apiClient.get<Appointment[]>('/api/v1/appointments', params);
+      // GET /api/v1/appointments, following next_cursor until the last page
+      const data: Appointment[] = [];
+      let cursor: string | null = null;
+      do {
+        const page: AppointmentPage = await apiClient.get<AppointmentPage>(
+          '/api/v1/appointments',
+          cursor ? { ...params, cursor } : params
+        );
+        data.push(...page.items);
+        cursor = page.next_cursor;
+      } while (cursor);
       setAppointments(data);
       return data;
     } catch (err: any) {
@@ -120,6 +120,11 @@ export interface Appointment {
   updated_at: string;
 }
 
+export interface AppointmentPage {
+  items: Appointment[];
+  next_cursor: string | null;
+}
+
 export interface AppointmentCreateRequest {
   pet_id: string;
   start_time: string;